@@ -0,0 +1,82 @@
+# common/batch_loader.py
+"""
+요청 단위 배치 로더 (DataLoader 방식)
+
+목록 API에서 행마다 연관 데이터를 1건씩 조회하던 N+1 패턴을
+"id를 모아 관계당 IN (...) 쿼리 1회"로 바꾸기 위한 공용 유틸리티입니다.
+
+- 배치 함수: async def fn(db, keys: List[K]) -> Dict[K, V]
+  (결과 dict 에 없는 키는 값 없음(None)으로 간주)
+- 메모이제이션: AsyncSession.info 에 로더를 보관하므로 요청(세션) 범위에서만 유지되고
+  같은 요청 안에서 동일 키는 다시 조회하지 않습니다.
+- 세션을 공유하는 코루틴은 동시에 쿼리할 수 없으므로 load_many 로 키를 모아 한 번에 호출합니다.
+
+사용법:
+    prices = await get_loader(db, "kok_latest_price", _fetch_latest_prices).load_many(product_ids)
+    price = prices.get(product_id)
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFn = Callable[[AsyncSession, List[K]], Awaitable[Dict[K, V]]]
+
+_SESSION_INFO_KEY = "uhok_batch_loaders"
+
+
+class BatchLoader(Generic[K, V]):
+    """키 묶음을 배치 함수 1회로 해석하고 결과를 메모이즈하는 로더"""
+
+    def __init__(self, db: AsyncSession, batch_fn: BatchFn, name: str = ""):
+        self.db = db
+        self.batch_fn = batch_fn
+        self.name = name or getattr(batch_fn, "__name__", "batch_loader")
+        self._cache: Dict[K, Optional[V]] = {}
+
+    async def load_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        """
+        키 목록 조회 (입력 순서 기준 중복 제거, 캐시에 없는 키만 배치 조회)
+        - 반환 dict 에는 값이 존재하는 키만 포함
+        """
+        unique_keys = list(dict.fromkeys(k for k in keys if k is not None))
+        missing = [k for k in unique_keys if k not in self._cache]
+        if missing:
+            fetched = await self.batch_fn(self.db, missing)
+            for key in missing:
+                self._cache[key] = fetched.get(key)
+        return {k: self._cache[k] for k in unique_keys if self._cache.get(k) is not None}
+
+    async def load(self, key: K) -> Optional[V]:
+        """키 1건 조회 (캐시 우선)"""
+        return (await self.load_many([key])).get(key)
+
+    def prime(self, key: K, value: V) -> None:
+        """이미 알고 있는 값을 캐시에 등록"""
+        self._cache[key] = value
+
+    def clear(self, key: Optional[K] = None) -> None:
+        """캐시 비우기 (쓰기 이후 같은 요청에서 다시 읽어야 할 때)"""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+
+def get_loader(db: AsyncSession, name: str, batch_fn: BatchFn) -> BatchLoader:
+    """
+    세션(요청) 범위 로더 조회/생성
+    - 같은 세션에서 같은 name 은 같은 로더(캐시)를 공유
+    - session.info 를 쓸 수 없는 세션(테스트 더블 등)은 호출마다 새 로더 반환
+    """
+    info: Any = getattr(db, "info", None)
+    if not isinstance(info, dict):
+        return BatchLoader(db, batch_fn, name)
+    loaders = info.setdefault(_SESSION_INFO_KEY, {})
+    loader = loaders.get(name)
+    if loader is None:
+        loader = loaders[name] = BatchLoader(db, batch_fn, name)
+    return loader
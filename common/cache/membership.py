@@ -0,0 +1,167 @@
+"""
+사용자별 찜/장바구니 멤버십 집합 (Redis SET, write-through)
+
+상품 목록/상세에서 "이 사용자가 찜했나/장바구니에 담았나" 를 상품마다 별도 쿼리로 확인하던 것을
+사용자별 ID 집합 조회(파이프라인 1회)로 바꿉니다.
+
+- 종류: kok_like(KOK_PRODUCT_ID), hs_like(LIVE_ID), kok_cart(KOK_PRODUCT_ID), hs_cart(PRODUCT_ID)
+- 키: `membership:v1:{kind}:user:{user_id}` — 전체 적재된 집합에는 표시 멤버 "*" 포함
+  · 표시가 없는 집합(적재 전 write-through 로 생긴 부분 집합)은 미적재로 보고 DB 에서 다시 적재
+- 적재: 미적재 종류만 UNION ALL 쿼리 1회로 조회 후 DEL + SADD + EXPIRE (MEMBERSHIP_TTL_SECONDS)
+- 갱신: 찜 토글/장바구니 추가·삭제/주문 생성 CRUD 가 record_membership() 으로 커밋 후 SADD/SREM
+  (TTL 은 적재와 갱신이 엇갈린 경우의 최대 지연 시간)
+- Redis 장애/미연결 시 DB 조회 결과를 그대로 사용 (캐시 없이 정확한 값)
+
+사용법:
+    sets = await get_memberships(db, user_id, [KOK_LIKE, KOK_CART])
+    await annotate_memberships(db, user_id, products, id_key="kok_product_id", like_kind=KOK_LIKE, cart_kind=KOK_CART)
+    record_membership(db, user_id, KOK_LIKE, kok_product_id, member=True)
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.database.after_commit import run_after_commit
+from common.logger import get_logger
+from common.metrics import record_cache_lookup
+
+logger = get_logger("membership_cache")
+
+KOK_LIKE = "kok_like"
+HS_LIKE = "hs_like"
+KOK_CART = "kok_cart"
+HS_CART = "hs_cart"
+
+MEMBERSHIP_TTL_SECONDS = 1800
+_KEY = "membership:v1:{kind}:user:{user_id}"
+_COMPLETE = "*"
+
+# 종류별 (사용자 → 대상 ID) 조회 SQL
+_MEMBERSHIP_SQL = {
+    KOK_LIKE: "SELECT '{kind}' AS kind, kl.KOK_PRODUCT_ID AS item_id FROM KOK_LIKES kl WHERE kl.USER_ID = :user_id",
+    HS_LIKE: "SELECT '{kind}' AS kind, hl.LIVE_ID AS item_id FROM HOMESHOPPING_LIKES hl WHERE hl.USER_ID = :user_id",
+    KOK_CART: "SELECT '{kind}' AS kind, kc.KOK_PRODUCT_ID AS item_id FROM KOK_CART kc WHERE kc.USER_ID = :user_id",
+    HS_CART: "SELECT '{kind}' AS kind, hc.PRODUCT_ID AS item_id FROM HOMESHOPPING_CART hc WHERE hc.USER_ID = :user_id",
+}
+
+_cache = None
+
+
+def _get_cache():
+    """멤버십 Redis 캐시 (첫 사용 시 생성)"""
+    global _cache
+    if _cache is None:
+        from common.cache.redis_cache import RedisCacheCore
+        from common.config import get_settings
+
+        redis_url = getattr(get_settings(), "redis_url", "redis://redis:6379/0")
+        _cache = RedisCacheCore(redis_url, component="membership")
+    return _cache
+
+
+def _key(kind: str, user_id: int) -> str:
+    return _KEY.format(kind=kind, user_id=user_id)
+
+
+async def _load_from_db(db: AsyncSession, user_id: int, kinds: Sequence[str]) -> Dict[str, Set[int]]:
+    """미적재 종류를 UNION ALL 쿼리 1회로 조회"""
+    sql = "\nUNION ALL\n".join(_MEMBERSHIP_SQL[kind].format(kind=kind) for kind in kinds)
+    rows = (await db.execute(text(sql), {"user_id": user_id})).fetchall()
+    loaded: Dict[str, Set[int]] = {kind: set() for kind in kinds}
+    for row in rows:
+        loaded[row.kind].add(int(row.item_id))
+    return loaded
+
+
+async def get_memberships(db: AsyncSession, user_id: int, kinds: Iterable[str]) -> Dict[str, Set[int]]:
+    """
+    사용자의 종류별 멤버십 ID 집합
+    - Redis 파이프라인 1회로 조회, 미적재 종류만 DB 쿼리 1회로 적재 후 저장
+    """
+    kinds = list(dict.fromkeys(kinds))
+    unknown = [kind for kind in kinds if kind not in _MEMBERSHIP_SQL]
+    if unknown:
+        raise ValueError(f"Unknown membership kind: {unknown}")
+    if not kinds:
+        return {}
+
+    result: Dict[str, Set[int]] = {}
+    client = await _get_cache().get_client()
+    if client is not None:
+        try:
+            pipe = client.pipeline()
+            for kind in kinds:
+                pipe.smembers(_key(kind, user_id))
+            for kind, members in zip(kinds, await pipe.execute()):
+                if _COMPLETE in members:
+                    result[kind] = {int(member) for member in members if member != _COMPLETE}
+        except Exception as e:
+            logger.warning(f"멤버십 캐시 조회 실패 (DB 조회로 대체): user_id={user_id}, error={e}")
+            client = None
+    for kind in kinds:
+        record_cache_lookup("membership", kind, hit=kind in result)
+
+    missing = [kind for kind in kinds if kind not in result]
+    if not missing:
+        return result
+
+    loaded = await _load_from_db(db, user_id, missing)
+    result.update(loaded)
+    if client is not None:
+        try:
+            pipe = client.pipeline()
+            for kind, ids in loaded.items():
+                key = _key(kind, user_id)
+                pipe.delete(key)
+                pipe.sadd(key, _COMPLETE, *ids)
+                pipe.expire(key, MEMBERSHIP_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"멤버십 캐시 저장 실패: user_id={user_id}, error={e}")
+    return result
+
+
+async def annotate_memberships(
+    db: AsyncSession,
+    user_id: Optional[int],
+    items: List[Dict[str, Any]],
+    *,
+    id_key: str,
+    like_kind: Optional[str] = None,
+    cart_kind: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    목록 항목에 "is_liked" / "is_in_cart" 를 한 번에 부착 (비로그인은 모두 False)
+    """
+    kinds = [kind for kind in (like_kind, cart_kind) if kind]
+    sets = await get_memberships(db, user_id, kinds) if user_id and items else {}
+    for item in items:
+        if like_kind:
+            item["is_liked"] = item.get(id_key) in sets.get(like_kind, ())
+        if cart_kind:
+            item["is_in_cart"] = item.get(id_key) in sets.get(cart_kind, ())
+    return items
+
+
+async def _apply_membership(user_id: int, kind: str, item_id: int, member: bool) -> None:
+    client = await _get_cache().get_client()
+    if client is None:
+        return
+    key = _key(kind, user_id)
+    pipe = client.pipeline()
+    if member:
+        pipe.sadd(key, int(item_id))
+    else:
+        pipe.srem(key, int(item_id))
+    pipe.expire(key, MEMBERSHIP_TTL_SECONDS)
+    await pipe.execute()
+
+
+def record_membership(db: AsyncSession, user_id: int, kind: str, item_id: int, member: bool) -> None:
+    """찜/장바구니 변경을 커밋 후 멤버십 집합에 반영 (롤백되면 반영하지 않음)"""
+    if kind not in _MEMBERSHIP_SQL:
+        raise ValueError(f"Unknown membership kind: {kind}")
+    run_after_commit(db, lambda: _apply_membership(user_id, kind, item_id, member))
+
@@ -0,0 +1,126 @@
+"""
+서킷 브레이커 (외부 서비스 호출 보호)
+
+외부 서비스 장애 중에는 모든 요청이 타임아웃 × 재시도만큼 기다리지 않도록
+연속 실패가 임계치를 넘으면 일정 시간 동안 호출 없이 즉시 실패시킵니다.
+
+상태:
+- closed: 정상 호출, 연속 실패 수 집계
+- open: reset_timeout 동안 호출 차단 (CircuitOpenError)
+- half_open: reset_timeout 경과 후 시험 호출 1건만 허용 → 성공 시 closed, 실패 시 다시 open
+  · 시험 호출이 결과 없이 취소되면 release_trial() 로 반납 (다음 요청이 시험 호출)
+
+사용법:
+    breaker = CircuitBreaker("ml_inference", failure_threshold=5, reset_timeout=30)
+    breaker.before_call()          # open 이면 CircuitOpenError
+    try:
+        result = await call()
+    except asyncio.CancelledError:
+        breaker.release_trial()
+        raise
+    except Exception:
+        breaker.record_failure()
+        raise
+    breaker.record_success()
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from common.logger import get_logger
+from common.metrics import circuit_breaker_state
+
+logger = get_logger("circuit_breaker")
+
+STATE_CLOSED = "closed"
+STATE_HALF_OPEN = "half_open"
+STATE_OPEN = "open"
+
+# 게이지 값 (0=closed, 1=half_open, 2=open)
+_STATE_VALUES = {STATE_CLOSED: 0, STATE_HALF_OPEN: 1, STATE_OPEN: 2}
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷이 열려 있어 호출하지 않고 즉시 실패"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} 서킷 열림 ({retry_after:.1f}초 후 재시도)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        circuit_breaker_state.set(_STATE_VALUES[STATE_CLOSED], name=name)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == STATE_OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return STATE_HALF_OPEN
+            return self._state
+
+    def _set_state(self, state: str) -> None:
+        if state != self._state:
+            logger.warning(f"서킷 상태 변경: name={self.name}, {self._state} → {state}")
+        self._state = state
+        circuit_breaker_state.set(_STATE_VALUES[state], name=self.name)
+
+    def before_call(self) -> None:
+        """호출 허용 여부 확인 (차단 시 CircuitOpenError)"""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return
+            elapsed = self._clock() - self._opened_at
+            if self._state == STATE_OPEN and elapsed < self.reset_timeout:
+                raise CircuitOpenError(self.name, self.reset_timeout - elapsed)
+            # reset_timeout 경과: 시험 호출 1건만 통과
+            if self._trial_in_flight:
+                raise CircuitOpenError(self.name, 0.0)
+            self._set_state(STATE_HALF_OPEN)
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self._set_state(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                self._set_state(STATE_OPEN)
+
+    def release_trial(self) -> None:
+        """성공/실패를 기록하지 못하고 끝난 호출(취소 등)의 시험 호출 슬롯 반납 — 상태는 유지"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def reset(self, state: Optional[str] = None) -> None:
+        """상태 초기화 (테스트/운영 수동 복구용)"""
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self._opened_at = self._clock() if state == STATE_OPEN else 0.0
+            self._set_state(state or STATE_CLOSED)
@@ -71,6 +71,31 @@ class Settings(BaseSettings):
     app_name: str = Field(..., env="APP_NAME", description="애플리케이션 이름")
     debug: bool = Field(..., env="DEBUG", description="디버그 모드 활성화 여부")
 
+    # 메트릭 설정 (/metrics, Prometheus 텍스트 포맷)
+    metrics_enabled: bool = Field(True, env="METRICS_ENABLED", description="요청/DB/캐시 메트릭 수집 및 /metrics 노출 여부")
+
+    # SQL 기록 설정 (개발/테스트용 N+1 탐지, 요청당 쿼리 예산)
+    query_recorder_mode: str = Field(
+        "off",
+        env="QUERY_RECORDER_MODE",
+        description="요청별 SQL 기록 모드 (off | warn | raise, 운영은 off)",
+    )
+    query_budget_default: int = Field(30, env="QUERY_BUDGET_DEFAULT", description="@query_budget 미지정 엔드포인트의 요청당 SQL 예산")
+
+    # 홈쇼핑 상품 검색 백엔드 설정
+    homeshopping_search_backend: str = Field(
+        "auto",
+        env="HOMESHOPPING_SEARCH_BACKEND",
+        description="홈쇼핑 상품 검색 백엔드 (auto | fulltext | inverted, auto 는 메모리 역색인, fulltext 는 ngram 인덱스가 있는 서버에서만)",
+    )
+
+    # 게이트웨이 마운트 서비스 설정 (슬림 워커용)
+    gateway_services: str = Field(
+        "all",
+        env="GATEWAY_SERVICES",
+        description="게이트웨이에 마운트할 서비스 목록 (쉼표 구분, 예: 'log', 'catalog', 'user,order'; 기본 'all')",
+    )
+
     class Config:
         """Pydantic 설정 클래스"""
         env_file = os.path.join(os.path.dirname(__file__), "..", ".env")  # .env 파일 경로
@@ -0,0 +1,69 @@
+"""
+커밋 후 실행 콜백 (캐시 무효화/write-through 용)
+
+CRUD 함수는 커밋하지 않고 라우터가 커밋하므로, CRUD 안에서 바로 캐시를 지우거나 갱신하면
+커밋 전에 다른 요청이 옛 DB 값으로 캐시를 다시 채우거나, 롤백된 변경이 캐시에 남을 수 있습니다.
+run_after_commit() 으로 등록한 비동기 콜백은 세션의 최상위 트랜잭션이 커밋된 뒤에만 실행되고,
+롤백되면 버려집니다.
+
+- 실행: after_commit 이벤트에서 백그라운드 태스크로 실행 (실패는 경고 로그만)
+- 테스트/종료 시 drain_after_commit_tasks() 로 진행 중인 콜백 완료 대기
+
+사용법:
+    run_after_commit(db, lambda: invalidate_ownership_snapshot(user_id))
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from common.logger import get_logger
+
+logger = get_logger("after_commit")
+
+AfterCommitCallback = Callable[[], Awaitable[object]]
+
+_PENDING_KEY = "after_commit_callbacks"
+_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def run_after_commit(db: AsyncSession, callback: AfterCommitCallback) -> None:
+    """현재 트랜잭션이 커밋되면 callback() 을 실행하도록 등록 (롤백 시 버림)"""
+    db.info.setdefault(_PENDING_KEY, []).append(callback)
+
+
+async def _run(callback: AfterCommitCallback) -> None:
+    try:
+        await callback()
+    except Exception as e:
+        logger.warning(f"커밋 후 콜백 실패: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    callbacks: List[AfterCommitCallback] = session.info.pop(_PENDING_KEY, [])
+    if not callbacks:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning(f"이벤트 루프 밖 커밋: 커밋 후 콜백 {len(callbacks)}건 생략")
+        return
+    for callback in callbacks:
+        task = loop.create_task(_run(callback))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def drain_after_commit_tasks() -> None:
+    """진행 중인 커밋 후 콜백 완료 대기 (테스트/종료 시)"""
+    while _tasks:
+        await asyncio.gather(*list(_tasks), return_exceptions=True)
@@ -0,0 +1,110 @@
+"""
+지연 생성(Lazy) 비동기 엔진 레지스트리
+- 각 DB 모듈은 import 시점이 아니라 첫 세션 요청 시점에 엔진을 생성한다
+- 슬림 게이트웨이(일부 서비스만 마운트)에서는 쓰지 않는 DB의 엔진/드라이버를 아예 로드하지 않음
+- 엔진 생성 훅을 등록하면 이미 생성된 엔진과 이후 생성될 엔진 모두에 적용된다
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from common.logger import get_logger
+
+logger = get_logger("lazy_engine")
+
+EngineHook = Callable[[str, AsyncEngine], None]
+
+_registry: Dict[str, "LazyAsyncEngine"] = {}
+_engine_hooks: List[EngineHook] = []
+
+
+class LazyAsyncEngine:
+    """첫 접근 시 AsyncEngine/세션 팩토리를 생성하는 래퍼"""
+
+    def __init__(
+        self,
+        name: str,
+        url_getter: Callable[[], Optional[str]],
+        **engine_kwargs: Any,
+    ):
+        self.name = name
+        self._url_getter = url_getter
+        self._engine_kwargs = engine_kwargs
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[async_sessionmaker] = None
+        _registry[name] = self
+
+    @property
+    def is_configured(self) -> bool:
+        """연결 URL이 설정되어 있는지 여부"""
+        return bool(self._url_getter())
+
+    @property
+    def is_initialized(self) -> bool:
+        """엔진이 이미 생성되었는지 여부"""
+        return self._engine is not None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """엔진 반환 (없으면 생성)"""
+        if self._engine is None:
+            url = self._url_getter()
+            if not url:
+                raise RuntimeError(f"{self.name} 연결 URL이 설정되지 않아 엔진을 생성할 수 없습니다.")
+            self._engine = create_async_engine(url, **self._engine_kwargs)
+            logger.info(f"{self.name} 엔진 생성됨 (지연 초기화), URL: {url}")
+            for hook in list(_engine_hooks):
+                _run_hook(hook, self.name, self._engine)
+        return self._engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        """세션 팩토리 반환 (없으면 엔진과 함께 생성)"""
+        if self._session_factory is None:
+            self._session_factory = async_sessionmaker(
+                self.engine, class_=AsyncSession, expire_on_commit=False
+            )
+        return self._session_factory
+
+    async def dispose(self) -> None:
+        """생성된 엔진의 커넥션 풀을 정리"""
+        if self._engine is None:
+            return
+        await self._engine.dispose()
+        logger.info(f"{self.name} 엔진 정리 완료")
+        self._engine = None
+        self._session_factory = None
+
+
+def _run_hook(hook: EngineHook, name: str, engine: AsyncEngine) -> None:
+    try:
+        hook(name, engine)
+    except Exception as e:
+        logger.error(f"엔진 생성 훅 실행 실패: engine={name}, hook={getattr(hook, '__name__', hook)}, error={str(e)}")
+
+
+def add_engine_hook(hook: EngineHook) -> None:
+    """
+    엔진 생성 훅 등록
+    - 이미 생성된 엔진에는 즉시 적용하고, 이후 생성되는 엔진에는 생성 직후 적용
+    """
+    if hook in _engine_hooks:
+        return
+    _engine_hooks.append(hook)
+    for lazy in list(_registry.values()):
+        if lazy.is_initialized:
+            _run_hook(hook, lazy.name, lazy.engine)
+
+
+def get_initialized_engines() -> Dict[str, AsyncEngine]:
+    """현재까지 생성된 엔진 목록 반환 (이름 → 엔진)"""
+    return {name: lazy.engine for name, lazy in _registry.items() if lazy.is_initialized}
+
+
+async def dispose_all_engines() -> None:
+    """생성된 모든 엔진 정리 (애플리케이션 종료 시 호출)"""
+    for lazy in list(_registry.values()):
+        try:
+            await lazy.dispose()
+        except Exception as e:
+            logger.error(f"{lazy.name} 엔진 정리 실패: {str(e)}")
@@ -1,17 +1,20 @@
 """
 MariaDB 서비스 전반 DB 세션 (service_db)
+- 엔진은 import 시점이 아닌 첫 세션 요청 시점에 생성된다 (common.database.lazy_engine)
 """
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 from common.config import get_settings
+from common.database.lazy_engine import LazyAsyncEngine
 from common.logger import get_logger
 
 logger = get_logger("mariadb_service")
 
-settings = get_settings()
-engine = create_async_engine(
-    settings.mariadb_service_url, 
+_lazy_engine = LazyAsyncEngine(
+    "mariadb_service",
+    lambda: get_settings().mariadb_service_url,
     echo=False,
     pool_size=20,  # 연결 풀 크기 증가
     max_overflow=30,  # 최대 오버플로우 연결
@@ -20,17 +23,33 @@ engine = create_async_engine(
     connect_args={
         "connect_timeout": 10,  # 연결 타임아웃
         "read_timeout": 30,  # 읽기 타임아웃
-    }
+    },
 )
-SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-logger.info(f"MariaDB Service 엔진 생성됨, URL: {settings.mariadb_service_url}")
-logger.info(f"디버그 모드: {settings.debug}")
+
+def get_engine() -> AsyncEngine:
+    """MariaDB 서비스용 엔진 반환 (최초 호출 시 생성)"""
+    return _lazy_engine.engine
+
+
+def get_session_factory() -> async_sessionmaker:
+    """MariaDB 서비스용 세션 팩토리 반환 (최초 호출 시 생성)"""
+    return _lazy_engine.session_factory
+
+
+def __getattr__(name: str):
+    """하위호환: `engine`, `SessionLocal` 속성 접근 시 지연 생성"""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 async def get_maria_service_db() -> AsyncGenerator[AsyncSession, None]:
     """MariaDB 서비스용 세션 반환"""
     logger.debug("MariaDB 서비스 데이터베이스 세션 생성 중")
-    async with SessionLocal() as session:
+    async with get_session_factory()() as session:
         logger.debug("MariaDB 서비스 데이터베이스 세션 생성 완료")
         try:
             yield session
@@ -1,25 +1,47 @@
 """
 PostgreSQL 로그 DB 세션 (log_db)
+- 엔진은 import 시점이 아닌 첫 세션 요청 시점에 생성된다 (common.database.lazy_engine)
 """
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 from common.config import get_settings
+from common.database.lazy_engine import LazyAsyncEngine
 from common.logger import get_logger
 
 logger = get_logger("postgres_log")
 
-settings = get_settings()
-engine = create_async_engine(settings.postgres_log_url, echo=False)
-SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+_lazy_engine = LazyAsyncEngine(
+    "postgres_log",
+    lambda: get_settings().postgres_log_url,
+    echo=False,
+)
+
+
+def get_engine() -> AsyncEngine:
+    """PostgreSQL 로그용 엔진 반환 (최초 호출 시 생성)"""
+    return _lazy_engine.engine
+
+
+def get_session_factory() -> async_sessionmaker:
+    """PostgreSQL 로그용 세션 팩토리 반환 (최초 호출 시 생성)"""
+    return _lazy_engine.session_factory
+
+
+def __getattr__(name: str):
+    """하위호환: `engine`, `SessionLocal` 속성 접근 시 지연 생성"""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-logger.info(f"PostgreSQL Log 엔진 생성됨, URL: {settings.postgres_log_url}")
-logger.info(f"디버그 모드: {settings.debug}")
 
 async def get_postgres_log_db() -> AsyncGenerator[AsyncSession, None]:
     """PostgreSQL 로그용 세션 반환"""
     logger.debug("PostgreSQL 로그 데이터베이스 세션 생성 중")
-    async with SessionLocal() as session:
+    async with get_session_factory()() as session:
         logger.debug("PostgreSQL 로그 데이터베이스 세션 생성 완료")
         yield session
     logger.debug("PostgreSQL 로그 데이터베이스 세션 종료됨")
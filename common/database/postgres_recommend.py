@@ -1,34 +1,57 @@
 """
 PostgreSQL 추천 DB 세션 (recommend_db)
+- 엔진은 import 시점이 아닌 첫 세션 요청 시점에 생성된다 (common.database.lazy_engine)
+- POSTGRES_RECOMMEND_URL 미설정 시 엔진/세션 팩토리는 None
 """
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from common.config import get_settings
+from common.database.lazy_engine import LazyAsyncEngine
 from common.logger import get_logger
 
 logger = get_logger("postgres_recommend")
 
-settings = get_settings()
-engine = None
-SessionLocal = None
+_lazy_engine = LazyAsyncEngine(
+    "postgres_recommend",
+    lambda: get_settings().postgres_recommend_url,
+    echo=False,
+)
+
+
+def get_engine() -> Optional[AsyncEngine]:
+    """PostgreSQL 추천용 엔진 반환 (URL 미설정 시 None)"""
+    if not _lazy_engine.is_configured:
+        return None
+    return _lazy_engine.engine
+
+
+def get_session_factory() -> Optional[async_sessionmaker]:
+    """PostgreSQL 추천용 세션 팩토리 반환 (URL 미설정 시 None)"""
+    if not _lazy_engine.is_configured:
+        return None
+    return _lazy_engine.session_factory
+
 
-if settings.postgres_recommend_url:
-    engine = create_async_engine(settings.postgres_recommend_url, echo=False)
-    SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    logger.info(f"PostgreSQL Recommend 엔진 생성됨, URL: {settings.postgres_recommend_url}")
-else:
-    logger.warning("POSTGRES_RECOMMEND_URL 미설정: PostgreSQL Recommend 세션 비활성화")
+def __getattr__(name: str):
+    """하위호환: `engine`, `SessionLocal` 속성 접근 시 지연 생성"""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-logger.info(f"디버그 모드: {settings.debug}")
 
 async def get_postgres_recommend_db() -> AsyncGenerator[AsyncSession, None]:
     """PostgreSQL 추천용 세션 반환"""
-    if SessionLocal is None:
+    session_factory = get_session_factory()
+    if session_factory is None:
+        logger.warning("POSTGRES_RECOMMEND_URL 미설정: PostgreSQL Recommend 세션 비활성화")
         raise RuntimeError("POSTGRES_RECOMMEND_URL이 설정되지 않아 recommend DB 세션을 생성할 수 없습니다.")
 
     logger.debug("PostgreSQL 추천 데이터베이스 세션 생성 중")
-    async with SessionLocal() as session:
+    async with session_factory() as session:
         logger.debug("PostgreSQL 추천 데이터베이스 세션 생성 완료")
         yield session
     logger.debug("PostgreSQL 추천 데이터베이스 세션 종료됨")
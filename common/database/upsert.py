@@ -0,0 +1,55 @@
+"""
+유니크 키 충돌을 무시하는 단일 INSERT (찜 토글 등 멱등 등록용)
+
+SELECT 로 존재 여부를 확인한 뒤 INSERT 하면 왕복이 2번이고, 두 요청이 동시에 "없음"을 보고
+둘 다 INSERT 해 중복 행이 생길 수 있습니다. insert_if_absent() 는 유니크 키에 맡겨
+한 번의 INSERT 로 "새로 추가됨 / 이미 있음"을 구분합니다.
+
+- MariaDB/MySQL: INSERT ... ON DUPLICATE KEY UPDATE <PK> = <PK> (변경 없는 no-op)
+  · INSERT IGNORE 는 FK 위반 등 다른 오류까지 경고로 바꾸므로 사용하지 않음
+  · 새로 추가되면 lastrowid = 새 PK, 중복이면 0
+- SQLite(테스트)/PostgreSQL: INSERT ... ON CONFLICT DO NOTHING (중복이면 rowcount 0)
+
+사용법:
+    like_id = await insert_if_absent(db, KokLikes, {KokLikes.user_id: 1, ...})
+    if like_id is None:  # 이미 있음
+        ...
+"""
+
+from typing import Any, Mapping, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def insert_if_absent(db: AsyncSession, model, values: Mapping[Any, Any]) -> Optional[int]:
+    """
+    유니크 키가 충돌하지 않으면 1행 INSERT
+
+    Args:
+        db: 데이터베이스 세션
+        model: 유니크 키가 있는 ORM 모델 (정수 자동 증가 PK 1개)
+        values: {모델 속성: 값}
+
+    Returns:
+        새로 추가한 행의 PK — 같은 유니크 키 행이 이미 있으면 None
+    """
+    dialect = db.get_bind().dialect.name
+    pk = model.__table__.primary_key.columns.values()[0]
+
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(model).values(values).on_duplicate_key_update({pk.name: pk})
+        result = await db.execute(stmt)
+        return result.lastrowid or None
+
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        stmt = pg_insert(model).values(values).on_conflict_do_nothing().returning(pk)
+        return (await db.execute(stmt)).scalar_one_or_none()
+
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    result = await db.execute(sqlite_insert(model).values(values).on_conflict_do_nothing())
+    return result.lastrowid if result.rowcount == 1 else None
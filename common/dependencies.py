@@ -5,7 +5,7 @@ from typing import Optional
 from jose import jwt
 
 from common.auth.jwt_handler import verify_token, is_token_expired
-from common.database.mariadb_auth import SessionLocal, get_maria_auth_db
+from common.database.mariadb_auth import get_maria_auth_db, get_session_factory
 from common.errors import InvalidTokenException, NotFoundException
 from common.logger import get_logger
 from common.config import get_settings
@@ -170,7 +170,7 @@ async def get_current_user_optional(
         # 데이터베이스에서 실제 사용자 정보 조회
         # 직접 데이터베이스 연결을 생성하여 사용자 정보 조회        
         # 새로운 세션 생성
-        async with SessionLocal() as db:
+        async with get_session_factory()() as db:
             user = await get_user_by_id(db, user_id)
             if user is None:
                 logger.warning(f"사용자를 찾을 수 없음: user_id={user_id}")
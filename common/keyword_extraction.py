@@ -22,8 +22,6 @@ import re
 from typing import Any, Dict, List, Set
 from urllib.parse import unquote, urlparse
 
-import pymysql
-
 from common.config import get_settings
 
 # (선택) 퍼지매칭 : RapidFuzz가 설치되어 있으면 오타 교정/근사 매칭에 사용
@@ -105,7 +103,10 @@ def connect_mysql(host: str, port: int, user: str, password: str, database: str)
     PyMySQL 커넥션 생성
     - autocommit=False : SELECT에는 영향 없고, INSERT/UPDATE 시 트랜잭션 제어 가능
     - charset='utf8mb4' : 이모지/한글 안전
+    - pymysql은 어휘 로드 시점에만 필요하므로 지연 import
     """
+    import pymysql
+
     return pymysql.connect(
         host=host, port=port, user=user, password=password, database=database,
         charset="utf8mb4", autocommit=False
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 import httpx
 
 from common.logger import get_logger
+from common.metrics import track_background_task
 
 logger = get_logger("log_utils")
 
@@ -142,38 +143,40 @@ async def send_user_log(
     - HTTP 정보를 포함하여 저장
     """
     
-    # 직접 DB에 저장하도록 변경 (재시도 로직 포함)
-    max_retries = 2
-    for attempt in range(max_retries):
-        try:
-            from common.database.postgres_log import SessionLocal
-            from services.log.crud.event_crud import create_user_log
+    # 백그라운드 작업 in-flight 수 메트릭 (/metrics)
+    async with track_background_task("send_user_log"):
+        # 직접 DB에 저장하도록 변경 (재시도 로직 포함)
+        max_retries = 2
+        for attempt in range(max_retries):
+            try:
+                from common.database.postgres_log import get_session_factory
+                from services.log.crud.event_crud import create_user_log
             
-            # 로그 데이터 구성 (datetime 직렬화 적용)
-            log_data = {
-                "user_id": user_id,
-                "event_type": event_type,
-                "event_data": serialize_datetime(event_data) if event_data else None,
-                "http_method": http_method,
-                "api_url": api_url,
-                "request_time": serialize_datetime(request_time) if request_time else None,
-                "response_time": serialize_datetime(response_time) if response_time else None,
-                "response_code": response_code,
-                "client_ip": client_ip
-            }
+                # 로그 데이터 구성 (datetime 직렬화 적용)
+                log_data = {
+                    "user_id": user_id,
+                    "event_type": event_type,
+                    "event_data": serialize_datetime(event_data) if event_data else None,
+                    "http_method": http_method,
+                    "api_url": api_url,
+                    "request_time": serialize_datetime(request_time) if request_time else None,
+                    "response_time": serialize_datetime(response_time) if response_time else None,
+                    "response_code": response_code,
+                    "client_ip": client_ip
+                }
             
-            # 로그 DB 세션 생성 및 저장
-            async with SessionLocal() as db:
-                log_obj = await create_user_log(db, log_data)
-                logger.debug(f"[log_utils] 로그 DB 저장 완료: user_id={user_id}, event_type={event_type}, log_id={log_obj.log_id}")
-                return {"log_id": log_obj.log_id, "status": "saved_to_db"}
+                # 로그 DB 세션 생성 및 저장
+                async with get_session_factory()() as db:
+                    log_obj = await create_user_log(db, log_data)
+                    logger.debug(f"[log_utils] 로그 DB 저장 완료: user_id={user_id}, event_type={event_type}, log_id={log_obj.log_id}")
+                    return {"log_id": log_obj.log_id, "status": "saved_to_db"}
                 
-        except Exception as e:
-            if attempt < max_retries - 1:
-                logger.warning(f"[log_utils] 로그 DB 저장 재시도 {attempt + 1}/{max_retries}: user_id={user_id}, error={str(e)}")
-                await asyncio.sleep(0.5)  # 0.5초 대기 후 재시도
-                continue
-            else:
-                logger.error(f"[log_utils] 로그 DB 저장 최종 실패: user_id={user_id}, event_type={event_type}, error={str(e)}")
-                # 로그 저장 실패는 전체 프로세스를 중단하지 않도록 None 반환
-                return None
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    logger.warning(f"[log_utils] 로그 DB 저장 재시도 {attempt + 1}/{max_retries}: user_id={user_id}, error={str(e)}")
+                    await asyncio.sleep(0.5)  # 0.5초 대기 후 재시도
+                    continue
+                else:
+                    logger.error(f"[log_utils] 로그 DB 저장 최종 실패: user_id={user_id}, event_type={event_type}, error={str(e)}")
+                    # 로그 저장 실패는 전체 프로세스를 중단하지 않도록 None 반환
+                    return None
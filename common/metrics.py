@@ -0,0 +1,429 @@
+"""
+경량 애플리케이션 메트릭 모듈 (Prometheus 텍스트 포맷)
+
+외부 의존성 없이 프로세스 내 카운터/게이지/히스토그램을 관리하고
+`/metrics` 엔드포인트에서 Prometheus 텍스트 포맷으로 노출합니다.
+
+수집 항목:
+- HTTP 요청 지연/건수 (라우트 템플릿 단위, 예: /api/kok/product/{product_id}/info)
+- 요청당 SQL 실행 횟수/시간 (SQLAlchemy before/after_cursor_execute 훅, 모든 엔진)
+- 엔진별 SQL 실행 시간, 커넥션 풀 체크아웃 대기 시간 및 사용 중 커넥션 수
+- 캐시 매니저별 Redis 히트/미스 (cache, cache_type 라벨)
+- 백그라운드 작업 in-flight 수, 이벤트 루프 태스크 수
+- ML Inference 호출 지연(엔드포인트/결과별), 서킷 브레이커 상태
+
+사용법:
+    from common.metrics import cache_requests_total, record_cache_lookup
+
+    record_cache_lookup("kok_cache", "discounted_products", hit=True)
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from common.logger import get_logger
+
+logger = get_logger("metrics")
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+QUERY_COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: Sequence[str], values: Sequence[str], extra: Optional[Dict[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape_label_value(str(v))}"' for n, v in zip(labelnames, values)]
+    if extra:
+        pairs.extend(f'{n}="{_escape_label_value(str(v))}"' for n, v in extra.items())
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """메트릭 공통 베이스"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 라벨 불일치 (기대={self.labelnames}, 입력={tuple(labels)})")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """현재 값 게이지 (스크레이프 시점 콜백 지원)"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._collector: Optional[Callable[[], Dict[LabelValues, float]]] = None
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: Any) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def set_collector(self, collector: Callable[[], Dict[LabelValues, float]]) -> None:
+        """스크레이프 시점에 값을 계산하는 콜백 등록 (라벨 튜플 → 값)"""
+        self._collector = collector
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = dict(self._values)
+        if self._collector is not None:
+            try:
+                items.update(self._collector())
+            except Exception as e:
+                logger.error(f"게이지 수집 실패: metric={self.name}, error={str(e)}")
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items.items()]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 → [버킷별 카운트..., 합계, 전체 건수]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [0.0] * (len(self.buckets) + 2)
+                self._values[key] = state
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def get_count(self, **labels: Any) -> float:
+        state = self._values.get(self._label_values(labels))
+        return state[-1] if state else 0.0
+
+    def get_sum(self, **labels: Any) -> float:
+        state = self._values.get(self._label_values(labels))
+        return state[-2] if state else 0.0
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._values.items()]
+        lines: List[str] = []
+        for key, state in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = _format_labels(self.labelnames, key, {"le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{le} {_format_value(cumulative)}")
+            le_inf = _format_labels(self.labelnames, key, {"le": "+Inf"})
+            lines.append(f"{self.name}_bucket{le_inf} {_format_value(state[-1])}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(state[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 등록/렌더링 레지스트리"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷(0.0.4) 문자열 생성"""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# ---------------------------------------------------------------------------
+# 메트릭 정의
+# ---------------------------------------------------------------------------
+http_requests_total = registry.counter(
+    "uhok_http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "uhok_http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ("method", "route")
+)
+request_db_queries = registry.histogram(
+    "uhok_request_db_queries", "요청당 SQL 실행 횟수", ("method", "route"), buckets=QUERY_COUNT_BUCKETS
+)
+request_db_seconds = registry.histogram(
+    "uhok_request_db_seconds", "요청당 SQL 실행 시간 합계(초)", ("method", "route")
+)
+db_query_duration_seconds = registry.histogram(
+    "uhok_db_query_duration_seconds", "SQL 실행 시간(초)", ("engine",)
+)
+db_pool_checkout_seconds = registry.histogram(
+    "uhok_db_pool_checkout_seconds", "커넥션 풀 체크아웃 대기 시간(초)", ("engine",)
+)
+db_pool_checked_out = registry.gauge(
+    "uhok_db_pool_checked_out", "사용 중인 커넥션 수", ("engine",)
+)
+cache_requests_total = registry.counter(
+    "uhok_cache_requests_total", "캐시 조회 결과 수", ("cache", "cache_type", "result")
+)
+background_tasks_in_flight = registry.gauge(
+    "uhok_background_tasks_in_flight", "실행 중인 백그라운드 작업 수", ("task",)
+)
+background_tasks_total = registry.counter(
+    "uhok_background_tasks_total", "완료된 백그라운드 작업 수", ("task", "result")
+)
+event_loop_tasks = registry.gauge(
+    "uhok_event_loop_tasks", "이벤트 루프에 등록된 asyncio 태스크 수"
+)
+stage_duration_seconds = registry.histogram(
+    "uhok_stage_duration_seconds", "내부 처리 단계별 소요 시간(초)", ("stage",)
+)
+ml_request_duration_seconds = registry.histogram(
+    "uhok_ml_request_duration_seconds", "ML Inference 서비스 호출 시간(초, 재시도 포함)", ("endpoint", "result")
+)
+circuit_breaker_state = registry.gauge(
+    "uhok_circuit_breaker_state", "서킷 브레이커 상태 (0=closed, 1=half_open, 2=open)", ("name",)
+)
+
+
+def _collect_event_loop_tasks() -> Dict[LabelValues, float]:
+    try:
+        return {(): float(len(asyncio.all_tasks()))}
+    except RuntimeError:
+        return {}
+
+
+event_loop_tasks.set_collector(_collect_event_loop_tasks)
+
+# ---------------------------------------------------------------------------
+# 요청 단위 DB 통계
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class RequestDbStats:
+    """요청 1건 동안 누적되는 SQL 통계"""
+
+    query_count: int = 0
+    sql_seconds: float = 0.0
+
+
+_request_db_stats: ContextVar[Optional[RequestDbStats]] = ContextVar("uhok_request_db_stats", default=None)
+
+
+def start_request_db_stats() -> Tuple[RequestDbStats, Any]:
+    """현재 컨텍스트에 요청 단위 SQL 통계 시작 (반환 토큰으로 reset)"""
+    stats = RequestDbStats()
+    token = _request_db_stats.set(stats)
+    return stats, token
+
+
+def reset_request_db_stats(token: Any) -> None:
+    _request_db_stats.reset(token)
+
+
+def get_request_db_stats() -> Optional[RequestDbStats]:
+    """현재 요청의 SQL 통계 (요청 컨텍스트 밖이면 None)"""
+    return _request_db_stats.get()
+
+
+# ---------------------------------------------------------------------------
+# SQLAlchemy 엔진 계측
+# ---------------------------------------------------------------------------
+_QUERY_START_KEY = "uhok_query_start"
+
+
+def instrument_engine(name: str, engine: Any) -> None:
+    """
+    AsyncEngine(또는 Engine)에 SQL 실행/풀 체크아웃 계측 훅을 부착
+    - common.database.lazy_engine.add_engine_hook 으로 모든 엔진에 자동 적용
+    """
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if getattr(sync_engine, "_uhok_metrics_instrumented", False):
+        return
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get(_QUERY_START_KEY)
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        db_query_duration_seconds.observe(elapsed, engine=name)
+        stats = _request_db_stats.get()
+        if stats is not None:
+            stats.query_count += 1
+            stats.sql_seconds += elapsed
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+
+    # 풀 체크아웃 대기 시간: Engine.raw_connection() → pool.connect() 구간 측정
+    pool = sync_engine.pool
+    original_connect = pool.connect
+
+    def timed_connect():
+        started = time.perf_counter()
+        try:
+            return original_connect()
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - started, engine=name)
+
+    pool.connect = timed_connect
+    _instrumented_pools[name] = pool
+    sync_engine._uhok_metrics_instrumented = True
+    logger.info(f"엔진 메트릭 계측 완료: engine={name}")
+
+
+_instrumented_pools: Dict[str, Any] = {}
+
+
+def _collect_pool_checked_out() -> Dict[LabelValues, float]:
+    values: Dict[LabelValues, float] = {}
+    for name, pool in list(_instrumented_pools.items()):
+        checkedout = getattr(pool, "checkedout", None)
+        if callable(checkedout):
+            values[(name,)] = float(checkedout())
+    return values
+
+
+db_pool_checked_out.set_collector(_collect_pool_checked_out)
+
+# ---------------------------------------------------------------------------
+# 캐시/백그라운드/단계 계측 헬퍼
+# ---------------------------------------------------------------------------
+
+
+def record_cache_lookup(cache: str, cache_type: str, hit: bool) -> None:
+    """캐시 매니저 조회 결과 기록"""
+    cache_requests_total.inc(cache=cache, cache_type=cache_type, result="hit" if hit else "miss")
+
+
+@asynccontextmanager
+async def track_background_task(task: str):
+    """백그라운드 작업 실행 구간을 in-flight 게이지/완료 카운터로 기록"""
+    background_tasks_in_flight.inc(task=task)
+    result = "success"
+    try:
+        yield
+    except Exception:
+        result = "error"
+        raise
+    finally:
+        background_tasks_in_flight.dec(task=task)
+        background_tasks_total.inc(task=task, result=result)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """내부 처리 단계 소요 시간 기록 (ML 호출, 추천 계산 등)"""
+    stage_duration_seconds.observe(seconds, stage=stage)
+
+
+def render_metrics() -> str:
+    """Prometheus 텍스트 포맷 렌더링"""
+    return registry.render()
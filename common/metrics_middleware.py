@@ -0,0 +1,85 @@
+# common/metrics_middleware.py
+"""
+HTTP 요청 메트릭 수집 미들웨어 (순수 ASGI)
+- 라우트 템플릿 단위로 요청 지연/건수, 요청당 SQL 실행 횟수/시간을 기록합니다.
+- DB 로그 적재(HttpLogMiddleware)와 달리 프로세스 메모리에만 기록하므로 요청당 오버헤드가 작습니다.
+- 응답 본문 전송이 끝난 시점에 기록하므로 BackgroundTasks 실행 시간은 지연에 포함되지 않습니다.
+- 적용: app.add_middleware(MetricsMiddleware)
+"""
+
+import time
+from typing import Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.metrics import (
+    http_request_duration_seconds,
+    http_requests_total,
+    request_db_queries,
+    request_db_seconds,
+    reset_request_db_stats,
+    start_request_db_stats,
+)
+
+# 메트릭 제외 경로(프리픽스)
+DEFAULT_EXCLUDE_PATHS: Sequence[str] = (
+    "/metrics",
+    "/healthz",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/favicon.ico",
+)
+
+# 매칭되지 않은 경로는 하나의 라벨로 묶어 라벨 카디널리티 폭증 방지
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """요청 지연/SQL 통계 메트릭 미들웨어"""
+
+    def __init__(self, app: ASGIApp, *, exclude_paths: Sequence[str] = DEFAULT_EXCLUDE_PATHS):
+        self.app = app
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("path", "").startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        stats, token = start_request_db_stats()
+        status_code = 500
+        recorded = False
+
+        def record() -> None:
+            nonlocal recorded
+            if recorded:
+                return
+            recorded = True
+            method = scope.get("method", "GET")
+            route = _route_template(scope)
+            http_requests_total.inc(method=method, route=route, status=str(status_code))
+            http_request_duration_seconds.observe(time.perf_counter() - started, method=method, route=route)
+            request_db_queries.observe(stats.query_count, method=method, route=route)
+            request_db_seconds.observe(stats.sql_seconds, method=method, route=route)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                record()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            record()
+            reset_request_db_stats(token)
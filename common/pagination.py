@@ -0,0 +1,102 @@
+# common/pagination.py
+"""
+키셋(커서) 페이지네이션 유틸리티
+
+OFFSET 페이지네이션은 뒤 페이지로 갈수록 건너뛸 행을 모두 읽고 버리므로
+주문/알림/검색 이력/로그처럼 사용자별로 계속 쌓이는 목록은 (정렬시각, ID) 키셋으로 이어 읽습니다.
+
+- 커서는 마지막 행의 (정렬시각, ID)를 base64url(JSON)로 감싼 불투명 문자열
+- 정렬은 항상 (정렬시각 DESC, ID DESC) — ID가 동일 시각 행의 순서를 고정
+- 인덱스는 (USER_ID, 정렬시각, ID) 복합 인덱스를 전제
+
+사용법:
+    after = parse_cursor_param(cursor)                      # 라우터: 잘못된 커서는 400
+    stmt = stmt.where(keyset_before(Model.created_at, Model.id, after))   # CRUD
+    next_cursor = build_next_cursor(rows, limit, lambda r: (r["created_at"], r["id"]))
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+from common.errors import BadRequestException
+
+CursorValues = Tuple[Any, ...]
+
+_DATETIME_TAG = "$dt"
+_DATE_TAG = "$d"
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없는 커서"""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE_TAG: value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if _DATETIME_TAG in value:
+            return datetime.fromisoformat(value[_DATETIME_TAG])
+        if _DATE_TAG in value:
+            return date.fromisoformat(value[_DATE_TAG])
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """키셋 값들을 불투명 커서 문자열로 인코딩"""
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int = 2) -> CursorValues:
+    """커서 문자열을 키셋 값 튜플로 디코딩 (형식이 다르면 InvalidCursorError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        if not isinstance(values, list) or len(values) != size:
+            raise InvalidCursorError(f"커서 값 개수 불일치: {cursor}")
+        return tuple(_decode_value(v) for v in values)
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        if isinstance(e, InvalidCursorError):
+            raise
+        raise InvalidCursorError(f"커서 디코딩 실패: {cursor}") from e
+
+
+def parse_cursor_param(cursor: Optional[str], size: int = 2) -> Optional[CursorValues]:
+    """라우터용: 쿼리 파라미터 커서 디코딩 (없으면 None, 잘못되면 400)"""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor, size)
+    except InvalidCursorError:
+        raise BadRequestException("유효하지 않은 cursor 값입니다.")
+
+
+def keyset_before(sort_col, id_col, after: CursorValues):
+    """
+    (sort_col DESC, id_col DESC) 정렬에서 커서 다음 행 조건
+    - 행 생성자 비교 대신 OR 전개형을 사용해 MariaDB에서도 복합 인덱스 범위 스캔이 되도록 함
+    """
+    sort_value, id_value = after
+    return or_(sort_col < sort_value, and_(sort_col == sort_value, id_col < id_value))
+
+
+def build_next_cursor(
+    items: Sequence[Any],
+    limit: int,
+    key: Callable[[Any], CursorValues],
+) -> Optional[str]:
+    """페이지가 가득 찼으면 마지막 항목 기준 다음 커서, 아니면 None"""
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(*key(items[-1]))
@@ -0,0 +1,78 @@
+"""
+주기 갱신 백그라운드 태스크 (프로세스 메모리 인덱스용)
+
+요청 경로에서 인덱스를 적재/재구성하지 않도록, 게이트웨이 lifespan 에서 태스크를 시작해
+시작 직후 1회 + interval_seconds 간격으로 MariaDB 세션을 열어 refresh(session) 을 호출합니다.
+
+- 실패는 경고 로그만 남기고 다음 주기에 재시도 (인덱스 사용처는 미준비 시 SQL 폴백)
+- start() 는 이미 실행 중이면 무시, stop() 은 태스크 취소 후 종료 대기
+
+사용법:
+    refresher = PeriodicRefresher("material_index", index.refresh, interval_seconds=300)
+    refresher.start()        # lifespan 시작
+    await refresher.stop()   # lifespan 종료
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.logger import get_logger
+
+logger = get_logger("periodic_refresh")
+
+RefreshFn = Callable[[AsyncSession], Awaitable[None]]
+SessionFactory = Callable[[], AsyncSession]
+
+
+class PeriodicRefresher:
+    """refresh(session) 을 주기 실행하는 백그라운드 태스크"""
+
+    def __init__(self, name: str, refresh: RefreshFn, interval_seconds: float):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self._refresh = refresh
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def run_once(self, session_factory: SessionFactory) -> bool:
+        """세션을 열어 1회 갱신 (성공 여부 반환)"""
+        try:
+            async with session_factory() as session:
+                await self._refresh(session)
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"{self.name} 갱신 실패 (다음 주기에 재시도): {e}")
+            return False
+
+    async def _loop(self, session_factory: SessionFactory) -> None:
+        while True:
+            await self.run_once(session_factory)
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self, session_factory: Optional[SessionFactory] = None) -> None:
+        """태스크 시작 (session_factory 가 없으면 MariaDB 서비스 세션 사용)"""
+        if self.running:
+            return
+        if session_factory is None:
+            from common.database.mariadb_service import get_session_factory
+
+            session_factory = get_session_factory()
+        self._task = asyncio.create_task(self._loop(session_factory), name=f"refresh:{self.name}")
+
+    async def stop(self) -> None:
+        """태스크 취소 후 종료 대기"""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,253 @@
+# common/query_recorder.py
+"""
+요청 단위 SQL 기록기 (N+1 탐지 / 쿼리 예산)
+
+개발/테스트 모드에서 요청(또는 테스트 블록) 동안 실행된 SQL을 모아
+- 전체 실행 횟수가 엔드포인트 쿼리 예산을 넘는지
+- 같은 모양(리터럴/바인드 값을 제거한 SQL)이 반복되는지(N+1 의심)
+를 판단합니다.
+
+모드 (QUERY_RECORDER_MODE):
+- off   : 비활성 (운영 기본값, 훅도 설치하지 않음)
+- warn  : 예산 초과/반복 쿼리를 경고 로그로 남김
+- raise : 예산을 넘는 순간 QueryBudgetExceeded 발생 (요청은 500으로 실패)
+
+사용법:
+    # 엔드포인트별 예산 지정
+    @router.get("/likes")
+    @query_budget(3)
+    async def get_liked_products(...): ...
+
+    # 테스트/스크립트에서 블록 단위 기록
+    with record_queries(budget=3, mode="raise") as rec:
+        await get_kok_liked_products(db, user_id=1)
+    assert not rec.repeated_shapes()
+"""
+
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from common.logger import get_logger
+from common.metrics_middleware import DEFAULT_EXCLUDE_PATHS
+
+logger = get_logger("query_recorder")
+
+QUERY_RECORDER_MODES = ("off", "warn", "raise")
+DEFAULT_QUERY_BUDGET = 30
+DEFAULT_REPEAT_THRESHOLD = 5
+
+_STRING_RX = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_RX = re.compile(r"%\(\w+\)s|%s|\?|(?<![:\w]):\w+")
+_NUMBER_RX = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST_RX = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WS_RX = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """엔드포인트/블록의 SQL 실행 횟수가 예산을 초과"""
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    SQL 문을 '모양'으로 정규화
+    - 문자열/숫자 리터럴과 바인드 파라미터를 ? 로 치환
+    - IN (?, ?, ...) 목록은 길이와 무관하게 IN (...) 로 통일
+    - 공백 정리
+    """
+    shape = _STRING_RX.sub("?", statement)
+    shape = _PLACEHOLDER_RX.sub("?", shape)
+    shape = _NUMBER_RX.sub("?", shape)
+    shape = _IN_LIST_RX.sub("IN (...)", shape)
+    return _WS_RX.sub(" ", shape).strip()
+
+
+def query_budget(limit: int) -> Callable:
+    """엔드포인트 함수에 쿼리 예산 지정 (라우터 데코레이터 아래에 선언)"""
+
+    def decorator(func: Callable) -> Callable:
+        func.__query_budget__ = int(limit)
+        return func
+
+    return decorator
+
+
+class QueryRecorder:
+    """요청/블록 1건 동안 실행된 SQL 모양을 기록"""
+
+    def __init__(
+        self,
+        *,
+        budget: Optional[int] = None,
+        mode: str = "warn",
+        repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD,
+        budget_resolver: Optional[Callable[[], Optional[int]]] = None,
+        label: str = "",
+    ):
+        if mode not in QUERY_RECORDER_MODES:
+            raise ValueError(f"지원하지 않는 쿼리 기록 모드: {mode} (사용 가능: {QUERY_RECORDER_MODES})")
+        self.mode = mode
+        self.repeat_threshold = repeat_threshold
+        self.label = label
+        self.statements: List[str] = []
+        self.shapes: Counter = Counter()
+        self._budget = budget
+        self._budget_resolver = budget_resolver
+
+    @property
+    def budget(self) -> Optional[int]:
+        if self._budget_resolver is not None:
+            resolved = self._budget_resolver()
+            if resolved is not None:
+                return resolved
+        return self._budget
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def record(self, statement: str) -> None:
+        """SQL 1건 기록 (raise 모드에서 예산 초과 시 즉시 예외)"""
+        self.statements.append(statement)
+        self.shapes[normalize_statement(statement)] += 1
+        budget = self.budget
+        if self.mode == "raise" and budget is not None and self.count > budget:
+            raise QueryBudgetExceeded(self._budget_message(budget))
+
+    def repeated_shapes(self, threshold: Optional[int] = None) -> Dict[str, int]:
+        """threshold 회 이상 반복된 SQL 모양 (N+1 의심)"""
+        limit = threshold if threshold is not None else self.repeat_threshold
+        return {shape: n for shape, n in self.shapes.most_common() if n >= limit}
+
+    def is_over_budget(self) -> bool:
+        budget = self.budget
+        return budget is not None and self.count > budget
+
+    def _budget_message(self, budget: int) -> str:
+        top = "; ".join(f"{n}x {shape[:120]}" for shape, n in self.shapes.most_common(3))
+        target = f"{self.label}: " if self.label else ""
+        return f"{target}쿼리 예산 초과 ({self.count} > {budget}), 상위 쿼리: {top}"
+
+    def report(self) -> None:
+        """예산 초과/반복 쿼리를 경고 로그로 출력"""
+        budget = self.budget
+        if budget is not None and self.count > budget:
+            logger.warning(self._budget_message(budget))
+        for shape, n in self.repeated_shapes().items():
+            logger.warning(f"N+1 의심 쿼리 반복: {self.label or '-'} {n}회, shape={shape[:200]}")
+
+
+_current_recorder: ContextVar[Optional[QueryRecorder]] = ContextVar("uhok_query_recorder", default=None)
+
+
+def get_current_recorder() -> Optional[QueryRecorder]:
+    return _current_recorder.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        recorder.record(statement)
+
+
+_installed = False
+
+
+def install_query_recorder() -> None:
+    """
+    모든 SQLAlchemy 엔진(Engine 클래스 단위)에 기록 훅 설치
+    - AsyncEngine은 내부 sync Engine을 통해 실행되므로 함께 기록된다
+    - 기록기가 없는 컨텍스트에서는 ContextVar 조회 1회만 수행
+    """
+    global _installed
+    if _installed:
+        return
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    _installed = True
+    logger.info("SQL 기록 훅 설치 완료 (N+1 탐지/쿼리 예산)")
+
+
+@contextmanager
+def use_recorder(recorder: QueryRecorder) -> Iterator[QueryRecorder]:
+    """이미 만든 기록기를 현재 컨텍스트에 활성화"""
+    install_query_recorder()
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+
+
+@contextmanager
+def record_queries(
+    *,
+    budget: Optional[int] = None,
+    mode: str = "warn",
+    repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD,
+    label: str = "",
+) -> Iterator[QueryRecorder]:
+    """블록 단위 SQL 기록 (async 코드에서도 with 로 사용 가능)"""
+    recorder = QueryRecorder(budget=budget, mode=mode, repeat_threshold=repeat_threshold, label=label)
+    try:
+        with use_recorder(recorder):
+            yield recorder
+    finally:
+        if mode == "warn":
+            recorder.report()
+
+
+class QueryRecorderMiddleware:
+    """
+    요청 단위 SQL 기록 미들웨어 (개발/테스트 모드 전용)
+    - 엔드포인트의 @query_budget 값, 없으면 default_budget 을 예산으로 사용
+    - warn: 응답 후 예산 초과/반복 쿼리 경고, raise: 예산 초과 시 요청 실패
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        mode: str = "warn",
+        default_budget: int = DEFAULT_QUERY_BUDGET,
+        repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD,
+        exclude_paths: Sequence[str] = DEFAULT_EXCLUDE_PATHS,
+    ):
+        self.app = app
+        self.mode = mode
+        self.default_budget = default_budget
+        self.repeat_threshold = repeat_threshold
+        self.exclude_paths = tuple(exclude_paths)
+        install_query_recorder()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("path", "").startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        def resolve_budget() -> Optional[int]:
+            endpoint = scope.get("endpoint")
+            return getattr(endpoint, "__query_budget__", None)
+
+        recorder = QueryRecorder(
+            budget=self.default_budget,
+            mode=self.mode,
+            repeat_threshold=self.repeat_threshold,
+            budget_resolver=resolve_budget,
+            label=f"{scope.get('method', '')} {scope.get('path', '')}",
+        )
+        token = _current_recorder.set(recorder)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_recorder.reset(token)
+            route = scope.get("route")
+            if route is not None:
+                recorder.label = f"{scope.get('method', '')} {getattr(route, 'path', scope.get('path', ''))}"
+            recorder.report()
@@ -4,19 +4,25 @@ gateway/main.py
 API Gateway 서비스 진입점.
 각 서비스의 FastAPI router를 통합해서 전체 API 엔드포인트로 제공한다.
 - CORS, 공통 예외처리, 로깅 등 공통 설정도 이곳에서 적용
+- 서비스 라우터는 GATEWAY_SERVICES 설정에 포함된 것만 import/마운트 (gateway.service_registry)
+- DB 엔진은 첫 요청 시 생성되며 종료 시 lifespan에서 정리
+- ML Inference 풀링 HTTP 클라이언트는 lifespan에서 생성/정리
+- 레시피 재료 비트맵 인덱스/레시피명 색인/상품 후보 카탈로그/홈쇼핑 검색 역색인은 lifespan에서 백그라운드 적재/주기 갱신 시작
 """
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from common.config import get_settings
+from common.database.lazy_engine import add_engine_hook, dispose_all_engines
 from common.logger import get_logger
+from common.metrics import instrument_engine, render_metrics
+from common.metrics_middleware import MetricsMiddleware
+from common.query_recorder import QueryRecorderMiddleware
 # from common.http_log_middleware import HttpLogMiddleware  # 미들웨어 비활성화
-from services.user.routers.api_router import router as user_router
-from services.log.routers.api_router import router as log_router
-from services.order.routers.api_router import router as order_router
-from services.homeshopping.routers.api_router import router as homeshopping_router
-from services.kok.routers.api_router import router as kok_router
-from services.recipe.routers.api_router import router as recipe_router
+from gateway.service_registry import load_service_router, resolve_enabled_services, service_label
 
 logger = get_logger("gateway", sqlalchemy_logging={'enable': False})
 logger.info("API Gateway 초기화 시작...")
@@ -40,11 +46,66 @@ except Exception as e:
     logger.error(f"설정 로드 실패: {e}")
     raise
 
+enabled_services = resolve_enabled_services(settings.gateway_services)
+logger.info(f"마운트 대상 서비스: {', '.join(enabled_services)}")
+
+
+# ML Inference 서비스를 호출하는 서비스 (이 서비스가 마운트된 워커만 ML HTTP 클라이언트 생성)
+ML_CLIENT_SERVICES = ("homeshopping", "recipe")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 수명주기: ML HTTP 클라이언트·레시피 인덱스·홈쇼핑 검색 역색인 시작/정리, 종료 시 생성된 DB 엔진 정리"""
+    use_ml_client = any(name in enabled_services for name in ML_CLIENT_SERVICES)
+    use_recipe_indexes = "recipe" in enabled_services
+    use_search_index = "homeshopping" in enabled_services
+    if use_ml_client:
+        from services.recipe.utils.remote_ml_adapter import start_ml_client
+
+        await start_ml_client()
+    if use_recipe_indexes:
+        from services.recipe.utils.material_index import start_material_index
+        from services.recipe.utils.product_candidate_index import start_product_candidate_index
+        from services.recipe.utils.title_index import start_title_index
+
+        start_material_index()
+        start_title_index()
+        start_product_candidate_index()
+    if use_search_index:
+        from services.homeshopping.utils.search_backend import start_search_index
+
+        start_search_index()
+    yield
+    if use_recipe_indexes:
+        from services.recipe.utils.material_index import stop_material_index
+        from services.recipe.utils.product_candidate_index import stop_product_candidate_index
+        from services.recipe.utils.title_index import stop_title_index
+
+        await stop_material_index()
+        await stop_title_index()
+        await stop_product_candidate_index()
+    if use_search_index:
+        from services.homeshopping.utils.search_backend import stop_search_index
+
+        await stop_search_index()
+    if use_ml_client:
+        from services.recipe.utils.remote_ml_adapter import close_ml_client
+
+        await close_ml_client()
+    # 커밋 후 캐시 갱신/무효화 콜백 완료 대기
+    from common.database.after_commit import drain_after_commit_tasks
+
+    await drain_after_commit_tasks()
+    await dispose_all_engines()
+
+
 logger.info(f"FastAPI 애플리케이션 생성: 제목={settings.app_name}, 디버그={settings.debug}")
 
 app = FastAPI(
     title=settings.app_name,
-    debug=settings.debug
+    debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # HTTP 로깅 미들웨어 설정 (비활성화 - 라우터에서만 로깅)
@@ -52,6 +113,23 @@ app = FastAPI(
 # app.add_middleware(HttpLogMiddleware)
 # logger.info("HTTP 로깅 미들웨어 설정 완료")
 
+# 메트릭 설정 (라우트별 지연, 요청당 SQL 횟수/시간, 풀 체크아웃 대기 → /metrics)
+if settings.metrics_enabled:
+    logger.info("메트릭 미들웨어 설정 중...")
+    add_engine_hook(instrument_engine)
+    app.add_middleware(MetricsMiddleware)
+    logger.info("메트릭 미들웨어 설정 완료")
+
+# SQL 기록 설정 (개발/테스트 전용: N+1 의심 쿼리 경고, 엔드포인트별 쿼리 예산)
+if settings.query_recorder_mode != "off":
+    logger.info(f"SQL 기록 미들웨어 설정 중... (mode={settings.query_recorder_mode})")
+    app.add_middleware(
+        QueryRecorderMiddleware,
+        mode=settings.query_recorder_mode,
+        default_budget=settings.query_budget_default,
+    )
+    logger.info("SQL 기록 미들웨어 설정 완료")
+
 # CORS 설정
 logger.info("CORS 미들웨어 설정 중...")
 app.add_middleware(            
@@ -80,29 +158,11 @@ logger.info("CORS 미들웨어 설정 완료")
 
 logger.info("서비스 라우터 등록 중...")
 
-logger.debug("사용자 라우터 포함 중...")
-app.include_router(user_router)
-logger.info("사용자 라우터 포함 완료")
-
-logger.debug("로그 라우터 포함 중...")
-app.include_router(log_router)
-logger.info("로그 라우터 포함 완료")
-
-logger.debug("주문 라우터 포함 중...")
-app.include_router(order_router)
-logger.info("주문 라우터 포함 완료")
-
-logger.debug("홈쇼핑 라우터 포함 중...")
-app.include_router(homeshopping_router)
-logger.info("홈쇼핑 라우터 포함 완료")
-
-logger.debug("콕 라우터 포함 중...")
-app.include_router(kok_router)
-logger.info("콕 라우터 포함 완료")
-
-logger.debug("레시피 라우터 포함 중...")
-app.include_router(recipe_router)
-logger.info("레시피 라우터 포함 완료")
+for service_name in enabled_services:
+    label = service_label(service_name)
+    logger.debug(f"{label} 라우터 포함 중...")
+    app.include_router(load_service_router(service_name))
+    logger.info(f"{label} 라우터 포함 완료")
 
 logger.info("모든 서비스 라우터 등록 완료")
 logger.info("API Gateway 시작 완료")    
@@ -119,6 +179,7 @@ async def health_check():
         "status": "healthy",
         "service": "uhok-backend-gateway",
         "version": "1.0.0",
+        "services": enabled_services,
         "timestamp": "2024-01-01T00:00:00Z"
     }
 
@@ -133,6 +194,19 @@ async def healthz():
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus 스크레이프 엔드포인트
+    - 라우트 템플릿별 요청 지연/건수, 요청당 SQL 실행 횟수/시간
+    - 엔진별 SQL 시간, 커넥션 풀 체크아웃 대기/사용 중 커넥션 수
+    - 캐시 히트/미스, 백그라운드 작업 in-flight 수
+    """
+    if not settings.metrics_enabled:
+        return PlainTextResponse("metrics disabled\n", status_code=404)
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/api/health/ml")
 async def ml_health_check():
     """
@@ -160,9 +234,8 @@ async def ml_health_check():
         }
 
 
-# TODO: 다른 서비스 라우터도 아래와 같이 추가
-# from services.recommend.routers.recommend_router import router as recommend_router
-# app.include_router(recommend_router)
+# TODO: 다른 서비스 라우터는 gateway/service_registry.py의 SERVICE_ROUTERS에 추가
+# "recommend": ("services.recommend.routers.api_router", "추천"),
 
 # 공통 예외 처리 (필요시)
 # from common.errors import *
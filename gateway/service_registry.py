@@ -0,0 +1,67 @@
+"""
+gateway/service_registry.py
+---------------------------
+게이트웨이에 마운트할 서비스 라우터 레지스트리.
+- 서비스 라우터 모듈은 마운트가 결정된 경우에만 import 한다 (지연 import)
+- GATEWAY_SERVICES 설정으로 일부 서비스만 올린 슬림 워커 구성 가능
+  예) GATEWAY_SERVICES=log          → 로그 전용 워커
+      GATEWAY_SERVICES=catalog      → 홈쇼핑/콕 카탈로그 전용 워커
+      GATEWAY_SERVICES=user,order   → 사용자/주문 워커
+"""
+import importlib
+from typing import Dict, List, Tuple
+
+from fastapi import APIRouter
+
+# 서비스명 → (라우터 모듈 경로, 로그 표시명). 등록 순서가 곧 마운트 순서
+SERVICE_ROUTERS: Dict[str, Tuple[str, str]] = {
+    "user": ("services.user.routers.api_router", "사용자"),
+    "log": ("services.log.routers.api_router", "로그"),
+    "order": ("services.order.routers.api_router", "주문"),
+    "homeshopping": ("services.homeshopping.routers.api_router", "홈쇼핑"),
+    "kok": ("services.kok.routers.api_router", "콕"),
+    "recipe": ("services.recipe.routers.api_router", "레시피"),
+}
+
+# 여러 서비스를 묶는 별칭
+SERVICE_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "all": tuple(SERVICE_ROUTERS),
+    "catalog": ("homeshopping", "kok"),
+}
+
+
+def resolve_enabled_services(raw: str) -> List[str]:
+    """
+    GATEWAY_SERVICES 값을 마운트할 서비스 목록으로 변환
+    - 쉼표 구분, 대소문자 무시, 그룹 별칭(all/catalog) 확장
+    - 반환 순서는 SERVICE_ROUTERS 등록 순서를 따른다
+    - 알 수 없는 서비스명이 있으면 ValueError (잘못된 설정으로 빈 워커가 뜨는 것을 방지)
+    """
+    requested = set()
+    for name in (raw or "all").split(","):
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name in SERVICE_GROUPS:
+            requested.update(SERVICE_GROUPS[name])
+        elif name in SERVICE_ROUTERS:
+            requested.add(name)
+        else:
+            available = ", ".join([*SERVICE_ROUTERS, *SERVICE_GROUPS])
+            raise ValueError(f"알 수 없는 서비스명: '{name}' (사용 가능: {available})")
+
+    if not requested:
+        requested.update(SERVICE_GROUPS["all"])
+    return [name for name in SERVICE_ROUTERS if name in requested]
+
+
+def load_service_router(name: str) -> APIRouter:
+    """서비스 라우터 모듈을 import 하여 router 객체 반환"""
+    module_path, _ = SERVICE_ROUTERS[name]
+    module = importlib.import_module(module_path)
+    return module.router
+
+
+def service_label(name: str) -> str:
+    """로그 표시용 서비스 이름"""
+    return SERVICE_ROUTERS[name][1]
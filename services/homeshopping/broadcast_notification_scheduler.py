@@ -27,9 +27,9 @@ class BroadcastNotificationScheduler:
         
         try:
             # 데이터베이스 연결
-            from common.database.mariadb_service import SessionLocal
+            from common.database.mariadb_service import get_session_factory
             
-            async with SessionLocal() as db:
+            async with get_session_factory()() as db:
                 # 현재 시간 기준으로 발송해야 할 알림 조회
                 current_time = datetime.now()
                 pending_notifications = await get_pending_broadcast_notifications(db, current_time)
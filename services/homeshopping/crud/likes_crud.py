@@ -1,15 +1,14 @@
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import and_, select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.cache.membership import HS_LIKE, record_membership
+from common.database.upsert import insert_if_absent
 from services.homeshopping.models.core_model import HomeshoppingList, HomeshoppingProductInfo
 from services.homeshopping.models.interaction_model import HomeshoppingLikes
-from services.homeshopping.crud.notification_crud import (
-    create_broadcast_notification,
-    delete_broadcast_notification,
-)
+from services.homeshopping.crud.notification_crud import create_broadcast_notification
 from .shared import logger
 
 async def toggle_homeshopping_likes(
@@ -18,96 +17,58 @@ async def toggle_homeshopping_likes(
     homeshopping_live_id: int
 ) -> bool:
     """
-    홈쇼핑 방송 찜 등록/해제
-    - live_id를 찜 목록에서 조회한 후 없을 경우 추가
-    - live_id를 찜 목록에서 조회했을 때 있는 경우에는 삭제
+    홈쇼핑 방송 찜 등록/해제 (반환: 토글 후 찜 여부)
+    - (USER_ID, LIVE_ID) 유니크 키에 맡겨 조회 없이 INSERT 1회로 등록 + 방송 시작 알림 생성
+    - 이미 찜한 상태면 DELETE 1회로 해제 (방송 알림은 HOMESHOPPING_LIKE_ID FK 의 ON DELETE CASCADE 로 함께 삭제)
     """
-    # logger.info(f"홈쇼핑 찜 토글 시작: user_id={user_id}, homeshopping_live_id={homeshopping_live_id}")
-
     try:
-        # FOR UPDATE로 동시 요청 시 race condition 방지
-        existing_like_result = await db.execute(
-            select(HomeshoppingLikes)
-            .where(
-                and_(
+        new_like_id = await insert_if_absent(db, HomeshoppingLikes, {
+            HomeshoppingLikes.user_id: user_id,
+            HomeshoppingLikes.live_id: homeshopping_live_id,
+            HomeshoppingLikes.homeshopping_like_created_at: datetime.now(),
+        })
+        if new_like_id is None:
+            # 이미 찜한 상태 → 찜 해제
+            await db.execute(
+                delete(HomeshoppingLikes).where(
                     HomeshoppingLikes.user_id == user_id,
-                    HomeshoppingLikes.live_id == homeshopping_live_id
+                    HomeshoppingLikes.live_id == homeshopping_live_id,
                 )
             )
-            .with_for_update()
-        )
-        existing_like = existing_like_result.scalar_one_or_none()
-        # logger.info(f"기존 찜 조회 결과: {existing_like is not None}")
-
-        if existing_like:
-            # 기존 찜이 있으면 찜 해제
-        # logger.info(f"기존 찜 발견, 찜 해제 처리: like_id={existing_like.homeshopping_like_id}")
-
-            try:
-                # 방송 알림도 함께 삭제
-                await delete_broadcast_notification(db, user_id, existing_like.homeshopping_like_id)
-                # logger.info("방송 알림 삭제 완료")
-            except Exception as e:
-                logger.warning(f"방송 알림 삭제 실패 (무시하고 진행): {str(e)}")
-
-            # 찜 레코드 삭제
-            await db.delete(existing_like)
-            # logger.info("찜 레코드 삭제 완료")
-
-            # logger.info(f"홈쇼핑 찜 해제 완료: user_id={user_id}, homeshopping_live_id={homeshopping_live_id}")
+            record_membership(db, user_id, HS_LIKE, homeshopping_live_id, member=False)
             return False
+    except Exception as e:
+        logger.error(f"홈쇼핑 찜 토글 실패: user_id={user_id}, homeshopping_live_id={homeshopping_live_id}, error={str(e)}")
+        raise
 
-        else:
-            # 기존 찜이 없으면 찜 등록
-            # logger.info(f"새로운 찜 등록 처리: user_id={user_id}, homeshopping_live_id={homeshopping_live_id}")
+    record_membership(db, user_id, HS_LIKE, homeshopping_live_id, member=True)
 
-            # 찜 레코드 생성
-            new_like = HomeshoppingLikes(
+    try:
+        # 방송 정보 조회하여 알림 생성
+        live_info_result = await db.execute(
+            select(HomeshoppingList).where(
+                HomeshoppingList.live_id == homeshopping_live_id
+            )
+        )
+        live_info = live_info_result.scalar_one_or_none()
+
+        if live_info and live_info.live_date and live_info.live_start_time:
+            # 방송 시작 알림 생성
+            await create_broadcast_notification(
+                db=db,
                 user_id=user_id,
+                homeshopping_like_id=new_like_id,
                 live_id=homeshopping_live_id,
-                homeshopping_like_created_at=datetime.now()
+                homeshopping_product_name=live_info.product_name,
+                broadcast_date=live_info.live_date,
+                broadcast_start_time=live_info.live_start_time
             )
-            db.add(new_like)
-            # logger.info("찜 레코드 생성 완료")
-
-            try:
-                # 방송 정보 조회하여 알림 생성
-                # logger.info(f"방송 정보 조회 시작: homeshopping_live_id={homeshopping_live_id}")
-                live_info_result = await db.execute(
-                    select(HomeshoppingList).where(
-                        HomeshoppingList.live_id == homeshopping_live_id
-                    )
-                )
-                live_info = live_info_result.scalar_one_or_none()
-                # logger.info(f"방송 정보 조회 결과: {live_info is not None}")
-
-                if live_info and live_info.live_date and live_info.live_start_time:
-                    # 방송 시작 알림 생성
-                    await create_broadcast_notification(
-                        db=db,
-                        user_id=user_id,
-                        homeshopping_like_id=new_like.homeshopping_like_id,
-                        live_id=homeshopping_live_id,
-                        homeshopping_product_name=live_info.product_name,
-                        broadcast_date=live_info.live_date,
-                        broadcast_start_time=live_info.live_start_time
-                    )
-                    # logger.info(f"방송 시작 알림 생성 완료: like_id={new_like.homeshopping_like_id}")
-                else:
-                    logger.warning("방송 정보가 부족하여 알림을 생성하지 않음")
-            except Exception as e:
-                logger.warning(f"방송 알림 생성 실패 (무시하고 진행): {str(e)}")
-
-            # logger.info(f"홈쇼핑 찜 등록 완료: user_id={user_id}, homeshopping_live_id={homeshopping_live_id}, like_id={new_like.homeshopping_like_id}")
-            return True
-
+        else:
+            logger.warning("방송 정보가 부족하여 알림을 생성하지 않음")
     except Exception as e:
-        logger.error(f"홈쇼핑 찜 토글 실패: user_id={user_id}, homeshopping_live_id={homeshopping_live_id}, error={str(e)}")
-        logger.error(f"에러 타입: {type(e).__name__}")
-        logger.error(f"에러 상세: {str(e)}")
-        import traceback
-        logger.error(f"스택 트레이스: {traceback.format_exc()}")
-        raise
+        logger.warning(f"방송 알림 생성 실패 (무시하고 진행): {str(e)}")
+
+    return True
 
 
 async def get_homeshopping_liked_products(
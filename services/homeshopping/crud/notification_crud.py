@@ -1,9 +1,11 @@
 from datetime import date, datetime, time, timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import and_, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.batch_loader import get_loader
+from common.pagination import keyset_before
 from services.homeshopping.models.core_model import HomeshoppingList, HomeshoppingProductInfo
 from services.homeshopping.models.interaction_model import (
     HomeshoppingLikes,
@@ -149,6 +151,34 @@ async def create_order_status_notification(
         raise
 
 
+async def _fetch_order_product_names(db: AsyncSession, homeshopping_order_ids: List[int]) -> Dict[int, str]:
+    """
+    홈쇼핑 주문 ID 목록 → 상품명 일괄 조회
+    - 상품이 여러 방송에 편성된 경우 가장 이른 방송의 상품명 사용
+    """
+    stmt = (
+        select(HomeShoppingOrder.homeshopping_order_id, HomeshoppingList.product_name)
+        .join(HomeshoppingList, HomeShoppingOrder.product_id == HomeshoppingList.product_id)
+        .where(HomeShoppingOrder.homeshopping_order_id.in_(homeshopping_order_ids))
+        .order_by(
+            HomeShoppingOrder.homeshopping_order_id,
+            HomeshoppingList.live_date.asc(),
+            HomeshoppingList.live_start_time.asc(),
+            HomeshoppingList.live_id.asc(),
+        )
+    )
+    try:
+        rows = (await db.execute(stmt)).all()
+    except Exception as e:
+        logger.warning(f"주문 상품명 일괄 조회 실패: 주문 수={len(homeshopping_order_ids)}, error={str(e)}")
+        return {}
+
+    product_names: Dict[int, str] = {}
+    for order_id, product_name in rows:
+        product_names.setdefault(order_id, product_name)
+    return product_names
+
+
 async def get_notifications_with_filter(
     db: AsyncSession,
     user_id: int,
@@ -156,10 +186,12 @@ async def get_notifications_with_filter(
     related_entity_type: Optional[str] = None,
     is_read: Optional[bool] = None,
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[Tuple[datetime, int]] = None
 ) -> Tuple[List[dict], int]:
     """
     필터링된 알림 조회
+    - cursor(직전 페이지 마지막 알림의 created_at, notification_id) 지정 시 OFFSET 대신 키셋 페이지네이션
     """
     # logger.info(f"필터링된 알림 조회 시작: user_id={user_id}, type={notification_type}, entity_type={related_entity_type}, is_read={is_read}")
     
@@ -187,8 +219,17 @@ async def get_notifications_with_filter(
             logger.error(f"알림 개수 조회 실패: user_id={user_id}, error={str(e)}")
             total_count = 0
         
-        # 페이지네이션 적용
-        query = query.order_by(HomeshoppingNotification.created_at.desc()).offset(offset).limit(limit)
+        # 페이지네이션 적용 (cursor 우선, 없으면 offset)
+        query = query.order_by(
+            HomeshoppingNotification.created_at.desc(),
+            HomeshoppingNotification.notification_id.desc(),
+        )
+        if cursor is not None:
+            query = query.where(
+                keyset_before(HomeshoppingNotification.created_at, HomeshoppingNotification.notification_id, cursor)
+            ).limit(limit)
+        else:
+            query = query.offset(offset).limit(limit)
         
         # 결과 조회
         try:
@@ -198,23 +239,14 @@ async def get_notifications_with_filter(
             logger.error(f"알림 목록 조회 실패: user_id={user_id}, error={str(e)}")
             return [], 0
         
-        for notification in result.scalars().all():
-            # 주문 알림인 경우 상품명 조회
-            product_name = None
-            if notification.homeshopping_order_id:
-                try:
-                    # HomeShoppingOrder와 HomeshoppingList를 조인하여 상품명 조회 (가장 최근 방송 정보에서 선택)
-                    product_query = select(HomeshoppingList.product_name).join(
-                        HomeShoppingOrder, 
-                        HomeShoppingOrder.product_id == HomeshoppingList.product_id
-                    ).where(
-                        HomeShoppingOrder.homeshopping_order_id == notification.homeshopping_order_id
-                    ).order_by(HomeshoppingList.live_date.asc(), HomeshoppingList.live_start_time.asc(), HomeshoppingList.live_id.asc()).limit(1)
-                    product_result = await db.execute(product_query)
-                    product_name = product_result.scalar_one_or_none()
-                except Exception as e:
-                    logger.warning(f"상품명 조회 실패: notification_id={notification.notification_id}, error={str(e)}")
-                    product_name = None
+        rows = result.scalars().all()
+        # 주문 알림의 상품명 일괄 조회 (페이지 크기와 무관하게 쿼리 1회)
+        product_names = await get_loader(
+            db, "hs_order_product_name", _fetch_order_product_names
+        ).load_many(n.homeshopping_order_id for n in rows if n.homeshopping_order_id)
+
+        for notification in rows:
+            product_name = product_names.get(notification.homeshopping_order_id)
             
             notifications.append({
                 "notification_id": notification.notification_id,
@@ -3,6 +3,7 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.cache.membership import HS_LIKE, get_memberships
 from services.homeshopping.models.core_model import (
     HomeshoppingDetailInfo,
     HomeshoppingImgUrl,
@@ -10,7 +11,6 @@ from services.homeshopping.models.core_model import (
     HomeshoppingList,
     HomeshoppingProductInfo,
 )
-from services.homeshopping.models.interaction_model import HomeshoppingLikes
 from .shared import logger
 
 async def get_homeshopping_product_detail(
@@ -20,9 +20,30 @@ async def get_homeshopping_product_detail(
 ) -> Optional[dict]:
     """
     홈쇼핑 상품 상세 정보 조회
+    - 상품/가격/채널 공용 부분은 캐시 우선, 미스 시 DB 조회 후 저장
+    - 찜 여부(is_liked)는 사용자별이므로 캐시하지 않고 조회 시 덧씌움
     """
+    from services.homeshopping.utils.cache_manager import cache_manager
+
     # logger.info(f"홈쇼핑 상품 상세 조회 시작: live_id={live_id}, user_id={user_id}")
-    
+    product_detail = await cache_manager.get_product_detail_cache(live_id)
+    if product_detail is None:
+        product_detail = await _load_homeshopping_product_detail(db, live_id)
+        if product_detail is None:
+            return None
+        await cache_manager.set_product_detail_cache(live_id, product_detail)
+
+    # 찜 상태 확인 (사용자 찜 멤버십 집합)
+    is_liked = False
+    if user_id:
+        is_liked = live_id in (await get_memberships(db, user_id, [HS_LIKE]))[HS_LIKE]
+
+    # logger.info(f"홈쇼핑 상품 상세 조회 완료: live_id={live_id}, user_id={user_id}")
+    return {**product_detail, "product": {**product_detail["product"], "is_liked": is_liked}}
+
+
+async def _load_homeshopping_product_detail(db: AsyncSession, live_id: int) -> Optional[dict]:
+    """방송/상품/채널 + 상세 정보 + 이미지 (사용자와 무관한 공용 부분)"""
     # live_id로 방송 정보 조회 (채널 정보 포함)
     stmt = (
         select(HomeshoppingList, HomeshoppingProductInfo, HomeshoppingInfo)
@@ -44,16 +65,6 @@ async def get_homeshopping_product_detail(
     
     live, product, homeshopping = product_data
     
-    # 찜 상태 확인
-    is_liked = False
-    if user_id:
-        like_stmt = select(HomeshoppingLikes).where(
-            HomeshoppingLikes.user_id == user_id,
-            HomeshoppingLikes.live_id == live_id
-        )
-        like_result = await db.execute(like_stmt)
-        is_liked = like_result.scalars().first() is not None
-    
     # 상세 정보 조회
     detail_stmt = (
         select(HomeshoppingDetailInfo)
@@ -93,7 +104,6 @@ async def get_homeshopping_product_detail(
             "live_start_time": live.live_start_time,
             "live_end_time": live.live_end_time,
             "thumb_img_url": live.thumb_img_url,
-            "is_liked": is_liked,
             
             # 채널 정보 추가
             "homeshopping_id": homeshopping.homeshopping_id if homeshopping else None,
@@ -117,6 +127,4 @@ async def get_homeshopping_product_detail(
             for img in images
         ]
     }
-    
-    # logger.info(f"홈쇼핑 상품 상세 조회 완료: live_id={live_id}, user_id={user_id}")
     return product_detail
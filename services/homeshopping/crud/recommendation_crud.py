@@ -3,10 +3,10 @@ from typing import Dict, List, Optional
 
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from services.homeshopping.models.core_model import HomeshoppingList
-from services.kok.models.product_model import KokProductInfo
+from services.kok.crud.shared import KOK_PRODUCT_CARD_COLUMNS, latest_kok_price_subquery
+from services.kok.models.product_model import KokPriceInfo, KokProductInfo
 from .shared import logger
 
 async def get_homeshopping_product_name(
@@ -53,21 +53,25 @@ async def get_kok_product_infos(
         return []
     
     try:
-        # 실제 FCT_KOK_PRODUCT_INFO 테이블에서 상품 정보 조회 (가격 정보 포함)
+        # 카드 컬럼 + 상품별 최신 할인가 행 1개만 조인 (가격 이력 전체를 엔티티로 올리지 않음)
+        latest_price = latest_kok_price_subquery(kok_product_ids, discounted_only=True)
         stmt = (
-            select(KokProductInfo)
+            select(
+                *KOK_PRODUCT_CARD_COLUMNS,
+                KokPriceInfo.kok_discount_rate,
+                KokPriceInfo.kok_discounted_price,
+            )
+            .outerjoin(latest_price, latest_price.c.kok_product_id == KokProductInfo.kok_product_id)
+            .outerjoin(KokPriceInfo, KokPriceInfo.kok_price_id == latest_price.c.kok_price_id)
             .where(
                 KokProductInfo.kok_product_id.in_(kok_product_ids)
             )
             .order_by(KokProductInfo.kok_review_cnt.desc())  # 리뷰 수 순으로 정렬 (MariaDB 호환)
         )
         
-        # 가격 정보도 함께 로드
-        stmt = stmt.options(selectinload(KokProductInfo.price_infos))
-        
         try:
             result = await db.execute(stmt)
-            kok_products = result.scalars().all()
+            kok_products = result.all()
         except Exception as e:
             logger.error(f"콕 상품 정보 조회 SQL 실행 실패: kok_product_ids={kok_product_ids}, error={str(e)}")
             return []
@@ -75,20 +79,10 @@ async def get_kok_product_infos(
         # 응답 형태로 변환
         products = []
         for product in kok_products:
-            # 할인율 계산 (원가와 할인가가 있을 때)
-            discount_rate = 0
             # kok_product_price를 원가로 사용하고, 할인가가 없으면 원가를 할인가로 사용
             original_price = product.kok_product_price or 0
-            discounted_price = 0
-            
-            # 가격 정보가 있는 경우 할인가 조회
-            if hasattr(product, 'price_infos') and product.price_infos:
-                for price_info in product.price_infos:
-                    if price_info.kok_discounted_price:
-                        discounted_price = price_info.kok_discounted_price
-                        if price_info.kok_discount_rate:
-                            discount_rate = price_info.kok_discount_rate
-                        break
+            discounted_price = product.kok_discounted_price or 0
+            discount_rate = (product.kok_discount_rate or 0) if discounted_price else 0
             
             # 할인가가 없으면 원가를 할인가로 사용
             if discounted_price == 0:
@@ -1,136 +1,335 @@
-import asyncio
-from datetime import date, datetime
-from typing import List, Optional
+"""
+홈쇼핑 편성표 CRUD (일자별 세그먼트 구체화)
 
-from sqlalchemy import text
+편성표를 방영일(live_date) 단위 세그먼트로 구체화해 프로세스 메모리 + Redis에 보관합니다.
+- 워터마크: 날짜별 (행 수, MAX(live_id), 방송 예정 수, 체크섬) — 집계 쿼리 1회,
+  SCHEDULE_WATERMARK_CHECK_SECONDS 간격으로만 확인
+  · 체크섬: 응답에 들어가는 상품명, 식품 분류(HOMESHOPPING_CLASSIFY.cls_food),
+    가격(FCT_HOMESHOPPING_PRODUCT_INFO) 변경도 감지 (행 수/ID 가 같아도 재조회)
+- 워터마크가 바뀐 날짜만 IN (...) 쿼리 1회로 다시 읽고, 나머지는 메모리/Redis 세그먼트 재사용
+- 세그먼트는 SCHEDULE_SEGMENT_MAX_AGE_SECONDS 가 지나면 워터마크와 관계없이 다시 읽음
+  (체크섬이 놓치는 편성 정보 수정, 다른 워커의 캐시 무효화 반영)
+- 전체 편성표는 날짜순 세그먼트 연결, 라이브 배너용 "현재 ± N시간" 구간 조회 지원
+- 반환 dict 는 세그먼트와 공유되므로 호출 측에서 수정하지 않음 (읽기 전용)
+"""
+
+import time as _time
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.homeshopping.utils.cache_manager import cache_manager
 from .shared import logger
 
+SCHEDULE_WATERMARK_CHECK_SECONDS = 30
+SCHEDULE_SEGMENT_MAX_AGE_SECONDS = 7200
+
+Watermark = Tuple[int, int, int, int]
+
+# 세그먼트 행(압축 형식) 컬럼 순서 — live_date 는 세그먼트 키로 대신함
+_ROW_COLUMNS = (
+    "live_id",
+    "homeshopping_id",
+    "homeshopping_name",
+    "homeshopping_channel",
+    "live_start_time",
+    "live_end_time",
+    "promotion_type",
+    "product_id",
+    "product_name",
+    "thumb_img_url",
+    "sale_price",
+    "dc_price",
+    "dc_rate",
+)
+
+_WATERMARK_SQL = """
+SELECT
+    hl.live_date AS live_date,
+    COUNT(*) AS row_count,
+    MAX(hl.live_id) AS max_live_id,
+    COALESCE(SUM(hl.scheduled_or_cancelled), 0) AS scheduled_count,
+    {checksum} AS checksum
+FROM FCT_HOMESHOPPING_LIST hl
+LEFT JOIN HOMESHOPPING_CLASSIFY hc ON hl.product_id = hc.product_id
+LEFT JOIN FCT_HOMESHOPPING_PRODUCT_INFO hpi ON hl.product_id = hpi.product_id
+{where}
+GROUP BY hl.live_date
+"""
+
+# 날짜별 체크섬 — MariaDB 는 행별 CRC32 의 XOR, 그 외(SQLite 테스트)는 live_id 가중 합
+_MARIADB_CHECKSUM = (
+    "COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', hl.live_id, hl.product_name, hc.cls_food, "
+    "hpi.sale_price, hpi.dc_price, hpi.dc_rate))), 0)"
+)
+_PORTABLE_CHECKSUM = (
+    "COALESCE(SUM(hl.live_id * (COALESCE(hc.cls_food, 2) + 3 * COALESCE(hpi.sale_price, 0) "
+    "+ 5 * COALESCE(hpi.dc_price, 0) + 7 * COALESCE(hpi.dc_rate, 0) "
+    "+ 11 * LENGTH(COALESCE(hl.product_name, '')))), 0)"
+)
+
+_DAY_ROWS_SQL = text("""
+SELECT
+    hl.live_id AS live_id,
+    hl.homeshopping_id AS homeshopping_id,
+    hl.live_date AS live_date,
+    hl.live_start_time AS live_start_time,
+    hl.live_end_time AS live_end_time,
+    hl.promotion_type AS promotion_type,
+    hl.product_id AS product_id,
+    hl.product_name AS product_name,
+    hl.thumb_img_url AS thumb_img_url,
+    hi.homeshopping_name AS homeshopping_name,
+    hi.homeshopping_channel AS homeshopping_channel,
+    COALESCE(hpi.sale_price, 0) as sale_price,
+    COALESCE(hpi.dc_price, 0) as dc_price,
+    COALESCE(hpi.dc_rate, 0) as dc_rate
+FROM FCT_HOMESHOPPING_LIST hl
+INNER JOIN HOMESHOPPING_INFO hi ON hl.homeshopping_id = hi.homeshopping_id
+INNER JOIN HOMESHOPPING_CLASSIFY hc ON hl.product_id = hc.product_id
+LEFT JOIN FCT_HOMESHOPPING_PRODUCT_INFO hpi ON hl.product_id = hpi.product_id
+WHERE hl.live_date IN :live_dates
+AND hc.cls_food = 1
+ORDER BY hl.live_date ASC, hl.live_start_time ASC, hl.live_id ASC
+""").bindparams(bindparam("live_dates", expanding=True))
+
+
+@dataclass
+class ScheduleSegment:
+    """방영일 하루치 편성표 (식품만)"""
+
+    watermark: Watermark
+    rows: List[dict]
+    built_at: float  # DB 에서 읽은 시각 (epoch 초, Redis 에 함께 저장)
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return (now or _time.time()) - self.built_at >= SCHEDULE_SEGMENT_MAX_AGE_SECONDS
+
+
+# 프로세스 메모리 세그먼트/워터마크
+_segments: Dict[date, ScheduleSegment] = {}
+_watermarks: Dict[date, Watermark] = {}
+_watermark_checked_at: Dict[str, float] = {}
+
+
+def clear_schedule_segments(live_date: Optional[date] = None) -> None:
+    """
+    프로세스 메모리 편성표 세그먼트 초기화 (Redis 캐시는 유지)
+    - live_date 가 있으면 해당 날짜만, 다음 조회는 워터마크부터 다시 확인
+    """
+    if live_date is None:
+        _segments.clear()
+        _watermarks.clear()
+    else:
+        _segments.pop(live_date, None)
+        _watermarks.pop(live_date, None)
+    _watermark_checked_at.clear()
+
+
+def _to_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _to_time(value) -> Optional[time]:
+    """MariaDB TIME(timedelta)/time/문자열을 time 으로 변환"""
+    if value is None:
+        return None
+    if hasattr(value, "total_seconds"):
+        return (datetime.min + value).time()
+    if isinstance(value, time):
+        return value
+    return time.fromisoformat(str(value))
+
+
+def _compact_row(row) -> list:
+    start_time = _to_time(row.live_start_time)
+    end_time = _to_time(row.live_end_time)
+    return [
+        row.live_id,
+        row.homeshopping_id,
+        row.homeshopping_name,
+        row.homeshopping_channel,
+        start_time.isoformat() if start_time else None,
+        end_time.isoformat() if end_time else None,
+        row.promotion_type,
+        row.product_id,
+        row.product_name,
+        row.thumb_img_url,
+        row.sale_price,
+        row.dc_price,
+        row.dc_rate,
+    ]
+
+
+def _expand_rows(live_date: date, compact_rows: Sequence[list]) -> List[dict]:
+    """압축 행 → 응답 dict (live_date 포함, 시각은 time 객체)"""
+    rows = []
+    for values in compact_rows:
+        item = dict(zip(_ROW_COLUMNS, values))
+        item["live_date"] = live_date
+        item["live_start_time"] = _to_time(item["live_start_time"])
+        item["live_end_time"] = _to_time(item["live_end_time"])
+        rows.append(item)
+    return rows
+
+
+async def _fetch_watermarks(db: AsyncSession, live_date: Optional[date] = None) -> Dict[date, Watermark]:
+    """날짜별 워터마크 조회 (live_date 가 있으면 해당 날짜만)"""
+    where = "WHERE hl.live_date = :live_date" if live_date else ""
+    params = {"live_date": live_date} if live_date else {}
+    dialect = db.get_bind().dialect.name
+    checksum = _MARIADB_CHECKSUM if dialect in ("mysql", "mariadb") else _PORTABLE_CHECKSUM
+    try:
+        result = await db.execute(text(_WATERMARK_SQL.format(checksum=checksum, where=where)), params)
+    except Exception as e:
+        logger.error(f"편성표 워터마크 조회 SQL 실행 실패: live_date={live_date}, error={str(e)}")
+        raise
+    return {
+        _to_date(row.live_date): (
+            int(row.row_count),
+            int(row.max_live_id or 0),
+            int(row.scheduled_count or 0),
+            int(row.checksum or 0),
+        )
+        for row in result.fetchall()
+        if row.live_date is not None
+    }
+
+
+async def _fetch_day_rows(db: AsyncSession, live_dates: List[date]) -> Dict[date, List[list]]:
+    """여러 날짜의 편성표 행을 한 번에 조회 (날짜별 압축 행)"""
+    try:
+        result = await db.execute(_DAY_ROWS_SQL, {"live_dates": live_dates})
+    except Exception as e:
+        logger.error(f"스케줄 조회 Raw SQL 실행 실패: live_dates={live_dates[:5]}, error={str(e)}")
+        raise
+
+    day_rows: Dict[date, List[list]] = {d: [] for d in live_dates}
+    for row in result.fetchall():
+        day_rows.setdefault(_to_date(row.live_date), []).append(_compact_row(row))
+    return day_rows
+
+
+async def _current_watermarks(db: AsyncSession, live_date: Optional[date]) -> Dict[date, Watermark]:
+    """범위(전체 또는 하루)의 워터마크 — 확인 간격 이내면 메모리 값 재사용"""
+    scope = live_date.isoformat() if live_date else "all"
+    now = _time.monotonic()
+    recent = [_watermark_checked_at.get(scope), _watermark_checked_at.get("all")]
+    if any(ts is not None and now - ts < SCHEDULE_WATERMARK_CHECK_SECONDS for ts in recent):
+        if live_date:
+            return {live_date: _watermarks[live_date]} if live_date in _watermarks else {}
+        return dict(_watermarks)
+
+    fetched = await _fetch_watermarks(db, live_date)
+    if live_date:
+        _watermarks.pop(live_date, None)
+        _watermarks.update(fetched)
+    else:
+        # 사라진 날짜는 세그먼트도 제거
+        for stale_day in set(_watermarks) - set(fetched):
+            _segments.pop(stale_day, None)
+        _watermarks.clear()
+        _watermarks.update(fetched)
+    _watermark_checked_at[scope] = now
+    return fetched
+
+
+async def load_schedule_segments(
+    db: AsyncSession,
+    live_date: Optional[date] = None
+) -> Dict[date, ScheduleSegment]:
+    """
+    날짜별 편성표 세그먼트 조회 (날짜 오름차순)
+    - 워터마크가 같고 최대 보관 시간 이내인 세그먼트는 메모리 → Redis 순으로 재사용
+    - 바뀐(또는 오래된) 날짜만 DB 에서 다시 읽어 메모리/Redis 갱신
+    """
+    watermarks = await _current_watermarks(db, live_date)
+    now = _time.time()
+
+    def _reusable(day: date) -> bool:
+        segment = _segments.get(day)
+        return segment is not None and segment.watermark == watermarks[day] and not segment.expired(now)
+
+    stale = [d for d in watermarks if not _reusable(d)]
+    if stale:
+        cached = await cache_manager.get_schedule_segments(stale)
+        for day, payload in cached.items():
+            segment = ScheduleSegment(
+                tuple(payload.get("watermark", ())),
+                _expand_rows(day, payload.get("rows", [])),
+                float(payload.get("built_at") or 0),
+            )
+            if segment.watermark == watermarks[day] and not segment.expired(now):
+                _segments[day] = segment
+
+        to_fetch = [d for d in stale if not _reusable(d)]
+        if to_fetch:
+            logger.info(f"편성표 세그먼트 갱신: {len(to_fetch)}일 (전체 {len(watermarks)}일)")
+            day_rows = await _fetch_day_rows(db, to_fetch)
+            for day in to_fetch:
+                _segments[day] = ScheduleSegment(watermarks[day], _expand_rows(day, day_rows.get(day, [])), now)
+            await cache_manager.set_schedule_segments({
+                day: {"watermark": list(watermarks[day]), "rows": day_rows.get(day, []), "built_at": now}
+                for day in to_fetch
+            })
+
+    return {day: _segments[day] for day in sorted(watermarks)}
+
+
 async def get_homeshopping_schedule(
     db: AsyncSession,
     live_date: Optional[date] = None
 ) -> List[dict]:
     """
-    홈쇼핑 편성표 조회 (식품만) - 캐싱 최적화 버전
-    - live_date가 제공되면 해당 날짜의 스케줄만 조회
-    - live_date가 None이면 전체 스케줄 조회
-    - Redis 캐싱으로 성능 최적화
+    홈쇼핑 편성표 조회 (식품만)
+    - live_date가 제공되면 해당 날짜 세그먼트만 반환
+    - live_date가 None이면 전체 날짜 세그먼트를 날짜순으로 연결
     - 제한 없이 모든 결과 반환
     """
     logger.info(f"홈쇼핑 편성표 조회 시작: live_date={live_date}")
-    
-    # Redis 캐시 활성화
-    cached_result = await cache_manager.get_schedule_cache(live_date)
-    if cached_result:
-        schedules = cached_result
-        logger.info(f"캐시에서 스케줄 조회 완료: 결과 수={len(schedules)}")
-        return schedules
-    
-    # DB에서 직접 조회
-    logger.info("DB에서 스케줄 조회 (캐시 미스)")
-    
-    # 극한 최적화: 더 간단한 Raw SQL 사용
-    # live_date에 따라 다른 쿼리 사용
-    if live_date:
-        # 특정 날짜 조회 - 가격 정보 포함
-        sql_query = """
-        SELECT 
-            hl.live_id,
-            hl.homeshopping_id,
-            hl.live_date,
-            hl.live_start_time,
-            hl.live_end_time,
-            hl.promotion_type,
-            hl.product_id,
-            hl.product_name,
-            hl.thumb_img_url,
-            hi.homeshopping_name,
-            hi.homeshopping_channel,
-            COALESCE(hpi.sale_price, 0) as sale_price,
-            COALESCE(hpi.dc_price, 0) as dc_price,
-            COALESCE(hpi.dc_rate, 0) as dc_rate
-        FROM FCT_HOMESHOPPING_LIST hl
-        INNER JOIN HOMESHOPPING_INFO hi ON hl.homeshopping_id = hi.homeshopping_id
-        INNER JOIN HOMESHOPPING_CLASSIFY hc ON hl.product_id = hc.product_id
-        LEFT JOIN FCT_HOMESHOPPING_PRODUCT_INFO hpi ON hl.product_id = hpi.product_id
-        WHERE hl.live_date = :live_date
-        AND hc.cls_food = 1
-        ORDER BY hl.live_date ASC, hl.live_start_time ASC, hl.live_id ASC
-        """
-        params = {"live_date": live_date}
-    else:
-        # 전체 스케줄 조회 - 가격 정보 포함
-        sql_query = """
-        SELECT 
-            hl.live_id,
-            hl.homeshopping_id,
-            hl.live_date,
-            hl.live_start_time,
-            hl.live_end_time,
-            hl.promotion_type,
-            hl.product_id,
-            hl.product_name,
-            hl.thumb_img_url,
-            hi.homeshopping_name,
-            hi.homeshopping_channel,
-            COALESCE(hpi.sale_price, 0) as sale_price,
-            COALESCE(hpi.dc_price, 0) as dc_price,
-            COALESCE(hpi.dc_rate, 0) as dc_rate
-        FROM FCT_HOMESHOPPING_LIST hl
-        INNER JOIN HOMESHOPPING_INFO hi ON hl.homeshopping_id = hi.homeshopping_id
-        INNER JOIN HOMESHOPPING_CLASSIFY hc ON hl.product_id = hc.product_id
-        LEFT JOIN FCT_HOMESHOPPING_PRODUCT_INFO hpi ON hl.product_id = hpi.product_id
-        WHERE hc.cls_food = 1
-        ORDER BY hl.live_date ASC, hl.live_start_time ASC, hl.live_id ASC
-        """
-        params = {}
-    
-    # Raw SQL 실행
-    # logger.info("최적화된 Raw SQL로 스케줄 데이터 조회 시작")
-    try:
-        result = await db.execute(text(sql_query), params)
-        schedules = result.fetchall()
-    except Exception as e:
-        logger.error(f"스케줄 조회 Raw SQL 실행 실패: live_date={live_date}, error={str(e)}")
-        raise
-    
-    # 결과 변환 - 시간 타입 처리
-    schedule_list = []
-    for row in schedules:
-        # timedelta를 time으로 변환
-        start_time = row.live_start_time
-        end_time = row.live_end_time
-        
-        if hasattr(start_time, 'total_seconds'):
-            # timedelta인 경우 time으로 변환
-            start_time = (datetime.min + start_time).time()
-        if hasattr(end_time, 'total_seconds'):
-            # timedelta인 경우 time으로 변환
-            end_time = (datetime.min + end_time).time()
-        
-        schedule_list.append({
-            "live_id": row.live_id,
-            "homeshopping_id": row.homeshopping_id,
-            "homeshopping_name": row.homeshopping_name,
-            "homeshopping_channel": row.homeshopping_channel,
-            "live_date": row.live_date,
-            "live_start_time": start_time,
-            "live_end_time": end_time,
-            "promotion_type": row.promotion_type,
-            "product_id": row.product_id,
-            "product_name": row.product_name,
-            "thumb_img_url": row.thumb_img_url,
-            "sale_price": row.sale_price,
-            "dc_price": row.dc_price,
-            "dc_rate": row.dc_rate
-        })
-    
-    # Redis 캐시 저장 활성화
-    asyncio.create_task(
-        cache_manager.set_schedule_cache(schedule_list, live_date)
-    )
-    
+
+    segments = await load_schedule_segments(db, live_date)
+    schedule_list = [row for segment in segments.values() for row in segment.rows]
+
     logger.info(f"홈쇼핑 편성표 조회 완료: live_date={live_date}, 결과 수={len(schedule_list)}")
     return schedule_list
+
+
+async def get_homeshopping_schedule_window(
+    db: AsyncSession,
+    center: Optional[datetime] = None,
+    hours: int = 2
+) -> List[dict]:
+    """
+    기준 시각 ± hours 구간에 방송되는 편성표 조회 (라이브 배너용)
+    - 자정을 넘기는 방송을 위해 전날 세그먼트부터 확인
+    - 방송 구간이 조회 구간과 겹치면 포함, 시작 시각순 정렬
+    """
+    center = center or datetime.now()
+    window_start = center - timedelta(hours=hours)
+    window_end = center + timedelta(hours=hours)
+
+    selected = []
+    day = window_start.date() - timedelta(days=1)
+    while day <= window_end.date():
+        for segment in (await load_schedule_segments(db, day)).values():
+            for row in segment.rows:
+                if row["live_start_time"] is None or row["live_end_time"] is None:
+                    continue
+                start_dt = datetime.combine(day, row["live_start_time"])
+                end_dt = datetime.combine(day, row["live_end_time"])
+                if end_dt <= start_dt:
+                    end_dt += timedelta(days=1)
+                if start_dt < window_end and end_dt > window_start:
+                    selected.append((start_dt, row["live_id"], row))
+        day += timedelta(days=1)
+
+    selected.sort(key=lambda item: (item[0], item[1]))
+    return [row for _, _, row in selected]
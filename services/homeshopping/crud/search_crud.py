@@ -1,42 +1,61 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.pagination import keyset_before
+
 from services.homeshopping.models.core_model import HomeshoppingList, HomeshoppingProductInfo
 from services.homeshopping.models.interaction_model import HomeshoppingSearchHistory
+from services.homeshopping.utils.search_backend import search_live_ids
 from .shared import logger
 
-async def search_homeshopping_products(
+async def search_homeshopping_products_page(
     db: AsyncSession,
-    keyword: str
-) -> List[dict]:
+    keyword: str,
+    page: int = 1,
+    size: Optional[int] = None
+) -> Tuple[List[dict], int]:
     """
-    홈쇼핑 상품 검색
+    홈쇼핑 상품 검색 (관련도순, 페이지 단위)
+    - 검색 백엔드(FULLTEXT 또는 메모리 역색인)로 live_id 페이지와 전체 건수 조회
+    - 페이지 상세는 live_id IN (...) 쿼리 1회로 조회
+    - size가 None이면 전체 결과 반환
     """
-    # logger.info(f"홈쇼핑 상품 검색 시작: keyword='{keyword}'")
+    # logger.info(f"홈쇼핑 상품 검색 시작: keyword='{keyword}', page={page}, size={size}")
+    
+    if not keyword or not keyword.strip():
+        return [], 0
+    
+    try:
+        live_ids, total = await search_live_ids(db, keyword, page, size)
+    except Exception as e:
+        logger.error(f"홈쇼핑 상품 검색 실행 실패: keyword='{keyword}', error={str(e)}")
+        raise
+    
+    if not live_ids:
+        return [], total
     
-    # 상품명, 판매자명에서 키워드 검색
+    # 상품명, 판매자명 상세 조회 (검색 백엔드 순서 유지)
     stmt = (
         select(HomeshoppingList, HomeshoppingProductInfo)
         .join(HomeshoppingProductInfo, HomeshoppingList.product_id == HomeshoppingProductInfo.product_id)
-        .where(
-            HomeshoppingList.product_name.contains(keyword) |
-            HomeshoppingProductInfo.store_name.contains(keyword)
-        )
-        .order_by(HomeshoppingList.live_date.asc(), HomeshoppingList.live_start_time.asc(), HomeshoppingList.live_id.asc())
+        .where(HomeshoppingList.live_id.in_(live_ids))
     )
     
     try:
         results = await db.execute(stmt)
-        products = results.all()
+        products = {live.live_id: (live, product) for live, product in results.all()}
     except Exception as e:
         logger.error(f"홈쇼핑 상품 검색 SQL 실행 실패: keyword='{keyword}', error={str(e)}")
         raise
     
     product_list = []
-    for live, product in products:
+    for live_id in live_ids:
+        if live_id not in products:
+            continue
+        live, product = products[live_id]
         product_list.append({
             "live_id": live.live_id,
             "product_id": live.product_id,
@@ -51,7 +70,18 @@ async def search_homeshopping_products(
             "live_end_time": live.live_end_time
         })
     
-    # logger.info(f"홈쇼핑 상품 검색 완료: keyword='{keyword}', 결과 수={len(product_list)}")
+    # logger.info(f"홈쇼핑 상품 검색 완료: keyword='{keyword}', 결과 수={len(product_list)}, 전체={total}")
+    return product_list, total
+
+
+async def search_homeshopping_products(
+    db: AsyncSession,
+    keyword: str
+) -> List[dict]:
+    """
+    홈쇼핑 상품 검색 (전체 결과, 관련도순)
+    """
+    product_list, _ = await search_homeshopping_products_page(db, keyword)
     return product_list
 
 
@@ -102,10 +132,12 @@ async def add_homeshopping_search_history(
 async def get_homeshopping_search_history(
     db: AsyncSession,
     user_id: int,
-    limit: int = 5
+    limit: int = 5,
+    cursor: Optional[Tuple[datetime, int]] = None
 ) -> List[dict]:
     """
     홈쇼핑 검색 이력 조회
+    - cursor(직전 페이지 마지막 이력의 homeshopping_searched_at, homeshopping_history_id) 지정 시 다음 페이지
     """
     # logger.info(f"홈쇼핑 검색 이력 조회 시작: user_id={user_id}, limit={limit}")
     
@@ -121,9 +153,20 @@ async def get_homeshopping_search_history(
     stmt = (
         select(HomeshoppingSearchHistory)
         .where(HomeshoppingSearchHistory.user_id == user_id)
-        .order_by(HomeshoppingSearchHistory.homeshopping_searched_at.desc())
+        .order_by(
+            HomeshoppingSearchHistory.homeshopping_searched_at.desc(),
+            HomeshoppingSearchHistory.homeshopping_history_id.desc(),
+        )
         .limit(limit)
     )
+    if cursor is not None:
+        stmt = stmt.where(
+            keyset_before(
+                HomeshoppingSearchHistory.homeshopping_searched_at,
+                HomeshoppingSearchHistory.homeshopping_history_id,
+                cursor,
+            )
+        )
     
     results = await db.execute(stmt)
     history = results.scalars().all()
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Column, Date, Enum, ForeignKey, Integer, SMALLINT, String, Text, Time
+from sqlalchemy import BigInteger, Column, Date, Enum, ForeignKey, Index, Integer, SMALLINT, String, Text, Time
 from sqlalchemy.orm import relationship
 
 from common.database.base_mariadb import MariaBase
@@ -23,6 +23,10 @@ class HomeshoppingInfo(MariaBase):
 class HomeshoppingList(MariaBase):
     """홈쇼핑 라이브 목록 테이블"""
     __tablename__ = "FCT_HOMESHOPPING_LIST"
+    __table_args__ = (
+        # 편성표 일자별 워터마크(행 수/MAX(live_id)/예정 수) 집계를 인덱스만으로 처리
+        Index("IX_HS_LIST_DATE_LIVE_SCHEDULED", "LIVE_DATE", "LIVE_ID", "SCHEDULED_OR_CANCELLED"),
+    )
     
     live_id = Column("LIVE_ID", Integer, primary_key=True, comment="라이브 인덱스")
     homeshopping_id = Column("HOMESHOPPING_ID", SMALLINT, ForeignKey("HOMESHOPPING_INFO.HOMESHOPPING_ID"), comment="홈쇼핑 인덱스")
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, SMALLINT, String, UniqueConstraint
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, SMALLINT, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from common.database.base_mariadb import MariaBase
@@ -39,6 +39,11 @@ class HomeshoppingSearchHistory(MariaBase):
     homeshopping_keyword = Column("HOMESHOPPING_KEYWORD", String(100), nullable=False, comment="검색 키워드")
     homeshopping_searched_at = Column("HOMESHOPPING_SEARCHED_AT", DateTime, nullable=False, comment="검색 시간")
 
+    __table_args__ = (
+        # 검색 이력 키셋 페이지네이션
+        Index("IX_HS_SEARCH_HISTORY_USER_TIME_ID", "USER_ID", "HOMESHOPPING_SEARCHED_AT", "HOMESHOPPING_HISTORY_ID"),
+    )
+
 
 class HomeshoppingLikes(MariaBase):
     """홈쇼핑 찜 테이블"""
@@ -49,6 +54,11 @@ class HomeshoppingLikes(MariaBase):
     live_id = Column("LIVE_ID", Integer, ForeignKey("FCT_HOMESHOPPING_LIST.LIVE_ID", ondelete="RESTRICT"), nullable=False, comment="방송 ID (FK)")
     homeshopping_like_created_at = Column("HOMESHOPPING_LIKE_CREATED_AT", DateTime, nullable=False, comment="찜한 시간")
 
+    __table_args__ = (
+        # 사용자별 방송 찜 1건 (찜 토글의 INSERT ... ON DUPLICATE KEY 기준)
+        UniqueConstraint("USER_ID", "LIVE_ID", name="UK_HOMESHOPPING_LIKES_USER_LIVE"),
+    )
+
     # 방송 정보와 N:1 관계 설정
     live_info = relationship(
         "HomeshoppingList",
@@ -84,6 +94,12 @@ class HomeshoppingNotification(MariaBase):
     is_read = Column("IS_READ", SMALLINT, nullable=False, default=0, comment="읽음 여부 (0: 안읽음, 1: 읽음)")
     created_at = Column("CREATED_AT", DateTime, nullable=False, server_default='current_timestamp()', comment='알림 생성 시각')
     read_at = Column("READ_AT", DateTime, nullable=True, comment="읽음 처리 시각")
+
+    __table_args__ = (
+        # 알림 목록 키셋 페이지네이션 (전체 / 타입별)
+        Index("IX_HS_NOTIFICATION_USER_TIME_ID", "USER_ID", "CREATED_AT", "NOTIFICATION_ID"),
+        Index("IX_HS_NOTIFICATION_USER_TYPE_TIME_ID", "USER_ID", "NOTIFICATION_TYPE", "CREATED_AT", "NOTIFICATION_ID"),
+    )
     
     # 관계 설정
     homeshopping_order = relationship("HomeShoppingOrder", back_populates="notifications", lazy="noload")
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -6,6 +8,8 @@ from common.dependencies import get_current_user
 from common.http_dependencies import extract_http_info
 from common.log_utils import send_user_log
 from common.logger import get_logger
+from common.pagination import build_next_cursor, parse_cursor_param
+from common.query_recorder import query_budget
 from services.homeshopping.crud.notification_crud import (
     get_notifications_with_filter,
     mark_notification_as_read,
@@ -17,10 +21,12 @@ logger = get_logger("homeshopping_router", level="DEBUG")
 router = APIRouter()
 
 @router.get("/notifications/orders", response_model=HomeshoppingNotificationListResponse)
+@query_budget(5)
 async def get_order_notifications_api(
         request: Request,
         limit: int = Query(20, ge=1, le=100, description="조회할 주문 알림 개수"),
-        offset: int = Query(0, ge=0, description="시작 위치"),
+        offset: int = Query(0, ge=0, description="시작 위치 (cursor 미지정 시)"),
+        cursor: Optional[str] = Query(None, description="다음 페이지 커서 (직전 응답의 next_cursor, 지정 시 offset 무시)"),
         current_user: UserOut = Depends(get_current_user),
         background_tasks: BackgroundTasks = None,
         db: AsyncSession = Depends(get_maria_service_db)
@@ -31,13 +37,15 @@ async def get_order_notifications_api(
     logger.debug(f"홈쇼핑 주문 알림 조회 시작: user_id={current_user.user_id}, limit={limit}, offset={offset}")
     logger.info(f"홈쇼핑 주문 알림 조회 요청: user_id={current_user.user_id}, limit={limit}, offset={offset}")
     
+    after = parse_cursor_param(cursor)
     try:
         notifications, total_count = await get_notifications_with_filter(
             db, 
             current_user.user_id, 
             notification_type="order_status",
             limit=limit, 
-            offset=offset
+            offset=offset,
+            cursor=after
         )
         logger.debug(f"주문 알림 조회 성공: user_id={current_user.user_id}, 결과 수={len(notifications)}, 전체={total_count}")
         
@@ -59,11 +67,15 @@ async def get_order_notifications_api(
         
         logger.info(f"홈쇼핑 주문 알림 조회 완료: user_id={current_user.user_id}, 결과 수={len(notifications)}, 전체 개수={total_count}")
         
-        has_more = (offset + limit) < total_count
+        next_cursor = build_next_cursor(
+            notifications, limit, lambda n: (n["created_at"], n["notification_id"])
+        )
+        has_more = next_cursor is not None if after is not None else (offset + limit) < total_count
         return {
             "notifications": notifications,
             "total_count": total_count,
-            "has_more": has_more
+            "has_more": has_more,
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
@@ -72,10 +84,12 @@ async def get_order_notifications_api(
 
 
 @router.get("/notifications/broadcasts", response_model=HomeshoppingNotificationListResponse)
+@query_budget(5)
 async def get_broadcast_notifications_api(
         request: Request,
         limit: int = Query(20, ge=1, le=100, description="조회할 방송 알림 개수"),
-        offset: int = Query(0, ge=0, description="시작 위치"),
+        offset: int = Query(0, ge=0, description="시작 위치 (cursor 미지정 시)"),
+        cursor: Optional[str] = Query(None, description="다음 페이지 커서 (직전 응답의 next_cursor, 지정 시 offset 무시)"),
         current_user: UserOut = Depends(get_current_user),
         background_tasks: BackgroundTasks = None,
         db: AsyncSession = Depends(get_maria_service_db)
@@ -86,13 +100,15 @@ async def get_broadcast_notifications_api(
     logger.debug(f"홈쇼핑 방송 알림 조회 시작: user_id={current_user.user_id}, limit={limit}, offset={offset}")
     logger.info(f"홈쇼핑 방송 알림 조회 요청: user_id={current_user.user_id}, limit={limit}, offset={offset}")
     
+    after = parse_cursor_param(cursor)
     try:
         notifications, total_count = await get_notifications_with_filter(
             db, 
             current_user.user_id, 
             notification_type="broadcast_start",
             limit=limit, 
-            offset=offset
+            offset=offset,
+            cursor=after
         )
         logger.debug(f"방송 알림 조회 성공: user_id={current_user.user_id}, 결과 수={len(notifications)}, 전체={total_count}")
         
@@ -114,11 +130,15 @@ async def get_broadcast_notifications_api(
         
         logger.info(f"홈쇼핑 방송 알림 조회 완료: user_id={current_user.user_id}, 결과 수={len(notifications)}, 전체 개수={total_count}")
         
-        has_more = (offset + limit) < total_count
+        next_cursor = build_next_cursor(
+            notifications, limit, lambda n: (n["created_at"], n["notification_id"])
+        )
+        has_more = next_cursor is not None if after is not None else (offset + limit) < total_count
         return {
             "notifications": notifications,
             "total_count": total_count,
-            "has_more": has_more
+            "has_more": has_more,
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
@@ -127,10 +147,12 @@ async def get_broadcast_notifications_api(
 
 
 @router.get("/notifications/all", response_model=HomeshoppingNotificationListResponse)
+@query_budget(5)
 async def get_all_notifications_api(
         request: Request,
         limit: int = Query(20, ge=1, le=100, description="조회할 알림 개수"),
-        offset: int = Query(0, ge=0, description="시작 위치"),
+        offset: int = Query(0, ge=0, description="시작 위치 (cursor 미지정 시)"),
+        cursor: Optional[str] = Query(None, description="다음 페이지 커서 (직전 응답의 next_cursor, 지정 시 offset 무시)"),
         current_user: UserOut = Depends(get_current_user),
         background_tasks: BackgroundTasks = None,
         db: AsyncSession = Depends(get_maria_service_db)
@@ -141,12 +163,14 @@ async def get_all_notifications_api(
     logger.debug(f"홈쇼핑 모든 알림 통합 조회 시작: user_id={current_user.user_id}, limit={limit}, offset={offset}")
     logger.info(f"홈쇼핑 모든 알림 통합 조회 요청: user_id={current_user.user_id}, limit={limit}, offset={offset}")
     
+    after = parse_cursor_param(cursor)
     try:
         notifications, total_count = await get_notifications_with_filter(
             db, 
             current_user.user_id, 
             limit=limit, 
-            offset=offset
+            offset=offset,
+            cursor=after
         )
         logger.debug(f"모든 알림 통합 조회 성공: user_id={current_user.user_id}, 결과 수={len(notifications)}, 전체={total_count}")
         
@@ -168,11 +192,15 @@ async def get_all_notifications_api(
         
         logger.info(f"홈쇼핑 모든 알림 통합 조회 완료: user_id={current_user.user_id}, 결과 수={len(notifications)}, 전체 개수={total_count}")
         
-        has_more = (offset + limit) < total_count
+        next_cursor = build_next_cursor(
+            notifications, limit, lambda n: (n["created_at"], n["notification_id"])
+        )
+        has_more = next_cursor is not None if after is not None else (offset + limit) < total_count
         return {
             "notifications": notifications,
             "total_count": total_count,
-            "has_more": has_more
+            "has_more": has_more,
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
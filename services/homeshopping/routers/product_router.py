@@ -1,4 +1,6 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.database.mariadb_service import get_maria_service_db
@@ -8,10 +10,31 @@ from common.log_utils import send_user_log
 from common.logger import get_logger
 from services.homeshopping.crud.product_crud import get_homeshopping_product_detail
 from services.homeshopping.schemas.product_schema import HomeshoppingProductDetailResponse
+from services.homeshopping.utils.cache_manager import cache_manager
 
 logger = get_logger("homeshopping_router", level="DEBUG")
 router = APIRouter()
 
+@router.post("/cache/invalidate/product-detail")
+async def invalidate_product_detail_cache(
+        live_id: Optional[int] = Query(None, description="특정 방송 캐시만 무효화할 경우 방송 ID")
+):
+    """
+    홈쇼핑 상품 상세 캐시 무효화 (상품·가격 적재 후 호출)
+    - live_id 미입력: 전체 상품 상세 캐시 삭제
+    - live_id 입력: 해당 방송 상품 상세 캐시만 삭제
+    """
+    logger.debug(f"상품 상세 캐시 무효화 시작: live_id={live_id}")
+
+    try:
+        deleted_count = await cache_manager.invalidate_product_detail_cache(live_id=live_id)
+        logger.info(f"상품 상세 캐시 무효화 완료: live_id={live_id}, 삭제된 키 수={deleted_count}")
+        return {"message": "상품 상세 캐시가 무효화되었습니다.", "deleted_count": deleted_count}
+    except Exception as e:
+        logger.error(f"상품 상세 캐시 무효화 실패: live_id={live_id}, error={str(e)}")
+        raise HTTPException(status_code=500, detail=f"캐시 무효화 중 오류가 발생했습니다: {str(e)}")
+
+
 @router.get("/product/{live_id}", response_model=HomeshoppingProductDetailResponse)
 async def get_product_detail(
         request: Request,
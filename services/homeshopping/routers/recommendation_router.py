@@ -251,7 +251,7 @@ async def get_recipe_recommendations_for_product(
         vector_searcher = await get_remote_ml_searcher()
         
         logger.debug(f"레시피 추천 실행: method=ingredient, query={keywords_query}")
-        recipes_df = await recommend_by_recipe_pgvector_v2(
+        recipe_records = await recommend_by_recipe_pgvector_v2(
             mariadb=db,
             postgres=None,
             vector_searcher=vector_searcher,
@@ -261,14 +261,14 @@ async def get_recipe_recommendations_for_product(
             size=10,
             include_materials=True
         )
-        logger.debug(f"레시피 추천 결과: DataFrame 크기={len(recipes_df)}")
+        logger.debug(f"레시피 추천 결과: 레코드 수={len(recipe_records)}")
         
-        # 9. DataFrame을 RecipeRecommendation 형태로 변환
-        logger.debug("DataFrame을 RecipeRecommendation 형태로 변환 시작")
+        # 9. 레코드를 RecipeRecommendation 형태로 변환
+        logger.debug("레시피 레코드를 RecipeRecommendation 형태로 변환 시작")
         recipes = []
-        if not recipes_df.empty:
-            logger.debug(f"레시피 데이터 변환: {len(recipes_df)}개 레시피 처리")
-            for _, row in recipes_df.iterrows():
+        if recipe_records:
+            logger.debug(f"레시피 데이터 변환: {len(recipe_records)}개 레시피 처리")
+            for row in recipe_records:
                 recipe = {
                     "recipe_id": int(row.get("RECIPE_ID", 0)),
                     "recipe_name": str(row.get("RECIPE_TITLE", "")),
@@ -280,7 +280,7 @@ async def get_recipe_recommendations_for_product(
                 }
                 
                 # 재료 정보가 있는 경우 추가
-                if "MATERIALS" in row and row["MATERIALS"]:
+                if row.get("MATERIALS"):
                     for material in row["MATERIALS"]:
                         material_name = material.get("MATERIAL_NAME", "")
                         if material_name:
@@ -9,7 +9,10 @@ from common.dependencies import get_current_user_optional
 from common.http_dependencies import extract_http_info
 from common.log_utils import send_user_log
 from common.logger import get_logger
-from services.homeshopping.crud.schedule_crud import get_homeshopping_schedule
+from services.homeshopping.crud.schedule_crud import (
+    get_homeshopping_schedule,
+    get_homeshopping_schedule_window,
+)
 from services.homeshopping.schemas.schedule_schema import HomeshoppingScheduleResponse
 
 logger = get_logger("homeshopping_router", level="DEBUG")
@@ -19,6 +22,7 @@ router = APIRouter()
 async def get_schedule(
         request: Request,
         live_date: Optional[date] = Query(None, description="조회할 날짜 (YYYY-MM-DD 형식, 미입력시 전체 스케줄)"),
+        window_hours: Optional[int] = Query(None, ge=1, le=24, description="현재 시각 ± N시간 방송만 조회 (라이브 배너용, live_date보다 우선)"),
         background_tasks: BackgroundTasks = None,
         db: AsyncSession = Depends(get_maria_service_db)
 ):
@@ -26,6 +30,7 @@ async def get_schedule(
     홈쇼핑 편성표 조회 (식품만) - 최적화된 버전
     - live_date가 제공되면 해당 날짜의 스케줄만 조회
     - live_date가 미입력시 전체 스케줄 조회
+    - window_hours가 제공되면 현재 시각 ± N시간 구간 방송만 조회
     - 제한 없이 모든 결과 반환
     """
     logger.debug(f"홈쇼핑 편성표 조회 시작: live_date={live_date}")
@@ -40,10 +45,13 @@ async def get_schedule(
     
     try:
         logger.info(f"=== 라우터에서 get_homeshopping_schedule 호출 시작 ===")
-        schedules = await get_homeshopping_schedule(
-            db, 
-            live_date=live_date
-        )
+        if window_hours:
+            schedules = await get_homeshopping_schedule_window(db, hours=window_hours)
+        else:
+            schedules = await get_homeshopping_schedule(
+                db, 
+                live_date=live_date
+            )
         logger.info(f"=== 라우터에서 get_homeshopping_schedule 호출 완료: 결과={len(schedules)} ===")
         logger.debug(f"편성표 조회 성공: 결과 수={len(schedules)}")
     except Exception as e:
@@ -59,6 +67,7 @@ async def get_schedule(
             event_type="homeshopping_schedule_view", 
             event_data={
                 "live_date": live_date.isoformat() if live_date else None,
+                "window_hours": window_hours,
                 "total_count": len(schedules)
             },
             **http_info  # HTTP 정보를 키워드 인자로 전달
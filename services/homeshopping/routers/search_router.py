@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -6,11 +8,12 @@ from common.dependencies import get_current_user, get_current_user_optional
 from common.http_dependencies import extract_http_info
 from common.log_utils import send_user_log
 from common.logger import get_logger
+from common.pagination import build_next_cursor, parse_cursor_param
 from services.homeshopping.crud.search_crud import (
     add_homeshopping_search_history,
     delete_homeshopping_search_history,
     get_homeshopping_search_history,
-    search_homeshopping_products,
+    search_homeshopping_products_page,
 )
 from services.homeshopping.schemas.search_schema import (
     HomeshoppingSearchHistoryCreate,
@@ -28,13 +31,16 @@ router = APIRouter()
 async def search_products(
         request: Request,
         keyword: str = Query(..., description="검색 키워드"),
+        page: int = Query(1, ge=1, description="페이지 번호"),
+        size: Optional[int] = Query(None, ge=1, le=100, description="페이지 크기 (미지정 시 전체 결과)"),
         background_tasks: BackgroundTasks = None,
         db: AsyncSession = Depends(get_maria_service_db)
 ):
     """
     홈쇼핑 상품 검색
+    - 관련도순 정렬, page/size 지정 시 해당 페이지만 반환 (total은 전체 건수)
     """
-    logger.debug(f"홈쇼핑 상품 검색 시작: keyword='{keyword}'")
+    logger.debug(f"홈쇼핑 상품 검색 시작: keyword='{keyword}', page={page}, size={size}")
     
     current_user = await get_current_user_optional(request)
     user_id = current_user.user_id if current_user else None
@@ -45,7 +51,7 @@ async def search_products(
     logger.info(f"홈쇼핑 상품 검색 요청: user_id={user_id}, keyword='{keyword}'")
     
     try:
-        products = await search_homeshopping_products(db, keyword)
+        products, total = await search_homeshopping_products_page(db, keyword, page, size)
         logger.debug(f"상품 검색 성공: keyword='{keyword}', 결과 수={len(products)}")
     except Exception as e:
         logger.error(f"상품 검색 실패: keyword='{keyword}', error={str(e)}")
@@ -64,9 +70,9 @@ async def search_products(
     
     logger.info(f"홈쇼핑 상품 검색 완료: user_id={user_id}, keyword='{keyword}', 결과 수={len(products)}")
     return {
-        "total": len(products),
-        "page": 1,
-        "size": len(products),
+        "total": total,
+        "page": page,
+        "size": size or len(products),
         "products": products
     }
 
@@ -117,6 +123,7 @@ async def add_search_history(
 async def get_search_history(
         request: Request,
         limit: int = Query(5, ge=1, le=20, description="조회할 검색 이력 개수"),
+        cursor: Optional[str] = Query(None, description="다음 페이지 커서 (직전 응답의 next_cursor)"),
         current_user: UserOut = Depends(get_current_user),
         background_tasks: BackgroundTasks = None,
         db: AsyncSession = Depends(get_maria_service_db)
@@ -126,9 +133,10 @@ async def get_search_history(
     """
     logger.debug(f"홈쇼핑 검색 이력 조회 시작: user_id={current_user.user_id}, limit={limit}")
     logger.info(f"홈쇼핑 검색 이력 조회 요청: user_id={current_user.user_id}, limit={limit}")
+    after = parse_cursor_param(cursor)
     
     try:
-        history = await get_homeshopping_search_history(db, current_user.user_id, limit)
+        history = await get_homeshopping_search_history(db, current_user.user_id, limit, cursor=after)
         logger.debug(f"검색 이력 조회 성공: user_id={current_user.user_id}, 결과 수={len(history)}")
     except Exception as e:
         logger.error(f"검색 이력 조회 실패: user_id={current_user.user_id}, error={str(e)}")
@@ -146,7 +154,10 @@ async def get_search_history(
         )
     
     logger.info(f"홈쇼핑 검색 이력 조회 완료: user_id={current_user.user_id}, 결과 수={len(history)}")
-    return {"history": history}
+    next_cursor = build_next_cursor(
+        history, limit, lambda h: (h["homeshopping_searched_at"], h["homeshopping_history_id"])
+    )
+    return {"history": history, "next_cursor": next_cursor}
 
 
 @router.delete("/search/history", response_model=HomeshoppingSearchHistoryDeleteResponse)
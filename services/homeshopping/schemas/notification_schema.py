@@ -65,6 +65,7 @@ class HomeshoppingNotificationListResponse(BaseModel):
     notifications: List[HomeshoppingNotificationResponse] = Field(default_factory=list, description="알림 목록")
     total_count: int = Field(..., description="전체 알림 개수")
     has_more: bool = Field(..., description="더 많은 알림이 있는지 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
 
 
 class HomeshoppingNotificationFilter(BaseModel):
@@ -59,6 +59,7 @@ class HomeshoppingSearchHistoryCreate(BaseModel):
 class HomeshoppingSearchHistoryResponse(BaseModel):
     """검색 이력 조회 응답"""
     history: List[HomeshoppingSearchHistory] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
 
 
 class HomeshoppingSearchHistoryDeleteRequest(BaseModel):
@@ -1,15 +1,18 @@
 """
 홈쇼핑 캐시 관리 유틸리티
-- Redis를 활용한 스케줄 데이터 캐싱
+- Redis를 활용한 스케줄 데이터 캐싱 (일자별 세그먼트)
+- 상품 상세 공용 페이로드 캐싱 (사용자별 찜 여부 제외, 상품·가격 적재 시 무효화)
 - 성능 최적화를 위한 캐시 전략 구현
 """
 
+import json
 from datetime import date
 from typing import Dict, List, Optional
 
 from common.cache.redis_cache import RedisCacheCore
 from common.config import get_settings
 from common.logger import get_logger
+from common.metrics import record_cache_lookup
 
 logger = get_logger("homeshopping_cache")
 settings = get_settings()
@@ -21,7 +24,7 @@ class HomeshoppingCacheManager:
         self.redis_url = redis_url or getattr(settings, "redis_url", "redis://redis:6379/0")
         self.redis_cache = RedisCacheCore(self.redis_url, component="homeshopping_cache")
         self.cache_ttl = {
-            "schedule": 7200,  # 2시간 (극도로 긴 캐시)
+            "schedule_day": 7200,  # 2시간 (일자별 편성표 세그먼트, 워터마크로 변경 감지, 세그먼트 최대 보관 시간과 동일)
             "schedule_count": 14400,  # 4시간
             "product_detail": 14400,  # 4시간
             "food_product_ids": 28800,  # 8시간 (식품 ID 목록)
@@ -38,66 +41,67 @@ class HomeshoppingCacheManager:
         
         return ":".join(key_parts)
     
-    async def get_schedule_cache(
-        self, 
-        live_date: Optional[date] = None
-    ) -> Optional[List[Dict]]:
-        """스케줄 캐시 조회"""
+    def _schedule_day_key(self, live_date: date) -> str:
+        return self._generate_cache_key("schedule_day", live_date=live_date.isoformat())
+
+    async def get_schedule_segments(self, live_dates: List[date]) -> Dict[date, Dict]:
+        """
+        일자별 편성표 세그먼트 조회 (MGET 1회)
+        - 반환: {live_date: {"watermark": [...], "rows": [...]}} (없는 날짜는 제외)
+        """
+        if not live_dates:
+            return {}
         try:
-            cache_key = self._generate_cache_key(
-                "schedule", 
-                live_date=live_date.isoformat() if live_date else "all"
-            )
-
-            cached_data = await self.redis_cache.get_json(cache_key)
-            if cached_data:
-                logger.info(f"스케줄 캐시 히트: {cache_key}")
-                return cached_data["schedules"]
-            
-            logger.info(f"스케줄 캐시 미스: {cache_key}")
-            return None
-            
+            client = await self.redis_cache.get_client()
+            if not client:
+                return {}
+            raw_values = await client.mget([self._schedule_day_key(d) for d in live_dates])
         except Exception as e:
-            logger.error(f"스케줄 캐시 조회 실패: {e}")
-            return None
-    
-    async def set_schedule_cache(
-        self, 
-        schedules: List[Dict], 
-        live_date: Optional[date] = None
-    ) -> bool:
-        """스케줄 캐시 저장"""
+            logger.error(f"편성표 세그먼트 캐시 조회 실패: {e}")
+            return {}
+
+        segments = {}
+        for live_date, raw in zip(live_dates, raw_values):
+            if raw:
+                segments[live_date] = json.loads(raw)
+        record_cache_lookup("homeshopping_cache", "schedule_day", hit=bool(segments))
+        return segments
+
+    async def set_schedule_segments(self, segments: Dict[date, Dict]) -> bool:
+        """일자별 편성표 세그먼트 저장 (파이프라인 1회)"""
+        if not segments:
+            return True
         try:
-            cache_key = self._generate_cache_key(
-                "schedule", 
-                live_date=live_date.isoformat() if live_date else "all"
-            )
-
-            cache_data = {"schedules": schedules}
-            success = await self.redis_cache.set_json(
-                cache_key,
-                cache_data,
-                self.cache_ttl["schedule"],
-            )
-            if not success:
+            client = await self.redis_cache.get_client()
+            if not client:
                 return False
-            
-            logger.info(f"스케줄 캐시 저장: {cache_key}")
+            pipe = client.pipeline()
+            for live_date, segment in segments.items():
+                pipe.setex(
+                    self._schedule_day_key(live_date),
+                    self.cache_ttl["schedule_day"],
+                    json.dumps(segment, ensure_ascii=False, default=str),
+                )
+            await pipe.execute()
+            logger.info(f"편성표 세그먼트 캐시 저장: {len(segments)}일")
             return True
-            
         except Exception as e:
-            logger.error(f"스케줄 캐시 저장 실패: {e}")
+            logger.error(f"편성표 세그먼트 캐시 저장 실패: {e}")
             return False
     
     async def invalidate_schedule_cache(self, live_date: Optional[date] = None) -> bool:
-        """스케줄 캐시 무효화"""
-        try:
-            # 패턴 매칭으로 관련 캐시 모두 삭제
-            pattern = self._generate_cache_key("schedule", live_date=live_date.isoformat() if live_date else "*")
-            if not live_date:
-                pattern = "homeshopping:schedule:*"
+        """
+        스케줄 캐시 무효화 (Redis + 이 프로세스의 메모리 세그먼트/워터마크)
+        - 다른 워커의 메모리 세그먼트는 워터마크 변경 또는 최대 보관 시간 경과 시 다시 읽음
+        """
+        from services.homeshopping.crud.schedule_crud import clear_schedule_segments
 
-            deleted_count = await self.redis_cache.delete_pattern(pattern)
+        clear_schedule_segments(live_date)
+        try:
+            if live_date:
+                deleted_count = await self.redis_cache.delete_key(self._schedule_day_key(live_date))
+            else:
+                deleted_count = await self.redis_cache.delete_pattern("homeshopping:schedule_day:*")
             if deleted_count:
                 logger.info(f"스케줄 캐시 무효화: {deleted_count}개 키 삭제")
             
@@ -107,6 +111,33 @@ class HomeshoppingCacheManager:
             logger.error(f"스케줄 캐시 무효화 실패: {e}")
             return False
 
+    async def get_product_detail_cache(self, live_id: int) -> Optional[Dict]:
+        """상품 상세 공용 페이로드 캐시 조회 (is_liked 제외)"""
+        cache_key = self._generate_cache_key("product_detail", live_id=live_id)
+        cached_data = await self.redis_cache.get_json(cache_key)
+        record_cache_lookup("homeshopping_cache", "product_detail", hit=cached_data is not None)
+        return cached_data
+
+    async def set_product_detail_cache(self, live_id: int, product_detail: Dict) -> bool:
+        """상품 상세 공용 페이로드 캐시 저장"""
+        cache_key = self._generate_cache_key("product_detail", live_id=live_id)
+        return await self.redis_cache.set_json(cache_key, product_detail, self.cache_ttl["product_detail"])
+
+    async def invalidate_product_detail_cache(self, live_id: Optional[int] = None) -> int:
+        """상품 상세 캐시 무효화 (live_id 미입력 시 전체 — 상품·가격 일괄 적재 후 호출)"""
+        try:
+            if live_id is None:
+                deleted_count = await self.redis_cache.delete_pattern("homeshopping:product_detail:*")
+            else:
+                deleted_count = await self.redis_cache.delete_key(
+                    self._generate_cache_key("product_detail", live_id=live_id)
+                )
+            logger.info(f"상품 상세 캐시 무효화: live_id={live_id}, 삭제된 키 수={deleted_count}")
+            return deleted_count
+        except Exception as e:
+            logger.error(f"상품 상세 캐시 무효화 실패: live_id={live_id}, error={e}")
+            return 0
+
     async def get_kok_recommendation_cache(
         self,
         product_id: int,
@@ -123,9 +154,11 @@ class HomeshoppingCacheManager:
             cached_data = await self.redis_cache.get_json(cache_key)
             if cached_data:
                 logger.info(f"KOK 추천 캐시 히트: {cache_key}")
+                record_cache_lookup("homeshopping_cache", "kok_recommendation", hit=True)
                 return cached_data["recommendations"]
 
             logger.info(f"KOK 추천 캐시 미스: {cache_key}")
+            record_cache_lookup("homeshopping_cache", "kok_recommendation", hit=False)
             return None
 
         except Exception as e:
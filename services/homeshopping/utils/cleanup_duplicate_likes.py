@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """
-홈쇼핑 중복 좋아요 정리 스크립트
-- 중복된 좋아요 데이터를 정리하는 유틸리티
-- 사용자당 상품당 하나의 좋아요만 유지
+찜 중복 정리 스크립트
+- 유니크 키(UK_HOMESHOPPING_LIKES_USER_LIVE / UK_KOK_LIKES_USER_PRODUCT) 추가 전에 실행
+- 사용자당 대상(방송/상품)당 가장 최근 찜 1건만 유지 (같은 시각이면 ID 가 큰 것)
+- 유니크 키 적용 후에는 찜 토글이 INSERT ... ON DUPLICATE KEY 로 중복을 만들지 않음
 """
 
 import asyncio
@@ -19,66 +20,71 @@ from common.logger import get_logger
 
 logger = get_logger("cleanup_duplicate_likes")
 
+# (테이블, PK, 대상 컬럼, 생성 시각 컬럼)
+LIKE_TABLES = [
+    ("HOMESHOPPING_LIKES", "HOMESHOPPING_LIKE_ID", "LIVE_ID", "HOMESHOPPING_LIKE_CREATED_AT"),
+    ("KOK_LIKES", "KOK_LIKE_ID", "KOK_PRODUCT_ID", "KOK_CREATED_AT"),
+]
+
+
 async def cleanup_duplicate_likes():
-    """중복 좋아요 정리"""
-    logger.info("=== 홈쇼핑 중복 좋아요 정리 시작 ===")
+    """중복 찜 정리"""
+    logger.info("=== 중복 찜 정리 시작 ===")
     
     try:
         async with SessionLocal() as db:
-            # 1. 중복 좋아요 확인
-            check_sql = """
-            SELECT 
-                user_id, 
-                product_id, 
-                COUNT(*) as duplicate_count
-            FROM homeshopping_likes 
-            GROUP BY user_id, product_id 
-            HAVING COUNT(*) > 1
-            ORDER BY duplicate_count DESC
-            """
-            
-            result = await db.execute(text(check_sql))
-            duplicates = result.fetchall()
-            
-            if not duplicates:
-                logger.info("중복 좋아요가 없습니다.")
-                return
-            
-            logger.info(f"중복 좋아요 발견: {len(duplicates)}개 그룹")
-            
-            # 2. 중복 제거 (가장 최근 것만 유지)
-            cleanup_sql = """
-            DELETE h1 FROM homeshopping_likes h1
-            INNER JOIN homeshopping_likes h2 
-            WHERE h1.user_id = h2.user_id 
-            AND h1.product_id = h2.product_id 
-            AND h1.created_at < h2.created_at
-            """
-            
-            result = await db.execute(text(cleanup_sql))
-            deleted_count = result.rowcount
-            await db.commit()
-            
-            logger.info(f"중복 좋아요 정리 완료: {deleted_count}개 삭제")
-            
-            # 3. 정리 후 확인
-            result = await db.execute(text(check_sql))
-            remaining_duplicates = result.fetchall()
-            
-            if not remaining_duplicates:
-                logger.info("✅ 모든 중복 좋아요가 정리되었습니다.")
-            else:
-                logger.warning(f"⚠️ {len(remaining_duplicates)}개 그룹의 중복이 남아있습니다.")
+            for table, pk, target, created_at in LIKE_TABLES:
+                # 1. 중복 찜 확인
+                check_sql = f"""
+                SELECT USER_ID, {target}, COUNT(*) AS duplicate_count
+                FROM {table}
+                GROUP BY USER_ID, {target}
+                HAVING COUNT(*) > 1
+                """
+                
+                result = await db.execute(text(check_sql))
+                duplicates = result.fetchall()
+                
+                if not duplicates:
+                    logger.info(f"{table}: 중복 찜이 없습니다.")
+                    continue
+                
+                logger.info(f"{table}: 중복 찜 발견 {len(duplicates)}개 그룹")
+                
+                # 2. 중복 제거 (가장 최근 것만 유지)
+                cleanup_sql = f"""
+                DELETE l1 FROM {table} l1
+                INNER JOIN {table} l2
+                    ON l1.USER_ID = l2.USER_ID
+                    AND l1.{target} = l2.{target}
+                    AND (l1.{created_at} < l2.{created_at}
+                         OR (l1.{created_at} = l2.{created_at} AND l1.{pk} < l2.{pk}))
+                """
+                
+                result = await db.execute(text(cleanup_sql))
+                deleted_count = result.rowcount
+                await db.commit()
+                
+                logger.info(f"{table}: 중복 찜 정리 완료 {deleted_count}개 삭제")
+                
+                # 3. 정리 후 확인
+                result = await db.execute(text(check_sql))
+                remaining_duplicates = result.fetchall()
+                
+                if not remaining_duplicates:
+                    logger.info(f"✅ {table}: 모든 중복 찜이 정리되었습니다.")
+                else:
+                    logger.warning(f"⚠️ {table}: {len(remaining_duplicates)}개 그룹의 중복이 남아있습니다.")
                 
     except Exception as e:
-        logger.error(f"중복 좋아요 정리 실패: {str(e)}")
+        logger.error(f"중복 찜 정리 실패: {str(e)}")
         raise
 
 async def main():
     """메인 함수"""
     try:
         await cleanup_duplicate_likes()
-        logger.info("=== 홈쇼핑 중복 좋아요 정리 완료 ===")
+        logger.info("=== 중복 찜 정리 완료 ===")
     except Exception as e:
         logger.error(f"스크립트 실행 실패: {str(e)}")
         sys.exit(1)
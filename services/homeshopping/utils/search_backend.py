@@ -0,0 +1,360 @@
+"""
+홈쇼핑 상품 검색 백엔드
+
+상품명/판매자명 `LIKE '%키워드%'` 검색(인덱스 미사용, 방송 이력이 쌓일수록 느려짐)을
+교체 가능한 검색 백엔드로 대체합니다. 백엔드는 (관련도순 live_id 페이지, 전체 건수)만 반환하고
+상세 행은 호출 측에서 live_id IN (...) 으로 한 번에 조회합니다.
+
+- fulltext: MariaDB/MySQL FULLTEXT 인덱스 (ngram 파서) + MATCH ... AGAINST (BOOLEAN MODE 구문 검색)
+  · 전체 건수는 COUNT(*) OVER () 로 같은 쿼리에서 계산
+  · 필요한 인덱스 (ngram 파서 플러그인이 있는 서버에서 1회 실행):
+      ALTER TABLE FCT_HOMESHOPPING_LIST
+          ADD FULLTEXT INDEX FT_HS_LIST_PRODUCT_NAME (PRODUCT_NAME) WITH PARSER ngram;
+      ALTER TABLE FCT_HOMESHOPPING_PRODUCT_INFO
+          ADD FULLTEXT INDEX FT_HS_PRODUCT_STORE_NAME (STORE_NAME) WITH PARSER ngram;
+  · 인덱스/파서가 없다는 오류(_FULLTEXT_UNAVAILABLE_CODES)면 프로세스 동안 비활성화하고 inverted 로 대체,
+    그 밖의 DB 오류(연결 끊김/잠금 대기 등)는 그대로 전파
+- inverted: 프로세스 메모리 2-gram 역색인 (중복 제거한 (상품명, 판매자명) 문서 단위)
+  · 후보 = 키워드 2-gram 포스팅 교집합 → 부분 문자열 검증 (기존 LIKE 와 같은 결과 집합)
+  · 게이트웨이 lifespan 에서 start_search_index() 로 백그라운드 적재 + 주기 갱신
+  · 워터마크(행 수, MAX(live_id))를 SEARCH_INDEX_CHECK_SECONDS 간격으로 확인,
+    신규 live_id 만 증분 반영하고 행 수가 어긋나거나 SEARCH_INDEX_MAX_AGE_SECONDS 가 지나면 전체 재구성
+  · 요청 경로는 적재된 색인을 그대로 사용, 아직 적재 전이면 1회만 적재 (동시 요청은 같은 적재를 대기)
+- 관련도: 상품명 일치(2) + 판매자명 일치(1) 내림차순 → 상품명 내 일치 위치 → 편성 순서
+- 선택: 설정 HOMESHOPPING_SEARCH_BACKEND (auto | fulltext | inverted)
+  · auto = inverted (MariaDB 는 ngram 파서가 없어 FULLTEXT 가 한글 부분 일치를 찾지 못함)
+  · fulltext 는 ngram 인덱스를 만든 MySQL 서버에서 명시적으로 설정한 경우에만 사용
+"""
+
+import asyncio
+import time as _time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.logger import get_logger
+from common.periodic_refresh import PeriodicRefresher
+
+logger = get_logger("homeshopping_search_backend")
+
+SEARCH_INDEX_CHECK_SECONDS = 30
+SEARCH_INDEX_MAX_AGE_SECONDS = 3600
+SEARCH_BACKENDS = ("auto", "fulltext", "inverted")
+
+SearchPage = Tuple[List[int], int]  # (관련도순 live_id 페이지, 전체 건수)
+
+_INDEX_ROWS_SQL = """
+SELECT
+    hl.live_id AS live_id,
+    hl.live_date AS live_date,
+    hl.live_start_time AS live_start_time,
+    hl.product_name AS product_name,
+    hpi.store_name AS store_name
+FROM FCT_HOMESHOPPING_LIST hl
+INNER JOIN FCT_HOMESHOPPING_PRODUCT_INFO hpi ON hl.product_id = hpi.product_id
+{where}
+"""
+
+_WATERMARK_SQL = text("""
+SELECT COUNT(*) AS row_count, MAX(hl.live_id) AS max_live_id
+FROM FCT_HOMESHOPPING_LIST hl
+INNER JOIN FCT_HOMESHOPPING_PRODUCT_INFO hpi ON hl.product_id = hpi.product_id
+""")
+
+_FULLTEXT_SQL = text("""
+SELECT
+    hl.live_id AS live_id,
+    COUNT(*) OVER () AS total_count
+FROM FCT_HOMESHOPPING_LIST hl
+INNER JOIN FCT_HOMESHOPPING_PRODUCT_INFO hpi ON hl.product_id = hpi.product_id
+WHERE MATCH(hl.product_name) AGAINST (:query IN BOOLEAN MODE)
+   OR MATCH(hpi.store_name) AGAINST (:query IN BOOLEAN MODE)
+ORDER BY
+    (MATCH(hl.product_name) AGAINST (:query IN BOOLEAN MODE) > 0) * 2
+        + (MATCH(hpi.store_name) AGAINST (:query IN BOOLEAN MODE) > 0) DESC,
+    MATCH(hl.product_name) AGAINST (:query IN BOOLEAN MODE) DESC,
+    hl.live_date ASC, hl.live_start_time ASC, hl.live_id ASC
+LIMIT :limit OFFSET :offset
+""")
+
+# ngram_token_size 기본값(2)보다 짧은 키워드는 FULLTEXT 로 찾을 수 없음
+_FULLTEXT_MIN_LENGTH = 2
+_FULLTEXT_UNLIMITED = 2**31 - 1
+
+# FULLTEXT 를 쓸 수 없는 서버 오류 (이 경우에만 역색인으로 대체)
+# 1191: 컬럼에 맞는 FULLTEXT 인덱스 없음, 1214: 테이블 엔진이 FULLTEXT 미지원,
+# 1128: 파서 플러그인(ngram) 미설치 — "Function 'ngram' is not defined"
+_FULLTEXT_UNAVAILABLE_CODES = frozenset({1128, 1191, 1214})
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """검색 비교용 정규화 (대소문자 무시, 앞뒤 공백 제거)"""
+    return (value or "").strip().casefold()
+
+
+def _bigrams(value: str) -> Set[str]:
+    return {value[i:i + 2] for i in range(len(value) - 1)}
+
+
+def _time_seconds(value) -> float:
+    """MariaDB TIME(timedelta)/time/문자열을 정렬용 초 단위로 변환"""
+    if value is None:
+        return 0.0
+    if hasattr(value, "total_seconds"):
+        return value.total_seconds()
+    if hasattr(value, "hour"):
+        return value.hour * 3600 + value.minute * 60 + value.second
+    hours, _, rest = str(value).partition(":")
+    minutes, _, seconds = rest.partition(":")
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds or 0)
+
+
+def _page(ids: List[int], page: int, size: Optional[int]) -> List[int]:
+    if size is None:
+        return ids
+    offset = (page - 1) * size
+    return ids[offset:offset + size]
+
+
+@dataclass
+class InvertedSearchIndex:
+    """(상품명, 판매자명) 문서 단위 2-gram 역색인"""
+
+    docs: List[Tuple[str, str]] = field(default_factory=list)
+    doc_ids: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    doc_lives: List[List[int]] = field(default_factory=list)
+    postings: Dict[str, Set[int]] = field(default_factory=dict)
+    order_keys: Dict[int, tuple] = field(default_factory=dict)
+    row_count: int = 0
+    max_live_id: int = 0
+
+    def add(self, live_id: int, live_date, live_start_time, product_name: Optional[str], store_name: Optional[str]) -> None:
+        doc = (normalize_text(product_name), normalize_text(store_name))
+        doc_id = self.doc_ids.get(doc)
+        if doc_id is None:
+            doc_id = len(self.docs)
+            self.doc_ids[doc] = doc_id
+            self.docs.append(doc)
+            self.doc_lives.append([])
+            for gram in _bigrams(doc[0]) | _bigrams(doc[1]):
+                self.postings.setdefault(gram, set()).add(doc_id)
+        self.doc_lives[doc_id].append(live_id)
+        self.order_keys[live_id] = (str(live_date), _time_seconds(live_start_time), live_id)
+        self.row_count += 1
+        self.max_live_id = max(self.max_live_id, live_id)
+
+    def _candidate_docs(self, keyword: str) -> List[int]:
+        grams = _bigrams(keyword)
+        if not grams:
+            # 1글자 키워드: 중복 제거된 문서만 선형 검사
+            return list(range(len(self.docs)))
+        posting_lists = sorted((self.postings.get(g, set()) for g in grams), key=len)
+        candidates = set(posting_lists[0])
+        for posting in posting_lists[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return list(candidates)
+
+    def search(self, keyword: str) -> List[int]:
+        """키워드가 상품명/판매자명에 포함된 live_id 전체 (관련도순)"""
+        keyword = normalize_text(keyword)
+        if not keyword:
+            return []
+
+        scored = []
+        for doc_id in self._candidate_docs(keyword):
+            name, store = self.docs[doc_id]
+            name_pos = name.find(keyword)
+            in_store = keyword in store
+            if name_pos < 0 and not in_store:
+                continue
+            relevance = (2 if name_pos >= 0 else 0) + (1 if in_store else 0)
+            position = name_pos if name_pos >= 0 else len(name)
+            for live_id in self.doc_lives[doc_id]:
+                scored.append(((-relevance, position) + self.order_keys[live_id], live_id))
+
+        scored.sort(key=lambda item: item[0])
+        return [live_id for _, live_id in scored]
+
+
+def is_fulltext_unavailable_error(error: BaseException) -> bool:
+    """FULLTEXT 인덱스/ngram 파서가 없어 실패했는지 여부"""
+    if not isinstance(error, DBAPIError):
+        return False
+    args = getattr(error.orig, "args", ())
+    return bool(args) and args[0] in _FULLTEXT_UNAVAILABLE_CODES
+
+
+class HomeshoppingSearchBackend(ABC):
+    """검색 백엔드 인터페이스"""
+
+    name = "base"
+
+    @abstractmethod
+    async def search(self, db: AsyncSession, keyword: str, page: int = 1, size: Optional[int] = None) -> SearchPage:
+        """(관련도순 live_id 페이지, 전체 건수)"""
+
+
+class InvertedIndexSearchBackend(HomeshoppingSearchBackend):
+    """프로세스 메모리 역색인 백엔드 (워터마크 기반 증분 갱신)"""
+
+    name = "inverted"
+
+    def __init__(self):
+        self._index: Optional[InvertedSearchIndex] = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._index is not None
+
+    def clear(self) -> None:
+        self._index = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+
+    async def _fetch_rows(self, db: AsyncSession, after_live_id: Optional[int] = None):
+        where = "WHERE hl.live_id > :after_live_id" if after_live_id is not None else ""
+        params = {"after_live_id": after_live_id} if after_live_id is not None else {}
+        result = await db.execute(text(_INDEX_ROWS_SQL.format(where=where)), params)
+        return result.fetchall()
+
+    async def _rebuild(self, db: AsyncSession) -> None:
+        index = InvertedSearchIndex()
+        for row in await self._fetch_rows(db):
+            index.add(row.live_id, row.live_date, row.live_start_time, row.product_name, row.store_name)
+        self._index = index
+        self._built_at = _time.monotonic()
+        logger.info(f"홈쇼핑 검색 역색인 재구성: rows={index.row_count}, docs={len(index.docs)}")
+
+    async def refresh(self, db: AsyncSession, force: bool = False) -> None:
+        """
+        워터마크 확인 후 신규 행 증분 반영 또는 전체 재구성 (주기 태스크용)
+        - 동시 호출은 잠금으로 1개씩, 확인 간격 안에 이미 확인했으면 생략 (force 제외)
+        """
+        async with self._lock:
+            now = _time.monotonic()
+            if not force and self._index is not None and now - self._checked_at < SEARCH_INDEX_CHECK_SECONDS:
+                return
+
+            watermark = (await db.execute(_WATERMARK_SQL)).one()
+            row_count, max_live_id = int(watermark.row_count or 0), int(watermark.max_live_id or 0)
+            index = self._index
+
+            if (
+                force
+                or index is None
+                or now - self._built_at >= SEARCH_INDEX_MAX_AGE_SECONDS
+                or max_live_id < index.max_live_id
+            ):
+                await self._rebuild(db)
+            elif (row_count, max_live_id) != (index.row_count, index.max_live_id):
+                for row in await self._fetch_rows(db, after_live_id=index.max_live_id):
+                    index.add(row.live_id, row.live_date, row.live_start_time, row.product_name, row.store_name)
+                if index.row_count != row_count:
+                    # 삭제/수정된 과거 행이 있으면 증분으로 맞출 수 없음
+                    await self._rebuild(db)
+
+            self._checked_at = _time.monotonic()
+
+    async def ensure_index(self, db: AsyncSession) -> InvertedSearchIndex:
+        """적재된 색인 반환 — 백그라운드 적재 전이면 요청 경로에서 1회 적재 (동시 요청은 같은 잠금 대기)"""
+        if self._index is None:
+            await self.refresh(db)
+        return self._index
+
+    async def search(self, db: AsyncSession, keyword: str, page: int = 1, size: Optional[int] = None) -> SearchPage:
+        index = await self.ensure_index(db)
+        live_ids = index.search(keyword)
+        return _page(live_ids, page, size), len(live_ids)
+
+
+class FulltextSearchBackend(HomeshoppingSearchBackend):
+    """MariaDB FULLTEXT(ngram) 인덱스 백엔드"""
+
+    name = "fulltext"
+
+    def __init__(self):
+        self.available = True
+
+    @staticmethod
+    def supports(db: AsyncSession, keyword: str) -> bool:
+        bind = db.get_bind()
+        return bind.dialect.name in ("mysql", "mariadb") and len(keyword.strip()) >= _FULLTEXT_MIN_LENGTH
+
+    async def search(self, db: AsyncSession, keyword: str, page: int = 1, size: Optional[int] = None) -> SearchPage:
+        # 구문 검색: 키워드 전체가 연속된 n-gram 으로 일치해야 함 (연산자 문자 제거)
+        query = '"' + keyword.strip().replace('"', " ") + '"'
+        limit = size or _FULLTEXT_UNLIMITED
+        offset = (page - 1) * size if size else 0
+        result = await db.execute(_FULLTEXT_SQL, {"query": query, "limit": limit, "offset": offset})
+        rows = result.fetchall()
+        total = int(rows[0].total_count) if rows else 0
+        if not rows and offset:
+            # 마지막 페이지를 넘긴 요청: 전체 건수만 다시 계산
+            count = await db.execute(_FULLTEXT_SQL, {"query": query, "limit": 1, "offset": 0})
+            first = count.first()
+            total = int(first.total_count) if first else 0
+        return [row.live_id for row in rows], total
+
+
+_inverted_backend = InvertedIndexSearchBackend()
+_fulltext_backend = FulltextSearchBackend()
+_refresher = PeriodicRefresher("homeshopping_search_index", _inverted_backend.refresh, SEARCH_INDEX_CHECK_SECONDS)
+
+
+def _configured_backend() -> str:
+    try:
+        from common.config import get_settings
+
+        name = get_settings().homeshopping_search_backend
+    except Exception:
+        return "auto"
+    return name if isinstance(name, str) and name in SEARCH_BACKENDS else "auto"
+
+
+async def search_live_ids(db: AsyncSession, keyword: str, page: int = 1, size: Optional[int] = None) -> SearchPage:
+    """
+    설정된 백엔드로 홈쇼핑 상품 검색
+
+    Returns:
+        (관련도순 live_id 페이지, 전체 건수)
+    """
+    backend_name = _configured_backend()
+    if backend_name == "fulltext" and _fulltext_backend.available and FulltextSearchBackend.supports(db, keyword):
+        try:
+            return await _fulltext_backend.search(db, keyword, page, size)
+        except DBAPIError as e:
+            if not is_fulltext_unavailable_error(e):
+                raise
+            # FULLTEXT 인덱스/ngram 파서가 없는 서버: 프로세스 동안 역색인 사용
+            _fulltext_backend.available = False
+            logger.warning(f"FULLTEXT 검색 사용 불가, 메모리 역색인으로 대체: error={str(e)}")
+    return await _inverted_backend.search(db, keyword, page, size)
+
+
+async def refresh_search_index(session: AsyncSession, force: bool = False) -> None:
+    """역색인 갱신 (주기 태스크/배치/테스트용)"""
+    await _inverted_backend.refresh(session, force=force)
+
+
+def start_search_index(session_factory: Optional[Callable[[], AsyncSession]] = None) -> None:
+    """백그라운드 적재 + 주기 갱신 태스크 시작 (게이트웨이 lifespan 에서 호출)"""
+    _refresher.start(session_factory)
+
+
+async def stop_search_index() -> None:
+    """주기 갱신 태스크 정리 (게이트웨이 종료 시)"""
+    await _refresher.stop()
+
+
+def clear_search_index() -> None:
+    """메모리 역색인 초기화 (다음 검색 시 재구성)"""
+    _inverted_backend.clear()
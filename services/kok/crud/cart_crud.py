@@ -4,6 +4,7 @@ from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.cache.membership import KOK_CART, record_membership
 from common.keyword_extraction import (
     extract_ingredient_keywords,
     get_homeshopping_db_config,
@@ -16,6 +17,14 @@ from services.kok.models.product_model import KokPriceInfo, KokProductInfo
 
 from .shared import get_latest_kok_price_id, logger
 
+
+def _invalidate_ownership(db: AsyncSession, user_id: int) -> None:
+    """장바구니 변경 시 레시피 식재료 보유 스냅샷 무효화 (커밋 후)"""
+    from services.recipe.utils.ownership_snapshot import invalidate_ownership_snapshot_after_commit
+
+    invalidate_ownership_snapshot_after_commit(db, user_id)
+
+
 async def get_kok_cart_items(
     db: AsyncSession,
     user_id: int,
@@ -99,6 +108,7 @@ async def add_kok_cart(
     if existing_cart:
         # 수량 업데이트
         existing_cart.kok_quantity += kok_quantity
+        _invalidate_ownership(db, user_id)
     # logger.info(f"장바구니 수량 업데이트 완료: kok_cart_id={existing_cart.kok_cart_id}, new_quantity={existing_cart.kok_quantity}")
         return {
             "kok_cart_id": existing_cart.kok_cart_id,
@@ -118,6 +128,8 @@ async def add_kok_cart(
         )
         
         db.add(new_cart)
+        record_membership(db, user_id, KOK_CART, kok_product_id, member=True)
+        _invalidate_ownership(db, user_id)
         # refresh는 commit 후에 호출해야 하므로 여기서는 제거
         # await db.refresh(new_cart)
         
@@ -156,6 +168,7 @@ async def update_kok_cart_quantity(
     
     # 수량 변경
     cart_item.kok_quantity = kok_quantity
+    _invalidate_ownership(db, user_id)
     
     return {
         "kok_cart_id": cart_item.kok_cart_id,
@@ -200,6 +213,8 @@ async def delete_kok_cart_item(
     
     # 장바구니에서 삭제
     await db.delete(cart_item)
+    record_membership(db, user_id, KOK_CART, cart_item.kok_product_id, member=False)
+    _invalidate_ownership(db, user_id)
     
     return {
         "success": True,
@@ -393,12 +408,12 @@ async def get_ingredients_from_cart_product_ids(
         
         # FCT_KOK_PRODUCT_INFO에서 상품명 조회
         product_stmt = (
-            select(KokProductInfo)
+            select(KokProductInfo.kok_product_id, KokProductInfo.kok_product_name)
             .where(KokProductInfo.kok_product_id.in_(kok_product_ids))
         )
         try:
             product_result = await db.execute(product_stmt)
-            products = product_result.scalars().all()
+            products = product_result.all()
         except Exception as e:
             logger.error(f"폴백 상품명 조회 SQL 실행 실패: kok_product_ids={kok_product_ids}, error={str(e)}")
             products = []
@@ -1,13 +1,15 @@
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.cache.membership import KOK_LIKE, record_membership
+from common.database.upsert import insert_if_absent
 from services.kok.models.interaction_model import KokLikes
-from services.kok.models.product_model import KokPriceInfo, KokProductInfo
+from services.kok.models.product_model import KokProductInfo
 
-from .shared import get_latest_kok_price_id, logger
+from .shared import load_latest_kok_prices, logger
 
 async def toggle_kok_likes(
     db: AsyncSession,
@@ -15,42 +17,34 @@ async def toggle_kok_likes(
     kok_product_id: int
 ) -> bool:
     """
-    찜 등록/해제 토글
+    찜 등록/해제 토글 (반환: 토글 후 찜 여부)
+    - (USER_ID, KOK_PRODUCT_ID) 유니크 키에 맡겨 조회 없이 INSERT 1회로 등록
+    - 이미 찜한 상태면 DELETE 1회로 해제
+    - 연속 두 번 누른 동시 요청은 한쪽이 등록, 다른 쪽이 해제 → 중복 행 없이 순서대로 토글
     """
-    # FOR UPDATE로 동시 요청 시 race condition 방지
-    stmt = (
-        select(KokLikes)
-        .where(
-            KokLikes.user_id == user_id,
-            KokLikes.kok_product_id == kok_product_id,
-        )
-        .with_for_update()
-    )
     try:
-        result = await db.execute(stmt)
-        existing_like = result.scalar_one_or_none()
-    except Exception as e:
-        logger.error(f"찜 상태 확인 SQL 실행 실패: user_id={user_id}, kok_product_id={kok_product_id}, error={str(e)}")
-        raise
-
-    if existing_like:
-        # 찜 해제
-        await db.delete(existing_like)
-    # logger.info(f"찜 해제 완료: user_id={user_id}, product_id={kok_product_id}")
-        return False
-    else:
-        # 찜 등록
-        created_at = datetime.now()
+        new_like_id = await insert_if_absent(db, KokLikes, {
+            KokLikes.user_id: user_id,
+            KokLikes.kok_product_id: kok_product_id,
+            KokLikes.kok_created_at: datetime.now(),
+        })
+        if new_like_id is not None:
+            record_membership(db, user_id, KOK_LIKE, kok_product_id, member=True)
+            return True
 
-        new_like = KokLikes(
-            user_id=user_id,
-            kok_product_id=kok_product_id,
-            kok_created_at=created_at
+        # 이미 찜한 상태 → 찜 해제
+        await db.execute(
+            delete(KokLikes).where(
+                KokLikes.user_id == user_id,
+                KokLikes.kok_product_id == kok_product_id,
+            )
         )
+    except Exception as e:
+        logger.error(f"찜 토글 SQL 실행 실패: user_id={user_id}, kok_product_id={kok_product_id}, error={str(e)}")
+        raise
 
-        db.add(new_like)
-    # logger.info(f"찜 등록 완료: user_id={user_id}, product_id={kok_product_id}")
-        return True
+    record_membership(db, user_id, KOK_LIKE, kok_product_id, member=False)
+    return False
 
 
 async def get_kok_liked_products(
@@ -75,29 +69,28 @@ async def get_kok_liked_products(
         logger.error(f"찜한 상품 목록 조회 SQL 실행 실패: user_id={user_id}, limit={limit}, error={str(e)}")
         return []
     
+    # 최신 가격 정보 일괄 조회 (상품 수와 무관하게 쿼리 1회)
+    try:
+        latest_prices = await load_latest_kok_prices(db, (product.kok_product_id for _, product in results))
+    except Exception as e:
+        # 조회 실패 시 상품별 기본값(할인 없음, 정가)으로 표시
+        logger.warning(f"찜한 상품 가격 정보 조회 실패: user_id={user_id}, error={str(e)}")
+        latest_prices = None
+
     liked_products = []
     for like, product in results:
-        # 최신 가격 정보 조회
-        latest_price_id = await get_latest_kok_price_id(db, product.kok_product_id)
-        if latest_price_id:
-            # 최신 가격 정보로 상세 정보 조회
-            price_stmt = select(KokPriceInfo).where(KokPriceInfo.kok_price_id == latest_price_id)
-            try:
-                price_result = await db.execute(price_stmt)
-                price = price_result.scalar_one_or_none()
-            except Exception as e:
-                logger.warning(f"찜한 상품 가격 정보 조회 실패: kok_product_id={product.kok_product_id}, latest_price_id={latest_price_id}, error={str(e)}")
-                price = None
-            
-            liked_products.append({
-                "kok_product_id": product.kok_product_id,
-                "kok_product_name": product.kok_product_name,
-                "kok_thumbnail": product.kok_thumbnail,
-                "kok_product_price": product.kok_product_price,
-                "kok_discount_rate": price.kok_discount_rate if price else 0,
-                "kok_discounted_price": price.kok_discounted_price if price else product.kok_product_price,
-                "kok_store_name": product.kok_store_name,
-            })
+        price = latest_prices.get(product.kok_product_id) if latest_prices is not None else None
+        if latest_prices is not None and price is None:
+            continue
+        liked_products.append({
+            "kok_product_id": product.kok_product_id,
+            "kok_product_name": product.kok_product_name,
+            "kok_thumbnail": product.kok_thumbnail,
+            "kok_product_price": product.kok_product_price,
+            "kok_discount_rate": price.kok_discount_rate if price else 0,
+            "kok_discounted_price": price.kok_discounted_price if price else product.kok_product_price,
+            "kok_store_name": product.kok_store_name,
+        })
     
     return liked_products
 
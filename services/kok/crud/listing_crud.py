@@ -8,7 +8,14 @@ from services.order.models.order_base_model import Order
 from services.order.models.kok.kok_order_model import KokOrder
 from services.kok.models.product_model import KokPriceInfo, KokProductInfo
 
-from .shared import get_latest_kok_price_id, logger
+from .shared import (
+    KOK_PRODUCT_ALL_COLUMNS,
+    KOK_PRODUCT_CARD_COLUMNS,
+    get_latest_kok_price_id,
+    load_kok_product_ids_by_price,
+    load_latest_kok_prices,
+    logger,
+)
 
 async def get_kok_product_list(
         db: AsyncSession,
@@ -23,8 +30,8 @@ async def get_kok_product_list(
     """
     offset = (page - 1) * size
     
-    # 기본 쿼리
-    stmt = select(KokProductInfo)
+    # 기본 쿼리 (엔티티 대신 컬럼 행으로 조회)
+    stmt = select(*KOK_PRODUCT_ALL_COLUMNS)
     
     # 키워드 검색
     if keyword:
@@ -55,7 +62,7 @@ async def get_kok_product_list(
     stmt = stmt.offset(offset).limit(size)
     
     try:
-        products = (await db.execute(stmt)).scalars().all()
+        products = (await db.execute(stmt)).all()
     except Exception as e:
         logger.error(f"콕 상품 목록 조회 SQL 실행 실패: page={page}, size={size}, keyword={keyword}, error={str(e)}")
         raise
@@ -73,39 +80,7 @@ async def get_kok_product_list(
         logger.error(f"콕 상품 개수 조회 SQL 실행 실패: keyword={keyword}, error={str(e)}")
         total = 0
     
-    product_list = []
-    for product in products:
-        product_dict = {
-            "kok_product_id": product.kok_product_id,
-            "kok_product_name": product.kok_product_name,
-            "kok_store_name": product.kok_store_name,
-            "kok_thumbnail": product.kok_thumbnail,
-            "kok_product_price": product.kok_product_price,
-            "kok_review_cnt": product.kok_review_cnt,
-            "kok_review_score": product.kok_review_score,
-            "kok_5_ratio": product.kok_5_ratio,
-            "kok_4_ratio": product.kok_4_ratio,
-            "kok_3_ratio": product.kok_3_ratio,
-            "kok_2_ratio": product.kok_2_ratio,
-            "kok_1_ratio": product.kok_1_ratio,
-            "kok_aspect_price": product.kok_aspect_price,
-            "kok_aspect_price_ratio": product.kok_aspect_price_ratio,
-            "kok_aspect_delivery": product.kok_aspect_delivery,
-            "kok_aspect_delivery_ratio": product.kok_aspect_delivery_ratio,
-            "kok_aspect_taste": product.kok_aspect_taste,
-            "kok_aspect_taste_ratio": product.kok_aspect_taste_ratio,
-            "kok_seller": product.kok_seller,
-            "kok_co_ceo": product.kok_co_ceo,
-            "kok_co_reg_no": product.kok_co_reg_no,
-            "kok_co_ec_reg": product.kok_co_ec_reg,
-            "kok_tell": product.kok_tell,
-            "kok_ver_item": product.kok_ver_item,
-            "kok_ver_date": product.kok_ver_date,
-            "kok_co_addr": product.kok_co_addr,
-            "kok_return_addr": product.kok_return_addr,
-            "kok_exchange_addr": product.kok_exchange_addr
-        }
-        product_list.append(product_dict)
+    product_list = [product._asdict() for product in products]
     
     return product_list, total
 
@@ -571,27 +546,16 @@ async def get_kok_unpurchased(
         logger.error(f"사용자 구매 상품 조회 SQL 실행 실패: user_id={user_id}, error={str(e)}")
         return []
     
-    # 구매한 상품 ID 목록 추출 (price_id를 통해 상품 정보 조회)
-    purchased_product_ids = []
-    for kok_order, order in purchased_orders:
-        # kok_price_id를 통해 상품 정보 조회
-        product_stmt = (
-            select(KokPriceInfo.kok_product_id)
-            .where(KokPriceInfo.kok_price_id == kok_order.kok_price_id)
-        )
-        try:
-            product_result = await db.execute(product_stmt)
-            product_id = product_result.scalar_one_or_none()
-            if product_id:
-                purchased_product_ids.append(product_id)
-        except Exception as e:
-            logger.warning(f"가격 ID로 상품 ID 조회 실패: kok_price_id={kok_order.kok_price_id}, error={str(e)}")
-            continue
+    # 구매한 상품 ID 목록 추출 (price_id → 상품 ID 일괄 조회)
+    product_ids_by_price = await load_kok_product_ids_by_price(
+        db, (kok_order.kok_price_id for kok_order, _ in purchased_orders)
+    )
+    purchased_product_ids = list(set(product_ids_by_price.values()))
     
     # 2. 최근 구매 상품과 중복되지 않는 상품 중에서 추천 상품 선택
     # 조건: 리뷰 점수가 높고, 할인이 있는 상품 우선
     stmt = (
-        select(KokProductInfo)
+        select(*KOK_PRODUCT_ALL_COLUMNS)
         .where(KokProductInfo.kok_review_score > 4.0)
         .where(KokProductInfo.kok_discount_rate > 0)
         .where(~KokProductInfo.kok_product_id.in_(purchased_product_ids))  # 구매하지 않은 상품만
@@ -600,7 +564,7 @@ async def get_kok_unpurchased(
     )
     
     try:
-        products = (await db.execute(stmt)).scalars().all()
+        products = (await db.execute(stmt)).all()
     except Exception as e:
         logger.error(f"미구매 상품 조회 SQL 실행 실패: user_id={user_id}, error={str(e)}")
         return []
@@ -608,19 +572,19 @@ async def get_kok_unpurchased(
     # 만약 조건에 맞는 상품이 10개 미만이면, 할인 조건을 제거하고 다시 조회
     if len(products) < 10:
         stmt = (
-            select(KokProductInfo)
+            select(*KOK_PRODUCT_ALL_COLUMNS)
             .where(KokProductInfo.kok_review_score > 3.5)
             .where(~KokProductInfo.kok_product_id.in_(purchased_product_ids))
             .order_by(KokProductInfo.kok_review_score.desc())
             .limit(10)
         )
         try:
-            products = (await db.execute(stmt)).scalars().all()
+            products = (await db.execute(stmt)).all()
         except Exception as e:
             logger.error(f"미구매 상품 폴백 조회 SQL 실행 실패: user_id={user_id}, error={str(e)}")
             return []
     
-    return [product.__dict__ for product in products]
+    return [product._asdict() for product in products]
 
 
 async def get_kok_store_best_items(
@@ -631,7 +595,7 @@ async def get_kok_store_best_items(
 ) -> List[dict]:
     """
     구매한 스토어의 베스트 상품 목록 조회 (정렬 기준에 따라 리뷰 개수 또는 별점 평균 순으로 정렬)
-    최적화: 단일 쿼리로 N+1 문제 해결 + Redis 캐싱
+    최적화: 스토어별 상위 N 인덱스 k-way merge + 구매 스토어 캐시 + Redis 결과 캐싱
     
     Args:
         db: 데이터베이스 세션
@@ -640,6 +604,11 @@ async def get_kok_store_best_items(
         use_cache: 캐시 사용 여부
     """
     from services.kok.utils.cache_utils import cache_manager
+    from services.kok.utils.store_best_index import (
+        get_purchased_store_names,
+        get_store_top_lists,
+        merge_store_tops,
+    )
     
     # logger.info(f"스토어 베스트 상품 조회 시작: user_id={user_id}, sort_by={sort_by}, use_cache={use_cache}")
     
@@ -655,62 +624,39 @@ async def get_kok_store_best_items(
             return cached_data
     
     if user_id:
-        # 1. 사용자가 구매한 주문에서 price_id를 통해 상품 정보 조회
-        stmt = (
-            select(KokOrder, KokPriceInfo, KokProductInfo)
-            .join(KokPriceInfo, KokOrder.kok_price_id == KokPriceInfo.kok_price_id)
-            .join(KokProductInfo, KokPriceInfo.kok_product_id == KokProductInfo.kok_product_id)
-            .join(Order, KokOrder.order_id == Order.order_id)
-            .where(Order.user_id == user_id)
-            .distinct()
-        )
+        # 1. 사용자가 구매한 스토어 목록 (캐시 우선, DISTINCT 스토어명만 조회)
         try:
-            results = (await db.execute(stmt)).all()
+            store_names = await get_purchased_store_names(db, user_id, use_cache=use_cache)
         except Exception as e:
-            logger.error(f"사용자 구매 상품 조회 SQL 실행 실패: user_id={user_id}, error={str(e)}")
+            logger.error(f"사용자 구매 스토어 조회 SQL 실행 실패: user_id={user_id}, error={str(e)}")
             return []
         
-        if not results:
-            logger.warning(f"사용자가 구매한 상품이 없음: user_id={user_id}")
+        if not store_names:
+            logger.warning(f"구매한 상품의 판매자 정보가 없음: user_id={user_id}")
             return []
         
-        logger.info(f"사용자 구매 상품 조회 결과: user_id={user_id}, 구매 상품 수={len(results)}")
-        
-        # 2. 구매한 상품들의 판매자 정보 수집
-        store_names = set()
-        for order, price, product in results:
-            if product.kok_store_name:
-                store_names.add(product.kok_store_name)
-                logger.debug(f"구매 상품: {product.kok_product_name}, 판매자: {product.kok_store_name}")
-            else:
-                logger.warning(f"구매 상품의 판매자 정보 누락: product_id={product.kok_product_id}, product_name={product.kok_product_name}")
-        
-    # logger.info(f"구매한 상품들의 판매자 정보: {store_names}, 판매자 수={len(store_names)}")
+        # 2. 스토어별 정렬된 상위 N 목록을 k-way merge 해 상위 10개 선택
+        try:
+            store_lists = await get_store_top_lists(db, store_names, sort_by)
+        except Exception as e:
+            logger.error(f"스토어 베스트 인덱스 조회 실패: user_id={user_id}, sort_by={sort_by}, error={str(e)}")
+            return []
+        product_ids = merge_store_tops(store_lists, limit=10)
         
-        if not store_names:
-            logger.warning(f"구매한 상품의 판매자 정보가 없음: user_id={user_id}")
+        if not product_ids:
+            logger.warning("조회된 상품이 없음")
             return []
         
-        # 3. 해당 판매자들이 판매중인 상품 중 정렬 기준에 따라 조회
-        if sort_by == "rating":
-            # 별점 평균 순으로 정렬 (리뷰가 있는 상품만)
-            store_best_stmt = (
-                select(KokProductInfo)
-                .where(KokProductInfo.kok_store_name.in_(store_names))
-                .where(KokProductInfo.kok_review_cnt > 0)
-                .where(KokProductInfo.kok_review_score > 0)
-                .order_by(KokProductInfo.kok_review_score.desc(), KokProductInfo.kok_review_cnt.desc())
-                .limit(10)
-            )
-        else:
-            # 기본값: 리뷰 개수 순으로 정렬
-            store_best_stmt = (
-                select(KokProductInfo)
-                .where(KokProductInfo.kok_store_name.in_(store_names))
-                .where(KokProductInfo.kok_review_cnt > 0)
-                .order_by(KokProductInfo.kok_review_cnt.desc(), KokProductInfo.kok_review_score.desc())
-                .limit(10)
-            )
+        # 3. 선택된 상품 정보 조회 (병합 순서 유지)
+        try:
+            products = (await db.execute(
+                select(*KOK_PRODUCT_CARD_COLUMNS).where(KokProductInfo.kok_product_id.in_(product_ids))
+            )).all()
+        except Exception as e:
+            logger.error(f"스토어 베스트 상품 조회 SQL 실행 실패: user_id={user_id}, sort_by={sort_by}, error={str(e)}")
+            return []
+        product_map = {product.kok_product_id: product for product in products}
+        store_results = [product_map[pid] for pid in product_ids if pid in product_map]
     else:
         # user_id가 없으면 전체 베스트 상품 조회
         logger.info("전체 베스트 상품 조회 모드 (user_id 없음)")
@@ -718,7 +664,7 @@ async def get_kok_store_best_items(
         if sort_by == "rating":
             # 별점 평균 순으로 정렬 (리뷰가 있는 상품만)
             store_best_stmt = (
-                select(KokProductInfo)
+                select(*KOK_PRODUCT_CARD_COLUMNS)
                 .where(KokProductInfo.kok_review_cnt > 0)
                 .where(KokProductInfo.kok_review_score > 0)
                 .order_by(KokProductInfo.kok_review_score.desc(), KokProductInfo.kok_review_cnt.desc())
@@ -728,97 +674,49 @@ async def get_kok_store_best_items(
         else:
             # 기본값: 리뷰 개수 순으로 정렬
             store_best_stmt = (
-                select(KokProductInfo)
+                select(*KOK_PRODUCT_CARD_COLUMNS)
                 .where(KokProductInfo.kok_review_cnt > 0)
                 .order_by(KokProductInfo.kok_review_cnt.desc(), KokProductInfo.kok_review_score.desc())
                 .limit(10)
             )
             logger.debug("정렬 기준: 리뷰 개수 순 → 별점 순")
-    
-    try:
-        store_results = (await db.execute(store_best_stmt)).scalars().all()
-    except Exception as e:
-        logger.error(f"스토어 베스트 상품 조회 SQL 실행 실패: user_id={user_id}, sort_by={sort_by}, error={str(e)}")
-        return []
+        
+        try:
+            store_results = (await db.execute(store_best_stmt)).all()
+        except Exception as e:
+            logger.error(f"스토어 베스트 상품 조회 SQL 실행 실패: user_id={user_id}, sort_by={sort_by}, error={str(e)}")
+            return []
     
     logger.info(f"해당 판매자들의 현재 판매 상품 수: {len(store_results)}")
-    if store_results:
-        logger.debug(f"첫 번째 상품 정보: {store_results[0].kok_product_name}, 판매자: {store_results[0].kok_store_name}, 리뷰 수: {store_results[0].kok_review_cnt}")
-    
-    # 최적화: 윈도우 함수를 사용하여 상품 정보와 최신 가격 정보를 한 번에 조회
-    product_ids = [product.kok_product_id for product in store_results]
-    
-    if not product_ids:
+    if not store_results:
         logger.warning("조회된 상품이 없음")
         return []
     
-    # 윈도우 함수를 사용한 최적화된 쿼리
-    windowed_query = (
-        select(
-            KokProductInfo.kok_product_id,
-            KokProductInfo.kok_thumbnail,
-            KokProductInfo.kok_product_name,
-            KokProductInfo.kok_store_name,
-            KokProductInfo.kok_product_price,
-            KokProductInfo.kok_review_cnt,
-            KokProductInfo.kok_review_score,
-            KokPriceInfo.kok_discount_rate,
-            KokPriceInfo.kok_discounted_price,
-            func.row_number().over(
-                partition_by=KokPriceInfo.kok_product_id,
-                order_by=KokPriceInfo.kok_price_id.desc()
-            ).label('rn')
-        )
-        .join(
-            KokPriceInfo,
-            KokProductInfo.kok_product_id == KokPriceInfo.kok_product_id
-        )
-        .where(KokProductInfo.kok_product_id.in_(product_ids))
-    )
-    
-    # 최신 가격만 필터링하여 조회
-    subquery = windowed_query.subquery()
-    optimized_stmt = (
-        select(
-            subquery.c.kok_product_id,
-            subquery.c.kok_discount_rate,
-            subquery.c.kok_discounted_price
-        )
-        .select_from(subquery)
-        .where(subquery.c.rn == 1)
-    )
-    
+    # 최신 가격 정보 일괄 조회 (상품 10개 이하, 쿼리 1회)
     try:
-        optimized_results = (await db.execute(optimized_stmt)).all()
+        latest_prices = await load_latest_kok_prices(db, [product.kok_product_id for product in store_results])
     except Exception as e:
-        logger.error(f"스토어 베스트 상품 가격 정보 조회 SQL 실행 실패: user_id={user_id}, product_ids={product_ids[:5]}, error={str(e)}")
-        return []
-    
-    # 결과를 딕셔너리로 변환하여 빠른 조회 가능하게 함
-    product_price_map = {}
-    for row in optimized_results:
-        product_price_map[row.kok_product_id] = {
-            'discount_rate': row.kok_discount_rate,
-            'discounted_price': row.kok_discounted_price
-        }
+        # 조회 실패 시 상품별 기본값(할인 없음, 정가)으로 표시
+        logger.error(f"스토어 베스트 상품 가격 정보 조회 SQL 실행 실패: user_id={user_id}, error={str(e)}")
+        latest_prices = None
     
     store_best_products = []
     for product in store_results:
-        price_info = product_price_map.get(product.kok_product_id)
-        if price_info:
+        price = latest_prices.get(product.kok_product_id) if latest_prices is not None else None
+        if price or latest_prices is None:
             store_best_products.append({
                 "kok_product_id": product.kok_product_id,
                 "kok_thumbnail": product.kok_thumbnail,
-                "kok_discount_rate": price_info['discount_rate'] or 0,
-                "kok_discounted_price": price_info['discounted_price'] or product.kok_product_price,
+                "kok_discount_rate": (price.kok_discount_rate if price else None) or 0,
+                "kok_discounted_price": (price.kok_discounted_price if price else None) or product.kok_product_price,
                 "kok_product_name": product.kok_product_name,
                 "kok_store_name": product.kok_store_name,
                 "kok_review_cnt": product.kok_review_cnt,
                 "kok_review_score": product.kok_review_score,
             })
     
-    # 캐시에 데이터 저장 (user_id가 있는 경우만)
-    if use_cache and user_id:
+    # 캐시에 데이터 저장 (user_id가 있는 경우만, 가격 조회 실패로 기본값을 쓴 결과는 저장하지 않음)
+    if use_cache and user_id and latest_prices is not None:
         await cache_manager.set(
             'store_best_items',
             store_best_products,
@@ -827,13 +725,7 @@ async def get_kok_store_best_items(
         )
     
     # logger.info(f"스토어 베스트 상품 조회 완료: user_id={user_id}, sort_by={sort_by}, 결과 수={len(store_best_products)}")
-    
-    # 최종 결과 요약 로그
-    if store_best_products:
-    # logger.info(f"반환된 상품들의 판매자 분포: {list(set([p['kok_store_name'] for p in store_best_products]))}")
-    # logger.info(f"반환된 상품들의 리뷰 수 범위: {min([p['kok_review_cnt'] for p in store_best_products])} ~ {max([p['kok_review_cnt'] for p in store_best_products])}")
-        pass
-    else:
+    if not store_best_products:
         logger.warning(f"빈 결과 반환 - 가능한 원인: 구매 이력 없음, 판매자 정보 누락, 해당 판매자 상품 없음, 리뷰 조건 불충족")
     
     return store_best_products
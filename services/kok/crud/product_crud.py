@@ -3,7 +3,7 @@ from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.kok.models.interaction_model import KokLikes
+from common.cache.membership import KOK_LIKE, get_memberships
 from services.kok.models.product_model import (
     KokDetailInfo,
     KokImageInfo,
@@ -22,7 +22,7 @@ from services.kok.schemas.product_schema import (
     KokReviewStats,
 )
 
-from .shared import get_latest_kok_price_id, logger
+from .shared import KOK_PRODUCT_CARD_COLUMNS, get_latest_kok_price_id, load_latest_kok_prices, logger
 
 async def get_kok_product_seller_details(
         db: AsyncSession,
@@ -32,8 +32,14 @@ async def get_kok_product_seller_details(
     상품의 상세정보를 반환
     - KOK_PRODUCT_INFO 테이블에서 판매자 정보
     - KOK_DETAIL_INFO 테이블에서 상세정보 목록
+    - 캐시(product_seller) 우선, 미스 시 DB 조회 후 저장
     """
+    from services.kok.utils.cache_utils import cache_manager
+
     # logger.info(f"상품 판매자 정보 조회 시작: kok_product_id={kok_product_id}")
+    cached = await cache_manager.get('product_seller', product_id=kok_product_id)
+    if cached:
+        return KokProductDetailsResponse(**cached)
     
     # 1. KOK_PRODUCT_INFO 테이블에서 판매자 정보 조회
     product_stmt = (
@@ -90,6 +96,7 @@ async def get_kok_product_seller_details(
         detail_info=detail_info_objects
     )
     
+    await cache_manager.set('product_seller', result.model_dump(), product_id=kok_product_id)
     # logger.info(f"상품 판매자 정보 조회 완료: kok_product_id={kok_product_id}, 상세정보 수={len(detail_info_objects)}")
     return result
     
@@ -118,8 +125,14 @@ async def get_kok_product_tabs(
         kok_product_id: int
 ) -> Optional[List[dict]]:
     """
-    상품 ID로 상품설명 이미지들 조회
+    상품 ID로 상품설명 이미지들 조회 (캐시(product_tabs) 우선, 미스 시 DB 조회 후 저장)
     """
+    from services.kok.utils.cache_utils import cache_manager
+
+    cached = await cache_manager.get('product_tabs', product_id=kok_product_id)
+    if cached:
+        return KokProductTabsResponse(**cached)
+
     # 상품 설명 이미지들 조회
     image_stmt = (
         select(KokImageInfo).where(KokImageInfo.kok_product_id == kok_product_id)
@@ -135,12 +148,13 @@ async def get_kok_product_tabs(
     for img in images:
         # None 값 체크 및 기본값 설정
         if img.kok_img_id is not None:  # 필수 필드 체크
-            images_list.append(KokImageInfo(
-                kok_img_id=img.kok_img_id,
-                kok_product_id=img.kok_product_id or kok_product_id,  # None이면 기본값 사용
-                kok_img_url=img.kok_img_url or ""  # None이면 빈 문자열
-            ))
+            images_list.append({
+                "kok_img_id": img.kok_img_id,
+                "kok_product_id": img.kok_product_id or kok_product_id,  # None이면 기본값 사용
+                "kok_img_url": img.kok_img_url or "",  # None이면 빈 문자열
+            })
     
+    await cache_manager.set('product_tabs', {"images": images_list}, product_id=kok_product_id)
     return KokProductTabsResponse(images=images_list)
 
 
@@ -151,9 +165,26 @@ async def get_kok_product_info(
 ) -> Optional[dict]:
     """
     상품 기본 정보 조회 (API 명세서 형식)
+    - 상품/가격 공용 부분은 캐시(product_info) 우선, 미스 시 DB 조회 후 저장
+    - 찜 여부(is_liked)는 사용자별이므로 캐시하지 않고 조회 시 덧씌움
     """
+    from services.kok.utils.cache_utils import cache_manager
+
     # logger.info(f"상품 기본 정보 조회 시작: kok_product_id={kok_product_id}, user_id={user_id}")
-    
+    shared = await cache_manager.get('product_info', product_id=kok_product_id)
+    if not shared:
+        shared = await _load_kok_product_info(db, kok_product_id)
+        if shared is None:
+            return None
+        await cache_manager.set('product_info', shared, product_id=kok_product_id)
+
+    is_liked = await _is_kok_product_liked(db, kok_product_id, user_id)
+    # logger.info(f"상품 기본 정보 조회 완료: kok_product_id={kok_product_id}, user_id={user_id}, is_liked={is_liked}")
+    return KokProductInfoResponse(**shared, is_liked=is_liked)
+
+
+async def _load_kok_product_info(db: AsyncSession, kok_product_id: int) -> Optional[dict]:
+    """상품 기본 정보 + 최신 가격 (사용자와 무관한 공용 부분)"""
     stmt = (
         select(KokProductInfo)
         .where(KokProductInfo.kok_product_id == kok_product_id)
@@ -183,33 +214,28 @@ async def get_kok_product_info(
     else:
         price = None
     
-    # 찜 상태 확인
-    is_liked = False
-    if user_id:
-        like_stmt = select(KokLikes).where(
-            KokLikes.user_id == user_id,
-            KokLikes.kok_product_id == product.kok_product_id
-        )
-        try:
-            like_result = await db.execute(like_stmt)
-            is_liked = like_result.scalar_one_or_none() is not None
-        except Exception as e:
-            logger.warning(f"찜 상태 확인 실패: user_id={user_id}, kok_product_id={kok_product_id}, error={str(e)}")
-            is_liked = False
-    
-    # logger.info(f"상품 기본 정보 조회 완료: kok_product_id={kok_product_id}, user_id={user_id}, is_liked={is_liked}")
-    
-    return KokProductInfoResponse(
-        kok_product_id=product.kok_product_id,
-        kok_product_name=product.kok_product_name or "",
-        kok_store_name=product.kok_store_name or "",
-        kok_thumbnail=product.kok_thumbnail or "",
-        kok_product_price=product.kok_product_price or 0,
-        kok_discount_rate=price.kok_discount_rate if price else 0,
-        kok_discounted_price=price.kok_discounted_price if price else (product.kok_product_price or 0),
-        kok_review_cnt=product.kok_review_cnt or 0,
-        is_liked=is_liked
-    )
+    return {
+        "kok_product_id": product.kok_product_id,
+        "kok_product_name": product.kok_product_name or "",
+        "kok_store_name": product.kok_store_name or "",
+        "kok_thumbnail": product.kok_thumbnail or "",
+        "kok_product_price": product.kok_product_price or 0,
+        "kok_discount_rate": price.kok_discount_rate if price else 0,
+        "kok_discounted_price": price.kok_discounted_price if price else (product.kok_product_price or 0),
+        "kok_review_cnt": product.kok_review_cnt or 0,
+    }
+
+
+async def _is_kok_product_liked(db: AsyncSession, kok_product_id: int, user_id: Optional[int]) -> bool:
+    """사용자별 찜 여부 (사용자 찜 멤버십 집합 조회, 비로그인은 False)"""
+    if not user_id:
+        return False
+    try:
+        liked_ids = (await get_memberships(db, user_id, [KOK_LIKE]))[KOK_LIKE]
+    except Exception as e:
+        logger.warning(f"찜 상태 확인 실패: user_id={user_id}, kok_product_id={kok_product_id}, error={str(e)}")
+        return False
+    return kok_product_id in liked_ids
 
 
 async def get_kok_review_data(
@@ -297,47 +323,41 @@ async def get_kok_products_by_ingredient(
     ingredient(예: 고춧가루)로 콕 상품을 LIKE 검색, 필드명 model 변수명과 100% 일치
     """
     stmt = (
-        select(KokProductInfo)
+        select(*KOK_PRODUCT_CARD_COLUMNS)
         .where(KokProductInfo.kok_product_name.ilike(f"%{ingredient}%"))
         .limit(limit)
     )
     try:
-        result = await db.execute(stmt)
-        results = result.all()
+        results = (await db.execute(stmt)).all()
     except Exception as e:
         logger.error(f"식재료 기반 상품 검색 SQL 실행 실패: ingredient={ingredient}, limit={limit}, error={str(e)}")
         return []
 
+    # 최신 가격 정보 일괄 조회 (상품 수와 무관하게 쿼리 1회)
+    try:
+        latest_prices = await load_latest_kok_prices(db, (product.kok_product_id for product in results))
+    except Exception as e:
+        # 조회 실패 시 상품별 기본값(할인 없음, 정가)으로 표시
+        logger.warning(f"식재료 상품 가격 정보 조회 실패: ingredient={ingredient}, error={str(e)}")
+        latest_prices = None
+
     products = []
     for product in results:
-        # 최신 가격 정보 조회
-        latest_price_id = await get_latest_kok_price_id(db, product.kok_product_id)
-        if latest_price_id:
-            # 최신 가격 정보로 상세 정보 조회
-            price_stmt = select(KokPriceInfo).where(KokPriceInfo.kok_price_id == latest_price_id)
-            try:
-                price_result = await db.execute(price_stmt)
-                price_info = price_result.scalar_one_or_none()
-            except Exception as e:
-                logger.warning(f"식재료 상품 가격 정보 조회 실패: kok_product_id={product.kok_product_id}, latest_price_id={latest_price_id}, error={str(e)}")
-                price_info = None
-            
-            products.append({
-                "kok_product_id": product.kok_product_id,
-                "kok_product_name": product.kok_product_name,
-                "kok_thumbnail": product.kok_thumbnail,
-                "kok_store_name": product.kok_store_name,
-                "kok_product_price": product.kok_product_price,
-                "kok_discount_rate": price_info.kok_discount_rate if price_info else 0,
-                "kok_discounted_price": (
-                    price_info.kok_discounted_price
-                    if price_info and price_info.kok_discounted_price
-                    else product.kok_product_price
-                ),
-                "kok_review_score": product.kok_review_score,
-                "kok_review_cnt": product.kok_review_cnt,
-                # 필요시 model에 정의된 추가 필드도 동일하게 추출
-            })
+        price_info = latest_prices.get(product.kok_product_id) if latest_prices is not None else None
+        if latest_prices is not None and price_info is None:
+            continue
+        products.append({
+            "kok_product_id": product.kok_product_id,
+            "kok_product_name": product.kok_product_name,
+            "kok_thumbnail": product.kok_thumbnail,
+            "kok_store_name": product.kok_store_name,
+            "kok_product_price": product.kok_product_price,
+            "kok_discount_rate": price_info.kok_discount_rate if price_info else 0,
+            "kok_discounted_price": (price_info.kok_discounted_price if price_info else None) or product.kok_product_price,
+            "kok_review_score": product.kok_review_score,
+            "kok_review_cnt": product.kok_review_cnt,
+            # 필요시 model에 정의된 추가 필드도 동일하게 추출
+        })
     
     return products
 
@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.pagination import keyset_before
+
 from services.kok.models.interaction_model import KokNotification, KokSearchHistory
 from services.kok.models.product_model import KokPriceInfo, KokProductInfo
 
@@ -134,17 +136,21 @@ async def search_kok_products(
 async def get_kok_search_history(
     db: AsyncSession,
     user_id: int,
-    limit: int = 10
+    limit: int = 10,
+    cursor: Optional[Tuple[datetime, int]] = None
 ) -> List[dict]:
     """
     사용자의 검색 이력 조회
+    - cursor(직전 페이지 마지막 이력의 kok_searched_at, kok_history_id) 지정 시 다음 페이지
     """
     stmt = (
         select(KokSearchHistory)
         .where(KokSearchHistory.user_id == user_id)
-        .order_by(KokSearchHistory.kok_searched_at.desc())
+        .order_by(KokSearchHistory.kok_searched_at.desc(), KokSearchHistory.kok_history_id.desc())
         .limit(limit)
     )
+    if cursor is not None:
+        stmt = stmt.where(keyset_before(KokSearchHistory.kok_searched_at, KokSearchHistory.kok_history_id, cursor))
     
     try:
         results = (await db.execute(stmt)).scalars().all()
@@ -1,13 +1,52 @@
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.batch_loader import get_loader
 from common.logger import get_logger
-from services.kok.models.product_model import KokPriceInfo
+from services.kok.models.product_model import KokPriceInfo, KokProductInfo
 
 logger = get_logger("kok_crud")
 
+# 목록/추천 카드 응답용 컬럼 (판매자·리뷰 비율 등 상세 탭 컬럼 제외)
+KOK_PRODUCT_CARD_COLUMNS = (
+    KokProductInfo.kok_product_id,
+    KokProductInfo.kok_thumbnail,
+    KokProductInfo.kok_product_name,
+    KokProductInfo.kok_store_name,
+    KokProductInfo.kok_product_price,
+    KokProductInfo.kok_review_cnt,
+    KokProductInfo.kok_review_score,
+)
+
+# 상품 테이블의 스칼라 컬럼 전체 (관계 속성 제외, 엔티티 대신 행으로 조회할 때 사용)
+KOK_PRODUCT_ALL_COLUMNS = tuple(
+    getattr(KokProductInfo, key) for key in KokProductInfo.__mapper__.columns.keys()
+)
+
+
+def latest_kok_price_subquery(
+        kok_product_ids: Optional[Iterable[int]] = None,
+        discounted_only: bool = False
+):
+    """
+    상품별 최신 가격 ID 서브쿼리 (kok_product_id, kok_price_id)
+
+    Args:
+        kok_product_ids: 대상 상품 ID (None이면 전체)
+        discounted_only: True면 할인가가 있는 가격 행 중 최신
+    """
+    stmt = select(
+        KokPriceInfo.kok_product_id.label("kok_product_id"),
+        func.max(KokPriceInfo.kok_price_id).label("kok_price_id"),
+    )
+    if kok_product_ids is not None:
+        stmt = stmt.where(KokPriceInfo.kok_product_id.in_(list(kok_product_ids)))
+    if discounted_only:
+        stmt = stmt.where(KokPriceInfo.kok_discounted_price.isnot(None))
+    return stmt.group_by(KokPriceInfo.kok_product_id).subquery()
+
 async def get_latest_kok_price_id(
         db: AsyncSession,
         kok_product_id: int
@@ -40,3 +79,57 @@ async def get_latest_kok_price_id(
     except Exception as e:
         logger.error(f"최신 가격 ID 조회 중 오류 발생: kok_product_id={kok_product_id}, error={str(e)}")
         return None
+
+
+async def _fetch_latest_kok_prices(db: AsyncSession, kok_product_ids: List[int]) -> Dict[int, KokPriceInfo]:
+    """상품 ID 목록의 최신 가격 행을 IN 쿼리 1회로 조회"""
+    latest = latest_kok_price_subquery(kok_product_ids)
+    stmt = select(KokPriceInfo).join(latest, KokPriceInfo.kok_price_id == latest.c.kok_price_id)
+    try:
+        prices = (await db.execute(stmt)).scalars().all()
+    except Exception as e:
+        logger.error(f"최신 가격 일괄 조회 중 오류 발생: 상품 수={len(kok_product_ids)}, error={str(e)}")
+        return {}
+    return {price.kok_product_id: price for price in prices}
+
+
+async def _fetch_kok_product_ids_by_price(db: AsyncSession, kok_price_ids: List[int]) -> Dict[int, int]:
+    """가격 ID 목록 → 상품 ID 매핑을 IN 쿼리 1회로 조회"""
+    stmt = (
+        select(KokPriceInfo.kok_price_id, KokPriceInfo.kok_product_id)
+        .where(KokPriceInfo.kok_price_id.in_(kok_price_ids))
+    )
+    try:
+        rows = (await db.execute(stmt)).all()
+    except Exception as e:
+        logger.error(f"가격 ID로 상품 ID 일괄 조회 중 오류 발생: 가격 ID 수={len(kok_price_ids)}, error={str(e)}")
+        return {}
+    return {price_id: product_id for price_id, product_id in rows}
+
+
+async def load_latest_kok_prices(
+        db: AsyncSession,
+        kok_product_ids: Iterable[int]
+) -> Dict[int, KokPriceInfo]:
+    """
+    상품 ID 목록의 최신 가격 정보를 일괄 조회 (요청 범위 메모이즈)
+    
+    Returns:
+        {kok_product_id: KokPriceInfo} (가격 정보가 없는 상품은 제외)
+    """
+    loader = get_loader(db, "kok_latest_price", _fetch_latest_kok_prices)
+    return await loader.load_many(kok_product_ids)
+
+
+async def load_kok_product_ids_by_price(
+        db: AsyncSession,
+        kok_price_ids: Iterable[int]
+) -> Dict[int, int]:
+    """
+    가격 ID 목록의 상품 ID를 일괄 조회 (요청 범위 메모이즈)
+    
+    Returns:
+        {kok_price_id: kok_product_id}
+    """
+    loader = get_loader(db, "kok_product_id_by_price", _fetch_kok_product_ids_by_price)
+    return await loader.load_many(kok_price_ids)
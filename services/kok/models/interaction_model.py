@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.schema import UniqueConstraint
 
@@ -15,6 +15,11 @@ class KokSearchHistory(MariaBase):
     kok_keyword = Column("KOK_KEYWORD", String(100), nullable=False)  # 검색 키워드
     kok_searched_at = Column("KOK_SEARCHED_AT", DateTime, nullable=False)  # 검색 시간
 
+    __table_args__ = (
+        # 검색 이력 키셋 페이지네이션
+        Index("IX_KOK_SEARCH_HISTORY_USER_TIME_ID", "USER_ID", "KOK_SEARCHED_AT", "KOK_HISTORY_ID"),
+    )
+
 class KokLikes(MariaBase):
     """
     KOK_LIKES 테이블의 ORM 모델
@@ -26,6 +31,11 @@ class KokLikes(MariaBase):
     kok_product_id = Column("KOK_PRODUCT_ID", Integer, ForeignKey("FCT_KOK_PRODUCT_INFO.KOK_PRODUCT_ID"), nullable=False)  # 제품 ID
     kok_created_at = Column("KOK_CREATED_AT", DateTime, nullable=False)  # 찜한 시간
 
+    __table_args__ = (
+        # 사용자별 상품 찜 1건 (찜 토글의 INSERT ... ON DUPLICATE KEY 기준)
+        UniqueConstraint("USER_ID", "KOK_PRODUCT_ID", name="UK_KOK_LIKES_USER_PRODUCT"),
+    )
+
     # 제품 정보와 N:1 관계 설정
     product = relationship(
         "KokProductInfo",
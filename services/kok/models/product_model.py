@@ -7,6 +7,9 @@ class KokProductInfo(MariaBase):
     """
     FCT_KOK_PRODUCT_INFO 테이블의 ORM 모델
     DB 데이터 정의서 기반으로 변수명 통일
+
+    관계 속성은 lazy="raise": 요청 경로에서 의도치 않은 지연 로딩(숨은 쿼리)을 막음.
+    필요한 곳에서만 selectinload 등 로더 옵션이나 컬럼 조회를 명시적으로 사용.
     """
     __tablename__ = "FCT_KOK_PRODUCT_INFO"
 
@@ -53,7 +56,7 @@ class KokProductInfo(MariaBase):
         "KokImageInfo",
         back_populates="product",
         primaryjoin="KokProductInfo.kok_product_id==KokImageInfo.kok_product_id",
-        lazy="select"
+        lazy="raise"
     )
 
     # 상세 정보와 1:N 관계 설정
@@ -61,7 +64,7 @@ class KokProductInfo(MariaBase):
         "KokDetailInfo",
         back_populates="product",
         primaryjoin="KokProductInfo.kok_product_id==KokDetailInfo.kok_product_id",
-        lazy="select"
+        lazy="raise"
     )
 
     # 리뷰 예시와 1:N 관계 설정
@@ -69,7 +72,7 @@ class KokProductInfo(MariaBase):
         "KokReviewExample",
         back_populates="product",
         primaryjoin="KokProductInfo.kok_product_id==KokReviewExample.kok_product_id",
-        lazy="select"
+        lazy="raise"
     )
 
     # 가격 정보와 1:N 관계 설정
@@ -77,7 +80,7 @@ class KokProductInfo(MariaBase):
         "KokPriceInfo",
         back_populates="product",
         primaryjoin="KokProductInfo.kok_product_id==KokPriceInfo.kok_product_id",
-        lazy="select"
+        lazy="raise"
     )
 
     # 찜과 1:N 관계 설정
@@ -85,7 +88,7 @@ class KokProductInfo(MariaBase):
         "KokLikes",
         back_populates="product",
         primaryjoin="KokProductInfo.kok_product_id==KokLikes.kok_product_id",
-        lazy="select"
+        lazy="raise"
     )
 
     # 장바구니와 1:N 관계 설정
@@ -93,7 +96,7 @@ class KokProductInfo(MariaBase):
         "KokCart",
         back_populates="product",
         primaryjoin="KokProductInfo.kok_product_id==KokCart.kok_product_id",
-        lazy="select"
+        lazy="raise"
     )
 
 class KokImageInfo(MariaBase):
@@ -110,7 +113,7 @@ class KokImageInfo(MariaBase):
     product = relationship(
         "KokProductInfo",
         back_populates="images",
-        lazy="select"
+        lazy="raise"
     )
 
 class KokDetailInfo(MariaBase):
@@ -128,7 +131,7 @@ class KokDetailInfo(MariaBase):
     product = relationship(
         "KokProductInfo",
         back_populates="detail_infos",
-        lazy="select"
+        lazy="raise"
     )
 
 class KokReviewExample(MariaBase):
@@ -151,7 +154,7 @@ class KokReviewExample(MariaBase):
     product = relationship(
         "KokProductInfo",
         back_populates="review_examples",
-        lazy="select"
+        lazy="raise"
     )
 
 class KokPriceInfo(MariaBase):
@@ -169,5 +172,5 @@ class KokPriceInfo(MariaBase):
     product = relationship(
         "KokProductInfo",
         back_populates="price_infos",
-        lazy="select"
+        lazy="raise"
     )
@@ -1,7 +1,14 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.database.mariadb_service import get_maria_service_db
+from common.errors import RateLimitExceededException
 from common.logger import get_logger
 from services.kok.utils.cache_utils import cache_manager
+from services.kok.utils.store_best_index import (
+    refresh_store_top_index_throttled,
+    store_top_refresh_retry_after,
+)
 
 logger = get_logger("kok_router")
 router = APIRouter()
@@ -54,6 +61,46 @@ async def invalidate_store_best_cache():
         logger.error(f"스토어 베스트 상품 캐시 무효화 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"캐시 무효화 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/cache/invalidate/product/{kok_product_id}")
+async def invalidate_product_detail_cache(kok_product_id: int):
+    """
+    상품 상세 캐시(기본 정보/이미지/판매자 정보) 무효화 (상품·가격 적재 후 호출)
+    """
+    logger.debug(f"상품 상세 캐시 무효화 시작: kok_product_id={kok_product_id}")
+    
+    try:
+        invalidated = await cache_manager.invalidate_product_info(kok_product_id)
+        logger.info(f"상품 상세 캐시 무효화 완료: kok_product_id={kok_product_id}, 삭제 여부={invalidated}")
+        return {"message": f"상품 상세 캐시가 무효화되었습니다. kok_product_id: {kok_product_id}"}
+    except Exception as e:
+        logger.error(f"상품 상세 캐시 무효화 실패: kok_product_id={kok_product_id}, error={str(e)}")
+        raise HTTPException(status_code=500, detail=f"캐시 무효화 중 오류가 발생했습니다: {str(e)}")
+
+@router.post("/cache/refresh/store-best-index")
+async def refresh_store_best_index(db: AsyncSession = Depends(get_maria_service_db)):
+    """
+    스토어별 베스트 상품 인덱스 재구성 (상품 리뷰 통계 적재 배치 마지막 단계에서 호출)
+    - 전체 스토어를 다시 조회하므로 진행 중이거나 최소 간격 이내 재호출은 429
+    """
+    logger.debug("스토어 베스트 인덱스 재구성 시작")
+    
+    retry_after = store_top_refresh_retry_after()
+    if retry_after > 0:
+        raise RateLimitExceededException(retry_after=retry_after)
+
+    try:
+        store_count = await refresh_store_top_index_throttled(db)
+        if store_count is None:
+            raise RateLimitExceededException(retry_after=store_top_refresh_retry_after() or 1)
+        deleted_count = await cache_manager.invalidate_store_best_items()
+        logger.info(f"스토어 베스트 인덱스 재구성 완료: 스토어 수={store_count}, 삭제된 결과 캐시 수={deleted_count}")
+        return {"message": f"스토어 베스트 인덱스가 재구성되었습니다. 스토어 수: {store_count}"}
+    except RateLimitExceededException:
+        raise
+    except Exception as e:
+        logger.error(f"스토어 베스트 인덱스 재구성 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"인덱스 재구성 중 오류가 발생했습니다: {str(e)}")
+
 @router.post("/cache/invalidate/all")
 async def invalidate_all_cache():
     """
@@ -65,8 +112,9 @@ async def invalidate_all_cache():
         discounted_count = await cache_manager.invalidate_discounted_products()
         top_selling_count = await cache_manager.invalidate_top_selling_products()
         store_best_count = await cache_manager.invalidate_store_best_items()
+        product_detail_count = await cache_manager.invalidate_product_details()
         
-        total_count = discounted_count + top_selling_count + store_best_count
+        total_count = discounted_count + top_selling_count + store_best_count + product_detail_count
         logger.debug(f"모든 KOK 캐시 무효화 성공: 총 삭제된 키 수={total_count}")
         logger.info(f"모든 KOK 캐시 무효화 완료: 총 삭제된 키 수={total_count}")
         return {
@@ -75,6 +123,7 @@ async def invalidate_all_cache():
                 "discounted_products": discounted_count,
                 "top_selling_products": top_selling_count,
                 "store_best_items": store_best_count,
+                "product_details": product_detail_count,
                 "total": total_count
             }
         }
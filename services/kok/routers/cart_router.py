@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status, BackgroundTasks, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-import pandas as pd
 
 from common.dependencies import get_current_user
 from common.database.mariadb_service import get_maria_service_db
@@ -278,7 +277,7 @@ async def recommend_recipes_from_cart_items(
         # ingredient 모드에서는 vector_searcher가 필요하지 않지만 함수 시그니처상 필수
         # None을 전달하여 실제 사용하지 않음을 표시
         logger.debug("레시피 추천 실행 시작")
-        recipes_df = await recommend_by_recipe_pgvector_v2(
+        recipe_records = await recommend_by_recipe_pgvector_v2(
             mariadb=db,
             postgres=db,  # MariaDB를 postgres로도 사용 (ingredient 모드에서는 pgvector 사용 안함)
             query=ingredients_query,
@@ -288,37 +287,30 @@ async def recommend_recipes_from_cart_items(
             include_materials=True,
             vector_searcher=None  # ingredient 모드에서는 사용하지 않음
         )
-        logger.debug(f"레시피 추천 결과: DataFrame 크기={len(recipes_df)}")
+        logger.debug(f"레시피 추천 결과: 레코드 수={len(recipe_records)}")
         
-        # DataFrame을 응답 형식에 맞게 변환
-        logger.debug("DataFrame을 응답 형식으로 변환 시작")
+        # 레코드를 응답 형식에 맞게 변환
+        logger.debug("레시피 레코드를 응답 형식으로 변환 시작")
         recipes = []
-        if not recipes_df.empty:
-            logger.debug(f"레시피 데이터 변환: {len(recipes_df)}개 레시피 처리")
-            for _, row in recipes_df.iterrows():
+        if recipe_records:
+            logger.debug(f"레시피 데이터 변환: {len(recipe_records)}개 레시피 처리")
+            for row in recipe_records:
                 recipe_dict = {
                     "recipe_id": int(row["RECIPE_ID"]),
                     "recipe_title": str(row.get("RECIPE_TITLE", "")) if row.get("RECIPE_TITLE") else None,
                     "cooking_name": str(row.get("COOKING_NAME", "")) if row.get("COOKING_NAME") else None,
                     "description": str(row.get("COOKING_INTRODUCTION", "")) if row.get("COOKING_INTRODUCTION") else None,
-                    "scrap_count": int(row["SCRAP_COUNT"]) if row["SCRAP_COUNT"] is not None and not (isinstance(row["SCRAP_COUNT"], float) and pd.isna(row["SCRAP_COUNT"])) else 0,
+                    "scrap_count": int(row["SCRAP_COUNT"]) if row.get("SCRAP_COUNT") is not None else 0,
                     "recipe_url": f"https://www.10000recipe.com/recipe/{int(row['RECIPE_ID'])}",
                     "number_of_serving": str(row.get("NUMBER_OF_SERVING", "")) if row.get("NUMBER_OF_SERVING") else None,
                     "ingredients": []
                 }
                 
                 # 재료 정보가 있으면 ingredients 배열에 재료명만 추가
-                if "MATERIALS" in row and row["MATERIALS"] is not None:
-                    try:
-                        # pandas의 NaN 값 체크를 안전하게 수행
-                        if not (isinstance(row["MATERIALS"], float) and pd.isna(row["MATERIALS"])):
-                            for material in row["MATERIALS"]:
-                                material_name = material.get("MATERIAL_NAME", "")
-                                if material_name:
-                                    recipe_dict["ingredients"].append(material_name)
-                    except:
-                        # 에러가 발생하면 재료 정보를 추가하지 않음
-                        pass
+                for material in row.get("MATERIALS") or []:
+                    material_name = material.get("MATERIAL_NAME", "")
+                    if material_name:
+                        recipe_dict["ingredients"].append(material_name)
                 
                 recipes.append(recipe_dict)
         else:
@@ -6,6 +6,7 @@ from common.database.mariadb_service import get_maria_service_db
 from common.log_utils import send_user_log
 from common.http_dependencies import extract_http_info
 from common.logger import get_logger
+from common.query_recorder import query_budget
 
 from services.user.schemas.profile_schema import UserOut
 from services.kok.schemas.interaction_schema import (
@@ -72,6 +73,7 @@ async def toggle_likes(
 
 
 @router.get("/likes", response_model=KokLikedProductsResponse)
+@query_budget(5)
 async def get_liked_products(
     request: Request,
     limit: int = Query(50, ge=1, le=100, description="조회할 찜 상품 개수"),
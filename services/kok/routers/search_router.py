@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -6,6 +8,7 @@ from common.database.mariadb_service import get_maria_service_db
 from common.log_utils import send_user_log
 from common.http_dependencies import extract_http_info
 from common.logger import get_logger
+from common.pagination import build_next_cursor, parse_cursor_param
 
 from services.user.schemas.profile_schema import UserOut
 from services.kok.schemas.interaction_schema import (
@@ -90,6 +93,7 @@ async def search_products(
 async def get_search_history(
     request: Request,
     limit: int = Query(10, ge=1, le=50, description="조회할 이력 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (직전 응답의 next_cursor)"),
     current_user: UserOut = Depends(get_current_user),
     background_tasks: BackgroundTasks = None,
     db: AsyncSession = Depends(get_maria_service_db)
@@ -98,9 +102,10 @@ async def get_search_history(
     사용자의 검색 이력을 조회
     """
     logger.debug(f"검색 이력 조회 시작: user_id={current_user.user_id}, limit={limit}")
+    after = parse_cursor_param(cursor)
     
     try:
-        history = await get_kok_search_history(db, current_user.user_id, limit)
+        history = await get_kok_search_history(db, current_user.user_id, limit, cursor=after)
         logger.debug(f"검색 이력 조회 성공: user_id={current_user.user_id}, 결과 수={len(history)}")
     except Exception as e:
         logger.error(f"검색 이력 조회 실패: user_id={current_user.user_id}, error={str(e)}")
@@ -117,7 +122,8 @@ async def get_search_history(
             **http_info  # HTTP 정보를 키워드 인자로 전달
         )
     
-    return {"history": history}
+    next_cursor = build_next_cursor(history, limit, lambda h: (h["kok_searched_at"], h["kok_history_id"]))
+    return {"history": history, "next_cursor": next_cursor}
 
 
 @router.post("/search/history", response_model=dict)
@@ -147,6 +147,7 @@ class KokSearchResponse(BaseModel):
 class KokSearchHistoryResponse(BaseModel):
     """검색 이력 응답"""
     history: List[KokSearchHistory] = Field(default_factory=list)
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
 class KokSearchHistoryCreate(BaseModel):
     """검색 이력 생성 요청"""
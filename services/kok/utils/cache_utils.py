@@ -5,6 +5,9 @@ Redis를 활용한 캐싱 전략을 구현합니다.
 - 할인 상품 목록 캐싱 (5분 TTL)
 - 인기 상품 목록 캐싱 (10분 TTL)
 - 스토어 베스트 상품 캐싱 (15분 TTL)
+- 사용자 구매 스토어 목록 캐싱 (1일 TTL, 주문 생성 시 무효화)
+- 상품 상세 공용 페이로드 캐싱 (기본 정보 30분 / 이미지·판매자 정보 6시간 TTL, 상품·가격 적재 시 무효화)
+  · 사용자별 찜 여부는 캐시하지 않고 조회 시 덧씌움
 """
 
 from typing import Any, Optional
@@ -12,6 +15,7 @@ from typing import Any, Optional
 from common.cache.redis_cache import RedisCacheCore
 from common.config import get_settings
 from common.logger import get_logger
+from common.metrics import record_cache_lookup
 
 logger = get_logger("kok_cache_utils")
 settings = get_settings()
@@ -29,6 +33,9 @@ class KokCacheManager:
         'top_selling_products': 'kok:top_selling:page:{page}:size:{size}:sort:{sort_by}',
         'store_best_items': 'kok:store_best:user:{user_id}:sort:{sort_by}',
         'product_info': 'kok:product:{product_id}',
+        'product_tabs': 'kok:product:{product_id}:tabs',
+        'product_seller': 'kok:product:{product_id}:seller',
+        'purchased_stores': 'kok:purchased_stores:user:{user_id}',
     }
 
     # TTL 설정 (초)
@@ -36,7 +43,10 @@ class KokCacheManager:
         'discounted_products': 300,  # 5분
         'top_selling_products': 600,  # 10분
         'store_best_items': 900,     # 15분
-        'product_info': 1800,        # 30분
+        'product_info': 1800,        # 30분 (가격 포함)
+        'product_tabs': 21600,       # 6시간 (상품 설명 이미지)
+        'product_seller': 21600,     # 6시간 (판매자/상세 정보)
+        'purchased_stores': 86400,   # 1일 (주문 생성 시 무효화)
     }
 
     @classmethod
@@ -56,8 +66,10 @@ class KokCacheManager:
 
             if cached_data:
                 logger.debug(f"캐시 히트: {cache_key}")
+                record_cache_lookup("kok_cache", cache_type, hit=True)
                 return cached_data
             logger.debug(f"캐시 미스: {cache_key}")
+            record_cache_lookup("kok_cache", cache_type, hit=False)
             return None
 
         except Exception as e:
@@ -108,17 +120,36 @@ class KokCacheManager:
         """스토어 베스트 상품 캐시 무효화"""
         return await self.delete_pattern("kok:store_best:*")
 
+    async def invalidate_user_store_best(self, user_id: int) -> int:
+        """사용자 구매 스토어 목록과 스토어 베스트 결과 캐시 무효화 (주문 생성 시)"""
+        from services.kok.utils.store_best_index import STORE_BEST_SORTS
+
+        keys = [self._get_cache_key('purchased_stores', user_id=user_id)] + [
+            self._get_cache_key('store_best_items', user_id=user_id, sort_by=sort_by)
+            for sort_by in STORE_BEST_SORTS
+        ]
+        deleted = 0
+        for key in keys:
+            deleted += await self.redis_cache.delete_key(key)
+        return deleted
+
     async def invalidate_product_info(self, product_id: int) -> bool:
-        """특정 상품 정보 캐시 무효화"""
+        """특정 상품 상세 캐시(기본 정보/이미지/판매자 정보) 무효화 (상품·가격 적재 후 호출)"""
         try:
-            cache_key = self._get_cache_key('product_info', product_id=product_id)
-            result = await self.redis_cache.delete_key(cache_key)
-            logger.info(f"상품 정보 캐시 무효화: {cache_key}, 결과: {result}")
+            result = 0
+            for cache_type in ('product_info', 'product_tabs', 'product_seller'):
+                cache_key = self._get_cache_key(cache_type, product_id=product_id)
+                result += await self.redis_cache.delete_key(cache_key)
+            logger.info(f"상품 상세 캐시 무효화: product_id={product_id}, 삭제된 키 수: {result}")
             return bool(result)
         except Exception as e:
             logger.error(f"상품 정보 캐시 무효화 실패: {product_id}, error: {str(e)}")
             return False
 
+    async def invalidate_product_details(self) -> int:
+        """모든 상품 상세 캐시 무효화 (상품·가격 일괄 적재 후 호출)"""
+        return await self.delete_pattern("kok:product:*")
+
     async def close(self):
         """Redis 연결 종료"""
         await self.redis_cache.close()
@@ -0,0 +1,260 @@
+"""
+KOK 스토어 베스트 인덱스
+
+구매한 스토어의 베스트 상품 조회 시 사용자의 전체 구매 행과 스토어 전체 상품을 훑던 방식을
+"스토어별로 미리 정렬된 상위 N개 목록 + 사용자별 구매 스토어 집합"으로 바꿉니다.
+
+- 스토어별 상위 N: Redis sorted set `kok:store_top:{sort_by}:{store_name}` (member=상품 ID, score=정렬 점수)
+  · 없는 스토어만 윈도우 쿼리 1회로 채우고 TTL 동안 재사용 (상품 통계는 배치로만 갱신)
+  · 상품 리뷰 통계(FCT_KOK_PRODUCT_INFO)는 외부 적재 배치로만 갱신 → 배치 마지막 단계에서
+    `POST /api/kok/cache/refresh/store-best-index` 를 호출해 즉시 재구성 (호출하지 않으면 TTL 후 반영)
+  · 재구성은 전체 스토어를 다시 조회하므로 프로세스당 1개씩, 최소 간격 이내 재호출은 429
+- 사용자 구매 스토어: KokCacheManager 'purchased_stores' 캐시 (주문 생성 시 무효화)
+- 조회: 스토어 목록 k개를 점수 내림차순으로 k-way merge 해 상위 limit 개만 선택
+- Redis 장애 시 같은 윈도우 쿼리 결과를 바로 병합 (결과 동일)
+"""
+
+import asyncio
+import heapq
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.logger import get_logger
+from services.kok.models.product_model import KokProductInfo
+from services.order.models.kok.kok_order_model import KokOrder
+from services.order.models.order_base_model import Order
+
+logger = get_logger("kok_store_best_index")
+
+STORE_TOP_N = 10
+STORE_TOP_TTL_SECONDS = 3600
+STORE_BEST_SORTS = ("review_count", "rating")
+STORE_TOP_REFRESH_MIN_INTERVAL_SECONDS = 60
+
+_STORE_TOP_KEY = "kok:store_top:{sort_by}:{store_name}"
+# 조건을 만족하는 상품이 없는 스토어도 "구성됨"으로 표시하기 위한 자리표시 멤버
+_EMPTY_MEMBER = "0"
+_EMPTY_SCORE = -1.0
+
+RankedEntry = Tuple[float, int]  # (정렬 점수, 상품 ID)
+
+_refresh_lock = asyncio.Lock()
+_last_refresh_at = 0.0
+
+
+def store_top_key(sort_by: str, store_name: str) -> str:
+    return _STORE_TOP_KEY.format(sort_by=sort_by, store_name=store_name)
+
+
+def rank_score(sort_by: str, review_cnt: Optional[int], review_score: Optional[float]) -> float:
+    """
+    (1차, 2차) 정렬 기준을 단일 점수로 합성 (sorted set score 용)
+    - review_count: 리뷰 수 → 별점 (별점×100 은 1000 미만)
+    - rating: 별점 → 리뷰 수 (리뷰 수는 10^9 미만으로 절단)
+    """
+    cnt = int(review_cnt or 0)
+    score = int(round(float(review_score or 0) * 100))
+    if sort_by == "rating":
+        return float(score * 10**9 + min(cnt, 10**9 - 1))
+    return float(cnt * 1000 + score)
+
+
+async def fetch_store_top_n(
+    db: AsyncSession,
+    store_names: Sequence[str],
+    sort_by: str,
+    top_n: int = STORE_TOP_N,
+) -> Dict[str, List[RankedEntry]]:
+    """
+    스토어별 상위 N개 상품 조회 (윈도우 쿼리 1회)
+
+    Returns:
+        {store_name: [(점수, 상품 ID), ...]} — 점수 내림차순, 조건을 만족하는 상품이 없으면 빈 목록
+    """
+    if not store_names:
+        return {}
+
+    if sort_by == "rating":
+        order_by = (KokProductInfo.kok_review_score.desc(), KokProductInfo.kok_review_cnt.desc())
+    else:
+        order_by = (KokProductInfo.kok_review_cnt.desc(), KokProductInfo.kok_review_score.desc())
+
+    ranked = (
+        select(
+            KokProductInfo.kok_product_id,
+            KokProductInfo.kok_store_name,
+            KokProductInfo.kok_review_cnt,
+            KokProductInfo.kok_review_score,
+            func.row_number().over(
+                partition_by=KokProductInfo.kok_store_name,
+                order_by=order_by,
+            ).label("rn"),
+        )
+        .where(KokProductInfo.kok_store_name.in_(list(store_names)))
+        .where(KokProductInfo.kok_review_cnt > 0)
+    )
+    if sort_by == "rating":
+        ranked = ranked.where(KokProductInfo.kok_review_score > 0)
+    subquery = ranked.subquery()
+
+    rows = (await db.execute(select(subquery).where(subquery.c.rn <= top_n))).all()
+
+    per_store: Dict[str, List[RankedEntry]] = {name: [] for name in store_names}
+    for row in rows:
+        per_store[row.kok_store_name].append(
+            (rank_score(sort_by, row.kok_review_cnt, row.kok_review_score), row.kok_product_id)
+        )
+    for entries in per_store.values():
+        entries.sort(reverse=True)
+    return per_store
+
+
+def merge_store_tops(per_store: Iterable[Sequence[RankedEntry]], limit: int) -> List[int]:
+    """점수 내림차순으로 정렬된 스토어별 목록을 k-way merge 해 상위 limit 개 상품 ID 반환"""
+    merged = heapq.merge(*per_store, key=lambda entry: entry[0], reverse=True)
+    result: List[int] = []
+    seen = set()
+    for _, product_id in merged:
+        if product_id in seen:
+            continue
+        seen.add(product_id)
+        result.append(product_id)
+        if len(result) >= limit:
+            break
+    return result
+
+
+async def _get_client():
+    from services.kok.utils.cache_utils import cache_manager
+
+    return await cache_manager.redis_cache.get_client()
+
+
+async def _write_store_tops(client, sort_by: str, per_store: Dict[str, List[RankedEntry]]) -> None:
+    """스토어별 상위 N을 sorted set 으로 교체 저장 (파이프라인 1회)"""
+    pipe = client.pipeline()
+    for store_name, entries in per_store.items():
+        key = store_top_key(sort_by, store_name)
+        mapping = {str(pid): score for score, pid in entries} or {_EMPTY_MEMBER: _EMPTY_SCORE}
+        pipe.delete(key)
+        pipe.zadd(key, mapping)
+        pipe.expire(key, STORE_TOP_TTL_SECONDS)
+    await pipe.execute()
+
+
+async def get_store_top_lists(
+    db: AsyncSession,
+    store_names: Sequence[str],
+    sort_by: str,
+) -> List[List[RankedEntry]]:
+    """
+    스토어별 정렬된 상위 N 목록 조회
+    - Redis 에 있는 스토어는 ZREVRANGE(파이프라인 1회), 없는 스토어만 DB 조회 후 저장
+    """
+    client = None
+    try:
+        client = await _get_client()
+    except Exception as e:
+        logger.warning(f"스토어 베스트 인덱스 Redis 연결 실패, DB 직접 조회: {str(e)}")
+
+    if client is None:
+        return list((await fetch_store_top_n(db, store_names, sort_by)).values())
+
+    try:
+        pipe = client.pipeline()
+        for store_name in store_names:
+            pipe.zrevrange(store_top_key(sort_by, store_name), 0, STORE_TOP_N - 1, withscores=True)
+        cached = await pipe.execute()
+    except Exception as e:
+        logger.warning(f"스토어 베스트 인덱스 조회 실패, DB 직접 조회: {str(e)}")
+        return list((await fetch_store_top_n(db, store_names, sort_by)).values())
+
+    lists: List[List[RankedEntry]] = []
+    missing: List[str] = []
+    for store_name, members in zip(store_names, cached):
+        if not members:
+            missing.append(store_name)
+            continue
+        lists.append([(float(score), int(member)) for member, score in members if member != _EMPTY_MEMBER])
+
+    if missing:
+        built = await fetch_store_top_n(db, missing, sort_by)
+        lists.extend(built.values())
+        try:
+            await _write_store_tops(client, sort_by, built)
+        except Exception as e:
+            logger.warning(f"스토어 베스트 인덱스 저장 실패: stores={len(missing)}, error={str(e)}")
+    return lists
+
+
+async def refresh_store_top_index(db: AsyncSession, store_names: Optional[Sequence[str]] = None) -> int:
+    """
+    스토어 베스트 인덱스 재구성 (상품 리뷰 통계 갱신 후 호출)
+    - store_names 가 없으면 판매자 정보가 있는 전체 스토어 대상
+
+    Returns:
+        재구성한 스토어 수 (Redis 를 사용할 수 없으면 0)
+    """
+    client = await _get_client()
+    if client is None:
+        return 0
+
+    if store_names is None:
+        stmt = select(KokProductInfo.kok_store_name).where(KokProductInfo.kok_store_name.isnot(None)).distinct()
+        store_names = [name for name in (await db.execute(stmt)).scalars().all() if name]
+
+    for sort_by in STORE_BEST_SORTS:
+        await _write_store_tops(client, sort_by, await fetch_store_top_n(db, store_names, sort_by))
+    logger.info(f"스토어 베스트 인덱스 재구성 완료: stores={len(store_names)}")
+    return len(store_names)
+
+
+def store_top_refresh_retry_after() -> int:
+    """재구성 API 를 다시 호출할 수 있을 때까지 남은 초 (0이면 즉시 가능)"""
+    if _refresh_lock.locked():
+        return STORE_TOP_REFRESH_MIN_INTERVAL_SECONDS
+    remaining = STORE_TOP_REFRESH_MIN_INTERVAL_SECONDS - (time.monotonic() - _last_refresh_at)
+    return max(0, int(remaining + 0.999)) if _last_refresh_at else 0
+
+
+async def refresh_store_top_index_throttled(db: AsyncSession) -> Optional[int]:
+    """
+    재구성 API 용: 진행 중이거나 최소 간격 이내이면 재구성하지 않음
+
+    Returns:
+        재구성한 스토어 수 — 생략했으면 None
+    """
+    global _last_refresh_at
+    if store_top_refresh_retry_after() > 0:
+        return None
+    async with _refresh_lock:
+        _last_refresh_at = time.monotonic()
+        return await refresh_store_top_index(db)
+
+
+async def get_purchased_store_names(db: AsyncSession, user_id: int, use_cache: bool = True) -> List[str]:
+    """사용자가 구매한 KOK 상품의 판매자(스토어) 목록 (캐시 우선, DISTINCT 스토어명만 조회)"""
+    from services.kok.utils.cache_utils import cache_manager
+
+    if use_cache:
+        cached = await cache_manager.get("purchased_stores", user_id=user_id)
+        if cached:
+            return list(cached)
+
+    stmt = (
+        select(KokProductInfo.kok_store_name)
+        .join(KokOrder, KokOrder.kok_product_id == KokProductInfo.kok_product_id)
+        .join(Order, KokOrder.order_id == Order.order_id)
+        .where(Order.user_id == user_id)
+        .where(KokProductInfo.kok_store_name.isnot(None))
+        .distinct()
+        .order_by(KokProductInfo.kok_store_name)
+    )
+    store_names = [name for name in (await db.execute(stmt)).scalars().all() if name]
+
+    if use_cache and store_names:
+        await cache_manager.set("purchased_stores", store_names, user_id=user_id)
+    return store_names
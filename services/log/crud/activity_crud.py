@@ -3,13 +3,15 @@
 - 프론트엔드에서 호출하는 사용자 활동 로그 처리
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.log_utils import serialize_datetime
 from common.logger import get_logger
+from common.pagination import keyset_before
 from services.log.models.user_log_model import UserLog
 from services.log.schemas.activity_schema import UserActivityLog
 
@@ -62,9 +64,11 @@ async def get_user_activity_logs(
     user_id: int,
     action: Optional[str] = None,
     limit: int = 100,
+    cursor: Optional[Tuple[datetime, int]] = None,
 ) -> list[UserLog]:
     """
     사용자 활동 로그 조회
+    - cursor(직전 페이지 마지막 로그의 created_at, log_id) 지정 시 다음 페이지
     """
 
     try:
@@ -73,7 +77,10 @@ async def get_user_activity_logs(
         if action:
             query = query.where(UserLog.event_type.like(f"user_activity_{action}%"))
 
-        query = query.order_by(UserLog.created_at.desc()).limit(limit)
+        if cursor is not None:
+            query = query.where(keyset_before(UserLog.created_at, UserLog.log_id, cursor))
+
+        query = query.order_by(UserLog.created_at.desc(), UserLog.log_id.desc()).limit(limit)
 
         result = await db.execute(query)
         logs = result.scalars().all()
@@ -2,12 +2,16 @@
 USER_LOG 사용자 이벤트 로그 CRUD 함수
 """
 
+from datetime import datetime
+from typing import Optional, Tuple
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.errors import BadRequestException, InternalServerErrorException
 from common.log_utils import serialize_datetime
 from common.logger import get_logger
+from common.pagination import keyset_before
 from services.log.models.user_log_model import UserLog
 
 logger = get_logger("user_event_log_crud")
@@ -63,20 +67,29 @@ async def create_user_log(db: AsyncSession, log_data: dict) -> UserLog:
         raise InternalServerErrorException("로그 저장 중 서버 오류가 발생했습니다.")
 
 
-async def get_user_logs(db: AsyncSession, user_id: int, limit: int = 50):
+async def get_user_logs(
+    db: AsyncSession,
+    user_id: int,
+    limit: int = 50,
+    cursor: Optional[Tuple[datetime, int]] = None,
+):
     """
     특정 유저의 최근 로그 리스트 조회
     - user_id: MariaDB USERS.USER_ID 기준
     - 최신순, 최대 50개까지 반환
+    - cursor(직전 페이지 마지막 로그의 created_at, log_id) 지정 시 다음 페이지
     """
 
     try:
-        result = await db.execute(
+        stmt = (
             select(UserLog)
             .where(UserLog.user_id == user_id)  # type: ignore
-            .order_by(UserLog.created_at.desc())
+            .order_by(UserLog.created_at.desc(), UserLog.log_id.desc())
             .limit(limit)
         )
+        if cursor is not None:
+            stmt = stmt.where(keyset_before(UserLog.created_at, UserLog.log_id, cursor))
+        result = await db.execute(stmt)
         logs = result.scalars().all()
         return logs
     except Exception as e:
@@ -3,7 +3,7 @@ USER_LOG (PostgreSQL) ORM 모델
 - DB 테이블/컬럼명은 대문자, Python 변수는 소문자
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, JSON, text
+from sqlalchemy import Column, Index, Integer, String, DateTime, JSON, text
 
 from common.database.base_postgres import PostgresBase
 
@@ -28,3 +28,8 @@ class UserLog(PostgresBase):
     response_time = Column("RESPONSE_TIME", DateTime, nullable=True, comment="API 응답 완료 시간")
     response_code = Column("RESPONSE_CODE", Integer, nullable=True, comment="HTTP 응답 상태 코드 (200, 404, 500 등)")
     client_ip = Column("CLIENT_IP", String(45), nullable=True, comment="요청자 IP 주소 (IPv4/IPv6 지원)")
+
+    __table_args__ = (
+        # 사용자별 로그 키셋 페이지네이션
+        Index("IX_USER_LOG_USER_TIME_ID", "USER_ID", "CREATED_AT", "LOG_ID"),
+    )
@@ -3,9 +3,9 @@
 - 사용자 이벤트 로그 기록 및 조회 기능 제공
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response, status
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,6 +13,7 @@ from common.database.postgres_log import get_postgres_log_db
 from common.errors import BadRequestException, InternalServerErrorException
 from common.log_utils import send_user_log
 from common.logger import get_logger
+from common.pagination import build_next_cursor, parse_cursor_param
 from services.log.crud.event_crud import create_user_log, get_user_logs
 from services.log.schemas.event_schema import UserEventLogCreate, UserEventLogRead
 
@@ -103,15 +104,23 @@ async def write_log(
 async def read_user_logs(
     user_id: int,
     request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200, description="조회할 로그 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (직전 응답의 X-Next-Cursor 헤더)"),
     background_tasks: BackgroundTasks = None,
     db: AsyncSession = Depends(get_postgres_log_db),
 ):
     """
     특정 사용자의 최근 로그 조회
+    - 응답 본문은 로그 목록 그대로 유지하고, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달
     """
 
+    after = parse_cursor_param(cursor)
     try:
-        logs = await get_user_logs(db, user_id)
+        logs = await get_user_logs(db, user_id, limit, cursor=after)
+        next_cursor = build_next_cursor(logs, limit, lambda log: (log.created_at, log.log_id))
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return logs
     except Exception:
         logger.error(f"사용자 이벤트 로그 조회 실패: user_id={user_id}")
@@ -14,6 +14,7 @@ from services.order.models.homeshopping.hs_order_model import (
     HomeShoppingOrderStatusHistory,
 )
 from services.order.models.kok.kok_order_model import KokOrder, KokOrderStatusHistory
+from services.order.crud.order_common import next_status_versions
 
 logger = get_logger("order_crud")
 
@@ -34,6 +35,7 @@ async def cancel_order(db: AsyncSession, order_id: int, reason: str):
         - 주문의 cancel_time을 현재 시간으로 설정
         - 모든 하위 주문(콕/홈쇼핑)의 상태를 CANCELLED로 변경
         - 상태 변경 이력을 StatusHistory 테이블에 기록
+        - 주문 행 FOR UPDATE 로 같은 주문의 결제 확인/웹훅 처리와 직렬화
     """
     try:
         # 주문 조회
@@ -41,6 +43,7 @@ async def cancel_order(db: AsyncSession, order_id: int, reason: str):
             order_result = await db.execute(
                 select(Order)
                 .where(Order.order_id == order_id)
+                .with_for_update()
             )
             order = order_result.scalar_one_or_none()
         except Exception as e:
@@ -78,6 +81,13 @@ async def cancel_order(db: AsyncSession, order_id: int, reason: str):
             logger.warning(f"홈쇼핑 주문 취소 조회 실패: order_id={order_id}, error={str(e)}")
             hs_orders = []
         
+        kok_versions = await next_status_versions(
+            db, KokOrderStatusHistory, [kok_order.kok_order_id for kok_order in kok_orders]
+        )
+        hs_versions = await next_status_versions(
+            db, HomeShoppingOrderStatusHistory, [hs_order.homeshopping_order_id for hs_order in hs_orders]
+        )
+
         # 콕 주문 상태를 CANCELLED로 업데이트
         for kok_order in kok_orders:
             # 상태 히스토리에 CANCELLED 기록 추가
@@ -85,7 +95,8 @@ async def cancel_order(db: AsyncSession, order_id: int, reason: str):
                 kok_order_id=kok_order.kok_order_id,
                 status_id=await _get_status_id_by_code(db, "CANCELLED"),
                 changed_at=current_time,
-                changed_by=1  # 시스템 자동 취소
+                changed_by=1,  # 시스템 자동 취소
+                status_version=kok_versions[kok_order.kok_order_id],
             )
             db.add(new_status_history)
         
@@ -96,10 +107,15 @@ async def cancel_order(db: AsyncSession, order_id: int, reason: str):
                 homeshopping_order_id=hs_order.homeshopping_order_id,
                 status_id=await _get_status_id_by_code(db, "CANCELLED"),
                 changed_at=current_time,
-                changed_by=1  # 시스템 자동 취소
+                changed_by=1,  # 시스템 자동 취소
+                status_version=hs_versions[hs_order.homeshopping_order_id],
             )
             db.add(new_status_history)
 
+        # 취소된 주문은 식재료 보유에서 제외되므로 스냅샷 무효화 (커밋 후)
+        from services.recipe.utils.ownership_snapshot import invalidate_ownership_snapshot_after_commit
+        invalidate_ownership_snapshot_after_commit(db, order.user_id)
+
     # logger.info(f"주문 취소 완료: order_id={order_id}, cancel_time={current_time}, reason={reason}")
         
         return {
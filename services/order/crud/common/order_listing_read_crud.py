@@ -1,5 +1,8 @@
 """Order listing read CRUD functions."""
 
+from datetime import datetime
+from typing import Optional, Tuple
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.logger import get_logger
@@ -13,7 +16,13 @@ from services.order.crud.common.order_ingredient_support_crud import _batch_fetc
 
 logger = get_logger("order_crud")
 
-async def get_user_orders(db: AsyncSession, user_id: int, limit: int = 20, offset: int = 0) -> list:
+async def get_user_orders(
+    db: AsyncSession,
+    user_id: int,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[Tuple[datetime, int]] = None,
+) -> list:
     """
     사용자별 주문 목록 조회 (최적화: 윈도우 함수 + Raw SQL 사용)
     
@@ -21,7 +30,8 @@ async def get_user_orders(db: AsyncSession, user_id: int, limit: int = 20, offse
         db: 데이터베이스 세션
         user_id: 조회할 사용자 ID
         limit: 조회할 주문 개수 (기본값: 20)
-        offset: 건너뛸 주문 개수 (기본값: 0)
+        offset: 건너뛸 주문 개수 (기본값: 0, cursor 미지정 시에만 사용)
+        cursor: 키셋 페이지네이션 기준 (직전 페이지 마지막 주문의 order_time, order_id)
     
     Returns:
         list: 사용자의 주문 목록 (각 주문에 상품 이미지, 레시피 정보 포함)
@@ -31,16 +41,23 @@ async def get_user_orders(db: AsyncSession, user_id: int, limit: int = 20, offse
         - 윈도우 함수와 Raw SQL을 사용하여 성능 최적화
         - 콕 주문: 상품 이미지, 레시피 정보, 재료 보유 현황 포함
         - 홈쇼핑 주문: 상품 이미지 포함
-        - 최신 주문순으로 정렬
+        - 최신 주문순(order_time DESC, order_id DESC)으로 정렬
+        - cursor 지정 시 OFFSET 없이 (USER_ID, ORDER_TIME, ORDER_ID) 인덱스 범위 스캔
     """
     from sqlalchemy import text
     
-    # 1. 먼저 order_id 목록을 limit/offset으로 조회
-    order_ids_sql = """
-    SELECT DISTINCT o.order_id, o.user_id, o.order_time, o.cancel_time
+    # 1. 먼저 order_id 목록을 limit + (cursor 또는 offset)으로 조회
+    keyset_condition = ""
+    if cursor is not None:
+        keyset_condition = """
+    AND (o.order_time < :cursor_time OR (o.order_time = :cursor_time AND o.order_id < :cursor_id))"""
+        offset = 0
+
+    order_ids_sql = f"""
+    SELECT o.order_id, o.user_id, o.order_time, o.cancel_time
     FROM ORDERS o
-    WHERE o.user_id = :user_id
-    ORDER BY o.order_time DESC
+    WHERE o.user_id = :user_id{keyset_condition}
+    ORDER BY o.order_time DESC, o.order_id DESC
     LIMIT :limit OFFSET :offset
     """
     
@@ -97,11 +114,14 @@ async def get_user_orders(db: AsyncSession, user_id: int, limit: int = 20, offse
     
     # 1. 먼저 order_id 목록을 조회
     try:
-        order_ids_result = await db.execute(text(order_ids_sql), {
+        order_ids_params = {
             "user_id": user_id,
             "limit": limit,
             "offset": offset
-        })
+        }
+        if cursor is not None:
+            order_ids_params["cursor_time"], order_ids_params["cursor_id"] = cursor
+        order_ids_result = await db.execute(text(order_ids_sql), order_ids_params)
         order_ids_data = order_ids_result.fetchall()
     except Exception as e:
         logger.error(f"주문 ID 목록 조회 SQL 실행 실패: user_id={user_id}, error={str(e)}")
@@ -222,7 +242,7 @@ async def get_user_orders(db: AsyncSession, user_id: int, limit: int = 20, offse
                 ingredients_info = ingredients_cache.get(row.recipe_id, {})
                 if 'summary' in ingredients_info:
                     kok_order.ingredients_owned = ingredients_info['summary'].get('owned_count', 0)
-                    kok_order.total_ingredients = ingredients_info['summary'].get('total_count', 0)
+                    kok_order.total_ingredients = ingredients_info['summary'].get('total_ingredients', 0)
                 else:
                     kok_order.ingredients_owned = 0
                     kok_order.total_ingredients = 0
@@ -274,7 +294,7 @@ async def get_user_orders(db: AsyncSession, user_id: int, limit: int = 20, offse
     
     # 9. 최신 주문순으로 정렬하여 반환
     order_list = list(order_dict.values())
-    order_list.sort(key=lambda x: x["order_time"], reverse=True)
+    order_list.sort(key=lambda x: (x["order_time"], x["order_id"]), reverse=True)
     
     return order_list
 
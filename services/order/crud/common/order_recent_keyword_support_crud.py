@@ -123,8 +123,8 @@ async def get_recent_orders_with_ingredients(
         }
     
     # ingredient_matcher 초기화
-    from services.recipe.utils.ingredient_matcher import IngredientKeywordExtractor
-    ingredient_extractor = IngredientKeywordExtractor()
+    from services.recipe.utils.ingredient_matcher import IngredientKeywordExtractor, aget_ing_vocab
+    ingredient_extractor = IngredientKeywordExtractor(await aget_ing_vocab())
     
     all_products = []
     all_keywords = set()
@@ -138,7 +138,7 @@ async def get_recent_orders_with_ingredients(
                 continue
             
             # 키워드 추출
-            extracted_keywords = ingredient_extractor.extract_keywords(product_name)
+            extracted_keywords = ingredient_extractor.extract_keywords(product_name, row.product_type)
             
             # 결과 저장
             product_info = {
@@ -13,7 +13,7 @@ from services.order.models.homeshopping.hs_order_model import (
     HomeShoppingOrderStatusHistory,
 )
 from services.homeshopping.models.interaction_model import HomeshoppingNotification
-from services.order.crud.order_common import get_status_by_code
+from services.order.crud.order_common import get_status_by_code, next_status_versions
 from services.order.crud.homeshopping.hs_order_pricing_crud import calculate_homeshopping_order_price
 from services.order.crud.homeshopping.hs_order_status_crud import (
     get_hs_current_status,
@@ -97,7 +97,8 @@ async def create_homeshopping_order(
                 homeshopping_order_id=new_homeshopping_order.homeshopping_order_id,
                 status_id=status.status_id,
                 changed_at=order_time,
-                changed_by=user_id
+                changed_by=user_id,
+                status_version=1,
             )
             db.add(new_status_history)
         else:
@@ -113,6 +114,10 @@ async def create_homeshopping_order(
         )
         
         db.add(new_notification)
+        
+        # 6. 레시피 식재료 보유 스냅샷 무효화 (새 주문 반영, 커밋 후)
+        from services.recipe.utils.ownership_snapshot import invalidate_ownership_snapshot_after_commit
+        invalidate_ownership_snapshot_after_commit(db, user_id)
 
     # logger.info(f"홈쇼핑 주문 생성 완료: user_id={user_id}, order_id={new_order.order_id}, homeshopping_order_id={new_homeshopping_order.homeshopping_order_id}")
 
@@ -201,12 +206,14 @@ async def confirm_hs_payment(
         logger.warning(f"PAYMENT_COMPLETED 상태를 찾을 수 없음: homeshopping_order_id={homeshopping_order_id}")
         raise ValueError("PAYMENT_COMPLETED 상태를 찾을 수 없습니다")
     
-    # 4. 새로운 상태 이력 생성
+    # 4. 새로운 상태 이력 생성 (다음 버전으로)
+    versions = await next_status_versions(db, HomeShoppingOrderStatusHistory, [homeshopping_order_id])
     new_status_history = HomeShoppingOrderStatusHistory(
         homeshopping_order_id=homeshopping_order_id,
         status_id=new_status.status_id,
         changed_at=datetime.now(),
-        changed_by=user_id
+        changed_by=user_id,
+        status_version=versions[homeshopping_order_id],
     )
     
     db.add(new_status_history)
@@ -16,6 +16,7 @@ from services.order.models.homeshopping.hs_order_model import (
 from services.homeshopping.models.interaction_model import HomeshoppingNotification
 from services.order.crud.order_common import (
     get_status_by_code,
+    next_status_versions,
     NOTIFICATION_TITLES,
     NOTIFICATION_MESSAGES,
 )
@@ -231,12 +232,14 @@ async def update_hs_order_status(
         logger.warning(f"주문 정보를 찾을 수 없음: order_id={hs_order.order_id}")
         raise Exception("주문 정보를 찾을 수 없습니다")
 
-    # 4. 상태 변경 이력 생성 (UPDATE 없이 INSERT만)
+    # 4. 상태 변경 이력 생성 (UPDATE 없이 INSERT만, 다음 버전으로)
+    versions = await next_status_versions(db, HomeShoppingOrderStatusHistory, [homeshopping_order_id])
     status_history = HomeShoppingOrderStatusHistory(
         homeshopping_order_id=homeshopping_order_id,
         status_id=new_status.status_id,
         changed_at=datetime.now(),
-        changed_by=changed_by or order.user_id
+        changed_by=changed_by or order.user_id,
+        status_version=versions[homeshopping_order_id],
     )
     
     db.add(status_history)
@@ -3,17 +3,18 @@
 from typing import List
 from datetime import datetime
 
-from sqlalchemy import select, delete, text
+from sqlalchemy import select, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.cache.membership import KOK_CART, record_membership
 from common.logger import get_logger
 from services.order.models.order_base_model import Order
 from services.order.models.kok.kok_order_model import KokOrder, KokOrderStatusHistory
-from services.kok.models.interaction_model import KokCart
+from services.kok.models.interaction_model import KokCart, KokNotification
 from services.kok.models.product_model import KokProductInfo
-from services.order.crud.order_common import get_status_by_code
-from services.order.crud.kok.kok_order_price_crud import calculate_kok_order_price, debug_cart_status
-from services.order.crud.kok.kok_order_status_crud import create_kok_notification_for_status_change
+from services.order.crud.order_common import get_status_by_code, set_transaction_isolation
+from services.order.crud.kok.kok_order_price_crud import calculate_kok_order_prices, debug_cart_status
+from services.order.crud.kok.kok_order_status_crud import build_kok_notification_rows
 
 logger = get_logger("kok_order_crud")
 
@@ -39,26 +40,29 @@ async def create_orders_from_selected_carts(
         - KokCart.recipe_id가 있으면 KokOrder.recipe_id로 전달
         - 처리 후 선택된 장바구니 항목 삭제
         - 주문 접수 상태로 초기화하고 알림 생성
+        - 항목 수와 무관하게 일정한 쿼리 수로 처리
+          (장바구니 잠금 1 + 가격 1 + 주문 1 + 주문 항목 1 + 상태 이력 1 + 알림 1 + 장바구니 삭제 1)
     """
     if not selected_items:
         raise ValueError("선택된 항목이 없습니다.")
 
-    # 주문 생성은 SERIALIZABLE로 격리 — 동시 주문 시 팬텀 리드 방지
-    await db.execute(text("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE"))
+    # READ COMMITTED + 장바구니 행 FOR UPDATE:
+    # 같은 장바구니 항목의 동시 주문은 행 잠금에서 대기하고, 먼저 커밋한 주문이 장바구니를 삭제하므로
+    # 뒤 주문은 항목을 찾지 못함 (이중 주문 방지). SERIALIZABLE 의 범위/공유 잠금으로 다른 사용자와 경합하지 않음
+    await set_transaction_isolation(db, "READ COMMITTED")
 
-    main_order = Order(user_id=user_id, order_time=datetime.now())
-    db.add(main_order)
-    await db.flush()
+    # 장바구니 ID → 선택 수량
+    quantities = {item["kok_cart_id"]: item["quantity"] for item in selected_items}
+    kok_cart_ids = list(quantities)
 
     # FOR UPDATE로 선택된 장바구니 항목을 잠근 후 조회 (동시 주문 방지)
-    kok_cart_ids = [item["kok_cart_id"] for item in selected_items]
-
+    # 상품 행은 잠그지 않음 (같은 상품을 주문하는 다른 사용자와 경합 방지)
     stmt = (
         select(KokCart, KokProductInfo)
         .join(KokProductInfo, KokCart.kok_product_id == KokProductInfo.kok_product_id)
         .where(KokCart.kok_cart_id.in_(kok_cart_ids))
         .where(KokCart.user_id == user_id)
-        .with_for_update()
+        .with_for_update(of=KokCart)
     )
     try:
         rows = (await db.execute(stmt)).all()
@@ -81,74 +85,89 @@ async def create_orders_from_selected_carts(
         logger.warning(f"주문접수 상태 코드를 찾을 수 없음: user_id={user_id}")
         raise ValueError("주문접수 상태 코드를 찾을 수 없습니다.")
 
-    total_created = 0
-    total_amount = 0
-    order_details: List[dict] = []
-    created_kok_order_ids: List[int] = []
-
+    items = []
     for cart, product in rows:
-        # 선택 항목의 수량 찾기
-        quantity = next((i["quantity"] for i in selected_items if i["kok_cart_id"] == cart.kok_cart_id), None)
-        if quantity is None:
-            continue
-
         # KokCart의 kok_price_id를 직접 사용
         if not cart.kok_price_id:
             logger.warning(f"장바구니에 가격 정보가 없음: kok_cart_id={cart.kok_cart_id}, user_id={user_id}")
             continue
+        items.append((cart, product, quantities[cart.kok_cart_id]))
 
-        # 주문 금액 계산 (별도 함수 사용)
-        price_info = await calculate_kok_order_price(db, cart.kok_price_id, product.kok_product_id, quantity)
-        order_price = price_info["order_price"]
-        unit_price = price_info["unit_price"]
+    # 주문 금액 계산 (가격 ID 일괄 조회 1회)
+    prices = await calculate_kok_order_prices(db, [cart.kok_price_id for cart, _, _ in items])
+    for cart, _, _ in items:
+        if cart.kok_price_id not in prices:
+            logger.warning(f"콕 할인 가격 정보를 찾을 수 없음: kok_price_id={cart.kok_price_id}")
+            raise ValueError("할인 가격 정보를 찾을 수 없습니다.")
 
-        # 주문 항목 생성
-        new_kok_order = KokOrder(
+    main_order = Order(user_id=user_id, order_time=datetime.now())
+    db.add(main_order)
+    await db.flush()
+
+    # 주문 항목 일괄 생성 (INSERT ... RETURNING 지원 시 다중 행 INSERT 1회로 kok_order_id 확보)
+    new_kok_orders = [
+        KokOrder(
             order_id=main_order.order_id,
             kok_price_id=cart.kok_price_id,
             kok_product_id=product.kok_product_id,
             quantity=quantity,
-            order_price=order_price,
+            order_price=prices[cart.kok_price_id]["unit_price"] * quantity,
             recipe_id=cart.recipe_id,
         )
-        db.add(new_kok_order)
-        # kok_order_id 확보
-        await db.flush()
-        total_created += 1
-        total_amount += order_price
-
-        # 주문 상세 정보 저장
-        order_details.append({
-            "kok_order_id": new_kok_order.kok_order_id,
+        for cart, product, quantity in items
+    ]
+    db.add_all(new_kok_orders)
+    await db.flush()
+
+    created_kok_order_ids = [kok_order.kok_order_id for kok_order in new_kok_orders]
+    total_created = len(new_kok_orders)
+    total_amount = sum(kok_order.order_price for kok_order in new_kok_orders)
+
+    # 주문 상세 정보
+    order_details: List[dict] = [
+        {
+            "kok_order_id": kok_order.kok_order_id,
             "kok_product_id": product.kok_product_id,
             "kok_product_name": product.kok_product_name,
             "quantity": quantity,
-            "unit_price": unit_price,
-            "total_price": order_price
-        })
-
-        # 상태 이력 기록 (주문접수)
-        status_history = KokOrderStatusHistory(
-            kok_order_id=new_kok_order.kok_order_id,
-            status_id=order_received_status.status_id,
-            changed_by=user_id,
+            "unit_price": prices[cart.kok_price_id]["unit_price"],
+            "total_price": kok_order.order_price,
+        }
+        for kok_order, (cart, product, quantity) in zip(new_kok_orders, items)
+    ]
+
+    if created_kok_order_ids:
+        # 상태 이력(주문접수)과 초기 알림은 executemany 1회씩
+        await db.execute(
+            insert(KokOrderStatusHistory),
+            [
+                {
+                    "kok_order_id": kok_order_id,
+                    "status_id": order_received_status.status_id,
+                    "changed_by": user_id,
+                    "status_version": 1,
+                }
+                for kok_order_id in created_kok_order_ids
+            ],
         )
-        db.add(status_history)
-
-        # 초기 알림 생성 (주문접수)
-        await create_kok_notification_for_status_change(
-            db=db,
-            kok_order_id=new_kok_order.kok_order_id,
-            status_id=order_received_status.status_id,
-            user_id=user_id,
+        await db.execute(
+            insert(KokNotification),
+            build_kok_notification_rows(order_received_status, created_kok_order_ids, user_id),
         )
 
-        created_kok_order_ids.append(new_kok_order.kok_order_id)
-
-    await db.flush()
-
-    # 선택된 장바구니 삭제
+    # 선택된 장바구니 삭제 (커밋 후 장바구니 멤버십 집합에서도 제거)
+    ordered_product_ids = {cart.kok_product_id for cart, _ in rows}
     await db.execute(delete(KokCart).where(KokCart.kok_cart_id.in_(kok_cart_ids)))
+    for kok_product_id in ordered_product_ids:
+        record_membership(db, user_id, KOK_CART, kok_product_id, member=False)
+
+    # 주문/장바구니가 바뀌었으므로 레시피 식재료 보유 스냅샷, 구매 스토어 캐시 무효화
+    # (커밋 전에 지우면 다른 요청이 커밋 전 DB 로 캐시를 다시 채울 수 있어 커밋 후 실행)
+    from common.database.after_commit import run_after_commit
+    from services.recipe.utils.ownership_snapshot import invalidate_ownership_snapshot_after_commit
+    from services.kok.utils.cache_utils import cache_manager
+    invalidate_ownership_snapshot_after_commit(db, user_id)
+    run_after_commit(db, lambda: cache_manager.invalidate_user_store_best(user_id))
 
     return {
         "order_id": main_order.order_id,
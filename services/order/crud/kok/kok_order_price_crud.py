@@ -1,8 +1,8 @@
 """Kok order pricing/debug CRUD functions."""
 
-from typing import List
+from typing import Dict, List
 
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.logger import get_logger
@@ -78,6 +78,53 @@ async def calculate_kok_order_price(
 
 
 
+async def calculate_kok_order_prices(db: AsyncSession, kok_price_ids: List[int]) -> Dict[int, dict]:
+    """
+    여러 콕 가격 ID의 단가를 한 번에 조회 (다건 주문용)
+
+    Args:
+        db: 데이터베이스 세션
+        kok_price_ids: 콕 가격 정보 ID 목록
+
+    Returns:
+        Dict[int, dict]: kok_price_id → {kok_product_id, unit_price, product_name} (없는 ID는 제외)
+
+    Note:
+        - calculate_kok_order_price 와 같은 단가 규칙 (할인 가격 → 상품 기본 가격 → 0)
+        - 주문 금액(단가 × 수량)은 호출측에서 계산
+    """
+    if not kok_price_ids:
+        return {}
+
+    sql_query = text("""
+    SELECT
+        kpi.kok_price_id AS kok_price_id,
+        kpi.kok_product_id AS kok_product_id,
+        kpr.kok_product_name AS kok_product_name,
+        COALESCE(kpi.kok_discounted_price, kpr.kok_product_price, 0) AS unit_price
+    FROM FCT_KOK_PRICE_INFO kpi
+    LEFT JOIN FCT_KOK_PRODUCT_INFO kpr ON kpi.kok_product_id = kpr.kok_product_id
+    WHERE kpi.kok_price_id IN :kok_price_ids
+    """).bindparams(bindparam("kok_price_ids", expanding=True))
+
+    unique_ids = list(dict.fromkeys(kok_price_ids))
+    try:
+        result = await db.execute(sql_query, {"kok_price_ids": unique_ids})
+        rows = result.fetchall()
+    except Exception as e:
+        logger.error(f"콕 가격 정보 일괄 조회 SQL 실행 실패: kok_price_ids={unique_ids}, error={str(e)}")
+        raise
+
+    return {
+        row.kok_price_id: {
+            "kok_product_id": row.kok_product_id,
+            "unit_price": row.unit_price,
+            "product_name": row.kok_product_name or f"상품_{row.kok_product_id}",
+        }
+        for row in rows
+    }
+
+
 async def debug_cart_status(db: AsyncSession, user_id: int, kok_cart_ids: List[int]) -> dict:
     """
     장바구니 상태를 디버깅하기 위한 함수
@@ -1,6 +1,7 @@
 """Kok order status/update CRUD functions."""
 
 import asyncio
+from typing import List
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +13,7 @@ from services.order.models.kok.kok_order_model import KokOrder, KokOrderStatusHi
 from services.kok.models.interaction_model import KokNotification
 from services.order.crud.order_common import (
     get_status_by_code,
+    next_status_versions,
     NOTIFICATION_TITLES,
     NOTIFICATION_MESSAGES,
 )
@@ -134,6 +136,28 @@ async def create_kok_notification_for_status_change(
     db.add(notification)
 
 
+def build_kok_notification_rows(status: StatusMaster, kok_order_ids: List[int], user_id: int) -> List[dict]:
+    """
+    여러 콕 주문의 상태 변경 알림 행 생성 (일괄 INSERT 용)
+
+    Note:
+        - create_kok_notification_for_status_change 와 같은 제목/메시지 규칙
+        - 상태 정보는 호출측에서 조회한 StatusMaster 를 재사용 (주문별 상태 조회 없음)
+    """
+    title = NOTIFICATION_TITLES.get(status.status_code, "주문 상태 변경")
+    message = NOTIFICATION_MESSAGES.get(status.status_code, f"주문 상태가 '{status.status_name}'로 변경되었습니다.")
+    return [
+        {
+            "user_id": user_id,
+            "kok_order_id": kok_order_id,
+            "status_id": status.status_id,
+            "title": title,
+            "message": message,
+        }
+        for kok_order_id in kok_order_ids
+    ]
+
+
 async def update_kok_order_status(
         db: AsyncSession,
         kok_order_id: int,
@@ -191,11 +215,13 @@ async def update_kok_order_status(
         logger.warning(f"주문 정보를 찾을 수 없음: order_id={kok_order.order_id}")
         raise Exception("주문 정보를 찾을 수 없습니다")
 
-    # 4. 상태 변경 이력 생성 (UPDATE 없이 INSERT만)
+    # 4. 상태 변경 이력 생성 (UPDATE 없이 INSERT만, 다음 버전으로)
+    versions = await next_status_versions(db, KokOrderStatusHistory, [kok_order_id])
     status_history = KokOrderStatusHistory(
         kok_order_id=kok_order_id,
         status_id=new_status.status_id,
-        changed_by=changed_by
+        changed_by=changed_by,
+        status_version=versions[kok_order_id],
     )
     db.add(status_history)
 
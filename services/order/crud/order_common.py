@@ -3,14 +3,25 @@
 CRUD 계층: 모든 DB 트랜잭션 처리 담당
 순환 import 방지를 위해 별도 파일로 분리
 """
+import asyncio
+import random
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, Iterable, Optional, TypeVar
 
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.database.mariadb_auth import get_maria_auth_db
+from common.logger import get_logger
 
-from services.order.models.order_base_model import StatusMaster
+from services.order.models.order_base_model import Order, StatusMaster
+from services.order.models.kok.kok_order_model import KokOrderStatusHistory
+from services.order.models.homeshopping.hs_order_model import HomeShoppingOrderStatusHistory
+
+logger = get_logger("order_common")
+
+T = TypeVar("T")
 
 # 상태 정보 캐시 (메모리 캐시)
 _status_cache: Dict[str, StatusMaster] = {}
@@ -56,6 +67,130 @@ NOTIFICATION_MESSAGES = {
     "REFUND_COMPLETED": "환불이 완료되었습니다."
 }
 
+ISOLATION_LEVELS = frozenset({"READ COMMITTED", "REPEATABLE READ", "SERIALIZABLE"})
+
+
+async def set_transaction_isolation(db: AsyncSession, level: str) -> None:
+    """
+    현재 트랜잭션의 격리 수준 지정 (트랜잭션의 첫 구문 전에 호출)
+
+    Args:
+        db: 데이터베이스 세션
+        level: "READ COMMITTED" / "REPEATABLE READ" / "SERIALIZABLE"
+
+    Note:
+        - MariaDB `SET TRANSACTION ISOLATION LEVEL` 구문 사용
+        - SQLite(테스트)는 세션 격리 수준 구문이 없으므로 생략
+    """
+    if level not in ISOLATION_LEVELS:
+        raise ValueError(f"지원하지 않는 격리 수준: {level}")
+    if db.get_bind().dialect.name == "sqlite":
+        return
+    await db.execute(text(f"SET TRANSACTION ISOLATION LEVEL {level}"))
+
+
+# 잠금 충돌 재시도 (MariaDB 1213: 데드락, 1205: 잠금 대기 시간 초과)
+RETRYABLE_LOCK_ERROR_CODES = frozenset({1205, 1213})
+LOCK_RETRY_MAX_ATTEMPTS = 3
+LOCK_RETRY_BACKOFF_SECONDS = 0.05
+
+# 상태 이력 모델 → 주문 키 속성 (STATUS_VERSION 순번 범위)
+_STATUS_HISTORY_ORDER_KEY = {
+    KokOrderStatusHistory: "kok_order_id",
+    HomeShoppingOrderStatusHistory: "homeshopping_order_id",
+}
+
+
+async def lock_order_row(db: AsyncSession, order_id: int) -> bool:
+    """
+    주문 행(ORDERS) SELECT ... FOR UPDATE
+
+    Returns:
+        bool: 주문 존재 여부
+
+    Note:
+        - 같은 주문의 결제 확인/웹훅/취소 처리를 직렬화 (다른 주문·사용자와는 경합하지 않음)
+        - 잠금은 트랜잭션 종료(commit/rollback)까지 유지
+    """
+    result = await db.execute(
+        select(Order.order_id).where(Order.order_id == order_id).with_for_update()
+    )
+    return result.scalar_one_or_none() is not None
+
+
+async def next_status_versions(db: AsyncSession, history_model, order_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    하위 주문별 다음 상태 이력 버전 (현재 최대 STATUS_VERSION + 1, 이력이 없으면 1)
+
+    Args:
+        history_model: KokOrderStatusHistory / HomeShoppingOrderStatusHistory
+        order_ids: 콕 주문 ID / 홈쇼핑 주문 ID 목록
+
+    Note:
+        - 같은 버전에서 출발한 동시 상태 변경은 (주문 ID, STATUS_VERSION) 유니크 키로 하나만 성공
+          → run_with_lock_retry 가 롤백 후 재시도하며 최신 상태를 다시 읽음
+    """
+    order_ids = list(dict.fromkeys(order_ids))
+    if not order_ids:
+        return {}
+    order_key = getattr(history_model, _STATUS_HISTORY_ORDER_KEY[history_model])
+    result = await db.execute(
+        select(order_key, func.max(history_model.status_version))
+        .where(order_key.in_(order_ids))
+        .group_by(order_key)
+    )
+    current = {order_id: version for order_id, version in result.all()}
+    return {order_id: (current.get(order_id) or 0) + 1 for order_id in order_ids}
+
+
+def is_retryable_lock_error(error: BaseException) -> bool:
+    """데드락/잠금 대기 시간 초과/상태 버전 충돌 여부 (트랜잭션 전체 재실행으로 해소)"""
+    if not isinstance(error, DBAPIError):
+        return False
+    args = getattr(error.orig, "args", ())
+    if args and args[0] in RETRYABLE_LOCK_ERROR_CODES:
+        return True
+    return isinstance(error, IntegrityError) and "STATUS_VERSION" in str(error.orig)
+
+
+async def run_with_lock_retry(
+    db: AsyncSession,
+    work: Callable[[], Awaitable[T]],
+    *,
+    label: str,
+    max_attempts: int = LOCK_RETRY_MAX_ATTEMPTS,
+) -> T:
+    """
+    트랜잭션 작업을 실행하고 잠금 충돌 시 롤백 후 제한 횟수만큼 재시도
+
+    Args:
+        db: 데이터베이스 세션
+        work: 트랜잭션 첫 구문부터 다시 실행할 수 있는 작업 (인자 없는 코루틴 함수)
+        label: 로그용 작업 이름
+        max_attempts: 최대 실행 횟수
+
+    Returns:
+        work 결과 (flush 까지 완료, commit 은 호출측)
+
+    Note:
+        - 재시도 전 롤백하므로 work 이전에 같은 세션에서 실행한 변경도 함께 취소됨
+        - 재시도 간격: LOCK_RETRY_BACKOFF_SECONDS * 2^(시도-1), 지터 포함
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            result = await work()
+            await db.flush()
+            return result
+        except DBAPIError as e:
+            if attempt >= max_attempts or not is_retryable_lock_error(e):
+                raise
+            await db.rollback()
+            delay = LOCK_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)) * (1 + random.random())
+            logger.warning(f"잠금 충돌로 트랜잭션 재시도: label={label}, attempt={attempt}, delay={delay:.3f}s, error={e.orig}")
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
 async def get_status_by_code(db: AsyncSession, status_code: str) -> Optional[StatusMaster]:
     """
     상태 코드로 상태 정보 조회 (최적화: 캐싱 + Raw SQL 사용)
@@ -88,9 +223,9 @@ async def get_status_by_code(db: AsyncSession, status_code: str) -> Optional[Sta
     # 최적화된 쿼리: Raw SQL 사용
     sql_query = """
     SELECT 
-        status_id,
-        status_code,
-        status_name
+        status_id AS status_id,
+        status_code AS status_code,
+        status_name AS status_name
     FROM STATUS_MASTER
     WHERE status_code = :status_code
     LIMIT 1
@@ -16,7 +16,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import httpx
 from dotenv import load_dotenv
 from fastapi import BackgroundTasks, HTTPException, Request
-from sqlalchemy import desc, select, text
+from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.config import get_settings
@@ -33,6 +33,9 @@ from services.order.crud.common.order_payment_state_management_crud import (
     _mark_all_children_payment_requested,
 )
 from services.order.crud.common.order_price_management_crud import calculate_order_total_price
+from services.order.crud.kok.kok_order_status_crud import get_kok_current_status
+from services.order.crud.homeshopping.hs_order_status_crud import get_hs_current_status
+from services.order.crud.order_common import lock_order_row, run_with_lock_retry
 from services.order.crud.payment_v1_crud import _verify_order_status_for_payment
 
 logger = get_logger("payment_crud")
@@ -223,6 +226,24 @@ class WaiterRegistry:
 # 전역 웹훅 대기자 레지스트리
 webhook_waiters = WaiterRegistry()
 
+async def _children_payment_completed(db: AsyncSession, order_data: Dict[str, Any]) -> bool:
+    """하위 주문이 모두 PAYMENT_COMPLETED 상태인지 (하위 주문이 없으면 False)"""
+    kok_orders = order_data.get("kok_orders", [])
+    hs_orders = order_data.get("homeshopping_orders", [])
+    if not kok_orders and not hs_orders:
+        return False
+
+    for kok_order in kok_orders:
+        current = await get_kok_current_status(db, kok_order.kok_order_id)
+        if not current or current.status.status_code != "PAYMENT_COMPLETED":
+            return False
+    for hs_order in hs_orders:
+        current = await get_hs_current_status(db, hs_order.homeshopping_order_id)
+        if not current or not current.status or current.status.status_code != "PAYMENT_COMPLETED":
+            return False
+    return True
+
+
 # 운영서버로 콜백 받을 때 서명을 검증
 def _verify_webhook_signature(body_bytes: bytes, signature_b64: str, secret: str) -> bool:
     """웹훅 payload에 대한 base64 인코딩 HMAC-SHA256 서명을 검증한다."""
@@ -247,28 +268,48 @@ async def confirm_payment_and_update_status_v2(
     - 결제서버로 callback_url을 포함해 '시작 요청'만 보냄
     - 웹훅 결과를 기다렸다가 최종 응답 반환
     - 완료/실패 업데이트는 웹훅 수신 핸들러에서 처리
+    - 주문 행 FOR UPDATE 후 상태 확인/PAYMENT_REQUESTED 기록, 결제서버 시작 요청이 성공하면 커밋
+      (실패 시 롤백하여 ORDER_RECEIVED 유지, 데드락은 run_with_lock_retry 로 재시도)
     """
 
     # logger.info(f"[v2] 결제 확인 시작: order_id={order_id}, user_id={user_id}")
 
-    # (1) 접근 검증
-    order_data = await _ensure_order_access(db, order_id, user_id)
+    async def _lock_and_mark_payment_requested():
+        # (1) 접근 검증
+        order_data = await _ensure_order_access(db, order_id, user_id)
+
+        # (1-1) 주문 행 잠금 — 같은 주문의 결제 확인/웹훅/취소를 직렬화 (다른 주문과는 경합 없음)
+        await lock_order_row(db, order_id)
+
+        # (1-2) PAYMENT_REQUESTED로 오래 멈춰 있는 경우(웹훅 미수신) 자동 취소
+        if await _expire_stale_payment_requested(db, order_id, order_data):
+            return order_data, None
+
+        # (1-3) 주문 상태 확인 (ORDER_RECEIVED 상태만 결제 가능, 잠금 후 확인하므로 중복 결제 요청 차단)
+        await _verify_order_status_for_payment(db, order_data)
 
-    # (1-1) PAYMENT_REQUESTED로 오래 멈춰 있는 경우(웹훅 미수신) 자동 취소 후 안내
-    if await _expire_stale_payment_requested(db, order_id, order_data):
+        # (2) 총액 계산
+        total = await calculate_order_total_price(db, order_id)
+
+        # (2-1) 결제 요청 상태로 변경 (결제서버 시작 요청이 성공하면 커밋)
+        await _mark_all_children_payment_requested(
+            db,
+            kok_orders=order_data.get("kok_orders", []),
+            hs_orders=order_data.get("homeshopping_orders", []),
+            user_id=user_id,
+        )
+        return order_data, total
+
+    order_data, total_order_price = await run_with_lock_retry(
+        db, _lock_and_mark_payment_requested, label=f"payment_confirm_v2:{order_id}"
+    )
+    if total_order_price is None:
+        await db.commit()
         raise HTTPException(
             status_code=400,
             detail="이전 결제 확인이 시간 초과로 취소되었습니다. 주문을 다시 진행해주세요.",
         )
 
-    # (1-2) 주문 상태 확인 (ORDER_RECEIVED 상태만 결제 가능)
-    # logger.info(f"[v2] 주문 상태 확인 시작: order_id={order_id}")
-    await _verify_order_status_for_payment(db, order_data)
-    # logger.info(f"[v2] 주문 상태 확인 완료: order_id={order_id}")
-
-    # (2) 총액 계산
-    total_order_price = await calculate_order_total_price(db, order_id)
-
     # (3) tx & callback_url 준비
     tx_id = f"tx_{order_id}_{secrets.token_urlsafe(8)}"
     cb_token = secrets.token_urlsafe(16)
@@ -293,18 +334,7 @@ async def confirm_payment_and_update_status_v2(
     if SERVICE_AUTH_TOKEN:
         headers["Authorization"] = f"Bearer {SERVICE_AUTH_TOKEN}"
 
-    # (4) 결제 요청 상태로 변경 — SERIALIZABLE로 결제 상태 중복 처리 방지
-    await db.execute(text("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE"))
-    # logger.info(f"[v2] 주문 상태를 PAYMENT_REQUESTED로 변경 시작: order_id={order_id}")
-    await _mark_all_children_payment_requested(
-        db,
-        kok_orders=order_data.get("kok_orders", []),
-        hs_orders=order_data.get("homeshopping_orders", []),
-        user_id=user_id,
-    )
-    # logger.info(f"[v2] 주문 상태를 PAYMENT_REQUESTED로 변경 완료: order_id={order_id}")
-
-    # (5) 결제서버에 시작 요청
+    # (4) 결제서버에 시작 요청 (주문 행 잠금 유지 — 웹훅은 PAYMENT_REQUESTED 커밋 이후에 반영됨)
     try:
         await webhook_waiters.register_callback_token(tx_id, cb_token)
         async with httpx.AsyncClient(timeout=10.0) as client:
@@ -314,13 +344,18 @@ async def confirm_payment_and_update_status_v2(
     # logger.info(f"[v2] 결제서버 시작 요청 성공: order_id={order_id}, tx_id={tx_id}")
     except httpx.RequestError as e:
         await webhook_waiters.discard_callback_token(tx_id)
+        await db.rollback()
         logger.error(f"[v2] 결제서버 연결 실패: {e}")
         raise HTTPException(status_code=503, detail="외부 결제 서비스에 연결할 수 없습니다.")
     except Exception as e:
         await webhook_waiters.discard_callback_token(tx_id)
+        await db.rollback()
         logger.error(f"[v2] 결제서버 오류: {e}")
         raise HTTPException(status_code=400, detail="결제 시작 요청 실패")
 
+    # (5) PAYMENT_REQUESTED 커밋 — 웹훅 대기 동안 주문 행 잠금을 잡고 있지 않음
+    await db.commit()
+
     # (6) 웹훅 결과 대기
     # logger.info(f"[v2] 웹훅 결과 대기 시작: order_id={order_id}, tx_id={tx_id}, timeout={timeout_sec}초")
     payment_id = init_ack.get("payment_id", f"pending_{tx_id}")
@@ -488,26 +523,35 @@ async def apply_payment_webhook_v2(
 
     # (3) event 처리
     if event == "payment.completed":
-        # 주문 접근 확인
-        # 서명 검증 통과시, 페이로드 user_id를 신뢰하여 접근 검증에 사용
-        try:
+        async def _lock_and_mark_payment_completed():
+            # 주문 접근 확인
+            # 서명 검증 통과시, 페이로드 user_id를 신뢰하여 접근 검증에 사용
             order_data = await _ensure_order_access(db, order_id, payload_user_id)
+
+            # 주문 행 잠금 후 현재 상태 확인 — 중복 웹훅은 잠금에서 대기한 뒤 완료 상태를 보고 건너뜀
+            await lock_order_row(db, order_id)
+            if await _children_payment_completed(db, order_data):
+                logger.info(f"[v2] 이미 결제완료 반영된 주문 (중복 웹훅): order_id={order_id}, tx_id={tx_id}")
+            else:
+                await _mark_all_children_payment_completed(
+                    db,
+                    kok_orders=order_data.get("kok_orders", []),
+                    hs_orders=order_data.get("homeshopping_orders", []),
+                    user_id=None,  # 시스템 처리면 None/0 등 정책에 맞게
+                )
+            return order_data
+
+        try:
+            order_data = await run_with_lock_retry(
+                db, _lock_and_mark_payment_completed, label=f"payment_webhook_v2:{order_id}"
+            )
         except HTTPException as e:
             logger.error(f"[v2] 주문 접근 검증 실패: order_id={order_id}, payload_user_id={payload_user_id}, status={e.status_code}, detail={e.detail}")
             return {"ok": False, "reason": "order_access_denied"}
- 
+
         kok_orders = order_data.get("kok_orders", [])
         hs_orders = order_data.get("homeshopping_orders", [])
 
-        # 하위 주문 상태 일괄 갱신 — SERIALIZABLE로 중복 웹훅 처리 방지
-        await db.execute(text("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE"))
-        await _mark_all_children_payment_completed(
-            db,
-            kok_orders=kok_orders,
-            hs_orders=hs_orders,
-            user_id=None,  # 시스템 처리면 None/0 등 정책에 맞게
-        )
-
         # (선택) 상태이력/알림 로깅
         # background task가 라우터에 없다면 여기서 바로 적재하거나 생략
         # logger.info(f"[v2] 결제완료 반영: order_id={order_id}, payment_id={payment_id}")
@@ -534,11 +578,12 @@ async def apply_payment_webhook_v2(
         return webhook_result
 
     elif event in ("payment.failed", "payment.cancelled"):
-        # 결제 실패/취소 시 주문 취소 — SERIALIZABLE로 중복 취소 방지
+        # 결제 실패/취소 시 주문 취소 — cancel_order 가 주문 행을 잠가 중복 취소/결제완료와 직렬화
         try:
-            await db.execute(text("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE"))
             reason = failure_reason if failure_reason else "결제 실패"
-            await cancel_order(db, order_id, reason)
+            await run_with_lock_retry(
+                db, lambda: cancel_order(db, order_id, reason), label=f"payment_webhook_v2_cancel:{order_id}"
+            )
             # logger.info(f"[v2] 결제실패/취소로 인한 주문 취소 완료: order_id={order_id}, reason={reason}")
         except Exception as e:
             logger.error(f"[v2] 주문 취소 실패: order_id={order_id}, error={str(e)}")
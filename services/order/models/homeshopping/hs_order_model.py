@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from common.database.base_mariadb import MariaBase
@@ -38,6 +38,11 @@ class HomeShoppingOrderStatusHistory(MariaBase):
     status_id = Column("STATUS_ID", Integer, ForeignKey("STATUS_MASTER.STATUS_ID", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False, comment="상태 ID (FK: STATUS_MASTER.STATUS_ID)")
     changed_at = Column("CHANGED_AT", DateTime, nullable=False, default=datetime.now, comment="상태 변경 일시")
     changed_by = Column("CHANGED_BY", Integer, nullable=True, comment="상태 변경자(관리자/사용자 ID, 옵션/논리 FK)")
+    status_version = Column("STATUS_VERSION", Integer, nullable=True, comment="주문별 상태 이력 순번 (낙관적 버전, 기존 이력은 NULL)")
+
+    __table_args__ = (
+        UniqueConstraint("HOMESHOPPING_ORDER_ID", "STATUS_VERSION", name="UQ_HOMESHOPPING_ORDER_STATUS_VERSION"),
+    )
 
     homeshopping_order = relationship("HomeShoppingOrder", back_populates="status_history", lazy="noload")
     status = relationship("StatusMaster", lazy="noload")
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from common.database.base_mariadb import MariaBase
@@ -30,11 +30,19 @@ class KokOrderStatusHistory(MariaBase):
 
     __tablename__ = "KOK_ORDER_STATUS_HISTORY"
 
-    history_id = Column("HISTORY_ID", BigInteger, primary_key=True, autoincrement=True)
+    # SQLite(테스트)는 INTEGER PRIMARY KEY 만 자동 증가하므로 변형 타입 지정
+    history_id = Column("HISTORY_ID", BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
     kok_order_id = Column("KOK_ORDER_ID", Integer, ForeignKey("KOK_ORDERS.KOK_ORDER_ID"), nullable=False)
     status_id = Column("STATUS_ID", Integer, ForeignKey("STATUS_MASTER.STATUS_ID"), nullable=False)
     changed_at = Column("CHANGED_AT", DateTime, nullable=False, default=datetime.now)
     changed_by = Column("CHANGED_BY", Integer, nullable=True)
+    # 주문별 상태 이력 순번 (낙관적 버전, 기존 이력은 NULL)
+    status_version = Column("STATUS_VERSION", Integer, nullable=True)
+
+    __table_args__ = (
+        # 같은 버전에서 출발한 동시 상태 변경은 두 번째 INSERT 가 중복 키로 실패
+        UniqueConstraint("KOK_ORDER_ID", "STATUS_VERSION", name="UQ_KOK_ORDER_STATUS_VERSION"),
+    )
 
     kok_order = relationship("KokOrder", back_populates="status_history", lazy="noload")
     status = relationship("StatusMaster", lazy="noload")
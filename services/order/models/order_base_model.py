@@ -1,6 +1,6 @@
 """Order base/status ORM models."""
 
-from sqlalchemy import Column, Integer, DateTime, String
+from sqlalchemy import Column, Integer, DateTime, Index, String
 from sqlalchemy.orm import relationship
 
 from common.database.base_mariadb import MariaBase
@@ -26,5 +26,10 @@ class Order(MariaBase):
     order_time = Column("ORDER_TIME", DateTime, nullable=False)
     cancel_time = Column("CANCEL_TIME", DateTime, nullable=True)
 
+    __table_args__ = (
+        # 주문 내역 키셋 페이지네이션 (USER_ID, ORDER_TIME DESC, ORDER_ID DESC)
+        Index("IX_ORDERS_USER_TIME_ID", "USER_ID", "ORDER_TIME", "ORDER_ID"),
+    )
+
     kok_orders = relationship("KokOrder", uselist=True, back_populates="order", lazy="noload")
     homeshopping_orders = relationship("HomeShoppingOrder", uselist=True, back_populates="order", lazy="noload")
@@ -1,6 +1,7 @@
 """Common order list/count/recent API routes."""
 
 from datetime import datetime, timedelta
+from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks, Request
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +11,7 @@ from common.dependencies import get_current_user
 from common.log_utils import send_user_log
 from common.http_dependencies import extract_http_info
 from common.logger import get_logger
+from common.pagination import build_next_cursor, parse_cursor_param
 from services.order.schemas.order_schema import (
     OrderCountResponse,
     RecentOrderItem,
@@ -29,6 +31,7 @@ router = APIRouter()
 async def list_orders(
     request: Request,
     limit: int = Query(30, description="조회 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (직전 응답의 next_cursor)"),
     background_tasks: BackgroundTasks = None,
     db: AsyncSession = Depends(get_maria_service_db),
     user=Depends(get_current_user)
@@ -38,6 +41,7 @@ async def list_orders(
     
     Args:
         limit: 조회할 주문 개수 (기본값: 10)
+        cursor: 다음 페이지 커서 (없으면 첫 페이지)
         background_tasks: 백그라운드 작업 관리자
         db: 데이터베이스 세션 (의존성 주입)
         user: 현재 인증된 사용자 (의존성 주입)
@@ -52,12 +56,13 @@ async def list_orders(
         - 각 주문에 배송 정보, 레시피 정보, 재료 보유 현황 포함
         - 사용자 행동 로그 기록
     """
-    logger.debug(f"주문 리스트 조회 시작: user_id={user.user_id}, limit={limit}")
+    logger.debug(f"주문 리스트 조회 시작: user_id={user.user_id}, limit={limit}, cursor={cursor}")
+    after = parse_cursor_param(cursor)
     logger.info(f"주문 리스트 조회 요청: user_id={user.user_id}, limit={limit}")
     
     # CRUD 계층에 주문 조회 위임
     try:
-        order_list = await get_user_orders(db, user.user_id, limit, 0)
+        order_list = await get_user_orders(db, user.user_id, limit, 0, cursor=after)
         logger.debug(f"주문 조회 성공: user_id={user.user_id}, 조회된 주문 수={len(order_list)}")
         
         # 전체 주문 개수 조회 (페이징을 위한 total_count)
@@ -184,7 +189,8 @@ async def list_orders(
     return OrdersListResponse(
         limit=limit,
         total_count=total_order_count,  # 전체 주문 개수 (order_groups 기준)
-        order_groups=order_groups
+        order_groups=order_groups,
+        next_cursor=build_next_cursor(order_list, limit, lambda o: (o["order_time"], o["order_id"])),
     )
 
 
@@ -14,6 +14,7 @@ from services.order.schemas.kok.cart_schema import (
     KokCartOrderResponse,
 )
 from services.order.crud.kok.kok_order_create_crud import create_orders_from_selected_carts
+from services.order.crud.order_common import run_with_lock_retry
 
 logger = get_logger("kok_order_router")
 router = APIRouter()
@@ -53,9 +54,12 @@ async def order_from_selected_carts(
         raise HTTPException(status_code=400, detail="선택된 항목이 없습니다.")
 
     try:
-        # CRUD 계층에 주문 생성 위임
-        result = await create_orders_from_selected_carts(
-            db, current_user.user_id, [i.model_dump() for i in request.selected_items]
+        # CRUD 계층에 주문 생성 위임 (데드락/잠금 대기 시간 초과 시 제한 횟수 재시도)
+        selected_items = [i.model_dump() for i in request.selected_items]
+        result = await run_with_lock_retry(
+            db,
+            lambda: create_orders_from_selected_carts(db, current_user.user_id, selected_items),
+            label=f"kok_cart_order:{current_user.user_id}",
         )
         await db.commit()
         logger.debug(f"장바구니 주문 생성 성공: user_id={current_user.user_id}, order_id={result['order_id']}")
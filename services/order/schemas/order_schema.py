@@ -98,6 +98,7 @@ class OrdersListResponse(BaseModel):
     limit: int            # 조회 개수
     total_count: int      # 전체 주문 수
     order_groups: List[OrderGroup]  # 주문 그룹 목록
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
     
     class Config:
         from_attributes = True
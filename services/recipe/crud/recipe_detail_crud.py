@@ -8,6 +8,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.logger import get_logger
+from services.recipe.utils.detail_cache import get_cached_recipe_detail, set_cached_recipe_detail
 from services.recipe.utils.inventory_recipe import get_recipe_url
 
 logger = get_logger("recipe_crud")
@@ -15,25 +16,29 @@ logger = get_logger("recipe_crud")
 async def get_recipe_detail(db: AsyncSession, recipe_id: int) -> Optional[Dict]:
     """
     레시피 상세정보(+재료 리스트, recipe_url 포함) 반환 (최적화: Raw SQL 사용)
+    - Redis 캐시 우선, 미스 시 DB 조회 후 저장 (services/recipe/utils/detail_cache.py)
     """    
     # logger.info(f"레시피 상세정보 조회 시작: recipe_id={recipe_id}")
+    cached = await get_cached_recipe_detail(recipe_id)
+    if cached is not None:
+        return cached
     
     # 최적화된 쿼리: 레시피와 재료 정보를 한 번에 조회
     sql_query = """
     SELECT 
-        r.recipe_id,
-        r.recipe_title,
-        r.cooking_name,
-        r.cooking_introduction,
-        r.scrap_count,
-        r.thumbnail_url,
-        r.cooking_case_name,
-        r.cooking_category_name,
-        r.number_of_serving,
-        m.material_id,
-        m.material_name,
-        m.measure_amount,
-        m.measure_unit
+        r.recipe_id AS recipe_id,
+        r.recipe_title AS recipe_title,
+        r.cooking_name AS cooking_name,
+        r.cooking_introduction AS cooking_introduction,
+        r.scrap_count AS scrap_count,
+        r.thumbnail_url AS thumbnail_url,
+        r.cooking_case_name AS cooking_case_name,
+        r.cooking_category_name AS cooking_category_name,
+        r.number_of_serving AS number_of_serving,
+        m.material_id AS material_id,
+        m.material_name AS material_name,
+        m.measure_amount AS measure_amount,
+        m.measure_unit AS measure_unit
     FROM FCT_RECIPE r
     LEFT JOIN FCT_MTRL m ON r.recipe_id = m.recipe_id
     WHERE r.recipe_id = :recipe_id
@@ -78,6 +83,7 @@ async def get_recipe_detail(db: AsyncSession, recipe_id: int) -> Optional[Dict]:
             })
     
     recipe_dict["materials"] = materials
+    await set_cached_recipe_detail(recipe_id, recipe_dict)
     
     # logger.info(f"레시피 상세정보 조회 완료: recipe_id={recipe_id}, 재료 개수={len(materials)}")
     return recipe_dict
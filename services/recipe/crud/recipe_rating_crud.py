@@ -2,27 +2,100 @@
 
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from typing import Dict, Iterable
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.recipe.models.core_model import RecipeRating
+from services.recipe.models.core_model import RecipeRating, RecipeRatingStat
+
+
+async def get_recipe_ratings(db: AsyncSession, recipe_ids: Iterable[int]) -> Dict[int, float]:
+    """
+    여러 레시피의 별점 평균을 집계 테이블(RECIPE_RATING_STAT) 한 번 조회로 반환
+    (별점이 없는 레시피는 0.0)
+    """
+    ids = list(dict.fromkeys(int(rid) for rid in recipe_ids))
+    if not ids:
+        return {}
+    stmt = (
+        select(RecipeRatingStat.recipe_id, RecipeRatingStat.rating_avg)
+        .where(RecipeRatingStat.recipe_id.in_(ids))  # type: ignore
+    )
+    averages = {int(rid): float(avg or 0.0) for rid, avg in (await db.execute(stmt)).all()}
+    return {rid: averages.get(rid, 0.0) for rid in ids}
+
 
 async def get_recipe_rating(db: AsyncSession, recipe_id: int) -> float:
     """
     해당 레시피의 별점 평균값을 반환
     """
+    return (await get_recipe_ratings(db, [recipe_id]))[int(recipe_id)]
+
+
+async def _apply_rating_delta(db: AsyncSession, recipe_id: int, sum_delta: int, count_delta: int) -> None:
+    """
+    집계 행에 합/개수 변화량을 반영 (단일 UPDATE — 행 잠금으로 동시 갱신 직렬화)
+    집계 행이 없으면 RECIPE_RATING 전체 집계로 생성 (기존 별점 백필 겸용)
+    """
+    new_count = RecipeRatingStat.rating_count + count_delta
     stmt = (
-        select(func.avg(RecipeRating.rating)).where(RecipeRating.recipe_id == recipe_id)  # type: ignore
+        update(RecipeRatingStat)
+        .where(RecipeRatingStat.recipe_id == recipe_id)  # type: ignore
+        .values(
+            rating_sum=RecipeRatingStat.rating_sum + sum_delta,
+            rating_count=new_count,
+            # SET 절은 모두 갱신 전 값 기준으로 계산 (DB 별 할당 순서 차이 회피)
+            rating_avg=func.coalesce(
+                (RecipeRatingStat.rating_sum + sum_delta) * 1.0 / func.nullif(new_count, 0), 0.0
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if (await db.execute(stmt)).rowcount:
+        return
+
+    agg_stmt = (
+        select(func.coalesce(func.sum(RecipeRating.rating), 0), func.count(RecipeRating.rating_id))
+        .where(RecipeRating.recipe_id == recipe_id)  # type: ignore
     )
-    avg_rating = (await db.execute(stmt)).scalar()
-    return float(avg_rating) if avg_rating is not None else 0.0
+    total, count = (await db.execute(agg_stmt)).one()
+    try:
+        async with db.begin_nested():
+            db.add(RecipeRatingStat(
+                recipe_id=recipe_id,
+                rating_sum=int(total),
+                rating_count=int(count),
+                rating_avg=float(total) / count if count else 0.0,
+            ))
+    except IntegrityError:
+        # 동시 요청이 먼저 집계 행을 만든 경우: 그 집계에는 미커밋인 이 요청의 변경이 없으므로 변화량만 반영
+        await db.execute(stmt)
 
 
 async def set_recipe_rating(db: AsyncSession, recipe_id: int, user_id: int, rating: int) -> int:
     """
-    새로운 별점을 등록(0~5 int)하고 저장된 값을 반환
+    별점을 등록(0~5 int)하고 저장된 값을 반환
+    - 같은 사용자가 이미 별점을 남겼으면 값을 변경, 없으면 새로 등록
+    - 집계 테이블(합/개수/평균)은 같은 트랜잭션에서 변화량만큼 증분 갱신
     """
-    new_rating = RecipeRating(recipe_id=recipe_id, user_id=user_id, rating=rating)
-    db.add(new_rating)
-    return rating
+    existing_stmt = (
+        select(RecipeRating)
+        .where(RecipeRating.recipe_id == recipe_id, RecipeRating.user_id == user_id)  # type: ignore
+        .order_by(RecipeRating.rating_id.desc())
+        .limit(1)
+        .with_for_update()
+    )
+    existing = (await db.execute(existing_stmt)).scalars().first()
+    if existing is not None:
+        sum_delta, count_delta = rating - int(existing.rating), 0
+        existing.rating = rating
+    else:
+        sum_delta, count_delta = rating, 1
+        db.add(RecipeRating(recipe_id=recipe_id, user_id=user_id, rating=rating))
+    await db.flush()
 
+    if sum_delta or count_delta:
+        await _apply_rating_delta(db, recipe_id, sum_delta, count_delta)
+    return rating
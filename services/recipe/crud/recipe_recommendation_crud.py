@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional, Tuple
 
-import pandas as pd
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -320,6 +319,8 @@ async def execute_standard_inventory_algorithm(
     
     # DataFrame으로 변환 (measure_amount가 None인 경우 처리)
     try:
+        import pandas as pd  # 레시피 경로에서만 필요하므로 첫 호출 시 로드
+
         recipe_df = pd.DataFrame(recipe_df)
     # logger.info(f"DataFrame 생성 완료: {len(recipe_df)}행")
     except Exception as e:
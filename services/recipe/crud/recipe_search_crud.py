@@ -2,18 +2,115 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import List, Optional, Tuple
 
-import pandas as pd
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.circuit_breaker import CircuitOpenError
 from common.logger import get_logger
 from services.recipe.models.core_model import Material, Recipe
+from services.recipe.utils.material_index import match_recipes_with_all_materials
+from services.recipe.utils.title_index import search_recipe_titles
 from services.recipe.utils.ports import VectorSearcherPort
+from services.recipe.utils.row_shaping import (
+    Record,
+    dedupe_ids,
+    fold_material_rows,
+    number_records,
+    order_by_ids,
+    rows_to_records,
+)
 
 logger = get_logger("recipe_crud")
 
+
+def _all_materials_ids_stmt(ingredients: List[str]):
+    """입력 재료를 모두 포함하는 레시피 ID (재료 인덱스 미준비 시 SQL 폴백, RECIPE_ID 오름차순)"""
+    return (
+        select(Material.recipe_id)
+        .where(Material.material_name.in_(set(ingredients)))
+        .group_by(Material.recipe_id)
+        .having(func.count(func.distinct(Material.material_name)) == len(set(ingredients)))
+        .order_by(Material.recipe_id)
+    )
+
+
+async def _title_ids_sql(mariadb: AsyncSession, query: str, limit: int) -> List[int]:
+    """레시피명에 검색어가 포함된 레시피 ID (스크랩 수 내림차순) — 레시피명 색인 미준비 시 SQL"""
+    name_col = getattr(Recipe, "cooking_name", None) or getattr(Recipe, "recipe_title")
+    base_stmt = (
+        select(Recipe.recipe_id)
+        .where(name_col.contains(query))
+        .order_by(desc(Recipe.scrap_count))
+        .limit(limit)
+    )
+    return dedupe_ids((await mariadb.execute(base_stmt)).scalars().all())
+
+
+async def _vector_ids(
+    vector_searcher: Optional[VectorSearcherPort],
+    postgres: Optional[AsyncSession],
+    query: str,
+    top_k: int,
+    exclude_ids: Optional[List[int]] = None,
+) -> List[int]:
+    """벡터 유사 레시피 ID — 검색기 없음/서킷 열림/실패 시 빈 목록 (제목 검색 결과만 사용)"""
+    if not vector_searcher:
+        logger.warning("vector_searcher가 없어 제목 검색 결과만 반환합니다.")
+        return []
+    try:
+        pairs = await vector_searcher.find_similar_ids(
+            pg_db=postgres,
+            query=query,
+            top_k=top_k,
+            exclude_ids=exclude_ids,
+        )
+        return [int(rid) for rid, _ in pairs]
+    except CircuitOpenError as e:
+        # ML 서비스 장애 중: 호출 없이 즉시 제목 검색 결과만 반환
+        logger.info(f"벡터 검색 생략(서킷 열림): {e}")
+    except Exception as e:
+        logger.warning(f"벡터 검색 실패(query='{query[:20]}'): {e}")
+    return []
+
+
+def _page_detail_stmt(page_ids: List[int], include_materials: bool):
+    """페이지 레시피 상세 (include_materials 이면 재료를 LEFT JOIN 해 한 번에 조회)"""
+    columns = [
+        Recipe.recipe_id.label("RECIPE_ID"),
+        Recipe.recipe_title.label("RECIPE_TITLE"),
+        Recipe.cooking_name.label("COOKING_NAME"),
+        Recipe.scrap_count.label("SCRAP_COUNT"),
+        Recipe.cooking_case_name.label("COOKING_CASE_NAME"),
+        Recipe.cooking_category_name.label("COOKING_CATEGORY_NAME"),
+        Recipe.cooking_introduction.label("COOKING_INTRODUCTION"),
+        Recipe.number_of_serving.label("NUMBER_OF_SERVING"),
+        Recipe.thumbnail_url.label("THUMBNAIL_URL"),
+    ]
+    if not include_materials:
+        return select(*columns).where(Recipe.recipe_id.in_(page_ids))
+    return (
+        select(
+            *columns,
+            Material.material_name.label("MATERIAL_NAME"),
+            Material.measure_amount.label("MEASURE_AMOUNT"),
+            Material.measure_unit.label("MEASURE_UNIT"),
+        )
+        .outerjoin(Material, Material.recipe_id == Recipe.recipe_id)
+        .where(Recipe.recipe_id.in_(page_ids))
+        .order_by(Recipe.recipe_id, Material.material_id)
+    )
+
+
+async def _fetch_page_records(mariadb: AsyncSession, page_ids: List[int], include_materials: bool) -> List[Record]:
+    """페이지 레시피 상세(+재료)를 쿼리 1회로 조회해 page_ids 순서의 레코드로 반환"""
+    rows = (await mariadb.execute(_page_detail_stmt(page_ids, include_materials))).all()
+    records = fold_material_rows(rows) if include_materials else rows_to_records(rows)
+    return order_by_ids(records, page_ids)
+
+
 async def search_recipes_with_pagination(
     *,
     mariadb: AsyncSession,
@@ -22,16 +119,16 @@ async def search_recipes_with_pagination(
     page: int,
     size: int,
     result_ids: Optional[List[int]] = None,
-) -> Tuple[pd.DataFrame, int, bool]:
+) -> Tuple[List[Record], int, bool]:
     """
-    레시피 검색(키워드/재료) 결과를 DataFrame으로 반환하고 페이지 정보도 함께 제공.
+    레시피 검색(키워드/재료) 결과를 레코드(dict) 목록으로 반환하고 페이지 정보도 함께 제공.
     - method="recipe": ML 검색 결과로 받은 result_ids 순서를 유지해 상세 조회
     - method="ingredient": 입력 재료를 모두 포함하는 레시피를 DB에서 조회
-    반환: (page_df, total_approx, has_more)
+    반환: (page_records, total_approx, has_more)
     """
     if method == "recipe":
         if not result_ids:
-            return pd.DataFrame(), 0, False
+            return [], 0, False
 
         name_col = getattr(Recipe, "cooking_name", None) or getattr(Recipe, "recipe_title")
         detail_stmt = (
@@ -47,54 +144,42 @@ async def search_recipes_with_pagination(
             )
             .where(Recipe.recipe_id.in_(result_ids))
         )
-        detail_rows = (await mariadb.execute(detail_stmt)).all()
-        df = pd.DataFrame(detail_rows, columns=[
-            "RECIPE_ID","RECIPE_TITLE","SCRAP_COUNT","COOKING_CASE_NAME","COOKING_CATEGORY_NAME",
-            "COOKING_INTRODUCTION","NUMBER_OF_SERVING","THUMBNAIL_URL"
-        ])
+        records = order_by_ids(rows_to_records((await mariadb.execute(detail_stmt)).all()), result_ids)
 
-        order_map = {rid: i for i, rid in enumerate(result_ids)}
-        df["__order__"] = df["RECIPE_ID"].map(order_map)
-        df = df.sort_values("__order__").drop(columns="__order__").reset_index(drop=True)
-
-        has_more = len(df) > size
+        has_more = len(records) > size
         start_index = (page - 1) * size
-        page_df = df.iloc[:size] if not df.empty else df
-        total_approx = start_index + len(page_df) + (1 if has_more else 0)
-        return page_df, total_approx, has_more
+        page_records = records[:size]
+        total_approx = start_index + len(page_records) + (1 if has_more else 0)
+        return page_records, total_approx, has_more
 
     # method == "ingredient"
     ingredients = [i.strip() for i in (recipe or "").split(",") if i.strip()]
     if not ingredients:
-        return pd.DataFrame(), 0, False
-
-    total_stmt = (
-        select(func.count(func.distinct(Material.recipe_id)))
-        .where(Material.material_name.in_(ingredients))
-        .having(func.count(func.distinct(Material.material_name)) == len(ingredients))
-    )
-    total_count = (await mariadb.execute(total_stmt)).scalar_one_or_none() or 0
+        return [], 0, False
 
     start_offset = (page - 1) * size
-    ids_stmt = (
-        select(Material.recipe_id)
-        .where(Material.material_name.in_(ingredients))
-        .group_by(Material.recipe_id)
-        .having(func.count(func.distinct(Material.material_name)) == len(ingredients))
-        .order_by(desc(func.count(func.distinct(Material.material_name))))
-        .offset(start_offset).limit(size)
-    )
-    page_ids = (await mariadb.execute(ids_stmt)).scalars().all()
+    matched = match_recipes_with_all_materials(ingredients, start_offset, size)
+    if matched is not None:
+        # 재료 비트맵 교집합: 정확한 총 개수 + 페이지 (FCT_MTRL 조회 없음)
+        page_ids, total_count = matched
+    else:
+        total_stmt = select(func.count()).select_from(_all_materials_ids_stmt(ingredients).subquery())
+        total_count = (await mariadb.execute(total_stmt)).scalar_one_or_none() or 0
+
+        ids_stmt = _all_materials_ids_stmt(ingredients).offset(start_offset).limit(size)
+        page_ids = (await mariadb.execute(ids_stmt)).scalars().all()
 
     if not page_ids:
-        return pd.DataFrame(), total_count, total_count > page * size
+        return [], total_count, total_count > page * size
     
     detail_stmt = select(Recipe).where(Recipe.recipe_id.in_(page_ids))
     detail_rows = (await mariadb.execute(detail_stmt)).scalars().all()
-    df = pd.DataFrame([r.__dict__ for r in detail_rows])
+    # ORM 속성만 레코드로 (SQLAlchemy 내부 상태 제외), 페이지 ID 순서 유지
+    records = [{k: v for k, v in r.__dict__.items() if not k.startswith("_")} for r in detail_rows]
+    records = order_by_ids(records, page_ids, key="recipe_id")
 
     has_more = total_count > page * size
-    return df, total_count, has_more
+    return records, total_count, has_more
 
 
 async def recommend_by_recipe_pgvector_v2(
@@ -108,11 +193,12 @@ async def recommend_by_recipe_pgvector_v2(
     page: int = 1,
     size: int = 10,
     include_materials: bool = False,
-) -> pd.DataFrame:
+) -> List[Record]:
     """
-    벡터 검색 결과와 MariaDB 정보를 조합해 페이지 단위 레시피 목록을 반환한다.
+    벡터 검색 결과와 MariaDB 정보를 조합해 페이지 단위 레시피 목록(레코드 dict)을 반환한다.
     - method="recipe": 제목 검색 결과를 우선 사용하고 부족분은 vector_searcher 결과로 보완
     - method="ingredient": 입력 재료를 모두 포함하는 레시피를 DB에서 직접 조회
+    - include_materials=True 이면 각 레코드에 "MATERIALS"(재료 dict 목록 또는 None) 포함
     """
     if method not in {"recipe", "ingredient"}:
         raise ValueError("method must be 'recipe' or 'ingredient'")
@@ -125,160 +211,49 @@ async def recommend_by_recipe_pgvector_v2(
     if method == "ingredient":
         ingredients = [i.strip() for i in (query or "").split(",") if i.strip()]
         if not ingredients:
-            return pd.DataFrame()
-
-        ids_stmt = (
-            select(Material.recipe_id)
-            .where(Material.material_name.in_(ingredients))
-            .group_by(Material.recipe_id)
-            .having(func.count(func.distinct(Material.material_name)) == len(ingredients))
-            .order_by(desc(func.count(func.distinct(Material.material_name))))
-        )
-        start = (page - 1) * size
-        ids_stmt = ids_stmt.offset(start).limit(size)
+            return []
 
-        ids_rows = await mariadb.execute(ids_stmt)
-        page_ids = [int(rid) for (rid,) in ids_rows.all()]
+        start = (page - 1) * size
+        matched = match_recipes_with_all_materials(ingredients, start, size)
+        if matched is not None:
+            page_ids = matched[0]
+        else:
+            ids_stmt = _all_materials_ids_stmt(ingredients).offset(start).limit(size)
+            page_ids = [int(rid) for rid in (await mariadb.execute(ids_stmt)).scalars().all()]
         if not page_ids:
-            return pd.DataFrame()
+            return []
 
-        detail_stmt = (
-            select(
-                Recipe.recipe_id.label("RECIPE_ID"),
-                Recipe.recipe_title.label("RECIPE_TITLE"),
-                Recipe.cooking_name.label("COOKING_NAME"),
-                Recipe.scrap_count.label("SCRAP_COUNT"),
-                Recipe.cooking_case_name.label("COOKING_CASE_NAME"),
-                Recipe.cooking_category_name.label("COOKING_CATEGORY_NAME"),
-                Recipe.cooking_introduction.label("COOKING_INTRODUCTION"),
-                Recipe.number_of_serving.label("NUMBER_OF_SERVING"),
-                Recipe.thumbnail_url.label("THUMBNAIL_URL"),
-            )
-            .where(Recipe.recipe_id.in_(page_ids))
-        )
-        detail_rows = (await mariadb.execute(detail_stmt)).all()
-        final_df = pd.DataFrame(detail_rows, columns=[
-            "RECIPE_ID","RECIPE_TITLE","COOKING_NAME","SCRAP_COUNT","COOKING_CASE_NAME",
-            "COOKING_CATEGORY_NAME","COOKING_INTRODUCTION","NUMBER_OF_SERVING","THUMBNAIL_URL"
-        ])
-
-        order_map = {rid: i for i, rid in enumerate(page_ids)}
-        final_df["__order__"] = final_df["RECIPE_ID"].map(order_map).fillna(len(page_ids))
-        final_df = final_df.sort_values("__order__").drop(columns="__order__").reset_index(drop=True)
-        final_df.insert(0, "No.", range(1, len(final_df) + 1))
-
-        if include_materials and page_ids:
-            m_stmt = select(
-                Material.recipe_id,
-                Material.material_name,
-                Material.measure_amount,
-                Material.measure_unit
-            ).where(Material.recipe_id.in_(page_ids))
-            m_rows = (await mariadb.execute(m_stmt)).all()
-            if m_rows:
-                m_df = pd.DataFrame(m_rows, columns=["RECIPE_ID","MATERIAL_NAME","MEASURE_AMOUNT","MEASURE_UNIT"])
-                mats = (
-                    m_df.groupby("RECIPE_ID")[["MATERIAL_NAME","MEASURE_AMOUNT","MEASURE_UNIT"]]
-                    .apply(lambda g: g.to_dict("records"))
-                    .rename("MATERIALS")
-                    .reset_index()
-                )
-                final_df = final_df.merge(mats, on="RECIPE_ID", how="left")
-
-        return final_df
+        return number_records(await _fetch_page_records(mariadb, page_ids, include_materials))
 
     # ============================ method: recipe ============================
-    name_col = getattr(Recipe, "cooking_name", None) or getattr(Recipe, "recipe_title")
-    base_stmt = (
-        select(Recipe.recipe_id, name_col.label("RECIPE_TITLE"), Recipe.scrap_count)
-        .where(name_col.contains(query))
-        .order_by(desc(Recipe.scrap_count))
-        .limit(max(fetch_upto, top_k))
-    )
-    base_rows = (await mariadb.execute(base_stmt)).all()
-    exact_df = pd.DataFrame(base_rows, columns=["RECIPE_ID","RECIPE_TITLE","SCRAP_COUNT"]).drop_duplicates("RECIPE_ID")
-    exact_ids = [int(x) for x in exact_df["RECIPE_ID"].tolist()]
-
-    need_count = max(0, fetch_upto - len(exact_ids))
+    # 제목 일치 단계와 벡터 단계를 동시에 실행 (제목 단계 결과를 기다렸다가 벡터 검색하지 않음)
     buffer_size = max(size * 2, 10)
-    vector_ids: List[int] = []
-    if need_count > 0:
-        if not vector_searcher:
-            logger.warning("vector_searcher가 없어 제목 검색 결과만 반환합니다.")
-        else:
-            try:
-                pairs = await vector_searcher.find_similar_ids(
-                    pg_db=postgres,
-                    query=query,
-                    top_k=need_count + buffer_size,
-                    exclude_ids=exact_ids or None,
-                )
-                vector_ids = [int(rid) for rid, _ in pairs]
-            except Exception as e:
-                logger.warning(f"벡터 검색 실패(query='{query[:20]}'): {e}")
-
-    merged_ids: List[int] = []
-    seen = set()
-    for rid in exact_ids:
-        if rid not in seen:
-            merged_ids.append(rid)
-            seen.add(rid)
-
-    for rid in vector_ids:
-        if rid not in seen:
-            merged_ids.append(rid)
-            seen.add(rid)
-        if len(merged_ids) >= fetch_upto:
-            break
+    indexed_ids = search_recipe_titles(query, max(fetch_upto, top_k))
+    if indexed_ids is not None:
+        # 레시피명 색인은 메모리 조회라 즉시 끝남 → 부족분만 제외 조건으로 벡터 검색
+        exact_ids = indexed_ids
+        need_count = max(0, fetch_upto - len(exact_ids))
+        vector_ids = (
+            await _vector_ids(vector_searcher, postgres, query, need_count + buffer_size, exact_ids or None)
+            if need_count > 0 else []
+        )
+    else:
+        # 제목 SQL(MariaDB) 과 벡터 검색(PostgreSQL) 은 서로 다른 연결 → 병렬 실행,
+        # 제목 결과를 모르므로 제외 조건 없이 fetch_upto 만큼 더 가져와 메모리에서 중복 제거
+        exact_ids, vector_ids = await asyncio.gather(
+            _title_ids_sql(mariadb, query, max(fetch_upto, top_k)),
+            _vector_ids(vector_searcher, postgres, query, fetch_upto + buffer_size),
+        )
+
+    merged_ids = dedupe_ids([*exact_ids, *vector_ids])[: max(fetch_upto, len(exact_ids))]
 
     start = (page - 1) * size
     page_ids = merged_ids[start : start + size]
     if not page_ids:
-        return pd.DataFrame()
-
-    detail_stmt = (
-        select(
-            Recipe.recipe_id.label("RECIPE_ID"),
-            Recipe.recipe_title.label("RECIPE_TITLE"),
-            Recipe.cooking_name.label("COOKING_NAME"),
-            Recipe.scrap_count.label("SCRAP_COUNT"),
-            Recipe.cooking_case_name.label("COOKING_CASE_NAME"),
-            Recipe.cooking_category_name.label("COOKING_CATEGORY_NAME"),
-            Recipe.cooking_introduction.label("COOKING_INTRODUCTION"),
-            Recipe.number_of_serving.label("NUMBER_OF_SERVING"),
-            Recipe.thumbnail_url.label("THUMBNAIL_URL"),
-        )
-        .where(Recipe.recipe_id.in_(page_ids))
-    )
-    detail_rows = (await mariadb.execute(detail_stmt)).all()
-    detail_df = pd.DataFrame(detail_rows, columns=[
-        "RECIPE_ID","RECIPE_TITLE","COOKING_NAME","SCRAP_COUNT","COOKING_CASE_NAME",
-        "COOKING_CATEGORY_NAME","COOKING_INTRODUCTION","NUMBER_OF_SERVING","THUMBNAIL_URL"
-    ])
+        return []
 
     exact_set = set(exact_ids)
-    detail_df["RANK_TYPE"] = detail_df["RECIPE_ID"].apply(lambda x: 0 if int(x) in exact_set else 1)
-    order_map = {rid: i for i, rid in enumerate(page_ids)}
-    detail_df["__order__"] = detail_df["RECIPE_ID"].map(order_map).fillna(len(page_ids))
-    final_df = detail_df.sort_values("__order__").drop(columns="__order__").reset_index(drop=True)
-    final_df.insert(0, "No.", range(1, len(final_df) + 1))
-
-    if include_materials and page_ids:
-        m_stmt = select(
-            Material.recipe_id,
-            Material.material_name,
-            Material.measure_amount,
-            Material.measure_unit
-        ).where(Material.recipe_id.in_(page_ids))
-        m_rows = (await mariadb.execute(m_stmt)).all()
-        if m_rows:
-            m_df = pd.DataFrame(m_rows, columns=["RECIPE_ID","MATERIAL_NAME","MEASURE_AMOUNT","MEASURE_UNIT"])
-            mats = (
-                m_df.groupby("RECIPE_ID")[["MATERIAL_NAME","MEASURE_AMOUNT","MEASURE_UNIT"]]
-                .apply(lambda g: g.to_dict("records"))
-                .rename("MATERIALS")
-                .reset_index()
-            )
-            final_df = final_df.merge(mats, on="RECIPE_ID", how="left")
-
-    return final_df
+    records = await _fetch_page_records(mariadb, page_ids, include_materials)
+    for record in records:
+        record["RANK_TYPE"] = 0 if int(record["RECIPE_ID"]) in exact_set else 1
+    return number_records(records)
@@ -1,6 +1,6 @@
 """Core MariaDB recipe models."""
 
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, Float, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 from common.database.base_mariadb import MariaBase
@@ -63,3 +63,20 @@ class RecipeRating(MariaBase):
     )
     user_id = Column("USER_ID", Integer, nullable=False)
     rating = Column("RATING", Integer, nullable=False)
+
+
+class RecipeRatingStat(MariaBase):
+    """RECIPE_RATING_STAT 테이블의 ORM 모델 (레시피별 별점 합/개수/평균, set_recipe_rating 에서 증분 갱신)."""
+
+    __tablename__ = "RECIPE_RATING_STAT"
+
+    recipe_id = Column(
+        "RECIPE_ID",
+        Integer,
+        ForeignKey("FCT_RECIPE.RECIPE_ID", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+        autoincrement=False,
+    )
+    rating_sum = Column("RATING_SUM", Integer, nullable=False, default=0)
+    rating_count = Column("RATING_COUNT", Integer, nullable=False, default=0)
+    rating_avg = Column("RATING_AVG", Float, nullable=False, default=0.0)
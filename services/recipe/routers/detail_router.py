@@ -1,6 +1,8 @@
 """Recipe detail endpoints."""
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Request
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.database.mariadb_service import get_maria_service_db
@@ -9,12 +11,32 @@ from common.http_dependencies import extract_http_info
 from common.log_utils import send_user_log
 from common.logger import get_logger
 from services.recipe.crud.recipe_detail_crud import get_recipe_detail
+from services.recipe.utils.detail_cache import invalidate_recipe_detail
 from services.recipe.utils.inventory_recipe import get_recipe_url
 from services.recipe.schemas.recipe_core_schema import RecipeDetailResponse, RecipeUrlResponse
 
 router = APIRouter()
 logger = get_logger("recipe_router")
 
+@router.post("/cache/invalidate/detail")
+async def invalidate_recipe_detail_cache(
+        recipe_id: Optional[int] = Query(None, description="특정 레시피 캐시만 무효화할 경우 레시피 ID")
+):
+    """
+    레시피 상세 캐시 무효화 (레시피/재료 적재 후 호출)
+    - recipe_id 미입력: 전체 레시피 상세 캐시 삭제
+    """
+    logger.debug(f"레시피 상세 캐시 무효화 시작: recipe_id={recipe_id}")
+
+    try:
+        deleted_count = await invalidate_recipe_detail(recipe_id)
+        logger.info(f"레시피 상세 캐시 무효화 완료: recipe_id={recipe_id}, 삭제된 키 수={deleted_count}")
+        return {"message": "레시피 상세 캐시가 무효화되었습니다.", "deleted_count": deleted_count}
+    except Exception as e:
+        logger.error(f"레시피 상세 캐시 무효화 실패: recipe_id={recipe_id}, error={str(e)}")
+        raise HTTPException(status_code=500, detail=f"캐시 무효화 중 오류가 발생했습니다: {str(e)}")
+
+
 @router.get("/{recipe_id}", response_model=RecipeDetailResponse)
 async def get_recipe(
         request: Request,
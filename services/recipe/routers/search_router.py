@@ -51,7 +51,7 @@ async def search_recipe(
 
             # ID 리스트 추출
             result_ids = [item['recipe_id'] for item in search_results]
-            df, total_approx, has_more = await search_recipes_with_pagination(
+            records, total_approx, has_more = await search_recipes_with_pagination(
                 mariadb=mariadb,
                 method=method,
                 recipe=recipe,
@@ -66,7 +66,7 @@ async def search_recipe(
 
     else: # method == "ingredient"
         # 기존 재료 검색 로직 유지
-        df, total_approx, has_more = await search_recipes_with_pagination(
+        records, total_approx, has_more = await search_recipes_with_pagination(
             mariadb=mariadb,
             method=method,
             recipe=recipe,
@@ -74,16 +74,16 @@ async def search_recipe(
             size=size,
             result_ids=None,
         )
-        if df.empty:
+        if not records:
             return {"recipes": [], "page": page, "total": total_approx}
 
     # 페이지네이션 및 결과 포맷팅
     start_index = (page - 1) * size
-    page_df = df.iloc[:size] if not df.empty else df
+    page_records = records[:size]
     # total_approx와 has_more는 crud 함수에서 계산된 값을 사용
 
     execution_time = time.time() - start_time
-    logger.info(f"레시피 검색 완료: uid={current_user.user_id}, kw={recipe}, method={method}, 실행시간={execution_time:.3f}초, 결과수={len(page_df)}")
+    logger.info(f"레시피 검색 완료: uid={current_user.user_id}, kw={recipe}, method={method}, 실행시간={execution_time:.3f}초, 결과수={len(page_records)}")
 
     if background_tasks:
         http_info = extract_http_info(request, response_code=200)
@@ -96,7 +96,7 @@ async def search_recipe(
                 "page": page,
                 "size": size,
                 "method": method,
-                "row_count": int(len(page_df)),
+                "row_count": len(page_records),
                 "has_more": has_more,
                 "execution_time_seconds": round(execution_time, 3),
             },
@@ -104,7 +104,7 @@ async def search_recipe(
         )
 
     return {
-        "recipes": page_df.to_dict(orient="records"),
+        "recipes": page_records,
         "page": page,
         "total": total_approx,
     }
@@ -0,0 +1,58 @@
+# services/recipe/utils/detail_cache.py
+"""
+레시피 상세 페이로드 캐시 (Redis, cache-aside)
+
+레시피 상세 조회마다 FCT_RECIPE + FCT_MTRL 을 조회하던 것을 Redis 캐시로 먼저 응답합니다.
+레시피/재료는 배치 적재로만 바뀌므로 TTL 을 길게 두고, 적재 후 invalidate_recipe_detail() 로 무효화합니다.
+
+- 키: `recipe:detail:v1:{recipe_id}` (사용자와 무관한 공용 페이로드만 저장)
+- Redis 장애/미연결 시 캐시 없이 DB 조회 (RedisCacheCore 가 경고 로그 후 None/False 반환)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from common.logger import get_logger
+from common.metrics import record_cache_lookup
+
+logger = get_logger("recipe_detail_cache")
+
+RECIPE_DETAIL_TTL_SECONDS = 6 * 3600
+_CACHE_KEY = "recipe:detail:v1:{recipe_id}"
+
+_redis = None
+
+
+def _get_redis():
+    """RedisCacheCore 지연 생성 (설정 로드/연결은 첫 사용 시)"""
+    global _redis
+    if _redis is None:
+        from common.cache.redis_cache import RedisCacheCore
+        from common.config import get_settings
+
+        redis_url = getattr(get_settings(), "redis_url", "redis://redis:6379/0")
+        _redis = RedisCacheCore(redis_url, component="recipe_detail_cache")
+    return _redis
+
+
+async def get_cached_recipe_detail(recipe_id: int) -> Optional[Dict[str, Any]]:
+    """캐시된 레시피 상세 (없으면 None)"""
+    cached = await _get_redis().get_json(_CACHE_KEY.format(recipe_id=recipe_id))
+    record_cache_lookup("recipe_detail_cache", "recipe_detail", hit=cached is not None)
+    return cached
+
+
+async def set_cached_recipe_detail(recipe_id: int, detail: Dict[str, Any]) -> bool:
+    """레시피 상세 저장"""
+    return await _get_redis().set_json(_CACHE_KEY.format(recipe_id=recipe_id), detail, RECIPE_DETAIL_TTL_SECONDS)
+
+
+async def invalidate_recipe_detail(recipe_id: Optional[int] = None) -> int:
+    """레시피 상세 캐시 무효화 (recipe_id 미입력 시 전체 — 레시피/재료 적재 후 호출)"""
+    if recipe_id is None:
+        deleted = await _get_redis().delete_pattern(_CACHE_KEY.format(recipe_id="*"))
+    else:
+        deleted = await _get_redis().delete_key(_CACHE_KEY.format(recipe_id=recipe_id))
+    logger.info(f"레시피 상세 캐시 무효화: recipe_id={recipe_id}, 삭제된 키 수={deleted}")
+    return deleted
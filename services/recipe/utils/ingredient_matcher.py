@@ -0,0 +1,222 @@
+# services/recipe/utils/ingredient_matcher.py
+"""
+레시피 재료 ↔ 사용자 주문/장바구니 매칭 유틸리티
+
+재료마다 주문/장바구니 행 전체를 돌며 키워드를 다시 추출하던 중첩 루프(재료 × 상품)를
+"요청당 인덱스 1회 구성 + 재료별 dict 조회"로 바꿉니다.
+
+- 상품명 키워드 추출은 상품 행당 1회 (같은 상품명은 추출기 안에서 메모이즈)
+- 인덱스: 정규화 키워드 → 첫 주문/장바구니 항목 (상품명 자체도 키로 등록해 완전 일치 지원)
+- 분류: 재료명 정규화 후 보유(주문) > 장바구니 > 미보유 순으로 판정 — 재료 수에 선형
+- 표준 재료 어휘(ing_vocab)는 프로세스 단위로 캐시 (매 요청 pymysql 로드 제거)
+
+사용법:
+    extractor = IngredientKeywordExtractor(await aget_ing_vocab())
+    matcher = IngredientStatusMatcher(extractor)
+    index = matcher.build_index(order_entries, cart_entries)
+    ingredients, summary = matcher.classify(material_names, index)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from common.logger import get_logger
+
+logger = get_logger("ingredient_matcher")
+
+# 표준 재료 어휘 캐시 TTL (재료 사전은 배치로만 바뀌므로 길게 유지)
+ING_VOCAB_TTL_SECONDS = 3600
+
+_vocab_cache: Optional[Tuple[float, FrozenSet[str]]] = None
+_vocab_lock = asyncio.Lock()
+
+
+def normalize_key(name: Optional[str]) -> str:
+    """매칭 키 정규화 (앞뒤/연속 공백 제거 + 영문 소문자)"""
+    return " ".join((name or "").split()).lower()
+
+
+def _load_ing_vocab_from_db() -> FrozenSet[str]:
+    """MariaDB 서비스 DB에서 표준 재료 어휘 로드 (블로킹)"""
+    from common.config import get_settings
+    from common.keyword_extraction import load_ing_vocab, parse_mariadb_url
+
+    db_conf = parse_mariadb_url(get_settings().mariadb_service_url)
+    if not db_conf:
+        return frozenset()
+    return frozenset(load_ing_vocab(db_conf))
+
+
+def _cached_vocab() -> Optional[FrozenSet[str]]:
+    if _vocab_cache and time.monotonic() - _vocab_cache[0] < ING_VOCAB_TTL_SECONDS:
+        return _vocab_cache[1]
+    return None
+
+
+def _store_vocab(vocab: FrozenSet[str]) -> FrozenSet[str]:
+    global _vocab_cache
+    _vocab_cache = (time.monotonic(), vocab)
+    return vocab
+
+
+def get_ing_vocab() -> FrozenSet[str]:
+    """
+    표준 재료 어휘 조회 (동기, 프로세스 캐시)
+    - 로드 실패 시 경고 후 직전 캐시 또는 빈 집합 반환 (실패는 캐시하지 않음)
+    """
+    cached = _cached_vocab()
+    if cached is not None:
+        return cached
+    try:
+        return _store_vocab(_load_ing_vocab_from_db())
+    except Exception as e:
+        logger.warning(f"표준 재료 어휘 로드 실패, 상품명 완전 일치로만 매칭: {str(e)}")
+        return _vocab_cache[1] if _vocab_cache else frozenset()
+
+
+async def aget_ing_vocab() -> FrozenSet[str]:
+    """
+    표준 재료 어휘 조회 (비동기)
+    - 캐시 미스일 때만 스레드에서 로드해 이벤트 루프를 막지 않음
+    - 동시 요청은 락으로 묶어 로드를 1회로 합침
+    """
+    cached = _cached_vocab()
+    if cached is not None:
+        return cached
+    async with _vocab_lock:
+        cached = _cached_vocab()
+        if cached is not None:
+            return cached
+        try:
+            return _store_vocab(await asyncio.to_thread(_load_ing_vocab_from_db))
+        except Exception as e:
+            logger.warning(f"표준 재료 어휘 로드 실패, 상품명 완전 일치로만 매칭: {str(e)}")
+            return _vocab_cache[1] if _vocab_cache else frozenset()
+
+
+def clear_ing_vocab_cache() -> None:
+    """어휘 캐시 초기화 (재료 사전 갱신 직후/테스트용)"""
+    global _vocab_cache
+    _vocab_cache = None
+
+
+class IngredientKeywordExtractor:
+    """상품명 → 표준 재료 키워드 추출기 (상품명 단위 메모이즈)"""
+
+    def __init__(self, ing_vocab: Optional[Iterable[str]] = None):
+        self._ing_vocab: Optional[FrozenSet[str]] = frozenset(ing_vocab) if ing_vocab is not None else None
+        self._memo: Dict[Tuple[str, str], List[str]] = {}
+
+    @property
+    def ing_vocab(self) -> FrozenSet[str]:
+        """주입되지 않았으면 프로세스 캐시 어휘 사용"""
+        if self._ing_vocab is None:
+            self._ing_vocab = get_ing_vocab()
+        return self._ing_vocab
+
+    def extract_keywords(self, product_name: Optional[str], product_type: str = "kok") -> List[str]:
+        """
+        상품명에서 표준 재료 키워드 추출
+        - product_type: "kok" | "homeshopping" (서비스별 추출 파라미터 선택)
+        - 어휘가 비어 있으면 추출하지 않음(빈 목록)
+        """
+        if not product_name or not self.ing_vocab:
+            return []
+        memo_key = (product_type, product_name)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            return cached
+
+        from common.keyword_extraction import extract_homeshopping_keywords, extract_kok_keywords
+
+        extract = extract_homeshopping_keywords if product_type == "homeshopping" else extract_kok_keywords
+        try:
+            # 추출은 어휘를 읽기만 하므로 frozenset 을 그대로 전달 (호출마다 set 복사하지 않음)
+            keywords = list(extract(product_name, self.ing_vocab).get("keywords", []))
+        except Exception as e:
+            logger.warning(f"키워드 추출 실패: product_name={product_name}, error={str(e)}")
+            keywords = []
+        self._memo[memo_key] = keywords
+        return keywords
+
+
+@dataclass
+class IngredientIndex:
+    """요청 범위 매칭 인덱스 (정규화 키워드 → 첫 주문/장바구니 항목)"""
+
+    orders: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    carts: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+class IngredientStatusMatcher:
+    """레시피 재료의 보유/장바구니/미보유 분류기"""
+
+    def __init__(self, extractor: Optional[IngredientKeywordExtractor] = None):
+        self.extractor = extractor or IngredientKeywordExtractor()
+
+    def _keys_for(self, product_name: Optional[str], product_type: str) -> List[str]:
+        """상품 1건의 인덱스 키 (추출 키워드 + 상품명 자체)"""
+        keys = [normalize_key(k) for k in self.extractor.extract_keywords(product_name, product_type)]
+        keys.append(normalize_key(product_name))
+        return [k for k in dict.fromkeys(keys) if k]
+
+    def build_index(
+        self,
+        orders: Iterable[Dict[str, Any]],
+        cart_items: Iterable[Dict[str, Any]] = (),
+    ) -> IngredientIndex:
+        """
+        주문/장바구니 항목으로 인덱스 구성
+        - 주문 항목: product_name, order_type 필수 (나머지 키는 order_info 로 그대로 노출)
+        - 장바구니 항목: product_name, cart_type 필수 (나머지 키는 cart_info 로 그대로 노출)
+        - 같은 키에 여러 항목이 있으면 먼저 들어온 항목 사용 (호출 측 정렬 순서 존중)
+        """
+        index = IngredientIndex()
+        for entry in orders:
+            for key in self._keys_for(entry.get("product_name"), entry.get("order_type", "kok")):
+                index.orders.setdefault(key, entry)
+        for entry in cart_items:
+            for key in self._keys_for(entry.get("product_name"), entry.get("cart_type", "kok")):
+                index.carts.setdefault(key, entry)
+        return index
+
+    def classify(
+        self,
+        material_names: Iterable[str],
+        index: IngredientIndex,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        재료 목록 분류 (입력 순서 유지, 중복 재료는 1회만)
+
+        Returns:
+            (ingredients, summary)
+            - ingredients: [{"material_name", "status", "order_info", "cart_info"}]
+            - summary: total_ingredients / owned_count / cart_count / not_owned_count
+        """
+        ingredients: List[Dict[str, Any]] = []
+        counts = {"owned": 0, "cart": 0, "not_owned": 0}
+
+        for material_name in dict.fromkeys(n for n in material_names if n):
+            key = normalize_key(material_name)
+            order_info = index.orders.get(key)
+            cart_info = None if order_info else index.carts.get(key)
+            status = "owned" if order_info else ("cart" if cart_info else "not_owned")
+            counts[status] += 1
+            ingredients.append({
+                "material_name": material_name,
+                "status": status,
+                "order_info": order_info,
+                "cart_info": cart_info,
+            })
+
+        summary = {
+            "total_ingredients": len(ingredients),
+            "owned_count": counts["owned"],
+            "cart_count": counts["cart"],
+            "not_owned_count": counts["not_owned"],
+        }
+        return ingredients, summary
@@ -0,0 +1,214 @@
+# services/recipe/utils/material_index.py
+"""
+재료 → 레시피 ID 비트맵 인덱스 ("입력 재료를 모두 포함하는 레시피" 조회)
+
+재료 검색 요청마다 FCT_MTRL 에 `GROUP BY RECIPE_ID HAVING COUNT(DISTINCT MATERIAL_NAME) = :n`
+을 총 개수/페이지용으로 두 번 실행하던 것을 프로세스 메모리의 비트맵 교집합으로 바꿉니다.
+
+- 비트맵: pyroaring.BitMap (설치된 경우), 없으면 정렬된 정수 배열(_SortedIds)
+- 키: 재료명 정규화(연속 공백 정리 + casefold) — MariaDB 기본 콜레이션의 IN 비교와 동일하게 대소문자 무시
+- 적재: FCT_MTRL (MATERIAL_ID, RECIPE_ID, MATERIAL_NAME) 전체
+  · 게이트웨이 lifespan 에서 start_material_index() 로 백그라운드 적재 + 주기 갱신
+  · MATERIAL_INDEX_CHECK_SECONDS 간격으로 MATERIAL_ID > 마지막 ID 인 신규 행만 증분 반영
+  · MATERIAL_INDEX_MAX_AGE_SECONDS 가 지나면 전체 재적재 (재료 수정/삭제 반영)
+- 조회: 재료별 비트맵을 작은 것부터 교집합 → 정확한 총 개수 + RECIPE_ID 오름차순 페이지
+  · 요청 경로에서는 적재하지 않음: 인덱스가 준비되지 않았으면 None → 호출측이 기존 SQL 로 폴백
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import time
+from array import array
+from functools import reduce
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.logger import get_logger
+from common.periodic_refresh import PeriodicRefresher
+
+logger = get_logger("material_index")
+
+try:
+    from pyroaring import BitMap as _BitMap
+except ImportError:  # pragma: no cover - 선택 의존성
+    _BitMap = None
+
+MATERIAL_INDEX_CHECK_SECONDS = 300
+MATERIAL_INDEX_MAX_AGE_SECONDS = 6 * 3600
+
+_MATERIAL_SQL = """
+    SELECT m.MATERIAL_ID AS material_id, m.RECIPE_ID AS recipe_id, m.MATERIAL_NAME AS material_name
+    FROM FCT_MTRL m
+    WHERE m.MATERIAL_NAME IS NOT NULL {after}
+"""
+
+
+def normalize_material(name: Optional[str]) -> str:
+    """재료명 인덱스 키 (연속 공백 정리 + casefold)"""
+    return " ".join((name or "").split()).casefold()
+
+
+class _SortedIds:
+    """pyroaring 미설치 시 사용하는 정렬된 레시피 ID 집합 (비트맵과 같은 연산만 제공)"""
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._ids = array("q", sorted(set(ids)))
+
+    def add(self, recipe_id: int) -> None:
+        ids = self._ids
+        if not ids or recipe_id > ids[-1]:
+            ids.append(recipe_id)
+            return
+        pos = bisect.bisect_left(ids, recipe_id)
+        if ids[pos] != recipe_id:
+            ids.insert(pos, recipe_id)
+
+    def __contains__(self, recipe_id: int) -> bool:
+        pos = bisect.bisect_left(self._ids, recipe_id)
+        return pos < len(self._ids) and self._ids[pos] == recipe_id
+
+    def __and__(self, other: "_SortedIds") -> "_SortedIds":
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+        result = _SortedIds()
+        result._ids = array("q", (rid for rid in small._ids if rid in large))
+        return result
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+
+def _new_bitmap(ids: Iterable[int] = ()):
+    return _BitMap(ids) if _BitMap is not None else _SortedIds(ids)
+
+
+class MaterialRecipeIndex:
+    """재료명 → 레시피 ID 비트맵 (프로세스 메모리)"""
+
+    def __init__(self):
+        self._postings: Dict[str, object] = {}
+        self._max_material_id = 0
+        self._loaded_at = 0.0
+        self._ready = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def clear(self) -> None:
+        self._postings = {}
+        self._max_material_id = 0
+        self._loaded_at = 0.0
+        self._ready = False
+
+    async def _fetch(self, session: AsyncSession, after_id: Optional[int] = None):
+        after = "AND m.MATERIAL_ID > :after_id" if after_id is not None else ""
+        params = {"after_id": after_id} if after_id is not None else {}
+        result = await session.execute(text(_MATERIAL_SQL.format(after=after)), params)
+        return result.fetchall()
+
+    @staticmethod
+    def _group(rows) -> Tuple[Dict[str, List[int]], int]:
+        grouped: Dict[str, List[int]] = {}
+        max_id = 0
+        for row in rows:
+            key = normalize_material(row.material_name)
+            if key:
+                grouped.setdefault(key, []).append(int(row.recipe_id))
+            max_id = max(max_id, int(row.material_id))
+        return grouped, max_id
+
+    async def _reload(self, session: AsyncSession) -> None:
+        grouped, max_id = self._group(await self._fetch(session))
+        self._postings = {key: _new_bitmap(ids) for key, ids in grouped.items()}
+        self._max_material_id = max_id
+        self._loaded_at = time.monotonic()
+        self._ready = True
+        logger.info(
+            f"재료 비트맵 인덱스 적재: 재료 수={len(self._postings)}, "
+            f"backend={'pyroaring' if _BitMap is not None else 'sorted_array'}"
+        )
+
+    async def _append_new_rows(self, session: AsyncSession) -> None:
+        grouped, max_id = self._group(await self._fetch(session, after_id=self._max_material_id))
+        for key, ids in grouped.items():
+            bitmap = self._postings.get(key)
+            if bitmap is None:
+                self._postings[key] = _new_bitmap(ids)
+                continue
+            for rid in ids:
+                bitmap.add(rid)
+        if grouped:
+            self._max_material_id = max(self._max_material_id, max_id)
+            logger.info(f"재료 비트맵 인덱스 증분 반영: 재료 수={len(grouped)}")
+
+    async def refresh(self, session: AsyncSession, force: bool = False) -> None:
+        """만료되었으면 전체 재적재, 아니면 신규 행만 반영 (동시 호출은 순서대로 1개씩)"""
+        async with self._lock:
+            if force or not self._ready or time.monotonic() - self._loaded_at >= MATERIAL_INDEX_MAX_AGE_SECONDS:
+                await self._reload(session)
+            else:
+                await self._append_new_rows(session)
+
+    def match_all(self, materials: Sequence[str], offset: int, limit: int) -> Optional[Tuple[List[int], int]]:
+        """
+        재료를 모두 포함하는 레시피 (RECIPE_ID 오름차순)
+
+        Returns:
+            (offset 부터 limit 개의 레시피 ID, 전체 개수) — 인덱스가 준비되지 않았으면 None
+        """
+        if not self._ready:
+            return None
+        keys = {normalize_material(name) for name in materials}
+        keys.discard("")
+        if not keys:
+            return [], 0
+        bitmaps = [self._postings.get(key) for key in keys]
+        if any(bitmap is None for bitmap in bitmaps):
+            return [], 0
+        matched = reduce(lambda acc, bitmap: acc & bitmap, sorted(bitmaps, key=len))
+        page_ids = [int(rid) for rid in islice(iter(matched), max(0, offset), max(0, offset) + max(0, limit))]
+        return page_ids, len(matched)
+
+
+_index = MaterialRecipeIndex()
+_refresher = PeriodicRefresher("material_index", _index.refresh, MATERIAL_INDEX_CHECK_SECONDS)
+
+
+def match_recipes_with_all_materials(
+    materials: Sequence[str],
+    offset: int,
+    limit: int,
+) -> Optional[Tuple[List[int], int]]:
+    """입력 재료를 모두 포함하는 레시피 페이지와 총 개수 (인덱스 미준비 시 None → SQL 폴백)"""
+    return _index.match_all(materials, offset, limit)
+
+
+async def refresh_material_index(session: AsyncSession, force: bool = False) -> None:
+    """인덱스 갱신 (주기 태스크/배치/테스트용)"""
+    await _index.refresh(session, force=force)
+
+
+def start_material_index(session_factory: Optional[Callable[[], AsyncSession]] = None) -> None:
+    """백그라운드 적재 + 주기 갱신 태스크 시작 (게이트웨이 lifespan 에서 호출)"""
+    _refresher.start(session_factory)
+
+
+async def stop_material_index() -> None:
+    """주기 갱신 태스크 정리 (게이트웨이 종료 시)"""
+    await _refresher.stop()
+
+
+def clear_material_index() -> None:
+    """인덱스 초기화 (테스트용)"""
+    _index.clear()
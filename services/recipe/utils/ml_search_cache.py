@@ -0,0 +1,275 @@
+# services/recipe/utils/ml_search_cache.py
+"""
+ML 벡터 검색 결과 캐시 (프로세스 메모리 + Redis 2단계, 동시 요청 병합)
+
+홈쇼핑 `/recipe-recommend` 의 상품명, 자주 쓰는 검색어처럼 같은 질의가 반복해서
+ML Inference `/api/v1/search` 를 호출하던 것을 줄입니다.
+
+- 키: 정규화한 질의(공백 정리 + casefold) 1개당 항목 1개 `recipe:ml_search:v1:{sha1}`
+  · 항목 = (요청 top_k, 요청 exclude_ids, 결과 [(recipe_id, distance), ...])
+- 재사용 규칙: 캐시 항목의 exclude 가 요청 exclude 의 부분집합이면 결과에서 요청 exclude 를 걸러
+  · 남은 결과가 top_k 이상이거나 캐시 항목이 끝까지 받은 결과(결과 수 < 항목 top_k)면 앞에서 top_k 개 반환
+  · 즉 넓은 top_k 로 받은 결과가 좁은 top_k, 더 많은 exclude 요청을 그대로 충족
+- 조회 순서: 프로세스 TTLCache(ML_SEARCH_LOCAL_TTL_SECONDS) → Redis(ML_SEARCH_REDIS_TTL_SECONDS) → ML 호출
+- 병합: 같은 질의의 ML 호출이 진행 중이면 새로 호출하지 않고 그 결과를 기다려 재사용
+- ML 호출 시 top_k 는 ML_SEARCH_MIN_FETCH_TOP_K 이상으로 받아 다음 페이지/다른 호출측 요청도 충족
+- 배치: cached_similar_ids_batch 는 캐시 미스 질의만 모아 배치 호출 1회 (단건 요청도 그 결과에 병합)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from cachetools import TTLCache
+
+from common.logger import get_logger
+from common.metrics import record_cache_lookup
+
+logger = get_logger("ml_search_cache")
+
+ML_SEARCH_LOCAL_TTL_SECONDS = 60
+ML_SEARCH_LOCAL_MAXSIZE = 1024
+ML_SEARCH_REDIS_TTL_SECONDS = 300
+ML_SEARCH_MIN_FETCH_TOP_K = 30
+_CACHE_KEY = "recipe:ml_search:v1:{digest}"
+
+SearchPairs = List[Tuple[int, float]]
+FetchFn = Callable[[str, int, Optional[List[int]]], Awaitable[Iterable[Tuple[Any, Any]]]]
+FetchManyFn = Callable[[List[str], int, Optional[List[int]]], Awaitable[Sequence[Iterable[Tuple[Any, Any]]]]]
+
+
+def normalize_query(query: str) -> str:
+    """연속 공백을 하나로 줄인 질의 (ML 호출에 사용)"""
+    return " ".join((query or "").split())
+
+
+def _cache_key(normalized: str) -> str:
+    digest = hashlib.sha1(normalized.casefold().encode("utf-8")).hexdigest()
+    return _CACHE_KEY.format(digest=digest)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    top_k: int
+    exclude: FrozenSet[int]
+    results: Tuple[Tuple[int, float], ...]
+
+    def serve(self, top_k: int, exclude: FrozenSet[int]) -> Optional[SearchPairs]:
+        """요청(top_k, exclude)을 이 항목으로 충족할 수 있으면 결과, 아니면 None"""
+        if not self.exclude <= exclude:
+            return None
+        filtered = [pair for pair in self.results if pair[0] not in exclude]
+        exhausted = len(self.results) < self.top_k
+        if len(filtered) >= top_k or exhausted:
+            return filtered[:top_k]
+        return None
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"top_k": self.top_k, "exclude": sorted(self.exclude), "results": [list(p) for p in self.results]}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "_Entry":
+        return cls(
+            top_k=int(data["top_k"]),
+            exclude=frozenset(int(rid) for rid in data.get("exclude", [])),
+            results=tuple((int(rid), float(dist)) for rid, dist in data.get("results", [])),
+        )
+
+
+_redis = None
+
+
+def _get_redis():
+    """검색 결과 Redis 캐시 (첫 사용 시 생성)"""
+    global _redis
+    if _redis is None:
+        from common.cache.redis_cache import RedisCacheCore
+        from common.config import get_settings
+
+        redis_url = getattr(get_settings(), "redis_url", "redis://redis:6379/0")
+        _redis = RedisCacheCore(redis_url, component="ml_search")
+    return _redis
+
+
+class MLSearchCache:
+    """질의별 ML 검색 결과 캐시 + 진행 중 호출 병합"""
+
+    def __init__(self):
+        self._local: TTLCache = TTLCache(maxsize=ML_SEARCH_LOCAL_MAXSIZE, ttl=ML_SEARCH_LOCAL_TTL_SECONDS)
+        self._inflight: Dict[str, "asyncio.Future[_Entry]"] = {}
+
+    def clear(self) -> None:
+        self._local.clear()
+        self._inflight.clear()
+
+    async def _load_redis(self, key: str) -> Optional[_Entry]:
+        try:
+            data = await _get_redis().get_json(key)
+            return _Entry.from_json(data) if data else None
+        except Exception as e:
+            logger.warning(f"ML 검색 캐시 조회 실패: key={key}, error={e}")
+            return None
+
+    async def _store(self, key: str, entry: _Entry) -> None:
+        self._local[key] = entry
+        try:
+            await _get_redis().set_json(key, entry.to_json(), ML_SEARCH_REDIS_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"ML 검색 캐시 저장 실패: key={key}, error={e}")
+
+    async def _lookup(self, key: str, top_k: int, exclude: FrozenSet[int]) -> Optional[SearchPairs]:
+        """프로세스 캐시 → Redis 순으로 조회 (충족 못 하면 None)"""
+        entry = self._local.get(key)
+        served = entry.serve(top_k, exclude) if entry else None
+        record_cache_lookup("ml_search", "local", hit=served is not None)
+        if served is not None:
+            return served
+
+        entry = await self._load_redis(key)
+        served = entry.serve(top_k, exclude) if entry else None
+        record_cache_lookup("ml_search", "redis", hit=served is not None)
+        if served is not None:
+            self._local[key] = entry
+        return served
+
+    async def search(
+        self,
+        query: str,
+        top_k: int,
+        exclude_ids: Optional[Iterable[int]],
+        fetch: FetchFn,
+    ) -> SearchPairs:
+        """
+        캐시를 거쳐 유사도 검색
+
+        Args:
+            fetch: 캐시 미스 시 호출할 함수 (query, top_k, exclude_ids) → [(recipe_id, distance), ...]
+        """
+        normalized = normalize_query(query)
+        exclude = frozenset(int(rid) for rid in exclude_ids or ())
+        key = _cache_key(normalized)
+
+        served = await self._lookup(key, top_k, exclude)
+        if served is not None:
+            return served
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                entry = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 선행 호출만 취소된 경우에는 직접 호출로 진행
+                if not inflight.cancelled():
+                    raise
+                entry = None
+            served = entry.serve(top_k, exclude) if entry else None
+            record_cache_lookup("ml_search", "inflight", hit=served is not None)
+            if served is not None:
+                return served
+
+        async def fetch_one(queries: List[str], k: int, excluded: Optional[List[int]]):
+            return [await fetch(queries[0], k, excluded)]
+
+        entries = await self._fetch_many({key: normalized}, top_k, exclude, fetch_one)
+        return entries[key].serve(top_k, exclude) or []
+
+    async def search_many(
+        self,
+        queries: Sequence[str],
+        top_k: int,
+        exclude_ids: Optional[Iterable[int]],
+        fetch_many: FetchManyFn,
+    ) -> List[SearchPairs]:
+        """
+        여러 질의를 캐시를 거쳐 검색 (미스 질의만 모아 fetch_many 1회 호출)
+
+        Args:
+            fetch_many: (queries, top_k, exclude_ids) → 질의 순서대로 [(recipe_id, distance), ...] 목록
+        """
+        exclude = frozenset(int(rid) for rid in exclude_ids or ())
+        keys = [_cache_key(normalize_query(query)) for query in queries]
+        unique = {key: normalize_query(query) for key, query in zip(keys, queries)}
+
+        lookups = await asyncio.gather(*[self._lookup(key, top_k, exclude) for key in unique])
+        served: Dict[str, SearchPairs] = {key: hit for key, hit in zip(unique, lookups) if hit is not None}
+        misses = {key: normalized for key, normalized in unique.items() if key not in served}
+        if misses:
+            entries = await self._fetch_many(misses, top_k, exclude, fetch_many)
+            for key, entry in entries.items():
+                served[key] = entry.serve(top_k, exclude) or []
+        return [list(served[key]) for key in keys]
+
+    async def _fetch_many(
+        self,
+        misses: Dict[str, str],
+        top_k: int,
+        exclude: FrozenSet[int],
+        fetch_many: FetchManyFn,
+    ) -> Dict[str, _Entry]:
+        """미스 질의(키 → 정규화 질의)를 한 번에 호출하고 캐시에 저장"""
+        fetch_top_k = max(top_k, ML_SEARCH_MIN_FETCH_TOP_K)
+        loop = asyncio.get_running_loop()
+        owned: Dict[str, "asyncio.Future[_Entry]"] = {}
+        for key in misses:
+            if key in self._inflight:
+                continue
+            future: "asyncio.Future[_Entry]" = loop.create_future()
+            # 대기자가 없을 때 실패 결과가 "never retrieved" 경고를 남기지 않도록 소비
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._inflight[key] = owned[key] = future
+        try:
+            pair_lists = await fetch_many(list(misses.values()), fetch_top_k, sorted(exclude) or None)
+            entries = {
+                key: _Entry(fetch_top_k, exclude, tuple((int(rid), float(dist)) for rid, dist in pairs))
+                for key, pairs in zip(misses, pair_lists)
+            }
+            for key, future in owned.items():
+                future.set_result(entries[key])
+        except asyncio.CancelledError:
+            for future in owned.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        finally:
+            for key, future in owned.items():
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+        for key, entry in entries.items():
+            await self._store(key, entry)
+        return entries
+
+
+_cache = MLSearchCache()
+
+
+async def cached_similar_ids(
+    query: str,
+    top_k: int,
+    exclude_ids: Optional[Iterable[int]],
+    fetch: FetchFn,
+) -> SearchPairs:
+    """ML 유사도 검색 (2단계 캐시 + 동시 요청 병합)"""
+    return await _cache.search(query, top_k, exclude_ids, fetch)
+
+
+async def cached_similar_ids_batch(
+    queries: Sequence[str],
+    top_k: int,
+    exclude_ids: Optional[Iterable[int]],
+    fetch_many: FetchManyFn,
+) -> List[SearchPairs]:
+    """여러 질의 ML 유사도 검색 (캐시 미스만 모아 1회 호출, 질의 순서대로 반환)"""
+    return await _cache.search_many(queries, top_k, exclude_ids, fetch_many)
+
+
+def clear_ml_search_cache() -> None:
+    """프로세스 캐시 초기화 (임베딩 인덱스 재구축 직후/테스트용)"""
+    _cache.clear()
@@ -0,0 +1,173 @@
+# services/recipe/utils/ownership_snapshot.py
+"""
+사용자 식재료 보유 스냅샷 (최근 주문 + 장바구니 → 정규화 키워드 인덱스)
+
+레시피 상세를 볼 때마다 최근 7일 주문/장바구니를 다시 조회하고 키워드를 추출하던 것을
+사용자 단위 스냅샷 1개로 묶어 짧은 TTL로 캐시합니다.
+
+- 구성: UNION ALL 쿼리 1회(콕/홈쇼핑 주문 + 콕/홈쇼핑 장바구니) → IngredientIndex
+- 캐시: Redis(`recipe:ownership:v1:user:{user_id}`, 60초) — 워커 간 무효화가 보이도록 공유 캐시 사용
+- 무효화: 장바구니 추가/수정/삭제, 주문 생성/취소 CRUD 에서 invalidate_ownership_snapshot_after_commit 호출
+  (커밋 전에 지우면 다른 요청이 커밋 전 DB 로 스냅샷을 다시 채울 수 있어 커밋 후 삭제)
+- 레시피별 상태: 재료명 키 집합과 스냅샷 키 집합의 교집합(dict 조회) + 재료 쿼리 1회
+
+사용법:
+    index = await get_ownership_snapshot(db, user_id)
+    ingredients, summary = IngredientStatusMatcher().classify(material_names, index)
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.logger import get_logger
+from common.metrics import record_cache_lookup
+from services.recipe.utils.ingredient_matcher import (
+    IngredientIndex,
+    IngredientKeywordExtractor,
+    IngredientStatusMatcher,
+    aget_ing_vocab,
+)
+
+logger = get_logger("ownership_snapshot")
+
+OWNERSHIP_SNAPSHOT_TTL_SECONDS = 60
+OWNERSHIP_WINDOW_DAYS = 7
+_SNAPSHOT_KEY = "recipe:ownership:v1:user:{user_id}"
+
+# 주문(최근 N일, 취소 제외)과 장바구니를 한 번에 조회 — 최신 항목이 먼저 오도록 정렬
+_SNAPSHOT_SQL = """
+SELECT 'order' AS kind, 'kok' AS source_type, o.order_id AS ref_id, o.order_time AS event_time,
+       kpi.kok_product_name AS product_name, ko.quantity AS quantity
+FROM ORDERS o
+INNER JOIN KOK_ORDERS ko ON o.order_id = ko.order_id
+INNER JOIN FCT_KOK_PRODUCT_INFO kpi ON ko.kok_product_id = kpi.kok_product_id
+WHERE o.user_id = :user_id AND o.order_time >= :since AND o.cancel_time IS NULL
+
+UNION ALL
+
+SELECT 'order' AS kind, 'homeshopping' AS source_type, o.order_id AS ref_id, o.order_time AS event_time,
+       hl.product_name AS product_name, ho.quantity AS quantity
+FROM ORDERS o
+INNER JOIN HOMESHOPPING_ORDERS ho ON o.order_id = ho.order_id
+INNER JOIN FCT_HOMESHOPPING_LIST hl ON ho.product_id = hl.product_id
+WHERE o.user_id = :user_id AND o.order_time >= :since AND o.cancel_time IS NULL
+
+UNION ALL
+
+SELECT 'cart' AS kind, 'kok' AS source_type, kc.kok_cart_id AS ref_id, kc.kok_created_at AS event_time,
+       kpi.kok_product_name AS product_name, kc.kok_quantity AS quantity
+FROM KOK_CART kc
+INNER JOIN FCT_KOK_PRODUCT_INFO kpi ON kc.kok_product_id = kpi.kok_product_id
+WHERE kc.user_id = :user_id
+
+UNION ALL
+
+SELECT 'cart' AS kind, 'homeshopping' AS source_type, hc.cart_id AS ref_id, hc.created_at AS event_time,
+       hl.product_name AS product_name, hc.quantity AS quantity
+FROM HOMESHOPPING_CART hc
+INNER JOIN FCT_HOMESHOPPING_LIST hl ON hc.product_id = hl.product_id
+WHERE hc.user_id = :user_id
+
+ORDER BY event_time DESC
+"""
+
+_cache = None
+
+
+def _get_cache():
+    """스냅샷 Redis 캐시 (첫 사용 시 생성)"""
+    global _cache
+    if _cache is None:
+        from common.cache.redis_cache import RedisCacheCore
+        from common.config import get_settings
+
+        redis_url = getattr(get_settings(), "redis_url", "redis://redis:6379/0")
+        _cache = RedisCacheCore(redis_url, component="recipe_ownership")
+    return _cache
+
+
+def _snapshot_key(user_id: int) -> str:
+    return _SNAPSHOT_KEY.format(user_id=user_id)
+
+
+def _json_safe(value: Any) -> Any:
+    """캐시 적중/미스 응답 형태를 맞추기 위해 시각은 ISO 문자열로 통일"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+async def build_ownership_snapshot(db: AsyncSession, user_id: int) -> IngredientIndex:
+    """주문/장바구니 UNION 쿼리 1회로 보유 스냅샷 구성 (캐시 미사용)"""
+    since = datetime.now() - timedelta(days=OWNERSHIP_WINDOW_DAYS)
+    try:
+        rows = (await db.execute(text(_SNAPSHOT_SQL), {"user_id": user_id, "since": since})).fetchall()
+    except Exception as e:
+        logger.error(f"보유 스냅샷 조회 SQL 실행 실패: user_id={user_id}, error={str(e)}")
+        raise
+
+    orders, carts = [], []
+    for row in rows:
+        if not row.product_name:
+            continue
+        if row.kind == "order":
+            orders.append({
+                "order_id": row.ref_id,
+                "order_date": _json_safe(row.event_time),
+                "product_name": row.product_name,
+                "quantity": row.quantity,
+                "order_type": row.source_type,
+            })
+        else:
+            carts.append({
+                "cart_id": row.ref_id,
+                "product_name": row.product_name,
+                "quantity": row.quantity,
+                "cart_type": row.source_type,
+            })
+
+    matcher = IngredientStatusMatcher(IngredientKeywordExtractor(await aget_ing_vocab()))
+    return matcher.build_index(orders, carts)
+
+
+async def get_ownership_snapshot(db: AsyncSession, user_id: int) -> IngredientIndex:
+    """
+    사용자 보유 스냅샷 조회 (캐시 우선)
+    - 캐시 장애 시 매번 구성 (응답 정확성 우선)
+    """
+    cache = _get_cache()
+    key = _snapshot_key(user_id)
+
+    cached: Optional[Dict[str, Any]] = await cache.get_json(key)
+    if cached is not None:
+        record_cache_lookup("recipe_ownership", "snapshot", hit=True)
+        return IngredientIndex(orders=cached.get("orders", {}), carts=cached.get("carts", {}))
+    record_cache_lookup("recipe_ownership", "snapshot", hit=False)
+
+    index = await build_ownership_snapshot(db, user_id)
+    await cache.set_json(
+        key,
+        {"orders": index.orders, "carts": index.carts},
+        OWNERSHIP_SNAPSHOT_TTL_SECONDS,
+    )
+    return index
+
+
+async def invalidate_ownership_snapshot(user_id: int) -> None:
+    """장바구니/주문 변경 시 사용자 스냅샷 무효화 (실패해도 TTL 내에서만 지연)"""
+    try:
+        await _get_cache().delete_key(_snapshot_key(user_id))
+    except Exception as e:
+        logger.warning(f"보유 스냅샷 무효화 실패: user_id={user_id}, error={str(e)}")
+
+
+def invalidate_ownership_snapshot_after_commit(db: AsyncSession, user_id: int) -> None:
+    """현재 트랜잭션이 커밋된 뒤 사용자 스냅샷 무효화 (롤백 시 생략)"""
+    from common.database.after_commit import run_after_commit
+
+    run_after_commit(db, lambda: invalidate_ownership_snapshot(user_id))
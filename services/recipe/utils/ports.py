@@ -1,7 +1,11 @@
 # backend/services/recipe/utils/ports.py
-from typing import Protocol, List, Tuple, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol, List, Tuple, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class RecommenderPort(Protocol):
     async def recommend_by_recipe_name(self, df: pd.DataFrame, query: str, top_k: int = 25) -> pd.DataFrame:
@@ -28,3 +32,18 @@ class VectorSearcherPort(Protocol):
         - 반환: [(recipe_id, distance), ...]
         """
         ...
+
+    async def find_similar_ids_batch(
+        self,
+        pg_db: AsyncSession,
+        queries: List[str],
+        top_k: int,
+        exclude_ids: Optional[List[int]] = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        여러 검색어를 한 번에 검색한다 (원격 구현은 요청 1회).
+        - queries: 검색어 목록
+        - top_k / exclude_ids: 모든 검색어에 공통 적용
+        - 반환: queries 순서대로 [(recipe_id, distance), ...] 목록
+        """
+        ...
@@ -0,0 +1,265 @@
+# services/recipe/utils/product_candidate_index.py
+"""
+식재료 → 추천 상품 후보 인덱스
+
+상품 추천 요청마다 HOMESHOPPING_CLASSIFY/KOK_CLASSIFY 전체를 REGEXP 로 훑던 방식을
+"식재료별로 미리 순위 매긴 상품 ID 목록 조회 + 상세 1회 조회"로 바꿉니다.
+
+- 카탈로그: 식재료 분류 상품(홈쇼핑 CLS_FOOD=1·CLS_ING=1, 콕 CLS_ING=1)의 (상품 ID, 상품명)만 메모리에 적재
+  · 게이트웨이 lifespan 에서 start_product_candidate_index() 로 백그라운드 적재 + 주기 갱신
+  · CATALOG_CHECK_SECONDS 간격으로 PRODUCT_ID > 마지막 ID 인 신규 상품만 증분 반영
+  · CATALOG_MAX_AGE_SECONDS 가 지나면 전체 재적재 (재분류/삭제 반영)
+  · 요청 경로는 적재된 카탈로그를 그대로 사용, 아직 적재 전이면 1회만 적재 (동시 요청은 같은 적재를 대기)
+- 후보 목록: 식재료 첫 조회 시 카탈로그에서 계산해 메모이즈, 신규 상품은 기존 목록에 병합
+  · 목록 길이는 max(CANDIDATE_LIST_SIZE, 호출측 요청 수) — 더 긴 목록을 요청하면 그 길이로 다시 계산
+  · 기존 SQL 과 같은 규칙: 오른쪽 경계 정규식(원문/공백 제거), EXCLUDE_CONTAINS 금지어 제외,
+    정렬은 상품명 내 키워드 위치(LOCATE) → 상품명 길이(CHAR_LENGTH)
+- precompute_ingredients 로 표준 재료 어휘 전체를 미리 계산해 둘 수 있음 (배치/워밍업)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.logger import get_logger
+from common.periodic_refresh import PeriodicRefresher
+
+logger = get_logger("product_candidate_index")
+
+CATALOG_CHECK_SECONDS = 60
+CATALOG_MAX_AGE_SECONDS = 3600
+# 식재료별로 유지하는 기본 후보 수 (호출측이 더 많이 요청하면 그 수만큼 계산)
+CANDIDATE_LIST_SIZE = 30
+
+SOURCES = ("homeshopping", "kok")
+
+_CATALOG_SQL = {
+    "homeshopping": """
+        SELECT hc.PRODUCT_ID AS product_id, hc.PRODUCT_NAME AS product_name
+        FROM HOMESHOPPING_CLASSIFY hc
+        WHERE hc.CLS_FOOD = 1 AND hc.CLS_ING = 1 {after}
+    """,
+    "kok": """
+        SELECT kc.PRODUCT_ID AS product_id, kc.PRODUCT_NAME AS product_name
+        FROM KOK_CLASSIFY kc
+        WHERE kc.CLS_ING = 1 {after}
+    """,
+}
+
+# LOCATE 결과가 0(미포함)일 때의 정렬값 (기존 SQL 과 동일)
+_NOT_LOCATED = 99999
+
+RankKey = Tuple[int, int, int]  # (키워드 위치, 상품명 길이, 상품 ID)
+
+
+@dataclass
+class IngredientMatcher:
+    """식재료 1개의 상품명 매칭 규칙 (정규식 + 금지어)"""
+
+    keyword: str
+    pattern: "re.Pattern[str]"
+    pattern_ns: "re.Pattern[str]"
+    bans: Tuple[str, ...]
+
+    @classmethod
+    def for_ingredient(cls, ingredient: str) -> "IngredientMatcher":
+        from services.recipe.utils.product_recommend import EXCLUDE_CONTAINS, build_regex_params, normalize_text
+
+        (pat, pat_ns), kw = build_regex_params(ingredient)
+        bans = tuple(b.casefold() for b in EXCLUDE_CONTAINS.get(normalize_text(ingredient), []))
+        # MariaDB REGEXP/LOCATE 는 기본 콜레이션에서 대소문자를 구분하지 않음
+        return cls(kw, re.compile(pat, re.IGNORECASE), re.compile(pat_ns, re.IGNORECASE), bans)
+
+    def rank_key(self, product_id: int, product_name: Optional[str]) -> Optional[RankKey]:
+        """매칭되면 정렬 키, 아니면 None"""
+        if not product_name or not self.keyword:
+            return None
+        if not (self.pattern.search(product_name) or self.pattern_ns.search(product_name.replace(" ", ""))):
+            return None
+        folded = product_name.casefold()
+        if any(ban in folded for ban in self.bans):
+            return None
+        position = folded.find(self.keyword.casefold())
+        return (position + 1 if position >= 0 else _NOT_LOCATED, len(product_name), int(product_id))
+
+
+def rank_products(
+    ingredient: str,
+    products: Iterable[Tuple[int, Optional[str]]],
+    limit: int = CANDIDATE_LIST_SIZE,
+) -> List[RankKey]:
+    """(상품 ID, 상품명) 목록에서 식재료 후보를 순위대로 최대 limit 개 선택"""
+    matcher = IngredientMatcher.for_ingredient(ingredient)
+    keys = [key for pid, name in products if (key := matcher.rank_key(pid, name)) is not None]
+    keys.sort()
+    return keys[:limit]
+
+
+@dataclass
+class _SourceCatalog:
+    products: List[Tuple[int, str]] = field(default_factory=list)
+    max_product_id: int = 0
+
+
+@dataclass
+class _CandidateLists:
+    size: int
+    lists: Dict[str, List[RankKey]]
+
+
+class ProductCandidateIndex:
+    """식재료 → 소스별 순위 상품 ID 목록 (프로세스 메모리)"""
+
+    def __init__(self):
+        self._catalogs: Dict[str, _SourceCatalog] = {}
+        self._candidates: Dict[str, _CandidateLists] = {}
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._catalogs)
+
+    def clear(self) -> None:
+        self._catalogs = {}
+        self._candidates = {}
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+
+    async def _fetch_catalog(self, session: AsyncSession, source: str, after_id: Optional[int] = None):
+        after = "AND PRODUCT_ID > :after_id" if after_id is not None else ""
+        params = {"after_id": after_id} if after_id is not None else {}
+        result = await session.execute(text(_CATALOG_SQL[source].format(after=after)), params)
+        return [(int(row.product_id), row.product_name or "") for row in result.fetchall()]
+
+    async def _reload(self, session: AsyncSession) -> None:
+        catalogs = {}
+        for source in SOURCES:
+            products = await self._fetch_catalog(session, source)
+            catalogs[source] = _SourceCatalog(products, max((pid for pid, _ in products), default=0))
+        self._catalogs = catalogs
+        self._candidates = {}
+        self._loaded_at = time.monotonic()
+        logger.info(
+            f"상품 후보 카탈로그 적재: homeshopping={len(catalogs['homeshopping'].products)}, "
+            f"kok={len(catalogs['kok'].products)}"
+        )
+
+    async def _append_new_products(self, session: AsyncSession) -> None:
+        """신규 분류 상품만 카탈로그와 계산된 후보 목록에 병합"""
+        for source in SOURCES:
+            catalog = self._catalogs[source]
+            added = await self._fetch_catalog(session, source, after_id=catalog.max_product_id)
+            if not added:
+                continue
+            catalog.products.extend(added)
+            catalog.max_product_id = max(catalog.max_product_id, max(pid for pid, _ in added))
+            for ingredient, computed in self._candidates.items():
+                merged = computed.lists[source] + rank_products(ingredient, added, computed.size)
+                merged.sort()
+                computed.lists[source] = merged[:computed.size]
+            logger.info(f"상품 후보 카탈로그 증분 반영: source={source}, added={len(added)}")
+
+    async def refresh(self, session: AsyncSession, force: bool = False) -> None:
+        """
+        만료되었으면 전체 재적재, 아니면 신규 상품만 반영 (주기 태스크용)
+        - 동시 호출은 잠금으로 1개씩, 확인 간격 안에 이미 확인했으면 생략 (force 제외)
+        """
+        async with self._lock:
+            now = time.monotonic()
+            if not force and self._catalogs and now - self._checked_at < CATALOG_CHECK_SECONDS:
+                return
+            if force or not self._catalogs or now - self._loaded_at >= CATALOG_MAX_AGE_SECONDS:
+                await self._reload(session)
+            else:
+                await self._append_new_products(session)
+            self._checked_at = time.monotonic()
+
+    async def ensure_catalog(self, session: AsyncSession) -> None:
+        """백그라운드 적재 전이면 요청 경로에서 1회 적재 (동시 요청은 같은 잠금 대기)"""
+        if not self._catalogs:
+            await self.refresh(session)
+
+    def _compute(self, ingredient: str, limit: int = CANDIDATE_LIST_SIZE) -> Dict[str, List[RankKey]]:
+        size = max(limit, CANDIDATE_LIST_SIZE)
+        computed = self._candidates.get(ingredient)
+        if computed is None or computed.size < size:
+            lists = {source: rank_products(ingredient, self._catalogs[source].products, size) for source in SOURCES}
+            computed = self._candidates[ingredient] = _CandidateLists(size, lists)
+        return computed.lists
+
+    async def get_candidates(
+        self,
+        session: AsyncSession,
+        ingredient: str,
+        limit: int = CANDIDATE_LIST_SIZE,
+    ) -> Dict[str, List[int]]:
+        """
+        식재료의 소스별 후보 상품 ID (순위순, 소스별 최대 limit 개)
+
+        Returns:
+            {"homeshopping": [...], "kok": [...]}
+        """
+        await self.ensure_catalog(session)
+        lists = self._compute(ingredient, limit)
+        return {source: [key[2] for key in lists[source][:limit]] for source in SOURCES}
+
+    async def precompute(self, session: AsyncSession, ingredients: Sequence[str]) -> int:
+        """식재료 목록의 후보를 미리 계산 (반환: 계산한 식재료 수)"""
+        await self.ensure_catalog(session)
+        for ingredient in ingredients:
+            self._compute(ingredient)
+        return len(ingredients)
+
+
+_index = ProductCandidateIndex()
+_refresher = PeriodicRefresher("product_candidate_index", _index.refresh, CATALOG_CHECK_SECONDS)
+
+
+async def get_product_candidates(
+    session: AsyncSession,
+    ingredient: str,
+    limit: int = CANDIDATE_LIST_SIZE,
+) -> Dict[str, List[int]]:
+    """식재료 → 소스별 순위 상품 ID 목록 조회 (프로세스 인덱스, 소스별 최대 limit 개)"""
+    return await _index.get_candidates(session, ingredient, limit)
+
+
+async def precompute_ingredients(session: AsyncSession, ingredients: Optional[Sequence[str]] = None) -> int:
+    """
+    후보 목록 미리 계산
+    - ingredients 가 없으면 표준 재료 어휘 전체 대상
+    """
+    if ingredients is None:
+        from services.recipe.utils.ingredient_matcher import aget_ing_vocab
+
+        ingredients = sorted(await aget_ing_vocab())
+    return await _index.precompute(session, ingredients)
+
+
+async def refresh_product_candidate_index(session: AsyncSession, force: bool = False) -> None:
+    """카탈로그 갱신 (주기 태스크/배치/테스트용)"""
+    await _index.refresh(session, force=force)
+
+
+def start_product_candidate_index(session_factory: Optional[Callable[[], AsyncSession]] = None) -> None:
+    """백그라운드 적재 + 주기 갱신 태스크 시작 (게이트웨이 lifespan 에서 호출)"""
+    _refresher.start(session_factory)
+
+
+async def stop_product_candidate_index() -> None:
+    """주기 갱신 태스크 정리 (게이트웨이 종료 시)"""
+    await _refresher.stop()
+
+
+def clear_product_candidate_index() -> None:
+    """후보 인덱스 초기화 (분류 배치 직후/테스트용)"""
+    _index.clear()
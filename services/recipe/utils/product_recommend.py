@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 # utils.py — 공통 유틸 + DB 연결 + 필터/정규화
+from __future__ import annotations
+
+import math
 import re
-import pandas as pd
-import numpy as np
+
 from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+
+from services.recipe.utils.product_candidate_index import get_product_candidates
 
 # 환경변수 로드
 load_dotenv()
@@ -61,48 +65,20 @@ def is_false_positive(name: str, keyword: str) -> bool:
     """임시 스텁: 향후 맥락 필터 확장 전까지 항상 False"""
     return False
 
-def apply_exclude(df: pd.DataFrame, name_col: str, ingredient: str) -> pd.DataFrame:
-    """임시방편: ingredient에 매핑된 금지어가 상품명에 포함되면 제외"""
-    if df is None or df.empty:
-        return df
-    key = normalize_text(ingredient)
-    bans = EXCLUDE_CONTAINS.get(key, [])
-    if not bans:
-        return df
-    name_s = df[name_col].astype(str)
-    mask = pd.Series(True, index=df.index)
-    for ban in bans:
-        mask &= ~name_s.str.contains(re.escape(ban), case=False, na=False)
-    return df[mask]
-
 def safe_price(price_value):
     """가격 값을 안전하게 변환: nan, None, 빈 값은 None으로 변환"""
     if price_value is None:
         return None
-    if pd.isna(price_value) or np.isnan(price_value):
-        return None
     try:
         # 숫자로 변환 시도
         price_float = float(price_value)
-        if np.isnan(price_float):
+        if math.isnan(price_float):
             return None
         return int(price_float) if price_float.is_integer() else price_float
     except (ValueError, TypeError):
         return None
 
 # ---------- DB 유틸 ----------
-async def _read_df_async(session: AsyncSession, sql: str, params: list) -> pd.DataFrame:
-    """SQLAlchemy 세션을 사용하여 데이터프레임 반환"""
-    result = await session.execute(text(sql), params)
-    rows = result.fetchall()
-    if rows:
-        # 컬럼명 추출
-        columns = result.keys()
-        # 딕셔너리 리스트로 변환
-        dict_rows = [dict(zip(columns, row)) for row in rows]
-        return pd.DataFrame(dict_rows)
-    return pd.DataFrame()
-
 # def detect_name_col(conn, table: str) -> str:
 #     cur = conn.cursor()
 #     cur.execute(f"SELECT * FROM {table} LIMIT 1")
@@ -113,8 +89,9 @@ async def _read_df_async(session: AsyncSession, sql: str, params: list) -> pd.Da
 # -*- coding: utf-8 -*-
 # recommend.py — 검색 쿼리 + 추천 로직
 
-# ---------- SQL 템플릿 (REGEXP + 오른쪽 경계) ----------
-HS_SQL_TMPL = """
+# ---------- 상세 조회 SQL (후보 상품 ID → 상세) ----------
+# 후보 선정(REGEXP + 오른쪽 경계 + 금지어 + 순위)은 product_candidate_index 에서 미리 계산
+HS_DETAIL_SQL = text("""
 SELECT 
     hc.PRODUCT_ID as product_id,
     hc.PRODUCT_NAME as product_name,
@@ -130,19 +107,11 @@ FROM HOMESHOPPING_CLASSIFY hc
 LEFT JOIN FCT_HOMESHOPPING_PRODUCT_INFO hpi ON hc.PRODUCT_ID = hpi.PRODUCT_ID
 LEFT JOIN FCT_HOMESHOPPING_LIST hfl ON hc.PRODUCT_ID = hfl.PRODUCT_ID
 LEFT JOIN HOMESHOPPING_INFO hi ON hfl.HOMESHOPPING_ID = hi.HOMESHOPPING_ID
-WHERE hc.CLS_FOOD = 1
-  AND hc.CLS_ING  = 1
-  AND (
-        hc.PRODUCT_NAME REGEXP :pat
-        OR REPLACE(hc.PRODUCT_NAME, ' ', '') REGEXP :pat_ns
-      )
-ORDER BY
-  CASE WHEN LOCATE(:kw, hc.PRODUCT_NAME) > 0 THEN LOCATE(:kw, hc.PRODUCT_NAME) ELSE 99999 END,
-  CHAR_LENGTH(hc.PRODUCT_NAME) ASC
-LIMIT :limit_n
-"""
-
-KOK_SQL_TMPL = """
+WHERE hc.PRODUCT_ID IN :product_ids
+ORDER BY hfl.LIVE_ID DESC
+""").bindparams(bindparam("product_ids", expanding=True))
+
+KOK_DETAIL_SQL = text("""
 SELECT 
     kc.PRODUCT_ID as product_id,
     kc.PRODUCT_NAME as product_name,
@@ -156,45 +125,33 @@ SELECT
 FROM KOK_CLASSIFY kc
 LEFT JOIN FCT_KOK_PRODUCT_INFO kpi ON kc.PRODUCT_ID = kpi.KOK_PRODUCT_ID
 LEFT JOIN FCT_KOK_PRICE_INFO kpri ON kc.PRODUCT_ID = kpri.KOK_PRODUCT_ID
-WHERE kc.CLS_ING = 1
-  AND (
-        kc.PRODUCT_NAME REGEXP :pat
-        OR REPLACE(kc.PRODUCT_NAME, ' ', '') REGEXP :pat_ns
-      )
-ORDER BY
-  CASE WHEN LOCATE(:kw, kc.PRODUCT_NAME) > 0 THEN LOCATE(:kw, kc.PRODUCT_NAME) ELSE 99999 END,
-  CHAR_LENGTH(kc.PRODUCT_NAME) ASC
-LIMIT :limit_n
-"""
+WHERE kc.PRODUCT_ID IN :product_ids
+ORDER BY kpri.KOK_PRICE_ID DESC
+""").bindparams(bindparam("product_ids", expanding=True))
+
+async def _fetch_details(session: AsyncSession, sql, product_ids: list) -> list:
+    """후보 상품 ID 순서대로 상세 행(dict) 반환 (상품당 1행, 여러 방송/가격이면 최신 방송/가격)"""
+    if not product_ids:
+        return []
+    result = await session.execute(sql, {"product_ids": list(product_ids)})
+    by_id = {}
+    for row in result.mappings().all():
+        by_id.setdefault(row["product_id"], dict(row))
+    return [by_id[pid] for pid in product_ids if pid in by_id]
 
 # ---------- 검색 함수 ----------
-async def search_homeshopping(session: AsyncSession, ingredient: str, limit_n: int = 2) -> pd.DataFrame:
-    (pat, pat_ns), kw = build_regex_params(ingredient)
-    sql = HS_SQL_TMPL
-    params = {"pat": pat, "pat_ns": pat_ns, "kw": kw, "limit_n": limit_n * 3}  # 중복/필터 대비 여유
-    
-    df = await _read_df_async(session, sql, params)
-
-    if not df.empty:
-        # (선택) 맥락 필터 — 현재 스텁 False
-        df = df[~df['product_name'].astype(str).apply(lambda n: is_false_positive(n, ingredient))]
-        # 임시 금지어 필터
-        df = apply_exclude(df, 'product_name', ingredient)
-        df = df.head(limit_n)
-    return df
-
-async def search_kok(session: AsyncSession, ingredient: str, limit_n: int) -> pd.DataFrame:
-    (pat, pat_ns), kw = build_regex_params(ingredient)
-    sql = KOK_SQL_TMPL
-    params = {"pat": pat, "pat_ns": pat_ns, "kw": kw, "limit_n": limit_n * 3}
-    
-    df = await _read_df_async(session, sql, params)
-
-    if not df.empty:
-        df = df[~df['product_name'].astype(str).apply(lambda n: is_false_positive(n, ingredient))]
-        df = apply_exclude(df, 'product_name', ingredient)
-        df = df.head(limit_n)
-    return df
+async def search_homeshopping(session: AsyncSession, ingredient: str, limit_n: int = 2) -> list:
+    candidates = await get_product_candidates(session, ingredient, limit_n * 3)  # 중복/필터 대비 여유
+    rows = await _fetch_details(session, HS_DETAIL_SQL, candidates["homeshopping"])
+    # (선택) 맥락 필터 — 현재 스텁 False
+    rows = [r for r in rows if not is_false_positive(str(r["product_name"]), ingredient)]
+    return rows[:limit_n]
+
+async def search_kok(session: AsyncSession, ingredient: str, limit_n: int) -> list:
+    candidates = await get_product_candidates(session, ingredient, limit_n * 3)
+    rows = await _fetch_details(session, KOK_DETAIL_SQL, candidates["kok"])
+    rows = [r for r in rows if not is_false_positive(str(r["product_name"]), ingredient)]
+    return rows[:limit_n]
 
 # ---------- 추천 메인 ----------
 async def recommend_for_ingredient(session: AsyncSession, ingredient: str, max_total: int = 5, max_home: int = 2):
@@ -206,8 +163,8 @@ async def recommend_for_ingredient(session: AsyncSession, ingredient: str, max_t
 
     # 1) 홈쇼핑 먼저 (최대 2)
     hs = await search_homeshopping(session, ingredient, limit_n=max_home)
-    if not hs.empty:
-        for _, r in hs.iterrows():
+    if hs:
+        for r in hs:
             name = str(r.get('product_name', "")); key = norm_for_dedupe(name)
             if key in seen:
                 continue
@@ -229,8 +186,8 @@ async def recommend_for_ingredient(session: AsyncSession, ingredient: str, max_t
     need = max_total - len(recs)
     if need > 0:
         kok = await search_kok(session, ingredient, limit_n=need * 3)  # 여유로 뽑아 중복 제거
-        if not kok.empty:
-            for _, r in kok.iterrows():
+        if kok:
+            for r in kok:
                 if len(recs) >= max_total:
                     break
                 name = str(r.get('product_name', "")); key = norm_for_dedupe(name)
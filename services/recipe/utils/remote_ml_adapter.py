@@ -1,16 +1,31 @@
 """
 원격 ML 서비스 호출 어댑터
 백엔드에서 ML Inference 서비스와 통신하는 모듈입니다.
+
+- HTTP 클라이언트: 모듈 단위 풀링 클라이언트 1개를 재사용 (keep-alive, 연결 수 제한, h2 설치 시 HTTP/2)
+  · 게이트웨이 lifespan 에서 start_ml_client() 로 생성, 종료 시 close_ml_client() 로 정리
+  · lifespan 밖(스크립트/테스트)에서는 첫 호출 시 생성
+- 서킷 브레이커: 연속 실패가 ML_CIRCUIT_FAILURES 회에 도달하면 ML_CIRCUIT_RESET_SECONDS 동안
+  호출 없이 CircuitOpenError 로 즉시 실패 (호출측은 제목 검색 결과만으로 응답)
+- 메트릭: uhok_ml_request_duration_seconds{endpoint, result}, uhok_circuit_breaker_state{name}
+- 결과 캐시: find_similar_ids 는 ml_search_cache(프로세스 + Redis, 동시 요청 병합)를 거쳐 호출
+- 배치 검색: find_similar_ids_batch 는 여러 질의를 /api/v1/search/batch 1회로 요청
+  · 요청 {"queries": [...], "top_k": N, "exclude_ids": [...]}
+  · 응답 {"results": [{"query": q, "results": [{"recipe_id", "distance"}, ...]}, ...]} (요청 질의 순서)
 """
 
+import importlib.util
 import os
 import httpx
 import asyncio
 from typing import List, Tuple, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
+from .ml_search_cache import cached_similar_ids, cached_similar_ids_batch
 from .ports import VectorSearcherPort
+from common.circuit_breaker import CircuitBreaker, CircuitOpenError
 from common.logger import get_logger
 from common.config import get_settings
+from common.metrics import ml_request_duration_seconds, observe_stage
 import time
 
 logger = get_logger("remote_ml_adapter")
@@ -32,6 +47,76 @@ def _resolve_ml_inference_url() -> str:
 ML_INFERENCE_URL = _resolve_ml_inference_url()
 ML_TIMEOUT = float(os.getenv("ML_TIMEOUT", "10.0"))
 ML_RETRIES = int(os.getenv("ML_RETRIES", "2"))
+ML_HEALTH_TIMEOUT = 5.0
+
+# 커넥션 풀
+ML_MAX_CONNECTIONS = int(os.getenv("ML_MAX_CONNECTIONS", "20"))
+ML_MAX_KEEPALIVE = int(os.getenv("ML_MAX_KEEPALIVE", "10"))
+ML_KEEPALIVE_EXPIRY = float(os.getenv("ML_KEEPALIVE_EXPIRY", "30.0"))
+
+# 서킷 브레이커
+ML_CIRCUIT_FAILURES = int(os.getenv("ML_CIRCUIT_FAILURES", "5"))
+ML_CIRCUIT_RESET_SECONDS = float(os.getenv("ML_CIRCUIT_RESET_SECONDS", "30.0"))
+
+ml_circuit_breaker = CircuitBreaker(
+    "ml_inference",
+    failure_threshold=ML_CIRCUIT_FAILURES,
+    reset_timeout=ML_CIRCUIT_RESET_SECONDS,
+)
+
+_client: Optional["httpx.AsyncClient"] = None
+# ML 서비스가 /api/v1/search/batch 를 지원하지 않으면(404/405) 단건 호출로 전환
+_batch_supported = True
+
+
+def _http2_available() -> bool:
+    """httpx HTTP/2 지원에 필요한 h2 패키지 설치 여부"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_client() -> "httpx.AsyncClient":
+    return httpx.AsyncClient(
+        timeout=ML_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=ML_MAX_CONNECTIONS,
+            max_keepalive_connections=ML_MAX_KEEPALIVE,
+            keepalive_expiry=ML_KEEPALIVE_EXPIRY,
+        ),
+        http2=_http2_available(),
+    )
+
+
+def get_ml_client() -> "httpx.AsyncClient":
+    """풀링 HTTP 클라이언트 반환 (lifespan 밖에서 호출되면 이 시점에 생성)"""
+    global _client
+    if _client is None:
+        _client = _build_client()
+    return _client
+
+
+async def start_ml_client() -> None:
+    """게이트웨이 시작 시 풀링 HTTP 클라이언트 생성"""
+    get_ml_client()
+    logger.info(
+        f"ML 서비스 HTTP 클라이언트 생성: max_connections={ML_MAX_CONNECTIONS}, "
+        f"keepalive={ML_MAX_KEEPALIVE}, http2={_http2_available()}"
+    )
+
+
+async def close_ml_client() -> None:
+    """게이트웨이 종료 시 풀링 HTTP 클라이언트 정리"""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"ML 서비스 HTTP 클라이언트 정리 실패: {e}")
+
+
+def _observe_request(endpoint: str, result: str, started: float) -> None:
+    ml_request_duration_seconds.observe(time.perf_counter() - started, endpoint=endpoint, result=result)
+
 
 class RemoteMLAdapter(VectorSearcherPort):
     """
@@ -60,33 +145,106 @@ class RemoteMLAdapter(VectorSearcherPort):
         if not ML_INFERENCE_URL:
             raise RuntimeError("ML 서비스 URL이 설정되지 않았습니다. ML_INFERENCE_URL을 설정하세요.")
 
-        start_time = time.time()
-        url = f"{ML_INFERENCE_URL}/api/v1/search"
+        # 같은 질의는 캐시/진행 중 호출 결과를 재사용 (넓은 top_k 결과가 좁은 요청도 충족)
+        return await cached_similar_ids(query, top_k, exclude_ids, self._request_similar_ids)
+
+    async def find_similar_ids_batch(
+        self,
+        pg_db: AsyncSession,  # 포트 호환성을 위해 유지 (사용 안 함)
+        queries: List[str],
+        top_k: int,
+        exclude_ids: Optional[List[int]] = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        여러 질의를 /api/v1/search/batch 1회 호출로 검색합니다.
+        캐시에 있는 질의는 제외하고 미스 질의만 보냅니다.
+
+        Returns:
+            queries 순서대로 (recipe_id, distance) 튜플 리스트의 리스트
+        """
+        if not ML_INFERENCE_URL:
+            raise RuntimeError("ML 서비스 URL이 설정되지 않았습니다. ML_INFERENCE_URL을 설정하세요.")
+        if not queries:
+            return []
+
+        return await cached_similar_ids_batch(queries, top_k, exclude_ids, self._request_similar_ids_batch)
+
+    async def _request_similar_ids(
+        self,
+        query: str,
+        top_k: int,
+        exclude_ids: Optional[List[int]] = None,
+    ) -> List[Tuple[int, float]]:
+        """/api/v1/search 실제 호출"""
         payload = {
             "query": query,
             "top_k": top_k,
             "exclude_ids": exclude_ids or []
         }
-        logger.info(f"ML 서비스 검색 요청: URL={url}, query='{query}', top_k={top_k}")
+        data = await self._post_search("search", "/api/v1/search", payload, f"query='{query}', top_k={top_k}")
+        # 결과 형식 변환: List[Dict] -> List[Tuple[int, float]]
+        return _to_pairs(data.get("results", []))
+
+    async def _request_similar_ids_batch(
+        self,
+        queries: List[str],
+        top_k: int,
+        exclude_ids: Optional[List[int]] = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """/api/v1/search/batch 실제 호출 (배치 미지원 서비스면 단건 호출 병렬 실행)"""
+        global _batch_supported
+        if _batch_supported:
+            payload = {
+                "queries": queries,
+                "top_k": top_k,
+                "exclude_ids": exclude_ids or []
+            }
+            try:
+                data = await self._post_search(
+                    "search_batch", "/api/v1/search/batch", payload, f"queries={len(queries)}, top_k={top_k}"
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in (404, 405):
+                    raise
+                logger.warning("ML 서비스가 배치 검색을 지원하지 않아 단건 호출로 전환합니다.")
+                _batch_supported = False
+            else:
+                results = data.get("results", [])
+                if len(results) != len(queries):
+                    raise ValueError(f"ML 배치 검색 응답 수 불일치: 요청 {len(queries)}건, 응답 {len(results)}건")
+                return [_to_pairs(item.get("results", [])) for item in results]
+
+        return list(await asyncio.gather(*[
+            self._request_similar_ids(query, top_k, exclude_ids) for query in queries
+        ]))
+
+    async def _post_search(self, endpoint: str, path: str, payload: dict, context: str) -> dict:
+        """ML 검색 엔드포인트 POST (서킷 브레이커 + 타임아웃 재시도 + 지연 기록)"""
+        start_time = time.time()
+        started = time.perf_counter()
+        try:
+            ml_circuit_breaker.before_call()
+        except CircuitOpenError:
+            _observe_request(endpoint, "circuit_open", started)
+            raise
+
+        url = f"{ML_INFERENCE_URL}{path}"
+        logger.info(f"ML 서비스 검색 요청: URL={url}, {context}")
 
-        async with httpx.AsyncClient(timeout=ML_TIMEOUT) as client:
+        client = get_ml_client()
+        try:
             for attempt in range(ML_RETRIES + 1):
                 try:
                     response = await client.post(url, json=payload)
                     response.raise_for_status()
-                    
                     data = response.json()
-                    results = data.get("results", [])
-                    
-                    # 결과 형식 변환: List[Dict] -> List[Tuple[int, float]]
-                    formatted_results = [(item["recipe_id"], item["distance"]) for item in results]
-                    
+
                     total_time = time.time() - start_time
-                    logger.info(
-                        f"ML 서비스 검색 성공: query='{query}', top_k={top_k}, "
-                        f"총 {total_time:.3f}s 소요, 결과 {len(formatted_results)}건 수신"
-                    )
-                    return formatted_results
+                    ml_circuit_breaker.record_success()
+                    _observe_request(endpoint, "ok", started)
+                    observe_stage(f"ml_{endpoint}", total_time)
+                    logger.info(f"ML 서비스 검색 성공: {context}, 총 {total_time:.3f}s 소요")
+                    return data
 
                 except httpx.TimeoutException:
                     if attempt < ML_RETRIES:
@@ -94,25 +252,44 @@ class RemoteMLAdapter(VectorSearcherPort):
                         await asyncio.sleep(0.5 * (attempt + 1))
                     else:
                         logger.error("ML 서비스 타임아웃, 최대 재시도 횟수 초과")
+                        ml_circuit_breaker.record_failure()
+                        _observe_request(endpoint, "timeout", started)
                         raise
-                
+
                 except httpx.HTTPStatusError as e:
                     total_time = time.time() - start_time
                     logger.error(
                         f"ML 서비스 HTTP 에러: status={e.response.status_code}, "
                         f"response='{e.response.text}', 총 {total_time:.3f}s 소요"
                     )
+                    # 4xx 는 요청 문제이므로 서비스 장애로 집계하지 않음
+                    if e.response.status_code >= 500:
+                        ml_circuit_breaker.record_failure()
+                    else:
+                        ml_circuit_breaker.record_success()
+                    _observe_request(endpoint, "http_error", started)
                     raise
 
                 except Exception as e:
                     total_time = time.time() - start_time
                     logger.error(f"ML 서비스 호출 실패: 총 {total_time:.3f}s, error='{str(e)}'")
+                    ml_circuit_breaker.record_failure()
+                    _observe_request(endpoint, "error", started)
                     raise
-        
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료/상위 타임아웃으로 취소: 결과가 없으므로 시험 호출 슬롯만 반납
+            ml_circuit_breaker.release_trial()
+            _observe_request(endpoint, "cancelled", started)
+            raise
+
         # 모든 재시도 실패 시
         raise Exception("ML 서비스 호출에 최종적으로 실패했습니다.")
 
 
+def _to_pairs(results: List[Dict[str, Any]]) -> List[Tuple[int, float]]:
+    return [(item["recipe_id"], item["distance"]) for item in results]
+
+
 class MLServiceHealthChecker:
     """ML 서비스 상태 확인 클래스"""
     
@@ -130,15 +307,20 @@ class MLServiceHealthChecker:
                 "error": "ML 서비스 URL이 설정되지 않았습니다. ML_INFERENCE_URL을 설정하세요.",
             }
 
+        started = time.perf_counter()
         try:
             url = f"{ML_INFERENCE_URL}/health"
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
+            response = await get_ml_client().get(url, timeout=ML_HEALTH_TIMEOUT)
+            response.raise_for_status()
+            _observe_request("health", "ok", started)
+            status = response.json()
+            if isinstance(status, dict):
+                status["circuit"] = ml_circuit_breaker.state
+            return status
         except Exception as e:
+            _observe_request("health", "error", started)
             logger.error(f"ML 서비스 헬스체크 실패: {str(e)}")
-            return {"status": "error", "error": str(e)}
+            return {"status": "error", "error": str(e), "circuit": ml_circuit_breaker.state}
 
 # 팩토리 함수
 async def get_remote_ml_searcher() -> VectorSearcherPort:
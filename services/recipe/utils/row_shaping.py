@@ -0,0 +1,80 @@
+# services/recipe/utils/row_shaping.py
+"""
+레시피 검색/추천 결과 행 정리 유틸리티 (pandas 미사용)
+
+페이지 크기 5~20 건의 결과를 DataFrame 으로 만들어 정렬/병합 후 다시 dict 로 바꾸던 처리를
+dict 레코드 목록 위에서 바로 수행합니다. 결과 형식은 기존 `DataFrame.to_dict("records")` 와 같은
+대문자 컬럼 키 dict 목록입니다.
+
+- rows_to_records: SQLAlchemy Row → dict (라벨 컬럼명 유지)
+- order_by_ids: 기준 ID 순서로 재정렬 (기준에 없는 행은 원래 순서대로 뒤에)
+- number_records: 1부터 "No." 부여
+- group_materials / attach_materials: 레시피별 재료 묶음("MATERIALS") 부착
+- fold_material_rows: 상세 + 재료 LEFT JOIN 행 → 레시피당 1건 + "MATERIALS"
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+Record = Dict[str, Any]
+
+MATERIAL_FIELDS = ("MATERIAL_NAME", "MEASURE_AMOUNT", "MEASURE_UNIT")
+
+
+def rows_to_records(rows: Iterable[Any]) -> List[Record]:
+    """SQLAlchemy Row(라벨 select 결과) 목록을 dict 목록으로 변환"""
+    return [dict(row._mapping) for row in rows]
+
+
+def order_by_ids(records: List[Record], ids: Sequence[int], key: str = "RECIPE_ID") -> List[Record]:
+    """ids 순서대로 재정렬 (ids 에 없는 레코드는 뒤에 원래 순서 유지)"""
+    order = {rid: i for i, rid in enumerate(ids)}
+    missing = len(order)
+    return sorted(records, key=lambda r: order.get(r.get(key), missing))
+
+
+def number_records(records: List[Record], column: str = "No.") -> List[Record]:
+    """레코드 맨 앞에 1부터 순번 컬럼 추가"""
+    return [{column: i, **record} for i, record in enumerate(records, start=1)]
+
+
+def group_materials(material_rows: Iterable[Sequence[Any]]) -> Dict[int, List[Record]]:
+    """(recipe_id, material_name, measure_amount, measure_unit) 행 → 레시피별 재료 목록"""
+    grouped: Dict[int, List[Record]] = {}
+    for recipe_id, *values in material_rows:
+        grouped.setdefault(recipe_id, []).append(dict(zip(MATERIAL_FIELDS, values)))
+    return grouped
+
+
+def attach_materials(
+    records: List[Record],
+    grouped: Dict[int, List[Record]],
+    key: str = "RECIPE_ID",
+) -> List[Record]:
+    """레코드에 "MATERIALS" 부착 (재료가 없으면 None)"""
+    for record in records:
+        record["MATERIALS"] = grouped.get(record.get(key))
+    return records
+
+
+def fold_material_rows(rows: Iterable[Any], key: str = "RECIPE_ID") -> List[Record]:
+    """
+    상세 컬럼 + MATERIAL_FIELDS 라벨의 LEFT JOIN 행을 레시피당 1건으로 접고 "MATERIALS" 부착
+    (재료가 없는 레시피는 None, 레시피는 처음 나온 순서 유지)
+    """
+    folded: Dict[Any, Record] = {}
+    for row in rows:
+        mapping = dict(row._mapping)
+        material = {field: mapping.pop(field, None) for field in MATERIAL_FIELDS}
+        record = folded.get(mapping[key])
+        if record is None:
+            record = folded[mapping[key]] = {**mapping, "MATERIALS": None}
+        if material["MATERIAL_NAME"] is not None:
+            if record["MATERIALS"] is None:
+                record["MATERIALS"] = []
+            record["MATERIALS"].append(material)
+    return list(folded.values())
+
+
+def dedupe_ids(ids: Iterable[Optional[int]]) -> List[int]:
+    """순서를 유지하며 중복/None 제거"""
+    return [int(rid) for rid in dict.fromkeys(ids) if rid is not None]
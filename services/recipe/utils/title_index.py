@@ -0,0 +1,182 @@
+# services/recipe/utils/title_index.py
+"""
+레시피명 n-gram 역색인 (레시피명 검색의 제목 일치 단계)
+
+레시피 검색마다 FCT_RECIPE 전체를 `COOKING_NAME LIKE '%검색어%' ORDER BY SCRAP_COUNT DESC` 로
+훑던 것을 프로세스 메모리 역색인 조회로 바꿉니다. (MariaDB 는 ngram FULLTEXT 파서가 없어 메모리 색인 사용)
+
+- 대상: 기존 SQL 과 같은 COOKING_NAME (casefold — 기본 콜레이션의 LIKE 처럼 대소문자 무시)
+- 포스팅: 1-gram/2-gram → 레시피 ID 목록, 스크랩 수 내림차순(NULL 은 마지막) → 레시피 ID 순으로 미리 정렬
+- 조회: 검색어의 n-gram 중 포스팅이 가장 짧은 것을 앞에서부터 훑으며 부분 문자열 검증,
+  limit 개를 채우면 중단 (기존 LIKE + ORDER BY SCRAP_COUNT DESC + LIMIT 과 같은 결과)
+- 적재: 게이트웨이 lifespan 에서 start_title_index() 로 백그라운드 적재 + 주기 갱신
+  · TITLE_INDEX_CHECK_SECONDS 간격으로 RECIPE_ID > 마지막 ID 인 신규 레시피만 증분 반영
+  · TITLE_INDEX_MAX_AGE_SECONDS 가 지나면 전체 재적재 (스크랩 수 변화/수정 반영)
+  · 인덱스가 준비되지 않았으면 None → 호출측이 기존 SQL 로 폴백
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.logger import get_logger
+from common.periodic_refresh import PeriodicRefresher
+
+logger = get_logger("title_index")
+
+TITLE_INDEX_CHECK_SECONDS = 300
+TITLE_INDEX_MAX_AGE_SECONDS = 3600
+
+_TITLE_SQL = """
+    SELECT r.RECIPE_ID AS recipe_id, r.COOKING_NAME AS cooking_name, r.SCRAP_COUNT AS scrap_count
+    FROM FCT_RECIPE r
+    WHERE r.COOKING_NAME IS NOT NULL {after}
+"""
+
+# 전체 레시피 포스팅 키 (빈 검색어 = 기존 LIKE '%%')
+_ALL = ""
+
+SortKey = Tuple[int, int, int]
+
+
+def _grams(value: str) -> Set[str]:
+    """1-gram + 2-gram"""
+    return set(value) | {value[i:i + 2] for i in range(len(value) - 1)}
+
+
+def _sort_key(recipe_id: int, scrap_count: Optional[int]) -> SortKey:
+    # SCRAP_COUNT DESC 에서 NULL 은 마지막
+    return (1 if scrap_count is None else 0, -(scrap_count or 0), recipe_id)
+
+
+class RecipeTitleIndex:
+    """COOKING_NAME n-gram → 스크랩 수 순 레시피 ID (프로세스 메모리)"""
+
+    def __init__(self):
+        self._names: Dict[int, str] = {}
+        self._keys: Dict[int, SortKey] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._max_recipe_id = 0
+        self._loaded_at = 0.0
+        self._ready = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def clear(self) -> None:
+        self._names = {}
+        self._keys = {}
+        self._postings = {}
+        self._max_recipe_id = 0
+        self._loaded_at = 0.0
+        self._ready = False
+
+    async def _fetch(self, session: AsyncSession, after_id: Optional[int] = None):
+        after = "AND r.RECIPE_ID > :after_id" if after_id is not None else ""
+        params = {"after_id": after_id} if after_id is not None else {}
+        result = await session.execute(text(_TITLE_SQL.format(after=after)), params)
+        return result.fetchall()
+
+    async def _reload(self, session: AsyncSession) -> None:
+        rows = await self._fetch(session)
+        names: Dict[int, str] = {}
+        keys: Dict[int, SortKey] = {}
+        for row in rows:
+            rid = int(row.recipe_id)
+            names[rid] = (row.cooking_name or "").casefold()
+            keys[rid] = _sort_key(rid, row.scrap_count)
+
+        # 정렬 순서대로 추가하면 포스팅은 이미 정렬된 상태
+        postings: Dict[str, List[int]] = {_ALL: []}
+        for rid in sorted(names, key=keys.__getitem__):
+            postings[_ALL].append(rid)
+            for gram in _grams(names[rid]):
+                postings.setdefault(gram, []).append(rid)
+
+        self._names, self._keys, self._postings = names, keys, postings
+        self._max_recipe_id = max(names, default=0)
+        self._loaded_at = time.monotonic()
+        self._ready = True
+        logger.info(f"레시피명 색인 적재: 레시피 수={len(names)}, n-gram 수={len(postings) - 1}")
+
+    async def _append_new_rows(self, session: AsyncSession) -> None:
+        rows = await self._fetch(session, after_id=self._max_recipe_id)
+        for row in rows:
+            rid = int(row.recipe_id)
+            if rid in self._names:
+                continue
+            self._names[rid] = (row.cooking_name or "").casefold()
+            self._keys[rid] = _sort_key(rid, row.scrap_count)
+            for gram in _grams(self._names[rid]) | {_ALL}:
+                bisect.insort(self._postings.setdefault(gram, []), rid, key=self._keys.__getitem__)
+            self._max_recipe_id = max(self._max_recipe_id, rid)
+        if rows:
+            logger.info(f"레시피명 색인 증분 반영: 추가={len(rows)}")
+
+    async def refresh(self, session: AsyncSession, force: bool = False) -> None:
+        """만료되었으면 전체 재적재, 아니면 신규 레시피만 반영"""
+        async with self._lock:
+            if force or not self._ready or time.monotonic() - self._loaded_at >= TITLE_INDEX_MAX_AGE_SECONDS:
+                await self._reload(session)
+            else:
+                await self._append_new_rows(session)
+
+    def search(self, query: str, limit: int) -> Optional[List[int]]:
+        """
+        레시피명에 검색어가 포함된 레시피 ID (스크랩 수 내림차순, 최대 limit 개)
+
+        Returns:
+            레시피 ID 목록 — 인덱스가 준비되지 않았으면 None
+        """
+        if not self._ready:
+            return None
+        folded = (query or "").casefold()
+        grams = _grams(folded) or {_ALL}
+        postings = [self._postings.get(gram) for gram in grams]
+        if any(posting is None for posting in postings):
+            return []
+
+        matched: List[int] = []
+        for rid in min(postings, key=len):
+            if folded in self._names[rid]:
+                matched.append(rid)
+                if len(matched) >= limit:
+                    break
+        return matched
+
+
+_index = RecipeTitleIndex()
+_refresher = PeriodicRefresher("title_index", _index.refresh, TITLE_INDEX_CHECK_SECONDS)
+
+
+def search_recipe_titles(query: str, limit: int) -> Optional[List[int]]:
+    """레시피명 포함 검색 상위 limit 개 (인덱스 미준비 시 None → SQL 폴백)"""
+    return _index.search(query, limit)
+
+
+async def refresh_title_index(session: AsyncSession, force: bool = False) -> None:
+    """색인 갱신 (주기 태스크/배치/테스트용)"""
+    await _index.refresh(session, force=force)
+
+
+def start_title_index(session_factory: Optional[Callable[[], AsyncSession]] = None) -> None:
+    """백그라운드 적재 + 주기 갱신 태스크 시작 (게이트웨이 lifespan 에서 호출)"""
+    _refresher.start(session_factory)
+
+
+async def stop_title_index() -> None:
+    """주기 갱신 태스크 정리 (게이트웨이 종료 시)"""
+    await _refresher.stop()
+
+
+def clear_title_index() -> None:
+    """색인 초기화 (테스트용)"""
+    _index.clear()
@@ -1,15 +1,21 @@
 """User password hashing and verification helpers."""
 
-from passlib.context import CryptContext
+from functools import lru_cache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=1)
+def _get_pwd_context():
+    """bcrypt CryptContext를 최초 사용 시점에 생성 (passlib 지연 로드)."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def hash_password(plain_pw: str) -> str:
     """Hash plain text password with bcrypt."""
-    return pwd_context.hash(plain_pw)
+    return _get_pwd_context().hash(plain_pw)
 
 
 def verify_password(plain_pw, hashed_pw):
     """입력받은 평문 비밀번호와 해시된 비밀번호가 일치하는지 검증."""
-    return pwd_context.verify(plain_pw, hashed_pw)
+    return _get_pwd_context().verify(plain_pw, hashed_pw)
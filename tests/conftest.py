@@ -8,11 +8,16 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # ── 실제 DB 연결 없이 import 가능하도록 common.* stub 등록 ──────────────────
 import types
 
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
 def _stub(name, **attrs):
     if name in sys.modules:
         return sys.modules[name]
     mod = types.ModuleType(name)
-    mod.__path__ = []
+    # 실제 패키지 경로를 유지해 stub 되지 않은 하위 모듈(common.metrics 등)은 그대로 import 가능
+    real_path = os.path.join(_ROOT, *name.split("."))
+    mod.__path__ = [real_path] if os.path.isdir(real_path) else []
     mod.__package__ = name
     for k, v in attrs.items():
         setattr(mod, k, v)
@@ -58,3 +63,64 @@ _fake_client.post = AsyncMock(return_value=_fake_resp)
 _fake_httpx.AsyncClient.return_value = _fake_client
 _fake_httpx.RequestError = Exception
 sys.modules["httpx"] = _fake_httpx
+
+
+# ── SQL 쿼리 예산 (N+1 탐지) ────────────────────────────────────────────────
+# @pytest.mark.query_budget(3) 이 붙은 테스트는 실행 중 SQL이 3건을 넘거나
+# 같은 모양의 쿼리가 repeat_threshold(기본 5) 회 이상 반복되면 실패한다.
+# 마커가 없는 테스트에는 영향이 없다(기록 훅은 ContextVar 조회만 수행).
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(limit, repeat_threshold=5): 테스트 실행 중 SQL 실행 횟수 예산 (초과/N+1 반복 시 실패)",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _query_budget_guard(request):
+    """마커가 있으면 테스트용 기록기를 만든다 (활성화는 테스트 본문 실행 중에만)"""
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        return None
+
+    from common.query_recorder import QueryRecorder
+
+    limit = marker.args[0] if marker.args else marker.kwargs["limit"]
+    recorder = QueryRecorder(
+        budget=limit,
+        mode="raise",
+        repeat_threshold=marker.kwargs.get("repeat_threshold", 5),
+        label=request.node.nodeid,
+    )
+    request.node._query_recorder = recorder
+    return recorder
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    recorder = getattr(item, "_query_recorder", None)
+    if recorder is None:
+        yield
+        return
+
+    from common.query_recorder import QueryBudgetExceeded, use_recorder
+
+    # fixture 준비/정리 쿼리는 제외하고 테스트 본문만 기록
+    with use_recorder(recorder):
+        outcome = yield
+    if outcome.excinfo is None:
+        repeated = recorder.repeated_shapes()
+        if repeated:
+            shapes = "; ".join(f"{n}x {shape[:120]}" for shape, n in repeated.items())
+            outcome.force_exception(QueryBudgetExceeded(f"{item.nodeid}: N+1 의심 쿼리 반복 — {shapes}"))
+
+
+@pytest.fixture
+def query_recorder(_query_budget_guard):
+    """현재 테스트의 SQL 기록기 (query_budget 마커가 있을 때만 사용 가능)"""
+    if _query_budget_guard is None:
+        pytest.skip("query_budget 마커가 없는 테스트")
+    return _query_budget_guard
@@ -1,10 +1,12 @@
 """
 수정된 ACID 로직 단위 테스트
-1. toggle_kok_likes          — with_for_update() 적용
-2. toggle_homeshopping_likes — with_for_update() 적용
-3. create_orders_from_selected_carts — with_for_update() + SERIALIZABLE 적용
-4. apply_payment_webhook_v2  — SERIALIZABLE 적용
+1. toggle_kok_likes          — 유니크 키 + 단일 INSERT/DELETE
+2. toggle_homeshopping_likes — 유니크 키 + 단일 INSERT/DELETE
+3. create_orders_from_selected_carts — 장바구니 행 with_for_update() + READ COMMITTED 적용
+4. apply_payment_webhook_v2  — 주문 행 FOR UPDATE 적용 (SERIALIZABLE 제거)
 5. _expire_stale_payment_requested  — 웹훅 미수신으로 멈춘 주문 자동 취소
+6. run_with_lock_retry       — 데드락/상태 버전 충돌 시 롤백 후 제한 횟수 재시도
+7. 동시 주문 벤치마크        — N건 병렬 주문의 처리량 (행 잠금 vs 테이블 범위 잠금)
 """
 
 from datetime import datetime
@@ -43,97 +45,84 @@ def _select_chain():
 
 
 # ─────────────────────────────────────────────────────────────
-# 1 · toggle_kok_likes — with_for_update()
+# 1 · toggle_kok_likes — 유니크 키 + 단일 INSERT/DELETE
 # ─────────────────────────────────────────────────────────────
 
 import services.kok.crud.likes_crud as kok_likes_mod
 
 
-class _FakeKokLike:
-    pass
-
-
 @pytest.mark.asyncio
-async def test_toggle_kok_likes_for_update_existing():
-    """찜이 있을 때 SELECT FOR UPDATE → 해제 → False 반환."""
-    existing = _FakeKokLike()
+async def test_toggle_kok_likes_existing_deletes():
+    """이미 찜한 상태(INSERT 무시됨) → DELETE 1회 → False 반환."""
     db = make_db()
-    db.execute.return_value.scalar_one_or_none.return_value = existing
 
-    chain = _select_chain()
-    with patch.object(kok_likes_mod, "select", return_value=chain):
+    with patch.object(kok_likes_mod, "insert_if_absent", new=AsyncMock(return_value=None)) as insert:
         result = await kok_likes_mod.toggle_kok_likes(db, user_id=1, kok_product_id=10)
 
-    chain.with_for_update.assert_called_once()
+    insert.assert_awaited_once()
     assert result is False
-    db.delete.assert_called_once_with(existing)
+    db.execute.assert_awaited_once()
+    assert str(db.execute.await_args.args[0]).startswith('DELETE FROM "KOK_LIKES"')
+    db.delete.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_toggle_kok_likes_for_update_new():
-    """찜이 없을 때 SELECT FOR UPDATE → 등록 → True 반환."""
+async def test_toggle_kok_likes_new_inserts_once():
+    """찜이 없을 때 INSERT 1회로 등록 → True 반환 (조회/삭제 없음)."""
     db = make_db()
-    db.execute.return_value.scalar_one_or_none.return_value = None
 
-    chain = _select_chain()
-    with patch.object(kok_likes_mod, "select", return_value=chain):
+    with patch.object(kok_likes_mod, "insert_if_absent", new=AsyncMock(return_value=123)) as insert:
         result = await kok_likes_mod.toggle_kok_likes(db, user_id=1, kok_product_id=10)
 
-    chain.with_for_update.assert_called_once()
+    insert.assert_awaited_once()
     assert result is True
-    db.add.assert_called_once()
+    db.execute.assert_not_awaited()
+    db.add.assert_not_called()
 
 
 # ─────────────────────────────────────────────────────────────
-# 2 · toggle_homeshopping_likes — with_for_update()
+# 2 · toggle_homeshopping_likes — 유니크 키 + 단일 INSERT/DELETE
 # ─────────────────────────────────────────────────────────────
 
 import services.homeshopping.crud.likes_crud as hs_likes_mod
 
 
-class _FakeHsLike:
-    homeshopping_like_id = 99
-
-
 @pytest.mark.asyncio
-async def test_toggle_homeshopping_likes_for_update_existing():
-    """홈쇼핑 찜 해제 경로에서 with_for_update() 호출."""
-    existing = _FakeHsLike()
+async def test_toggle_homeshopping_likes_existing_deletes():
+    """홈쇼핑 찜 해제: DELETE 1회 (방송 알림은 FK CASCADE), 알림 생성 없음."""
     db = make_db()
-    db.execute.return_value.scalar_one_or_none.return_value = existing
 
-    chain = _select_chain()
     with (
-        patch.object(hs_likes_mod, "select", return_value=chain),
-        patch.object(hs_likes_mod, "delete_broadcast_notification", new_callable=AsyncMock),
+        patch.object(hs_likes_mod, "insert_if_absent", new=AsyncMock(return_value=None)),
+        patch.object(hs_likes_mod, "create_broadcast_notification", new_callable=AsyncMock) as notify,
     ):
         result = await hs_likes_mod.toggle_homeshopping_likes(db, user_id=1, homeshopping_live_id=5)
 
-    chain.with_for_update.assert_called_once()
     assert result is False
-    db.delete.assert_called_once_with(existing)
+    db.execute.assert_awaited_once()
+    assert str(db.execute.await_args.args[0]).startswith('DELETE FROM "HOMESHOPPING_LIKES"')
+    notify.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_toggle_homeshopping_likes_for_update_new():
-    """홈쇼핑 찜 등록 경로에서 with_for_update() 호출."""
-    db = make_db()
-    db.execute.return_value.scalar_one_or_none.return_value = None
+async def test_toggle_homeshopping_likes_new_creates_notification():
+    """홈쇼핑 찜 등록: 새 찜 ID 로 방송 시작 알림 생성."""
+    live = MagicMock(live_date=datetime(2025, 1, 1).date(), live_start_time=datetime(2025, 1, 1, 10).time(), product_name="상품")
+    db = make_db(scalar_return=live)
 
-    chain = _select_chain()
     with (
-        patch.object(hs_likes_mod, "select", return_value=chain),
-        patch.object(hs_likes_mod, "create_broadcast_notification", new_callable=AsyncMock),
+        patch.object(hs_likes_mod, "insert_if_absent", new=AsyncMock(return_value=77)),
+        patch.object(hs_likes_mod, "create_broadcast_notification", new_callable=AsyncMock) as notify,
     ):
         result = await hs_likes_mod.toggle_homeshopping_likes(db, user_id=1, homeshopping_live_id=5)
 
-    chain.with_for_update.assert_called_once()
     assert result is True
-    db.add.assert_called_once()
+    notify.assert_awaited_once()
+    assert notify.await_args.kwargs["homeshopping_like_id"] == 77
 
 
 # ─────────────────────────────────────────────────────────────
-# 3 · create_orders_from_selected_carts — FOR UPDATE + SERIALIZABLE
+# 3 · create_orders_from_selected_carts — FOR UPDATE + READ COMMITTED
 # ─────────────────────────────────────────────────────────────
 
 import services.order.crud.kok.kok_order_create_crud as order_create_mod
@@ -148,10 +137,10 @@ async def test_create_orders_raises_on_empty_items():
 
 
 @pytest.mark.asyncio
-async def test_create_orders_uses_for_update_and_serializable():
+async def test_create_orders_uses_for_update_and_read_committed():
     """
-    - KokCart 조회 시 with_for_update() 체인 호출
-    - db.execute에 SERIALIZABLE SET이 포함된 호출이 있어야 함
+    - KokCart 조회 시 with_for_update(of=KokCart) 체인 호출 (상품 행은 잠그지 않음)
+    - db.execute에 READ COMMITTED SET이 포함된 호출이 있어야 함 (SERIALIZABLE 미사용)
     """
     fake_order = MagicMock()
     fake_order.order_id = 1
@@ -183,13 +172,14 @@ async def test_create_orders_uses_for_update_and_serializable():
                 db, user_id=1, selected_items=[{"kok_cart_id": 1, "quantity": 2}]
             )
 
-    assert any("SERIALIZABLE" in c for c in execute_calls), \
-        f"SERIALIZABLE 미호출. execute_calls={execute_calls}"
-    chain.with_for_update.assert_called_once()
+    assert any("READ COMMITTED" in c for c in execute_calls), \
+        f"READ COMMITTED 미호출. execute_calls={execute_calls}"
+    assert not any("SERIALIZABLE" in c for c in execute_calls)
+    chain.with_for_update.assert_called_once_with(of=order_create_mod.KokCart)
 
 
 # ─────────────────────────────────────────────────────────────
-# 4 · apply_payment_webhook_v2 — SERIALIZABLE
+# 4 · apply_payment_webhook_v2 — 주문 행 FOR UPDATE
 # ─────────────────────────────────────────────────────────────
 
 import services.order.crud.payment_v2_crud as payment_v2_mod
@@ -211,8 +201,8 @@ def _patch_payment_v2(mod):
 
 
 @pytest.mark.asyncio
-async def test_webhook_completed_sets_serializable():
-    """payment.completed 웹훅에서 SERIALIZABLE이 db.execute에 전달된다."""
+async def test_webhook_completed_locks_order_row():
+    """payment.completed 웹훅은 주문 행을 FOR UPDATE로 잠그고 SERIALIZABLE은 쓰지 않는다."""
     import json
 
     _patch_payment_v2(payment_v2_mod)
@@ -243,13 +233,14 @@ async def test_webhook_completed_sets_serializable():
         )
 
     assert result.get("ok") is True
-    assert any("SERIALIZABLE" in c for c in execute_calls), \
-        f"SERIALIZABLE 미호출. calls={execute_calls}"
+    assert any("ORDERS" in c and "FOR UPDATE" in c for c in execute_calls), \
+        f"주문 행 잠금 미호출. calls={execute_calls}"
+    assert not any("SERIALIZABLE" in c for c in execute_calls)
 
 
 @pytest.mark.asyncio
-async def test_webhook_failed_sets_serializable():
-    """payment.failed 웹훅에서도 SERIALIZABLE이 db.execute에 전달된다."""
+async def test_webhook_failed_cancels_without_serializable():
+    """payment.failed 웹훅은 cancel_order(주문 행 FOR UPDATE)로 취소하고 SERIALIZABLE은 쓰지 않는다."""
     import json
 
     _patch_payment_v2(payment_v2_mod)
@@ -267,7 +258,7 @@ async def test_webhook_failed_sets_serializable():
         "order_id": 42, "payment_id": "pay_1", "failure_reason": "insufficient_funds"
     }).encode()
 
-    with patch.object(payment_v2_mod, "cancel_order", new_callable=AsyncMock):
+    with patch.object(payment_v2_mod, "cancel_order", new_callable=AsyncMock) as mock_cancel:
         result = await payment_v2_mod.apply_payment_webhook_v2(
             db=db,
             tx_id="tx_42_abc",
@@ -278,8 +269,31 @@ async def test_webhook_failed_sets_serializable():
         )
 
     assert result.get("ok") is True
-    assert any("SERIALIZABLE" in c for c in execute_calls), \
-        f"SERIALIZABLE 미호출. calls={execute_calls}"
+    mock_cancel.assert_awaited_once()
+    assert mock_cancel.await_args.args[1:] == (42, "insufficient_funds")
+    assert not any("SERIALIZABLE" in c for c in execute_calls)
+
+
+@pytest.mark.asyncio
+async def test_cancel_order_locks_order_row():
+    """cancel_order는 주문 행을 FOR UPDATE로 조회한다 (결제 확인/웹훅과 직렬화)."""
+    import services.order.crud.common.order_cancel_management_crud as cancel_mod
+
+    execute_calls = []
+    db = AsyncMock(spec=AsyncSession)
+
+    async def fake_execute(stmt, *a, **kw):
+        execute_calls.append(str(stmt))
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = None
+        return result
+
+    db.execute.side_effect = fake_execute
+
+    with pytest.raises(ValueError, match="주문을 찾을 수 없습니다"):
+        await cancel_mod.cancel_order(db, 42, "결제 실패")
+
+    assert "FOR UPDATE" in execute_calls[0]
 
 
 # ─────────────────────────────────────────────────────────────
@@ -352,3 +366,208 @@ async def test_expire_stale_payment_requested_keeps_recent_request():
 
     assert expired is False
     mock_cancel.assert_not_awaited()
+
+
+# ─────────────────────────────────────────────────────────────
+# 6 · run_with_lock_retry — 데드락/상태 버전 충돌 재시도
+# ─────────────────────────────────────────────────────────────
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from services.order.crud import order_common
+
+
+def _db_error(error_cls, code, message):
+    return error_cls("INSERT ...", {}, Exception(code, message))
+
+
+@pytest.mark.asyncio
+async def test_lock_retry_rolls_back_and_retries_deadlock(monkeypatch):
+    """데드락(1213)/상태 버전 충돌은 롤백 후 재실행, 그 외 오류는 즉시 전파."""
+    monkeypatch.setattr(order_common, "LOCK_RETRY_BACKOFF_SECONDS", 0)
+    db = make_db()
+    errors = [
+        _db_error(OperationalError, 1213, "Deadlock found when trying to get lock"),
+        _db_error(IntegrityError, 1062, "Duplicate entry '7-3' for key 'UQ_KOK_ORDER_STATUS_VERSION'"),
+    ]
+
+    async def work():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    assert await order_common.run_with_lock_retry(db, work, label="test") == "ok"
+    assert db.rollback.await_count == 2
+
+    db = make_db()
+
+    async def duplicate_key():
+        raise _db_error(IntegrityError, 1062, "Duplicate entry '1' for key 'PRIMARY'")
+
+    with pytest.raises(IntegrityError):
+        await order_common.run_with_lock_retry(db, duplicate_key, label="test")
+    db.rollback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_lock_retry_is_bounded(monkeypatch):
+    """재시도는 LOCK_RETRY_MAX_ATTEMPTS 회까지만, 마지막 오류를 그대로 전파."""
+    monkeypatch.setattr(order_common, "LOCK_RETRY_BACKOFF_SECONDS", 0)
+    db = make_db()
+    attempts = []
+
+    async def always_deadlock():
+        attempts.append(1)
+        raise _db_error(OperationalError, 1213, "Deadlock found when trying to get lock")
+
+    with pytest.raises(OperationalError):
+        await order_common.run_with_lock_retry(db, always_deadlock, label="test")
+    assert len(attempts) == order_common.LOCK_RETRY_MAX_ATTEMPTS
+
+
+# ─────────────────────────────────────────────────────────────
+# 7 · 동시 주문 벤치마크 — N건 병렬 주문 처리량
+# ─────────────────────────────────────────────────────────────
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+
+from services.kok.models.interaction_model import KokCart
+from services.kok.models.product_model import KokProductInfo
+
+PARALLEL_CHECKOUTS = 20
+STATEMENT_LATENCY = 0.002  # 구문당 DB 왕복 시간 대역
+
+
+class _LockTable:
+    """
+    InnoDB 잠금 대역: FOR UPDATE 구문이 잠금 키를 잡고 commit/rollback 까지 유지
+    - row 모드: 사용자별 장바구니 행 키 (행 잠금)
+    - range 모드: 모든 주문이 같은 키 (SERIALIZABLE 의 범위/공유 잠금 경합 모델)
+    """
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.locks = defaultdict(asyncio.Lock)
+        self.active = 0
+        self.peak = 0
+
+    def key(self, user_id):
+        return ("KOK_CART", user_id) if self.mode == "row" else ("KOK_CART", "*")
+
+
+def _checkout_db(lock_table, user_id, carts):
+    """한 사용자의 주문 트랜잭션 세션 대역 (장바구니는 커밋 시 삭제)"""
+    db = AsyncMock(spec=AsyncSession)
+    held = []
+
+    async def fake_execute(stmt, *a, **kw):
+        await asyncio.sleep(STATEMENT_LATENCY)
+        sql = str(stmt)
+        result = MagicMock()
+        if "FOR UPDATE" in sql:
+            lock = lock_table.locks[lock_table.key(user_id)]
+            await lock.acquire()
+            held.append(lock)
+            lock_table.active += 1
+            lock_table.peak = max(lock_table.peak, lock_table.active)
+            cart = carts.get(user_id)
+            result.all.return_value = [(cart, KokProductInfo(kok_product_id=1, kok_product_name="상품"))] if cart else []
+        return result
+
+    async def release():
+        if user_id in carts and any(held):
+            carts.pop(user_id, None)
+        while held:
+            lock_table.active -= 1
+            held.pop().release()
+
+    async def rollback():
+        while held:
+            lock_table.active -= 1
+            held.pop().release()
+
+    async def flush():
+        await asyncio.sleep(STATEMENT_LATENCY)
+
+    db.execute.side_effect = fake_execute
+    db.flush = AsyncMock(side_effect=flush)
+    db.add = MagicMock()
+    db.add_all = MagicMock()
+    db.commit = AsyncMock(side_effect=release)
+    db.rollback = AsyncMock(side_effect=rollback)
+    return db
+
+
+async def _run_checkouts(lock_table, user_ids):
+    carts = {
+        user_id: KokCart(kok_cart_id=user_id, user_id=user_id, kok_product_id=1, kok_price_id=1, recipe_id=None)
+        for user_id in set(user_ids)
+    }
+    status = MagicMock(status_id=1, status_code="ORDER_RECEIVED", status_name="주문 생성")
+
+    async def checkout(user_id):
+        db = _checkout_db(lock_table, user_id, carts)
+        try:
+            await order_common.run_with_lock_retry(
+                db,
+                lambda: order_create_mod.create_orders_from_selected_carts(
+                    db, user_id=user_id, selected_items=[{"kok_cart_id": user_id, "quantity": 1}]
+                ),
+                label="benchmark",
+            )
+            await db.commit()
+            return True
+        except ValueError:
+            await db.rollback()
+            return False
+
+    async def no_invalidate(*args, **kwargs):
+        return 0
+
+    with (
+        patch.object(order_create_mod, "Order", return_value=MagicMock(order_id=1, order_time=datetime.now())),
+        patch.object(order_create_mod, "get_status_by_code", new_callable=AsyncMock, return_value=status),
+        patch.object(order_create_mod, "calculate_kok_order_prices", new_callable=AsyncMock,
+                     return_value={1: {"kok_product_id": 1, "unit_price": 1000, "product_name": "상품"}}),
+        patch.object(order_create_mod, "debug_cart_status", new_callable=AsyncMock, return_value={}),
+        patch("services.recipe.utils.ownership_snapshot.invalidate_ownership_snapshot", no_invalidate),
+        patch("services.kok.utils.cache_utils.cache_manager.invalidate_user_store_best", no_invalidate),
+    ):
+        started = time.perf_counter()
+        results = await asyncio.gather(*[checkout(user_id) for user_id in user_ids])
+        elapsed = time.perf_counter() - started
+    return results, elapsed
+
+
+@pytest.mark.asyncio
+async def test_parallel_checkout_throughput_with_row_locks():
+    """
+    서로 다른 사용자 N건 동시 주문:
+    - 행 잠금: N건이 동시에 잠금 보유 (사용자 간 대기 없음)
+    - 범위 잠금 모델(기존 SERIALIZABLE): 한 번에 1건씩 처리
+    같은 장바구니 중복 주문은 행 잠금에서 대기 후 1건만 성공
+    """
+    user_ids = list(range(1, PARALLEL_CHECKOUTS + 1))
+
+    row_locks = _LockTable("row")
+    results, row_elapsed = await _run_checkouts(row_locks, user_ids)
+    assert all(results)
+    assert row_locks.peak == PARALLEL_CHECKOUTS
+
+    range_locks = _LockTable("range")
+    results, range_elapsed = await _run_checkouts(range_locks, user_ids)
+    assert all(results)
+    assert range_locks.peak == 1
+
+    logging.getLogger(__name__).info(
+        "병렬 주문 %d건 처리량: 행 잠금 %.0f건/s, 범위 잠금 %.0f건/s",
+        PARALLEL_CHECKOUTS, PARALLEL_CHECKOUTS / row_elapsed, PARALLEL_CHECKOUTS / range_elapsed,
+    )
+
+    # 같은 장바구니로 동시에 5번 주문 → 1건만 성공 (이중 주문 방지)
+    duplicate_locks = _LockTable("row")
+    results, _ = await _run_checkouts(duplicate_locks, [7] * 5)
+    assert results.count(True) == 1
@@ -0,0 +1,115 @@
+"""
+배치 로더 단위 테스트
+1. BatchLoader — 중복 제거, 요청(세션) 범위 메모이즈
+2. 목록 CRUD — 상품 수와 무관하게 관계당 IN 쿼리 1회 (query_budget 마커로 검증)
+3. 가격 일괄 조회 실패 — 상품별 기본값(할인 없음, 정가)으로 표시
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+
+from common.batch_loader import BatchLoader, get_loader
+
+
+@pytest_asyncio.fixture
+async def kok_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from services.kok.models.interaction_model import KokLikes
+    from services.kok.models.product_model import KokPriceInfo, KokProductInfo
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: [
+                table.create(sync_conn)
+                for table in (KokProductInfo.__table__, KokPriceInfo.__table__, KokLikes.__table__)
+            ]
+        )
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    for pid in range(1, 7):
+        session.add(KokProductInfo(
+            kok_product_id=pid,
+            kok_product_name=f"국산 고춧가루 {pid}",
+            kok_store_name="우리농원",
+            kok_product_price=10000,
+        ))
+        # 가격 이력 2건: 최신(가격 ID가 큰) 행이 응답에 사용되어야 함
+        session.add(KokPriceInfo(kok_product_id=pid, kok_discount_rate=5, kok_discounted_price=9500))
+        session.add(KokPriceInfo(kok_product_id=pid, kok_discount_rate=10 + pid, kok_discounted_price=9000 - pid))
+        session.add(KokLikes(user_id=1, kok_product_id=pid, kok_created_at=datetime(2025, 1, pid)))
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_dedupes_and_memoizes():
+    calls = []
+
+    async def fetch(db, keys):
+        calls.append(list(keys))
+        return {k: k * 10 for k in keys if k != 3}
+
+    db = MagicMock()
+    db.info = {}
+    loader = get_loader(db, "x10", fetch)
+    assert get_loader(db, "x10", fetch) is loader
+
+    assert await loader.load_many([1, 2, 2, 3, None]) == {1: 10, 2: 20}
+    assert await loader.load_many([2, 3, 4]) == {2: 20, 4: 40}
+    assert await loader.load(3) is None
+    assert calls == [[1, 2, 3], [4]]
+
+    # session.info 를 쓸 수 없는 세션은 메모이즈 없이 동작
+    assert isinstance(get_loader(MagicMock(), "x10", fetch), BatchLoader)
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(2)
+async def test_get_kok_liked_products_uses_single_price_query(kok_session, query_recorder):
+    from services.kok.crud.likes_crud import get_kok_liked_products
+
+    liked = await get_kok_liked_products(kok_session, user_id=1)
+
+    assert query_recorder.count == 2
+    assert [p["kok_product_id"] for p in liked] == [6, 5, 4, 3, 2, 1]
+    assert liked[0]["kok_discount_rate"] == 16
+    assert liked[0]["kok_discounted_price"] == 8994
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(2)
+async def test_get_kok_products_by_ingredient_uses_single_price_query(kok_session, query_recorder):
+    from services.kok.crud.product_crud import get_kok_products_by_ingredient
+
+    products = await get_kok_products_by_ingredient(kok_session, "고춧가루", limit=10)
+
+    assert query_recorder.count == 2
+    assert len(products) == 6
+    assert {p["kok_discount_rate"] for p in products} == {11, 12, 13, 14, 15, 16}
+
+
+@pytest.mark.asyncio
+async def test_price_load_failure_falls_back_to_list_price(kok_session, monkeypatch):
+    from services.kok.crud import likes_crud, product_crud
+
+    async def broken(db, ids):
+        raise RuntimeError("price query failed")
+
+    monkeypatch.setattr(likes_crud, "load_latest_kok_prices", broken)
+    monkeypatch.setattr(product_crud, "load_latest_kok_prices", broken)
+
+    liked = await likes_crud.get_kok_liked_products(kok_session, user_id=1)
+    products = await product_crud.get_kok_products_by_ingredient(kok_session, "고춧가루", limit=10)
+
+    for items in (liked, products):
+        assert len(items) == 6
+        assert all(p["kok_discount_rate"] == 0 and p["kok_discounted_price"] == 10000 for p in items)
@@ -0,0 +1,184 @@
+"""
+상세 페이지 캐시(cache-aside) 단위 테스트
+1. 콕 상품 기본 정보 — 공용 페이로드는 캐시, 찜 여부는 사용자별로 덧씌움, 가격 적재 후 무효화
+2. 콕 상품 이미지/판매자 정보 — 캐시 히트 시 DB 조회 없음
+3. 홈쇼핑 상품 상세 — 캐시된 공용 페이로드 + 사용자별 찜 여부
+4. 레시피 상세 — 캐시 히트 시 DB 조회 없음, 무효화 후 재조회
+"""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+
+from services.recipe.utils import detail_cache
+
+
+class _FakeRedisCache:
+    """RedisCacheCore 대체 (JSON 직렬화까지 동일하게 거침)"""
+
+    def __init__(self):
+        import json
+
+        self._json = json
+        self.store = {}
+
+    async def get_json(self, key):
+        raw = self.store.get(key)
+        return self._json.loads(raw) if raw is not None else None
+
+    async def set_json(self, key, data, ttl, *, ensure_ascii=False):
+        self.store[key] = self._json.dumps(data, ensure_ascii=ensure_ascii, default=str)
+        return True
+
+    async def delete_key(self, key):
+        return 1 if self.store.pop(key, None) is not None else 0
+
+    async def delete_pattern(self, pattern):
+        prefix = pattern.rstrip("*")
+        keys = [key for key in self.store if key.startswith(prefix)]
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+
+class _NoRedis:
+    async def get_client(self):
+        return None
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    from common.cache import membership
+    from services.homeshopping.utils.cache_manager import cache_manager as hs_cache_manager
+    from services.kok.utils.cache_utils import cache_manager as kok_cache_manager
+
+    redis = _FakeRedisCache()
+    monkeypatch.setattr(kok_cache_manager, "redis_cache", redis)
+    monkeypatch.setattr(hs_cache_manager, "redis_cache", redis)
+    monkeypatch.setattr(detail_cache, "_redis", redis)
+    monkeypatch.setattr(membership, "_cache", _NoRedis())  # 찜 여부는 DB 조회
+    return redis
+
+
+@pytest_asyncio.fixture
+async def detail_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import services.homeshopping.models.core_model  # noqa: F401  (관계 대상 매퍼)
+    import services.order.models.homeshopping.hs_order_model  # noqa: F401
+    import services.order.models.kok.kok_order_model  # noqa: F401
+    import services.order.models.order_base_model  # noqa: F401
+    from services.homeshopping.models.interaction_model import HomeshoppingLikes
+    from services.kok.models.interaction_model import KokLikes
+    from services.kok.models.product_model import KokDetailInfo, KokImageInfo, KokPriceInfo, KokProductInfo
+    from services.recipe.models.core_model import Material, Recipe
+
+    tables = (
+        KokProductInfo, KokPriceInfo, KokImageInfo, KokDetailInfo, KokLikes, HomeshoppingLikes, Recipe, Material,
+    )
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.__table__.create(sync_conn) for t in tables])
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    session.add_all([
+        KokProductInfo(kok_product_id=1, kok_product_name="참기름", kok_store_name="고소상회",
+                       kok_product_price=10000, kok_review_cnt=3, kok_co_ceo="김대표"),
+        KokPriceInfo(kok_product_id=1, kok_discount_rate=10, kok_discounted_price=9000),
+        KokImageInfo(kok_img_id=1, kok_product_id=1, kok_img_url="a.jpg"),
+        KokDetailInfo(kok_detail_col_id=1, kok_product_id=1, kok_detail_col="용량", kok_detail_val="300ml"),
+        KokLikes(user_id=7, kok_product_id=1, kok_created_at=datetime.now()),
+        HomeshoppingLikes(user_id=7, live_id=5, homeshopping_like_created_at=datetime.now()),
+        Recipe(recipe_id=1, recipe_title="김치찌개 만들기", cooking_name="김치찌개", scrap_count=3),
+        Material(recipe_id=1, material_name="김치", measure_amount="1", measure_unit="컵"),
+    ])
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(20)
+async def test_kok_product_info_caches_shared_part_and_overlays_likes(detail_session, fake_redis, query_recorder):
+    from services.kok.crud.product_crud import get_kok_product_info
+    from services.kok.models.product_model import KokPriceInfo
+    from services.kok.utils.cache_utils import cache_manager
+
+    first = await get_kok_product_info(detail_session, 1, user_id=7)
+    assert first.is_liked and first.kok_discounted_price == 9000
+    assert "is_liked" not in await cache_manager.get("product_info", product_id=1)
+
+    # 캐시 히트: 찜 여부 조회 1회만 (다른 사용자는 다른 찜 여부)
+    before = len(query_recorder.statements)
+    second = await get_kok_product_info(detail_session, 1, user_id=8)
+    assert len(query_recorder.statements) - before == 1
+    assert not second.is_liked
+    assert second.model_dump(exclude={"is_liked"}) == first.model_dump(exclude={"is_liked"})
+
+    # 비로그인 + 캐시 히트: DB 조회 없음
+    before = len(query_recorder.statements)
+    assert not (await get_kok_product_info(detail_session, 1)).is_liked
+    assert len(query_recorder.statements) == before
+
+    # 가격 적재 후 무효화하면 새 가격 반영
+    detail_session.add(KokPriceInfo(kok_product_id=1, kok_discount_rate=20, kok_discounted_price=8000))
+    await detail_session.commit()
+    assert (await get_kok_product_info(detail_session, 1)).kok_discounted_price == 9000
+    assert await cache_manager.invalidate_product_info(1)
+    assert (await get_kok_product_info(detail_session, 1)).kok_discounted_price == 8000
+    assert await get_kok_product_info(detail_session, 99) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(10)
+async def test_kok_tabs_and_seller_details_are_cached(detail_session, fake_redis, query_recorder):
+    from services.kok.crud.product_crud import get_kok_product_seller_details, get_kok_product_tabs
+
+    tabs = await get_kok_product_tabs(detail_session, 1)
+    seller = await get_kok_product_seller_details(detail_session, 1)
+    before = len(query_recorder.statements)
+    assert await get_kok_product_tabs(detail_session, 1) == tabs
+    assert await get_kok_product_seller_details(detail_session, 1) == seller
+    assert len(query_recorder.statements) == before
+
+    assert [img.kok_img_url for img in tabs.images] == ["a.jpg"]
+    assert seller.seller_info.kok_co_ceo == "김대표"
+    assert [d.kok_detail_val for d in seller.detail_info] == ["300ml"]
+
+
+@pytest.mark.asyncio
+async def test_homeshopping_detail_overlays_likes_on_cached_payload(detail_session, fake_redis):
+    from services.homeshopping.crud.product_crud import get_homeshopping_product_detail
+    from services.homeshopping.utils.cache_manager import cache_manager
+
+    payload = {"product": {"product_id": 10, "product_name": "홈쇼핑 상품"}, "detail_infos": [], "images": []}
+    await cache_manager.set_product_detail_cache(5, payload)
+
+    liked = await get_homeshopping_product_detail(detail_session, 5, user_id=7)
+    assert liked["product"] == {**payload["product"], "is_liked": True}
+    assert (await get_homeshopping_product_detail(detail_session, 5, user_id=8))["product"]["is_liked"] is False
+    assert await cache_manager.get_product_detail_cache(5) == payload  # 공용 페이로드는 그대로
+
+    assert await cache_manager.invalidate_product_detail_cache() == 1
+    assert await cache_manager.get_product_detail_cache(5) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(5)
+async def test_recipe_detail_is_cached_until_invalidated(detail_session, fake_redis, query_recorder):
+    from services.recipe.crud.recipe_detail_crud import get_recipe_detail
+
+    detail = await get_recipe_detail(detail_session, 1)
+    assert [m["material_name"] for m in detail["materials"]] == ["김치"]
+
+    before = len(query_recorder.statements)
+    assert await get_recipe_detail(detail_session, 1) == detail
+    assert len(query_recorder.statements) == before
+
+    assert await detail_cache.invalidate_recipe_detail(1) == 1
+    assert await get_recipe_detail(detail_session, 1) == detail
+    assert len(query_recorder.statements) == before + 1
@@ -0,0 +1,185 @@
+"""
+홈쇼핑 상품 검색 백엔드 단위 테스트
+1. InvertedSearchIndex — 결과 집합이 부분 문자열(LIKE) 검색과 같고 관련도순 정렬
+2. search_homeshopping_products_page — 페이지/전체 건수, 신규 방송 증분 반영 (sqlite → 메모리 역색인)
+3. search_live_ids — auto 는 역색인, FULLTEXT 는 인덱스/파서 없음 오류에서만 비활성화
+4. PeriodicRefresher — lifespan 백그라운드 태스크로 역색인 적재
+"""
+
+import asyncio
+from datetime import date, time
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from services.homeshopping.utils import search_backend
+from services.homeshopping.utils.search_backend import InvertedSearchIndex
+
+ROWS = [
+    # live_id, live_date, start, product_name, store_name
+    (1, date(2025, 3, 1), time(9, 0), "국산 김치 5kg", "김치명가"),
+    (2, date(2025, 3, 1), time(10, 0), "포기김치 10kg", "종가"),
+    (3, date(2025, 3, 2), time(9, 0), "무선 청소기", "김치냉장고몰"),
+    (4, date(2025, 3, 2), time(11, 0), "국산 김치 5kg", "김치명가"),
+    (5, date(2025, 3, 3), time(8, 0), "Fresh 두부", "풀무원"),
+]
+
+
+def _like_search(keyword):
+    keyword = keyword.casefold()
+    return {r[0] for r in ROWS if keyword in r[3].casefold() or keyword in r[4].casefold()}
+
+
+def test_inverted_index_matches_substring_search():
+    index = InvertedSearchIndex()
+    for row in ROWS:
+        index.add(*row)
+
+    # 같은 (상품명, 판매자명)은 한 문서로 색인
+    assert len(index.docs) == 4
+    for keyword in ["김치", "국산 김치", "치", "fresh", "청소", "없는상품"]:
+        assert set(index.search(keyword)) == _like_search(keyword)
+
+    # 상품명+판매자명 일치 > 상품명 일치(앞쪽 위치 우선) > 판매자명만 일치, 동률은 편성 순서
+    assert index.search("김치") == [1, 4, 2, 3]
+
+
+@pytest_asyncio.fixture
+async def search_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import services.homeshopping.models.interaction_model  # noqa: F401  (관계 대상 매퍼)
+    import services.kok.models.interaction_model  # noqa: F401
+    import services.kok.models.product_model  # noqa: F401
+    import services.order.models.homeshopping.hs_order_model  # noqa: F401
+    import services.order.models.kok.kok_order_model  # noqa: F401
+    import services.order.models.order_base_model  # noqa: F401
+    import services.recipe.models.core_model  # noqa: F401
+    from services.homeshopping.models.core_model import HomeshoppingInfo, HomeshoppingList, HomeshoppingProductInfo
+
+    tables = (HomeshoppingInfo.__table__, HomeshoppingList.__table__, HomeshoppingProductInfo.__table__)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.create(sync_conn) for t in tables])
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    for live_id, live_date, start, name, store in ROWS:
+        session.add(HomeshoppingProductInfo(product_id=live_id * 10, store_name=store, sale_price=1000, dc_price=900, dc_rate=10))
+        session.add(HomeshoppingList(
+            live_id=live_id, homeshopping_id=1, live_date=live_date, live_start_time=start, live_end_time=start,
+            product_id=live_id * 10, product_name=name, thumb_img_url="t.jpg",
+        ))
+    await session.commit()
+
+    search_backend.clear_search_index()
+    yield session
+    search_backend.clear_search_index()
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_search_page_with_total_and_incremental_refresh(search_session, monkeypatch):
+    from services.homeshopping.crud.search_crud import search_homeshopping_products_page
+    from services.homeshopping.models.core_model import HomeshoppingList, HomeshoppingProductInfo
+
+    products, total = await search_homeshopping_products_page(search_session, "김치", page=2, size=2)
+    assert total == 4
+    assert [p["live_id"] for p in products] == [2, 3]
+    assert products[1]["store_name"] == "김치냉장고몰"
+
+    # 신규 방송: 주기 갱신의 워터마크 확인 시 live_id > MAX 행만 증분 반영
+    monkeypatch.setattr(search_backend, "SEARCH_INDEX_CHECK_SECONDS", 0)
+    search_session.add(HomeshoppingProductInfo(product_id=60, store_name="종가", sale_price=1000, dc_price=900, dc_rate=10))
+    search_session.add(HomeshoppingList(
+        live_id=6, homeshopping_id=1, live_date=date(2025, 3, 4), live_start_time=time(9, 0),
+        live_end_time=time(10, 0), product_id=60, product_name="열무김치", thumb_img_url="t.jpg",
+    ))
+    await search_session.commit()
+
+    # 요청 경로는 적재된 색인을 그대로 사용 (갱신은 백그라운드 태스크 몫)
+    _, total = await search_homeshopping_products_page(search_session, "김치")
+    assert total == 4
+
+    await search_backend.refresh_search_index(search_session)
+    products, total = await search_homeshopping_products_page(search_session, "김치")
+    assert total == 5
+    assert [p["live_id"] for p in products] == [1, 4, 2, 6, 3]
+    assert search_backend._inverted_backend._index.row_count == 6
+
+
+class _MySQLSession:
+    """FULLTEXT 쿼리가 error 로 실패하는 MariaDB 세션 흉내"""
+
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="mariadb"))
+
+    async def execute(self, *args, **kwargs):
+        self.calls += 1
+        raise self.error
+
+
+def _dbapi_error(code, message):
+    from sqlalchemy.exc import OperationalError
+
+    return OperationalError("SELECT ...", {}, Exception(code, message))
+
+
+@pytest.mark.asyncio
+async def test_fulltext_disabled_only_for_missing_index(monkeypatch):
+    from sqlalchemy.exc import OperationalError
+
+    async def inverted_search(db, keyword, page=1, size=None):
+        return [1], 1
+
+    monkeypatch.setattr(search_backend._inverted_backend, "search", inverted_search)
+    monkeypatch.setattr(search_backend._fulltext_backend, "available", True)
+
+    # auto: MariaDB 라도 FULLTEXT 를 시도하지 않음
+    monkeypatch.setattr(search_backend, "_configured_backend", lambda: "auto")
+    session = _MySQLSession(_dbapi_error(2013, "Lost connection to MySQL server during query"))
+    assert await search_backend.search_live_ids(session, "김치") == ([1], 1)
+    assert session.calls == 0
+
+    # fulltext: 인덱스/파서와 무관한 오류는 전파하고 FULLTEXT 를 유지
+    monkeypatch.setattr(search_backend, "_configured_backend", lambda: "fulltext")
+    with pytest.raises(OperationalError):
+        await search_backend.search_live_ids(session, "김치")
+    assert search_backend._fulltext_backend.available
+
+    # 인덱스 없음(1191): 비활성화 후 역색인으로 대체
+    session = _MySQLSession(_dbapi_error(1191, "Can't find FULLTEXT index matching the column list"))
+    assert await search_backend.search_live_ids(session, "김치") == ([1], 1)
+    assert not search_backend._fulltext_backend.available
+
+
+@pytest.mark.asyncio
+async def test_periodic_refresher_builds_index_in_background(search_session):
+    from common.periodic_refresh import PeriodicRefresher
+
+    class _Factory:
+        def __call__(self):
+            return self
+
+        async def __aenter__(self):
+            return search_session
+
+        async def __aexit__(self, *exc):
+            return False
+
+    refresher = PeriodicRefresher("homeshopping_search_index_test", search_backend._inverted_backend.refresh, 0.01)
+    refresher.start(_Factory())
+    for _ in range(100):
+        if search_backend._inverted_backend.ready:
+            break
+        await asyncio.sleep(0.01)
+    await refresher.stop()
+
+    assert search_backend._inverted_backend.ready
+    assert search_backend._inverted_backend._index.search("김치") == [1, 4, 2, 3]
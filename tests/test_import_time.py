@@ -0,0 +1,115 @@
+"""
+게이트웨이 import-time 프로파일 테스트 (`python -X importtime` 기반)
+1. 전체 게이트웨이 import 시 pandas/numpy/passlib/pymysql 및 DB 드라이버가 로드되지 않는다
+2. GATEWAY_SERVICES=log 슬림 워커는 로그 서비스 외 라우터를 import 하지 않는다
+3. GATEWAY_SERVICES=catalog 워커는 홈쇼핑/콕 라우터만 import 한다
+4. 알 수 없는 서비스명은 부팅 시 ValueError
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 실제 DB 연결 없이 Settings 검증만 통과하도록 더미 환경변수 사용 (엔진은 지연 생성)
+_GATEWAY_ENV = {
+    "JWT_SECRET": "test-secret",
+    "JWT_ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "WEBHOOK_BASE_URL": "http://localhost",
+    "MARIADB_AUTH_URL": "mysql+asyncmy://user:pw@localhost:3306/auth",
+    "MARIADB_AUTH_MIGRATE_URL": "mysql+pymysql://user:pw@localhost:3306/auth",
+    "MARIADB_SERVICE_URL": "mysql+asyncmy://user:pw@localhost:3306/service",
+    "POSTGRES_LOG_URL": "postgresql+psycopg://user:pw@localhost:5432/log",
+    "POSTGRES_LOG_MIGRATE_URL": "postgresql+psycopg2://user:pw@localhost:5432/log",
+    "POSTGRES_RECOMMEND_URL": "postgresql+psycopg://user:pw@localhost:5432/recommend",
+    "APP_NAME": "uhok-test",
+    "DEBUG": "false",
+}
+
+_IMPORTTIME_RX = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\S+)")
+
+HEAVY_MODULES = ("pandas", "numpy", "passlib", "pymysql", "asyncmy", "psycopg")
+
+
+def _profile_gateway_import(gateway_services: str):
+    """
+    서브프로세스에서 `-X importtime`으로 gateway.main을 import 하고
+    (모듈명 → 누적 import 시간(us)) 딕셔너리와 프로세스 결과를 반환
+    """
+    env = {**os.environ, **_GATEWAY_ENV, "GATEWAY_SERVICES": gateway_services, "PYTHONPATH": ROOT}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import gateway.main"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    modules = {name: int(cumulative) for _, cumulative, name in _IMPORTTIME_RX.findall(proc.stderr)}
+    return modules, proc
+
+
+def _top_imports(modules, n=10):
+    return sorted(modules.items(), key=lambda kv: kv[1], reverse=True)[:n]
+
+
+def test_full_gateway_defers_heavy_dependencies():
+    """전체 서비스를 마운트해도 무거운 의존성/DB 드라이버는 첫 사용 시점까지 로드되지 않는다."""
+    modules, proc = _profile_gateway_import("all")
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert "gateway.main" in modules
+
+    loaded = [m for m in HEAVY_MODULES if m in modules]
+    assert not loaded, f"import 시점에 로드된 무거운 모듈: {loaded}, 상위 import: {_top_imports(modules)}"
+
+
+def test_log_only_gateway_skips_other_services():
+    """GATEWAY_SERVICES=log 워커는 로그 라우터만 import 한다."""
+    modules, proc = _profile_gateway_import("log")
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    assert "services.log.routers.event_router" in modules
+    for service in ("kok", "homeshopping", "recipe", "order"):
+        leaked = [m for m in modules if m.startswith(f"services.{service}.")]
+        assert not leaked, f"log 전용 워커에서 {service} 모듈이 로드됨: {leaked[:5]}"
+
+
+def test_catalog_gateway_mounts_only_catalog_services():
+    """GATEWAY_SERVICES=catalog 워커는 홈쇼핑/콕 라우터만 import 한다."""
+    modules, proc = _profile_gateway_import("catalog")
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    assert any(m.startswith("services.homeshopping.routers.") for m in modules)
+    assert any(m.startswith("services.kok.routers.") for m in modules)
+    for service in ("recipe", "log"):
+        leaked = [m for m in modules if m.startswith(f"services.{service}.routers.")]
+        assert not leaked, f"catalog 워커에서 {service} 라우터가 로드됨: {leaked[:5]}"
+
+
+def test_unknown_gateway_service_fails_fast():
+    """알 수 없는 서비스명이 설정되면 부팅 단계에서 실패한다."""
+    _, proc = _profile_gateway_import("log,unknown")
+    assert proc.returncode != 0
+    assert "알 수 없는 서비스명" in proc.stderr
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("all", ["user", "log", "order", "homeshopping", "kok", "recipe"]),
+        ("log", ["log"]),
+        ("catalog", ["homeshopping", "kok"]),
+        (" Kok , user ", ["user", "kok"]),
+        ("", ["user", "log", "order", "homeshopping", "kok", "recipe"]),
+    ],
+)
+def test_resolve_enabled_services(raw, expected):
+    """GATEWAY_SERVICES 파싱: 별칭 확장, 대소문자/공백 무시, 등록 순서 유지."""
+    from gateway.service_registry import resolve_enabled_services
+
+    assert resolve_enabled_services(raw) == expected
@@ -0,0 +1,58 @@
+"""
+재료 매칭 인덱스 단위 테스트
+1. IngredientKeywordExtractor — 주입 어휘로 추출, 상품명 단위 메모이즈
+2. IngredientStatusMatcher — 보유 > 장바구니 > 미보유 분류, 상품명 완전 일치 보조
+"""
+
+from unittest.mock import patch
+
+from services.recipe.utils.ingredient_matcher import (
+    IngredientKeywordExtractor,
+    IngredientStatusMatcher,
+)
+
+VOCAB = {"양파", "대파", "감자", "고춧가루"}
+
+
+def test_extractor_memoizes_per_product_name():
+    extractor = IngredientKeywordExtractor(VOCAB)
+    with patch(
+        "common.keyword_extraction.extract_kok_keywords",
+        return_value={"keywords": ["양파"]},
+    ) as extract:
+        assert extractor.extract_keywords("농협 국산 양파 3kg") == ["양파"]
+        assert extractor.extract_keywords("농협 국산 양파 3kg") == ["양파"]
+    assert extract.call_count == 1
+    # 생성 시 만든 frozenset 을 호출마다 복사하지 않고 그대로 전달
+    assert extract.call_args.args[1] is extractor.ing_vocab
+    assert isinstance(extractor.ing_vocab, frozenset)
+
+    assert IngredientKeywordExtractor(set()).extract_keywords("농협 국산 양파 3kg") == []
+
+
+def test_matcher_classifies_owned_cart_and_not_owned():
+    matcher = IngredientStatusMatcher(IngredientKeywordExtractor(VOCAB))
+    index = matcher.build_index(
+        [
+            {"order_id": 10, "product_name": "농협 국산 양파 3kg", "order_type": "kok"},
+            {"order_id": 11, "product_name": "감자", "order_type": "homeshopping"},
+        ],
+        [
+            {"cart_id": 1, "product_name": "청정원 고춧가루 500g", "cart_type": "kok"},
+            {"cart_id": 2, "product_name": "농협 햇 양파 1kg", "cart_type": "kok"},
+        ],
+    )
+
+    ingredients, summary = matcher.classify(["양파", "고춧가루", "감자", "대파", "양파"], index)
+
+    by_name = {i["material_name"]: i for i in ingredients}
+    assert [i["material_name"] for i in ingredients] == ["양파", "고춧가루", "감자", "대파"]
+    assert by_name["양파"]["status"] == "owned"
+    assert by_name["양파"]["order_info"]["order_id"] == 10
+    assert by_name["양파"]["cart_info"] is None
+    assert by_name["고춧가루"]["status"] == "cart"
+    assert by_name["고춧가루"]["cart_info"]["cart_id"] == 1
+    # 키워드 추출이 안 되는 짧은 상품명은 상품명 완전 일치로 매칭
+    assert by_name["감자"]["status"] == "owned"
+    assert by_name["대파"]["status"] == "not_owned"
+    assert summary == {"total_ingredients": 4, "owned_count": 2, "cart_count": 1, "not_owned_count": 1}
@@ -0,0 +1,122 @@
+"""
+콕 다건 주문 생성 단위 테스트
+1. create_orders_from_selected_carts — 가격/주문 항목/상태 이력/알림을 일괄 처리, 항목 수와 무관한 쿼리 수
+2. 이미 주문된(삭제된) 장바구니 항목으로 재주문 시 ValueError (이중 주문 방지)
+"""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+import services.order.crud.kok.kok_order_create_crud as order_create_mod
+from services.order.crud import order_common
+
+
+@pytest_asyncio.fixture
+async def checkout_session(monkeypatch):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import services.homeshopping.models.core_model  # noqa: F401  (관계 대상 매퍼)
+    import services.homeshopping.models.interaction_model  # noqa: F401
+    import services.order.models.homeshopping.hs_order_model  # noqa: F401
+    import services.recipe.models.core_model  # noqa: F401
+    from services.kok.models.interaction_model import KokCart, KokNotification
+    from services.kok.models.product_model import KokPriceInfo, KokProductInfo
+    from services.order.models.kok.kok_order_model import KokOrder, KokOrderStatusHistory
+    from services.order.models.order_base_model import Order, StatusMaster
+
+    tables = [
+        StatusMaster.__table__, Order.__table__, KokProductInfo.__table__, KokPriceInfo.__table__,
+        KokCart.__table__, KokOrder.__table__, KokOrderStatusHistory.__table__, KokNotification.__table__,
+    ]
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.create(sync_conn) for t in tables])
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    session.add(StatusMaster(status_id=1, status_code="ORDER_RECEIVED", status_name="주문 생성"))
+    for pid in range(1, 11):
+        session.add(KokProductInfo(kok_product_id=pid, kok_product_name=f"상품{pid}", kok_product_price=1000 * pid))
+        # 홀수 상품만 할인 가격 보유
+        session.add(KokPriceInfo(kok_price_id=pid, kok_product_id=pid, kok_discounted_price=900 * pid if pid % 2 else None))
+        session.add(KokCart(
+            kok_cart_id=pid, user_id=1, kok_product_id=pid, kok_price_id=pid, kok_quantity=1,
+            kok_created_at=datetime.now(), recipe_id=None,
+        ))
+    await session.commit()
+
+    async def _noop(*args, **kwargs):
+        return 0
+
+    from services.kok.utils.cache_utils import cache_manager
+
+    monkeypatch.setattr("services.recipe.utils.ownership_snapshot.invalidate_ownership_snapshot", _noop)
+    monkeypatch.setattr(cache_manager, "invalidate_user_store_best", _noop)
+    order_common.clear_status_cache()
+
+    yield session
+    order_common.clear_status_cache()
+    await session.close()
+    await engine.dispose()
+
+
+def _batched_statements(recorder):
+    """
+    주문 항목 INSERT 를 뺀 실행 SQL 수
+    (SQLite 는 RETURNING 다중 행 INSERT 의 행 순서를 보장하지 못해 ORM 이 행마다 INSERT,
+    MariaDB 는 다중 행 INSERT ... RETURNING 1회)
+    """
+    return sum(1 for statement in recorder.statements if 'INSERT INTO "KOK_ORDERS"' not in statement)
+
+
+async def _count(session, model):
+    return (await session.execute(select(func.count()).select_from(model))).scalar()
+
+
+@pytest.mark.asyncio
+# SQLite 에서는 주문 항목 INSERT 가 행마다 실행되므로 (_batched_statements 참고) 반복 임계치를 항목 수 이상으로
+@pytest.mark.query_budget(40, repeat_threshold=11)
+async def test_bulk_checkout_uses_constant_queries(checkout_session, query_recorder):
+    from services.kok.models.interaction_model import KokCart, KokNotification
+    from services.order.models.kok.kok_order_model import KokOrderStatusHistory
+
+    result = await order_create_mod.create_orders_from_selected_carts(
+        checkout_session, user_id=1, selected_items=[{"kok_cart_id": 1, "quantity": 2}, {"kok_cart_id": 2, "quantity": 3}],
+    )
+    small_order_queries = _batched_statements(query_recorder)
+    assert result["order_count"] == 2
+    assert result["total_amount"] == 900 * 2 + 2000 * 3
+    assert [d["unit_price"] for d in result["order_details"]] == [900, 2000]
+
+    before = _batched_statements(query_recorder)
+    result = await order_create_mod.create_orders_from_selected_carts(
+        checkout_session, user_id=1, selected_items=[{"kok_cart_id": cid, "quantity": 1} for cid in range(3, 11)],
+    )
+    assert result["order_count"] == 8 and len(set(result["kok_order_ids"])) == 8
+    # 항목 수가 늘어도 쿼리 수는 같음 (상태 코드는 첫 주문에서 캐시됨)
+    assert _batched_statements(query_recorder) - before <= small_order_queries
+    await checkout_session.commit()
+
+    assert await _count(checkout_session, KokOrderStatusHistory) == 10
+    assert await _count(checkout_session, KokNotification) == 10
+    assert await _count(checkout_session, KokCart) == 0
+    notification = (await checkout_session.execute(
+        select(KokNotification.title, KokNotification.user_id).limit(1)
+    )).one()
+    assert notification.title == "주문 생성" and notification.user_id == 1
+
+
+@pytest.mark.asyncio
+async def test_checkout_of_already_ordered_cart_is_rejected(checkout_session):
+    await order_create_mod.create_orders_from_selected_carts(
+        checkout_session, user_id=1, selected_items=[{"kok_cart_id": 1, "quantity": 1}],
+    )
+    await checkout_session.commit()
+
+    with pytest.raises(ValueError, match="장바구니 항목을 찾을 수 없습니다"):
+        await order_create_mod.create_orders_from_selected_carts(
+            checkout_session, user_id=1, selected_items=[{"kok_cart_id": 1, "quantity": 1}],
+        )
@@ -0,0 +1,96 @@
+"""
+콕 상품 컬럼 조회(프로젝션) 단위 테스트
+1. 상품 관계 속성은 lazy="raise" — 의도치 않은 지연 로딩 대신 즉시 오류
+2. get_kok_product_infos — 가격 이력 수와 무관하게 쿼리 1회, 최신 할인가 사용
+3. 목록 CRUD — 엔티티 대신 컬럼 행 조회 (세션 identity map 에 상품 객체가 남지 않음)
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+
+@pytest_asyncio.fixture
+async def product_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import services.homeshopping.models.core_model  # noqa: F401  (관계 대상 매퍼)
+    import services.homeshopping.models.interaction_model  # noqa: F401
+    import services.kok.models.interaction_model  # noqa: F401
+    import services.order.models.homeshopping.hs_order_model  # noqa: F401
+    import services.order.models.kok.kok_order_model  # noqa: F401
+    import services.order.models.order_base_model  # noqa: F401
+    import services.recipe.models.core_model  # noqa: F401
+    from services.kok.models.product_model import KokPriceInfo, KokProductInfo
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: [t.create(sync_conn) for t in (KokProductInfo.__table__, KokPriceInfo.__table__)]
+        )
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    for pid in range(1, 5):
+        session.add(KokProductInfo(
+            kok_product_id=pid, kok_product_name=f"국산 참기름 {pid}", kok_store_name="고소상회",
+            kok_product_price=10000, kok_review_cnt=pid * 10, kok_review_score=4.5,
+        ))
+        # 가격 이력 여러 건: 할인가 있는 행 중 최신 행이 응답에 사용되어야 함
+        for rate in (5, 10, 20):
+            session.add(KokPriceInfo(kok_product_id=pid, kok_discount_rate=rate, kok_discounted_price=10000 - rate * 100))
+        if pid == 4:
+            session.add(KokPriceInfo(kok_product_id=pid, kok_discount_rate=None, kok_discounted_price=None))
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_product_relationships_raise_on_lazy_load(product_session):
+    from services.kok.models.product_model import KokProductInfo
+
+    product = (await product_session.execute(
+        select(KokProductInfo).where(KokProductInfo.kok_product_id == 1)
+    )).scalar_one()
+    for attr in ("price_infos", "images", "detail_infos", "review_examples", "likes", "cart_items"):
+        with pytest.raises(InvalidRequestError):
+            getattr(product, attr)
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(1)
+async def test_get_kok_product_infos_reads_latest_discount_in_one_query(product_session, query_recorder):
+    from services.homeshopping.crud.recommendation_crud import get_kok_product_infos
+
+    products = await get_kok_product_infos(product_session, [1, 2, 3, 4, 99])
+
+    assert query_recorder.count == 1
+    assert [p["kok_product_id"] for p in products] == [4, 3, 2, 1]
+    assert {p["kok_discount_rate"] for p in products} == {20}
+    assert {p["kok_discounted_price"] for p in products} == {8000}
+    assert set(products[0]) == {
+        "kok_product_id", "kok_thumbnail", "kok_discount_rate", "kok_discounted_price",
+        "kok_product_name", "kok_store_name",
+    }
+
+
+@pytest.mark.asyncio
+async def test_listing_reads_rows_not_entities(product_session):
+    from services.kok.crud.listing_crud import get_kok_product_list, get_kok_store_best_items
+    from services.kok.models.product_model import KokProductInfo
+
+    product_list, total = await get_kok_product_list(product_session, page=1, size=2, sort_by="review_count")
+    assert total == 4
+    assert [p["kok_product_id"] for p in product_list] == [4, 3]
+    assert product_list[0]["kok_store_name"] == "고소상회" and "kok_exchange_addr" in product_list[0]
+
+    best = await get_kok_store_best_items(product_session, user_id=None, use_cache=False)
+    assert [p["kok_product_id"] for p in best] == [4, 3, 2, 1]
+    # 최신 가격 행(할인 없음)은 원가로 대체
+    assert best[0]["kok_discounted_price"] == 10000
+
+    assert not [obj for obj in product_session.identity_map.values() if isinstance(obj, KokProductInfo)]
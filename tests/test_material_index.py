@@ -0,0 +1,101 @@
+"""
+재료 → 레시피 비트맵 인덱스 단위 테스트
+1. match_all — 재료 교집합의 정확한 총 개수, RECIPE_ID 오름차순 페이지, 재료명 대소문자/공백 무시
+2. 증분 반영 — MATERIAL_ID > 마지막 ID 인 신규 행만 추가
+3. search_recipes_with_pagination(재료) — 인덱스 사용 시 FCT_MTRL 조회 없음, 미준비 시 SQL 폴백과 같은 결과
+"""
+
+import pytest
+import pytest_asyncio
+
+from services.recipe.utils import material_index
+
+# 레시피별 재료 (레시피 ID → 재료명)
+RECIPE_MATERIALS = {
+    1: ["양파", "대파", "돼지고기"],
+    2: ["양파", "대파"],
+    3: ["양파", "감자"],
+    4: ["Onion", "대파"],
+    5: ["대파", "두부"],
+    6: ["양파", "대파", "두부"],
+}
+
+
+@pytest_asyncio.fixture
+async def recipe_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from services.recipe.models.core_model import Material, Recipe
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.create(sync_conn) for t in (Recipe.__table__, Material.__table__)])
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    for rid, names in RECIPE_MATERIALS.items():
+        session.add(Recipe(recipe_id=rid, recipe_title=f"레시피 {rid}", cooking_name=f"요리{rid}", scrap_count=rid))
+        for name in names:
+            session.add(Material(recipe_id=rid, material_name=name))
+    await session.commit()
+
+    material_index.clear_material_index()
+    yield session
+    material_index.clear_material_index()
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_match_all_returns_exact_total_and_ordered_pages(recipe_session):
+    assert material_index.match_recipes_with_all_materials(["양파"], 0, 10) is None  # 적재 전
+
+    await material_index.refresh_material_index(recipe_session)
+
+    assert material_index.match_recipes_with_all_materials(["양파", "대파"], 0, 2) == ([1, 2], 3)
+    assert material_index.match_recipes_with_all_materials(["양파", "대파"], 2, 2) == ([6], 3)
+    assert material_index.match_recipes_with_all_materials(["onion", " 대파"], 0, 10) == ([4], 1)
+    # 중복 입력은 한 번으로, 없는 재료가 섞이면 결과 없음
+    assert material_index.match_recipes_with_all_materials(["두부", "두부"], 0, 10) == ([5, 6], 2)
+    assert material_index.match_recipes_with_all_materials(["양파", "없는재료"], 0, 10) == ([], 0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_appends_new_material_rows(recipe_session):
+    from services.recipe.models.core_model import Material, Recipe
+
+    await material_index.refresh_material_index(recipe_session)
+    recipe_session.add(Recipe(recipe_id=7, recipe_title="레시피 7", cooking_name="요리7", scrap_count=0))
+    recipe_session.add_all([Material(recipe_id=7, material_name="감자"), Material(recipe_id=7, material_name="당근")])
+    await recipe_session.commit()
+
+    assert material_index.match_recipes_with_all_materials(["감자"], 0, 10) == ([3], 1)
+    await material_index.refresh_material_index(recipe_session)
+    assert material_index.match_recipes_with_all_materials(["감자"], 0, 10) == ([3, 7], 2)
+    assert material_index.match_recipes_with_all_materials(["당근"], 0, 10) == ([7], 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(10)
+async def test_ingredient_search_uses_index_and_matches_sql_fallback(recipe_session, query_recorder):
+    from services.recipe.crud.recipe_search_crud import recommend_by_recipe_pgvector_v2, search_recipes_with_pagination
+
+    fallback = await search_recipes_with_pagination(
+        mariadb=recipe_session, method="ingredient", recipe="양파, 대파", page=1, size=3,
+    )
+    await material_index.refresh_material_index(recipe_session)
+
+    before = len(query_recorder.statements)
+    indexed = await search_recipes_with_pagination(
+        mariadb=recipe_session, method="ingredient", recipe="양파, 대파", page=1, size=3,
+    )
+    statements = query_recorder.statements[before:]
+    assert len(statements) == 1 and "FCT_MTRL" not in statements[0]
+
+    assert [r["recipe_id"] for r in indexed[0]] == [r["recipe_id"] for r in fallback[0]] == [1, 2, 6]
+    assert indexed[1:] == fallback[1:] == (3, False)
+
+    records = await recommend_by_recipe_pgvector_v2(
+        mariadb=recipe_session, postgres=None, query="양파,대파", method="ingredient", page=2, size=2,
+    )
+    assert [r["RECIPE_ID"] for r in records] == [6]
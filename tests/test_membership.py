@@ -0,0 +1,200 @@
+"""
+사용자별 찜/장바구니 멤버십 집합 단위 테스트
+1. get_memberships — 미적재 종류만 UNION 쿼리 1회로 적재, 이후 Redis 만 조회 / 목록 일괄 표시
+2. write-through — 찜 토글/장바구니 추가·삭제를 커밋 후 반영, 롤백 시 미반영
+3. 찜 토글 — 유니크 키 기준 단일 INSERT/DELETE, 중복 행 없음
+4. 표시 멤버 없는 부분 집합은 재적재, Redis 미연결 시 DB 결과 사용
+"""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+
+from common.cache import membership
+from common.cache.membership import HS_CART, HS_LIKE, KOK_CART, KOK_LIKE
+from common.database.after_commit import drain_after_commit_tasks
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        def op(*args):
+            self.ops.append((name, args))
+            return self
+        return op
+
+    async def execute(self):
+        return [getattr(self.redis, name)(*args) for name, args in self.ops]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.sets = {}
+        self.ttl = {}
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(str(m) for m in members)
+
+    def srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(str(m) for m in members)
+
+    def delete(self, key):
+        self.sets.pop(key, None)
+
+    def expire(self, key, ttl):
+        self.ttl[key] = ttl
+
+
+class _FakeCache:
+    def __init__(self, client):
+        self.client = client
+
+    async def get_client(self):
+        return self.client
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(membership, "_cache", _FakeCache(redis))
+    return redis
+
+
+@pytest_asyncio.fixture
+async def member_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import services.homeshopping.models.core_model  # noqa: F401  (관계 대상 매퍼)
+    import services.order.models.homeshopping.hs_order_model  # noqa: F401
+    import services.order.models.kok.kok_order_model  # noqa: F401
+    import services.order.models.order_base_model  # noqa: F401
+    import services.recipe.models.core_model  # noqa: F401
+    from services.homeshopping.models.interaction_model import HomeshoppingCart, HomeshoppingLikes
+    from services.kok.models.interaction_model import KokCart, KokLikes
+    from services.kok.models.product_model import KokPriceInfo, KokProductInfo
+
+    tables = (KokProductInfo, KokPriceInfo, KokLikes, KokCart, HomeshoppingLikes, HomeshoppingCart)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.__table__.create(sync_conn) for t in tables])
+
+    now = datetime.now()
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    session.add_all([KokProductInfo(kok_product_id=pid, kok_product_name=f"상품{pid}") for pid in (1, 2, 3)])
+    session.add_all([KokPriceInfo(kok_product_id=pid, kok_discounted_price=1000) for pid in (1, 2, 3)])
+    session.add_all([
+        KokLikes(user_id=7, kok_product_id=1, kok_created_at=now),
+        KokCart(user_id=7, kok_product_id=2, kok_quantity=1, kok_price_id=2, kok_created_at=now),
+        HomeshoppingLikes(user_id=7, live_id=50, homeshopping_like_created_at=now),
+        HomeshoppingCart(user_id=7, product_id=500, quantity=1, created_at=now),
+        KokLikes(user_id=8, kok_product_id=3, kok_created_at=now),
+    ])
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(5)
+async def test_memberships_load_once_then_served_from_redis(member_session, fake_redis, query_recorder):
+    sets = await membership.get_memberships(member_session, 7, [KOK_LIKE, KOK_CART, HS_LIKE, HS_CART])
+    assert sets == {KOK_LIKE: {1}, KOK_CART: {2}, HS_LIKE: {50}, HS_CART: {500}}
+    assert query_recorder.count == 1
+
+    products = [{"kok_product_id": pid} for pid in (1, 2, 3)]
+    await membership.annotate_memberships(
+        member_session, 7, products, id_key="kok_product_id", like_kind=KOK_LIKE, cart_kind=KOK_CART,
+    )
+    assert [(p["is_liked"], p["is_in_cart"]) for p in products] == [(True, False), (False, True), (False, False)]
+    assert query_recorder.count == 1  # Redis 만 조회
+
+    anonymous = await membership.annotate_memberships(
+        member_session, None, [{"kok_product_id": 1}], id_key="kok_product_id", like_kind=KOK_LIKE,
+    )
+    assert anonymous == [{"kok_product_id": 1, "is_liked": False}]
+    with pytest.raises(ValueError):
+        await membership.get_memberships(member_session, 7, ["unknown"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(30)
+async def test_writes_apply_after_commit_only(member_session, fake_redis, query_recorder):
+    from services.kok.crud.cart_crud import add_kok_cart
+    from services.kok.crud.likes_crud import toggle_kok_likes
+
+    await membership.get_memberships(member_session, 7, [KOK_LIKE, KOK_CART])
+
+    # 롤백된 변경은 반영하지 않음
+    assert await toggle_kok_likes(member_session, 7, 2) is True
+    await member_session.rollback()
+    await drain_after_commit_tasks()
+    assert (await membership.get_memberships(member_session, 7, [KOK_LIKE]))[KOK_LIKE] == {1}
+
+    # 커밋된 변경은 DB 재적재 없이 집합에 반영
+    assert await toggle_kok_likes(member_session, 7, 1) is False
+    assert await toggle_kok_likes(member_session, 7, 3) is True
+    await add_kok_cart(member_session, 7, 3)
+    assert (await membership.get_memberships(member_session, 7, [KOK_LIKE]))[KOK_LIKE] == {1}  # 커밋 전
+    await member_session.commit()
+    await drain_after_commit_tasks()
+
+    before = query_recorder.count
+    sets = await membership.get_memberships(member_session, 7, [KOK_LIKE, KOK_CART])
+    assert sets == {KOK_LIKE: {3}, KOK_CART: {2, 3}}
+    assert query_recorder.count == before
+
+
+@pytest.mark.asyncio
+async def test_partial_set_is_reloaded_and_redis_outage_uses_db(member_session, fake_redis, monkeypatch):
+    # 적재 전에 write-through 로 생긴 부분 집합(표시 멤버 없음)은 무시하고 재적재
+    fake_redis.sadd("membership:v1:kok_like:user:8", 9)
+    assert (await membership.get_memberships(member_session, 8, [KOK_LIKE]))[KOK_LIKE] == {3}
+    assert fake_redis.sets["membership:v1:kok_like:user:8"] == {"*", "3"}
+
+    monkeypatch.setattr(membership, "_cache", _FakeCache(None))
+    assert await membership.get_memberships(member_session, 7, [HS_LIKE, KOK_CART]) == {HS_LIKE: {50}, KOK_CART: {2}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(10)
+async def test_like_toggle_single_statement_without_duplicates(member_session, fake_redis, query_recorder):
+    from sqlalchemy import func, select
+
+    from common.database.upsert import insert_if_absent
+    from services.homeshopping.crud.likes_crud import toggle_homeshopping_likes
+    from services.homeshopping.models.interaction_model import HomeshoppingLikes
+    from services.kok.crud.likes_crud import toggle_kok_likes
+    from services.kok.models.interaction_model import KokLikes
+
+    # 등록은 INSERT 1회, 해제는 INSERT(무시) + DELETE 2회
+    before = query_recorder.count
+    assert await toggle_kok_likes(member_session, 7, 2) is True
+    assert query_recorder.count - before == 1
+    assert await toggle_kok_likes(member_session, 7, 2) is False
+    assert query_recorder.count - before == 3
+    assert await toggle_homeshopping_likes(member_session, 7, 50) is False
+
+    # 유니크 키 충돌은 오류 없이 무시
+    values = {KokLikes.user_id: 7, KokLikes.kok_product_id: 1, KokLikes.kok_created_at: datetime.now()}
+    assert await insert_if_absent(member_session, KokLikes, values) is None
+    await member_session.commit()
+    await drain_after_commit_tasks()
+
+    count = select(func.count()).select_from(KokLikes).where(KokLikes.user_id == 7)
+    assert (await member_session.execute(count)).scalar_one() == 1
+    hs_count = select(func.count()).select_from(HomeshoppingLikes).where(HomeshoppingLikes.user_id == 7)
+    assert (await member_session.execute(hs_count)).scalar_one() == 0
+    assert await membership.get_memberships(member_session, 7, [KOK_LIKE, HS_LIKE]) == {KOK_LIKE: {1}, HS_LIKE: set()}
@@ -0,0 +1,131 @@
+"""
+메트릭 레이어 단위 테스트
+1. Histogram/Counter 렌더링 — Prometheus 텍스트 포맷
+2. instrument_engine — SQL 실행 시간/요청당 쿼리 수/풀 체크아웃 대기 기록
+3. MetricsMiddleware — 라우트 템플릿 라벨로 요청 지연/SQL 통계 기록
+"""
+
+import pytest
+from fastapi import FastAPI
+
+from common.metrics import (
+    MetricsRegistry,
+    db_pool_checkout_seconds,
+    db_query_duration_seconds,
+    get_request_db_stats,
+    http_requests_total,
+    instrument_engine,
+    render_metrics,
+    request_db_queries,
+    reset_request_db_stats,
+    start_request_db_stats,
+)
+from common.metrics_middleware import UNMATCHED_ROUTE, MetricsMiddleware
+
+
+async def _asgi_get(app, path):
+    """httpx 없이 ASGI 앱에 GET 요청 1건을 보내고 (status, body) 반환."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    status = next(m["status"] for m in messages if m["type"] == "http.response.start")
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return status, body
+
+
+def test_histogram_renders_cumulative_buckets():
+    reg = MetricsRegistry()
+    hist = reg.histogram("t_latency_seconds", "테스트", ("route",), buckets=(0.1, 1.0))
+    hist.observe(0.05, route="/a")
+    hist.observe(0.5, route="/a")
+    hist.observe(5.0, route="/a")
+    reg.counter("t_total", "테스트", ("route",)).inc(route="/a")
+
+    text = reg.render()
+    assert '# TYPE t_latency_seconds histogram' in text
+    assert 't_latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 't_latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 't_latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 't_latency_seconds_count{route="/a"} 3' in text
+    assert 't_total{route="/a"} 1' in text
+
+
+def test_metric_label_mismatch_raises():
+    reg = MetricsRegistry()
+    counter = reg.counter("t_mismatch_total", "테스트", ("route",))
+    with pytest.raises(ValueError):
+        counter.inc(path="/a")
+
+
+@pytest.mark.asyncio
+async def test_instrument_engine_records_sql_per_request():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine("test_sqlite", engine)
+    instrument_engine("test_sqlite", engine)  # 중복 계측은 무시
+
+    before_queries = db_query_duration_seconds.get_count(engine="test_sqlite")
+    stats, token = start_request_db_stats()
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+        assert get_request_db_stats() is stats
+    finally:
+        reset_request_db_stats(token)
+        await engine.dispose()
+
+    assert stats.query_count == 2
+    assert stats.sql_seconds > 0
+    assert db_query_duration_seconds.get_count(engine="test_sqlite") - before_queries == 2
+    assert db_pool_checkout_seconds.get_count(engine="test_sqlite") >= 1
+    assert get_request_db_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_metrics_middleware_uses_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    before = http_requests_total.get(method="GET", route="/items/{item_id}", status="200")
+    before_db = request_db_queries.get_count(method="GET", route="/items/{item_id}")
+
+    for item_id in (1, 2, 3):
+        status, _ = await _asgi_get(app, f"/items/{item_id}")
+        assert status == 200
+    await _asgi_get(app, "/no-such-path")
+
+    assert http_requests_total.get(method="GET", route="/items/{item_id}", status="200") - before == 3
+    assert request_db_queries.get_count(method="GET", route="/items/{item_id}") - before_db == 3
+    assert http_requests_total.get(method="GET", route=UNMATCHED_ROUTE, status="404") >= 1
+
+    text = render_metrics()
+    assert 'uhok_http_request_duration_seconds_bucket{method="GET",route="/items/{item_id}"' in text
+    assert "/items/1" not in text
@@ -0,0 +1,144 @@
+"""
+ML 배치 벡터 검색 단위 테스트 (로컬 스텁 서버 + 실제 httpx)
+1. find_similar_ids_batch — 여러 질의를 /api/v1/search/batch 1회로 요청, 질의 순서대로 결과
+2. 캐시된 질의는 배치에서 제외, 배치 결과는 단건 검색에서도 재사용
+3. 배치 미지원(404) 서비스 — 단건 호출 병렬 실행으로 전환
+"""
+
+import importlib
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_asyncio
+
+from common.circuit_breaker import CircuitBreaker
+from services.recipe.utils import ml_search_cache, remote_ml_adapter
+
+# 스텁 ML 서비스의 질의별 순위 (거리 = 순위 / 10)
+CATALOG = {
+    "양파": [11, 12, 13, 14],
+    "대파": [21, 22, 11],
+    "김치찌개": [31, 32, 33, 34, 35],
+}
+
+
+def _rank(query, top_k, exclude_ids):
+    excluded = set(exclude_ids or [])
+    ids = [rid for rid in CATALOG.get(query, []) if rid not in excluded][:top_k]
+    return [{"recipe_id": rid, "distance": (i + 1) / 10} for i, rid in enumerate(ids)]
+
+
+class _StubMLHandler(BaseHTTPRequestHandler):
+    """uhok-ml-inference 검색 API 계약 스텁 (/api/v1/search, /api/v1/search/batch)"""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, body))
+        if self.path == "/api/v1/search":
+            self._reply(200, {"results": _rank(body["query"], body["top_k"], body.get("exclude_ids"))})
+        elif self.path == "/api/v1/search/batch" and self.server.batch_enabled:
+            self._reply(200, {"results": [
+                {"query": q, "results": _rank(q, body["top_k"], body.get("exclude_ids"))} for q in body["queries"]
+            ]})
+        else:
+            self._reply(404, {"detail": "Not Found"})
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get_json(self, key):
+        return self.store.get(key)
+
+    async def set_json(self, key, data, ttl, **kwargs):
+        self.store[key] = data
+        return True
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubMLHandler)
+    server.requests = []
+    server.batch_enabled = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def real_httpx():
+    """conftest 의 httpx 스텁 대신 실제 httpx 사용 (테스트 종료 후 스텁 복원)"""
+    stub = sys.modules.pop("httpx")
+    try:
+        module = importlib.import_module("httpx")
+    except ImportError:
+        sys.modules["httpx"] = stub
+        pytest.skip("httpx 미설치")
+    yield module
+    sys.modules["httpx"] = stub
+
+
+@pytest_asyncio.fixture
+async def adapter(stub_server, real_httpx, monkeypatch):
+    monkeypatch.setattr(remote_ml_adapter, "httpx", real_httpx)
+    monkeypatch.setattr(remote_ml_adapter, "_client", None)
+    monkeypatch.setattr(remote_ml_adapter, "_batch_supported", True)
+    monkeypatch.setattr(remote_ml_adapter, "ML_INFERENCE_URL", f"http://127.0.0.1:{stub_server.server_port}")
+    monkeypatch.setattr(remote_ml_adapter, "ml_circuit_breaker", CircuitBreaker("ml_batch_test"))
+    monkeypatch.setattr(ml_search_cache, "_redis", _FakeRedis())
+    ml_search_cache.clear_ml_search_cache()
+    yield remote_ml_adapter.RemoteMLAdapter()
+    await remote_ml_adapter.close_ml_client()
+    ml_search_cache.clear_ml_search_cache()
+
+
+@pytest.mark.asyncio
+async def test_batch_search_uses_one_round_trip(adapter, stub_server):
+    results = await adapter.find_similar_ids_batch(None, ["양파", "대파", " 양파 ", "없는재료"], top_k=2)
+
+    assert results == [[(11, 0.1), (12, 0.2)], [(21, 0.1), (22, 0.2)], [(11, 0.1), (12, 0.2)], []]
+    assert [path for path, _ in stub_server.requests] == ["/api/v1/search/batch"]
+    assert stub_server.requests[0][1]["queries"] == ["양파", "대파", "없는재료"]
+
+    # 캐시된 질의는 빼고 미스 질의만 배치로 요청
+    results = await adapter.find_similar_ids_batch(None, ["대파", "김치찌개"], top_k=3, exclude_ids=[])
+    assert results[1] == [(31, 0.1), (32, 0.2), (33, 0.3)]
+    assert stub_server.requests[-1][1]["queries"] == ["김치찌개"]
+
+    # 배치 결과는 단건 검색에서도 재사용
+    assert await adapter.find_similar_ids(None, "양파", top_k=1) == [(11, 0.1)]
+    assert len(stub_server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_falls_back_to_single_calls_when_unsupported(adapter, stub_server):
+    stub_server.batch_enabled = False
+
+    results = await adapter.find_similar_ids_batch(None, ["양파", "대파"], top_k=2, exclude_ids=[11])
+    assert results == [[(12, 0.1), (13, 0.2)], [(21, 0.1), (22, 0.2)]]
+    assert sorted(path for path, _ in stub_server.requests) == [
+        "/api/v1/search", "/api/v1/search", "/api/v1/search/batch",
+    ]
+    assert remote_ml_adapter._batch_supported is False
+    assert remote_ml_adapter.ml_circuit_breaker.state == "closed"
+
+    # 이후 배치 요청은 바로 단건 호출
+    await adapter.find_similar_ids_batch(None, ["김치찌개"], top_k=2)
+    assert stub_server.requests[-1][0] == "/api/v1/search"
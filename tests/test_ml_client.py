@@ -0,0 +1,209 @@
+"""
+ML Inference 호출 클라이언트 단위 테스트
+1. CircuitBreaker — 연속 실패 임계치에서 open, reset_timeout 후 half_open 시험 호출 1건, 성공 시 closed
+   · 시험 호출이 취소되면 슬롯 반납 (half_open 고착 없음)
+2. RemoteMLAdapter — 풀링 클라이언트 재사용, 서킷 open 시 호출 없이 즉시 실패 + 지연 히스토그램 기록
+3. recommend_by_recipe_pgvector_v2 — 서킷 open 중에는 제목 검색 결과만 반환
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from common.circuit_breaker import CircuitBreaker, CircuitOpenError
+from common.metrics import ml_request_duration_seconds
+from services.recipe.utils import ml_search_cache, remote_ml_adapter
+
+
+class _Timeout(Exception):
+    pass
+
+
+class _HTTPStatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.response = SimpleNamespace(status_code=status_code, text="")
+
+
+class _Response:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+class _FakeClient:
+    """httpx.AsyncClient 대역 (conftest 가 httpx 를 MagicMock 으로 대체하므로 직접 구성)"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.posts = 0
+
+    async def post(self, url, json=None):
+        self.posts += 1
+        if self.fail:
+            raise _Timeout("timed out")
+        return _Response({"results": [{"recipe_id": 7, "distance": 0.1}]})
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get_json(self, key):
+        return self.store.get(key)
+
+    async def set_json(self, key, data, ttl, **kwargs):
+        self.store[key] = data
+        return True
+
+
+@pytest.fixture
+def ml_client(monkeypatch):
+    monkeypatch.setattr(ml_search_cache, "_redis", _FakeRedis())
+    ml_search_cache.clear_ml_search_cache()
+    client = _FakeClient()
+    fake_httpx = SimpleNamespace(TimeoutException=_Timeout, HTTPStatusError=_HTTPStatusError)
+    monkeypatch.setattr(remote_ml_adapter, "httpx", fake_httpx)
+    monkeypatch.setattr(remote_ml_adapter, "_client", client)
+    monkeypatch.setattr(remote_ml_adapter, "ML_INFERENCE_URL", "http://ml-inference:8001")
+    monkeypatch.setattr(remote_ml_adapter, "ML_RETRIES", 0)
+    breaker = CircuitBreaker("ml_inference_test", failure_threshold=2, reset_timeout=60)
+    monkeypatch.setattr(remote_ml_adapter, "ml_circuit_breaker", breaker)
+    return client, breaker
+
+
+def test_circuit_breaker_transitions():
+    now = [0.0]
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=10, clock=lambda: now[0])
+
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # reset_timeout 경과: 시험 호출 1건만 허용, 실패하면 다시 open
+    now[0] = 10.0
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 20.0
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "closed"  # 성공 시 연속 실패 수 초기화
+
+
+@pytest.mark.asyncio
+async def test_adapter_reuses_client_and_fails_fast_when_open(ml_client):
+    client, breaker = ml_client
+    adapter = remote_ml_adapter.RemoteMLAdapter()
+
+    assert await adapter.find_similar_ids(None, "김치찌개", top_k=3) == [(7, 0.1)]
+    assert await adapter.find_similar_ids(None, "된장국", top_k=3) == [(7, 0.1)]
+    assert remote_ml_adapter.get_ml_client() is client and client.posts == 2
+
+    client.fail = True
+    for query in ("순두부찌개", "부대찌개"):
+        with pytest.raises(_Timeout):
+            await adapter.find_similar_ids(None, query, top_k=3)
+    assert breaker.state == "open"
+
+    open_before = ml_request_duration_seconds.get_count(endpoint="search", result="circuit_open")
+    with pytest.raises(CircuitOpenError):
+        await adapter.find_similar_ids(None, "청국장", top_k=3)
+    assert client.posts == 4  # open 중에는 요청하지 않음
+    assert ml_request_duration_seconds.get_count(endpoint="search", result="circuit_open") == open_before + 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_call_releases_half_open_slot(ml_client):
+    client, breaker = ml_client
+    adapter = remote_ml_adapter.RemoteMLAdapter()
+    breaker.reset_timeout = 0
+    breaker.reset("open")
+
+    started, hang = asyncio.Event(), asyncio.Event()
+    ok_post = client.post
+
+    async def hanging_post(url, json=None):
+        started.set()
+        await hang.wait()
+
+    client.post = hanging_post
+    trial = asyncio.create_task(adapter.find_similar_ids(None, "김치찌개", top_k=3))
+    await started.wait()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # 시험 호출 진행 중
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    # 취소된 시험 호출은 결과를 남기지 않음: 다음 요청이 새 시험 호출로 통과해 closed
+    assert breaker.state == "half_open"
+    client.post = ok_post
+    assert await adapter.find_similar_ids(None, "된장국", top_k=3) == [(7, 0.1)]
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_close_ml_client_releases_pool(monkeypatch):
+    closed = []
+
+    class _Closable:
+        async def aclose(self):
+            closed.append(True)
+
+    monkeypatch.setattr(remote_ml_adapter, "_client", _Closable())
+    await remote_ml_adapter.close_ml_client()
+    assert closed == [True] and remote_ml_adapter._client is None
+
+
+@pytest_asyncio.fixture
+async def recipe_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from services.recipe.models.core_model import Material, Recipe
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.create(sync_conn) for t in (Recipe.__table__, Material.__table__)])
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    for rid, name in [(1, "김치찌개"), (2, "된장국")]:
+        session.add(Recipe(recipe_id=rid, recipe_title=f"{name} 만들기", cooking_name=name, scrap_count=rid))
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_recommend_returns_title_matches_while_circuit_open(recipe_session, ml_client):
+    from services.recipe.crud.recipe_search_crud import recommend_by_recipe_pgvector_v2
+
+    client, breaker = ml_client
+    breaker.reset(state="open")
+
+    records = await recommend_by_recipe_pgvector_v2(
+        mariadb=recipe_session, postgres=None, query="김치찌개", page=1, size=5,
+        vector_searcher=remote_ml_adapter.RemoteMLAdapter(),
+    )
+    assert [r["RECIPE_ID"] for r in records] == [1]
+    assert client.posts == 0
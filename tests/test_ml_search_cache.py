@@ -0,0 +1,104 @@
+"""
+ML 벡터 검색 결과 캐시 단위 테스트
+1. 동시 동일 질의 — ML 호출 1회로 병합
+2. 넓은 top_k 결과가 좁은 top_k / 더 많은 exclude 요청을 충족, 부족하면 재호출
+3. 프로세스 캐시가 비어도 Redis 계층에서 재사용, 호출 실패는 캐시하지 않음
+"""
+
+import asyncio
+
+import pytest
+
+from services.recipe.utils import ml_search_cache
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get_json(self, key):
+        return self.store.get(key)
+
+    async def set_json(self, key, data, ttl, **kwargs):
+        self.store[key] = data
+        return True
+
+
+class _FakeML:
+    """ID 1..total 을 거리순으로 반환하는 ML 검색 대역"""
+
+    def __init__(self, total=100, delay=0.0):
+        self.total = total
+        self.delay = delay
+        self.calls = []
+        self.fail = False
+
+    async def __call__(self, query, top_k, exclude_ids):
+        self.calls.append((query, top_k, exclude_ids))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("ml down")
+        excluded = set(exclude_ids or [])
+        ids = [rid for rid in range(1, self.total + 1) if rid not in excluded][:top_k]
+        return [(rid, rid / 100) for rid in ids]
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(ml_search_cache, "_redis", redis)
+    ml_search_cache.clear_ml_search_cache()
+    yield redis
+    ml_search_cache.clear_ml_search_cache()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_call():
+    ml = _FakeML(delay=0.01)
+    results = await asyncio.gather(*[
+        ml_search_cache.cached_similar_ids(query, 5, None, ml)
+        for query in ["김치찌개", " 김치찌개 ", "김치찌개", "김치  찌개"]
+    ])
+
+    assert results[0] == results[1] == results[2] == [(rid, rid / 100) for rid in range(1, 6)]
+    # 공백만 다른 질의는 같은 키, 단어 사이 공백은 정규화 후 다른 질의
+    assert [call[0] for call in ml.calls] == ["김치찌개", "김치 찌개"]
+    assert ml.calls[0][1] == ml_search_cache.ML_SEARCH_MIN_FETCH_TOP_K
+
+
+@pytest.mark.asyncio
+async def test_wider_result_serves_narrower_requests():
+    ml = _FakeML()
+    await ml_search_cache.cached_similar_ids("된장국", 40, None, ml)
+
+    assert await ml_search_cache.cached_similar_ids("된장국", 3, None, ml) == [(1, 0.01), (2, 0.02), (3, 0.03)]
+    narrowed = await ml_search_cache.cached_similar_ids("된장국", 3, [1, 3], ml)
+    assert [rid for rid, _ in narrowed] == [2, 4, 5]
+    assert len(ml.calls) == 1
+
+    # 캐시 결과로 부족한 요청은 재호출
+    await ml_search_cache.cached_similar_ids("된장국", 60, None, ml)
+    assert [call[1] for call in ml.calls] == [40, 60]
+
+    # 결과가 끝까지 받은 목록이면 더 큰 top_k 도 충족
+    small = _FakeML(total=4)
+    assert len(await ml_search_cache.cached_similar_ids("청국장", 5, None, small)) == 4
+    assert len(await ml_search_cache.cached_similar_ids("청국장", 50, None, small)) == 4
+    assert len(small.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_and_failures(fake_redis):
+    ml = _FakeML()
+    await ml_search_cache.cached_similar_ids("Tomato Pasta", 5, None, ml)
+    assert len(fake_redis.store) == 1
+
+    ml_search_cache.clear_ml_search_cache()  # 다른 워커 상황
+    assert len(await ml_search_cache.cached_similar_ids("tomato pasta", 5, None, ml)) == 5
+    assert len(ml.calls) == 1
+
+    ml.fail = True
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await ml_search_cache.cached_similar_ids("감자조림", 5, None, ml)
+    assert len(ml.calls) == 3
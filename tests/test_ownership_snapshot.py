@@ -0,0 +1,150 @@
+"""
+사용자 식재료 보유 스냅샷 단위 테스트
+1. build_ownership_snapshot — 주문(최근 7일, 취소 제외)/장바구니를 UNION 쿼리 1회로 인덱싱
+2. get_ownership_snapshot — 캐시 적중 시 쿼리 없음, 무효화 후 재구성
+3. 장바구니 변경 — 커밋 후에만 스냅샷 무효화 (롤백 시 유지)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from services.recipe.utils import ownership_snapshot
+from services.recipe.utils.ingredient_matcher import IngredientStatusMatcher
+
+VOCAB = frozenset({"양파", "대파", "감자", "고춧가루", "두부"})
+
+
+class _FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get_json(self, key):
+        return self.store.get(key)
+
+    async def set_json(self, key, data, ttl, **kwargs):
+        self.store[key] = data
+        return True
+
+    async def delete_key(self, key):
+        return 1 if self.store.pop(key, None) is not None else 0
+
+
+@pytest.fixture(autouse=True)
+def fake_cache(monkeypatch):
+    cache = _FakeCache()
+    monkeypatch.setattr(ownership_snapshot, "_cache", cache)
+
+    async def _vocab():
+        return VOCAB
+
+    monkeypatch.setattr(ownership_snapshot, "aget_ing_vocab", _vocab)
+    return cache
+
+
+@pytest_asyncio.fixture
+async def order_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import services.recipe.models.core_model  # noqa: F401  (FK 대상 테이블 메타데이터)
+    from services.homeshopping.models.core_model import HomeshoppingList, HomeshoppingProductInfo
+    from services.homeshopping.models.interaction_model import HomeshoppingCart
+    from services.kok.models.interaction_model import KokCart
+    from services.kok.models.product_model import KokPriceInfo, KokProductInfo
+    from services.order.models.homeshopping.hs_order_model import HomeShoppingOrder
+    from services.order.models.kok.kok_order_model import KokOrder
+    from services.order.models.order_base_model import Order
+
+    tables = [
+        Order.__table__, KokProductInfo.__table__, KokPriceInfo.__table__, KokOrder.__table__,
+        HomeshoppingProductInfo.__table__, HomeshoppingList.__table__, HomeShoppingOrder.__table__,
+        KokCart.__table__, HomeshoppingCart.__table__,
+    ]
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.create(sync_conn) for t in tables])
+
+    now = datetime.now()
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    for pid, name in [(1, "농협 국산 양파 3kg"), (2, "농협 대파 1단"), (3, "강원 감자 2kg"), (4, "청정원 고춧가루 500g")]:
+        session.add(KokProductInfo(kok_product_id=pid, kok_product_name=name, kok_product_price=1000))
+    session.add(HomeshoppingList(live_id=1, product_id=100, product_name="풀무원 국산콩 두부 3입"))
+    session.add_all([
+        Order(order_id=1, user_id=1, order_time=now - timedelta(days=1)),
+        Order(order_id=2, user_id=1, order_time=now - timedelta(days=1), cancel_time=now),
+        Order(order_id=3, user_id=1, order_time=now - timedelta(days=8)),
+        Order(order_id=4, user_id=1, order_time=now - timedelta(days=2)),
+        Order(order_id=5, user_id=2, order_time=now - timedelta(days=1)),
+    ])
+    session.add_all([
+        KokOrder(order_id=1, kok_price_id=1, kok_product_id=1, quantity=1),
+        KokOrder(order_id=2, kok_price_id=1, kok_product_id=2, quantity=1),
+        KokOrder(order_id=3, kok_price_id=1, kok_product_id=3, quantity=1),
+        KokOrder(order_id=5, kok_price_id=1, kok_product_id=3, quantity=1),
+        HomeShoppingOrder(order_id=4, product_id=100, dc_price=3000, quantity=1),
+        KokCart(user_id=1, kok_product_id=4, kok_price_id=1, kok_quantity=2, kok_created_at=now),
+    ])
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_indexes_recent_orders_and_cart(order_session):
+    index = await ownership_snapshot.build_ownership_snapshot(order_session, user_id=1)
+
+    ingredients, summary = IngredientStatusMatcher().classify(
+        ["양파", "두부", "고춧가루", "대파", "감자"], index
+    )
+    status = {i["material_name"]: i["status"] for i in ingredients}
+    # 취소된 주문(대파)과 7일 이전 주문(감자), 다른 사용자 주문은 보유로 보지 않음
+    assert status == {"양파": "owned", "두부": "owned", "고춧가루": "cart", "대파": "not_owned", "감자": "not_owned"}
+    assert summary["owned_count"] == 2
+    by_name = {i["material_name"]: i for i in ingredients}
+    assert by_name["두부"]["order_info"]["order_type"] == "homeshopping"
+    assert by_name["고춧가루"]["cart_info"]["quantity"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(2)
+async def test_snapshot_is_cached_until_invalidated(order_session, query_recorder, fake_cache):
+    first = await ownership_snapshot.get_ownership_snapshot(order_session, user_id=1)
+    second = await ownership_snapshot.get_ownership_snapshot(order_session, user_id=1)
+    assert query_recorder.count == 1
+    assert second.orders.keys() == first.orders.keys()
+    assert second.carts == first.carts
+
+    await ownership_snapshot.invalidate_ownership_snapshot(1)
+    assert fake_cache.store == {}
+    await ownership_snapshot.get_ownership_snapshot(order_session, user_id=1)
+    assert query_recorder.count == 2
+
+
+@pytest.mark.asyncio
+async def test_cart_change_invalidates_snapshot_after_commit(order_session, fake_cache):
+    from sqlalchemy import select
+
+    from common.database.after_commit import drain_after_commit_tasks
+    from services.kok.crud.cart_crud import update_kok_cart_quantity
+    from services.kok.models.interaction_model import KokCart
+
+    cart_id = (await order_session.execute(select(KokCart.kok_cart_id))).scalar_one()
+    await ownership_snapshot.get_ownership_snapshot(order_session, user_id=1)
+    assert fake_cache.store
+
+    # 커밋 전에는 그대로, 롤백되면 무효화하지 않음
+    await update_kok_cart_quantity(order_session, 1, cart_id, 5)
+    await drain_after_commit_tasks()
+    assert fake_cache.store
+    await order_session.rollback()
+    await drain_after_commit_tasks()
+    assert fake_cache.store
+
+    await update_kok_cart_quantity(order_session, 1, cart_id, 5)
+    await order_session.commit()
+    await drain_after_commit_tasks()
+    assert fake_cache.store == {}
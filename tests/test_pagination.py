@@ -0,0 +1,81 @@
+"""
+키셋(커서) 페이지네이션 단위 테스트
+1. 커서 인코딩/디코딩 — datetime 왕복, 잘못된 커서는 400
+2. get_kok_search_history — 같은 시각 행이 섞여도 커서로 이어 읽은 결과가 OFFSET 전체 순서와 일치
+"""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+
+from common.pagination import (
+    InvalidCursorError,
+    build_next_cursor,
+    decode_cursor,
+    encode_cursor,
+    parse_cursor_param,
+)
+
+
+@pytest_asyncio.fixture
+async def history_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from services.kok.models.interaction_model import KokSearchHistory
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(KokSearchHistory.__table__.create)
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    # 같은 시각(분 단위)에 여러 검색 → ID로 순서가 고정되어야 함
+    for i in range(8):
+        session.add(KokSearchHistory(user_id=1, kok_keyword=f"키워드{i}", kok_searched_at=datetime(2025, 1, 1, 12, i // 3)))
+    session.add(KokSearchHistory(user_id=2, kok_keyword="다른 사용자", kok_searched_at=datetime(2025, 1, 1, 12, 0)))
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+def test_cursor_roundtrip_and_invalid_cursor():
+    cursor = encode_cursor(datetime(2025, 3, 1, 9, 30, 15, 123), 42)
+    assert decode_cursor(cursor) == (datetime(2025, 3, 1, 9, 30, 15, 123), 42)
+    assert parse_cursor_param(None) is None
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(1, 2, 3))
+    with pytest.raises(HTTPException) as exc_info:
+        parse_cursor_param("%%%")
+    assert exc_info.value.status_code == 400
+
+
+def test_build_next_cursor_only_for_full_page():
+    rows = [{"t": datetime(2025, 1, 1), "id": 3}, {"t": datetime(2025, 1, 1), "id": 2}]
+    assert build_next_cursor(rows, 3, lambda r: (r["t"], r["id"])) is None
+    assert decode_cursor(build_next_cursor(rows, 2, lambda r: (r["t"], r["id"]))) == (datetime(2025, 1, 1), 2)
+
+
+@pytest.mark.asyncio
+async def test_kok_search_history_cursor_pages_match_full_order(history_session):
+    from services.kok.crud.search_crud import get_kok_search_history
+
+    full = await get_kok_search_history(history_session, user_id=1, limit=100)
+    assert len(full) == 8
+
+    paged, after = [], None
+    while True:
+        page = await get_kok_search_history(history_session, user_id=1, limit=3, cursor=after)
+        paged.extend(page)
+        next_cursor = build_next_cursor(page, 3, lambda h: (h["kok_searched_at"], h["kok_history_id"]))
+        if next_cursor is None:
+            break
+        after = decode_cursor(next_cursor)
+
+    assert [h["kok_history_id"] for h in paged] == [h["kok_history_id"] for h in full]
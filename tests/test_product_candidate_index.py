@@ -0,0 +1,148 @@
+"""
+식재료 → 추천 상품 후보 인덱스 단위 테스트
+1. rank_products — 오른쪽 경계 규칙, EXCLUDE_CONTAINS 금지어, LOCATE → 길이 순위
+2. recommend_for_ingredient — 카탈로그 1회 적재 후 식재료별 상세 조회만 수행, 신규 상품 증분 반영
+3. 후보 목록 길이 — 호출측 요청 수가 기본 후보 수보다 크면 그만큼 계산
+4. 콕 상세 — 가격 행이 여러 개면 최신 가격(KOK_PRICE_ID 최대) 사용
+"""
+
+import pytest
+import pytest_asyncio
+
+from services.recipe.utils import product_candidate_index
+from services.recipe.utils.product_candidate_index import rank_products
+
+
+def test_rank_products_applies_boundary_exclude_and_order():
+    products = [
+        (1, "국산 양파 3kg"),
+        (2, "양파"),
+        (3, "양파링 과자"),        # 오른쪽 경계 위반 (뒤에 한글)
+        (4, "아몬드 양파 크래커"),  # '양파' 금지어 '아몬드'
+        (5, "햇 양 파"),            # 공백 제거 버전으로 일치 (LOCATE 0 → 마지막)
+        (6, "Onion 양파즙"),        # 경계 위반
+    ]
+    assert [key[2] for key in rank_products("양파", products)] == [2, 1, 5]
+
+    # 대소문자 무시 (MariaDB 기본 콜레이션과 동일)
+    assert [key[2] for key in rank_products("onion", [(1, "ONION powder"), (2, "onions")])] == [1]
+
+
+@pytest_asyncio.fixture
+async def catalog_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import services.homeshopping.models.interaction_model  # noqa: F401  (관계 대상 매퍼)
+    import services.kok.models.interaction_model  # noqa: F401
+    import services.order.models.homeshopping.hs_order_model  # noqa: F401
+    import services.order.models.kok.kok_order_model  # noqa: F401
+    import services.order.models.order_base_model  # noqa: F401
+    import services.recipe.models.core_model  # noqa: F401
+    from services.homeshopping.models.core_model import (
+        HomeshoppingClassify,
+        HomeshoppingInfo,
+        HomeshoppingList,
+        HomeshoppingProductInfo,
+    )
+    from services.kok.models.classify_model import KokClassify
+    from services.kok.models.product_model import KokPriceInfo, KokProductInfo
+
+    tables = [
+        HomeshoppingInfo.__table__, HomeshoppingList.__table__, HomeshoppingClassify.__table__,
+        HomeshoppingProductInfo.__table__, KokClassify.__table__, KokProductInfo.__table__, KokPriceInfo.__table__,
+    ]
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.create(sync_conn) for t in tables])
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    session.add(HomeshoppingInfo(homeshopping_id=1, homeshopping_name="홈쇼핑A", homeshopping_channel=10))
+    for pid, name, food in [(100, "햇 양파 10kg", 1), (101, "양파링", 1), (102, "무안 양파 5kg", 0), (103, "두부 4입", 1)]:
+        session.add(HomeshoppingClassify(product_id=pid, product_name=name, cls_food=food, cls_ing=1))
+        session.add(HomeshoppingProductInfo(product_id=pid, store_name="농협", sale_price=20000, dc_rate=10))
+    session.add(HomeshoppingList(live_id=1, homeshopping_id=1, product_id=100, product_name="햇 양파 10kg", thumb_img_url="old.jpg"))
+    session.add(HomeshoppingList(live_id=2, homeshopping_id=1, product_id=100, product_name="햇 양파 10kg", thumb_img_url="new.jpg"))
+    for pid, name in [(1, "국산 양파 1kg"), (2, "양파 3kg"), (3, "아몬드 양파"), (4, "두부")]:
+        session.add(KokClassify(product_id=pid, product_name=name, cls_ing=1))
+        session.add(KokProductInfo(kok_product_id=pid, kok_product_name=name, kok_store_name="콕마트", kok_product_price=5000))
+        session.add(KokPriceInfo(kok_product_id=pid, kok_discount_rate=5, kok_discounted_price=4750))
+    await session.commit()
+
+    product_candidate_index.clear_product_candidate_index()
+    yield session
+    product_candidate_index.clear_product_candidate_index()
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(6)
+async def test_recommend_uses_precomputed_candidates(catalog_session, query_recorder):
+    from services.recipe.utils.product_recommend import recommend_for_ingredient
+
+    recs = await recommend_for_ingredient(catalog_session, "양파", max_total=5, max_home=2)
+    assert [(r["source"], r["name"]) for r in recs] == [
+        ("homeshopping", "햇 양파 10kg"),
+        ("kok", "양파 3kg"),
+        ("kok", "국산 양파 1kg"),
+    ]
+    assert recs[0]["live_id"] == 2 and recs[0]["thumb_img_url"] == "new.jpg"
+    assert recs[1]["brand_name"] == "콕마트" and recs[1]["price"] == 5000
+    assert query_recorder.count == 4  # 카탈로그 2 + 상세 2
+
+    # 다른 식재료: 카탈로그 재사용, 상세 조회만
+    recs = await recommend_for_ingredient(catalog_session, "두부", max_total=5, max_home=2)
+    assert [r["name"] for r in recs] == ["두부 4입", "두부"]
+    assert query_recorder.count == 6
+
+
+@pytest.mark.asyncio
+async def test_new_products_are_merged_into_existing_candidates(catalog_session, monkeypatch):
+    from services.kok.models.classify_model import KokClassify
+
+    assert (await product_candidate_index.get_product_candidates(catalog_session, "양파"))["kok"] == [2, 1]
+
+    monkeypatch.setattr(product_candidate_index, "CATALOG_CHECK_SECONDS", 0)
+    catalog_session.add(KokClassify(product_id=5, product_name="양파", cls_ing=1))
+    await catalog_session.commit()
+
+    # 요청 경로는 적재된 카탈로그를 그대로 사용 (갱신은 백그라운드 태스크 몫)
+    assert (await product_candidate_index.get_product_candidates(catalog_session, "양파"))["kok"] == [2, 1]
+    await product_candidate_index.refresh_product_candidate_index(catalog_session)
+    assert (await product_candidate_index.get_product_candidates(catalog_session, "양파"))["kok"] == [5, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_candidate_list_grows_to_requested_limit(catalog_session, monkeypatch):
+    from services.kok.models.classify_model import KokClassify
+
+    monkeypatch.setattr(product_candidate_index, "CANDIDATE_LIST_SIZE", 2)
+    for pid in range(10, 20):
+        catalog_session.add(KokClassify(product_id=pid, product_name=f"양파 {pid}kg", cls_ing=1))
+    await catalog_session.commit()
+
+    assert len((await product_candidate_index.get_product_candidates(catalog_session, "양파", 2))["kok"]) == 2
+    kok = (await product_candidate_index.get_product_candidates(catalog_session, "양파", 9))["kok"]
+    assert len(kok) == 9 and kok[0] == 2
+
+    # 증분 반영도 늘어난 길이를 유지
+    monkeypatch.setattr(product_candidate_index, "CATALOG_CHECK_SECONDS", 0)
+    catalog_session.add(KokClassify(product_id=30, product_name="양파", cls_ing=1))
+    await catalog_session.commit()
+    await product_candidate_index.refresh_product_candidate_index(catalog_session)
+    kok = (await product_candidate_index.get_product_candidates(catalog_session, "양파", 9))["kok"]
+    assert len(kok) == 9 and kok[:2] == [30, 2]
+
+
+@pytest.mark.asyncio
+async def test_kok_detail_uses_latest_price(catalog_session):
+    from services.kok.models.product_model import KokPriceInfo
+    from services.recipe.utils.product_recommend import search_kok
+
+    catalog_session.add(KokPriceInfo(kok_product_id=2, kok_discount_rate=30, kok_discounted_price=3500))
+    await catalog_session.commit()
+
+    rows = await search_kok(catalog_session, "양파", limit_n=2)
+    assert [r["product_id"] for r in rows] == [2, 1]
+    assert rows[0]["kok_discount_rate"] == 30
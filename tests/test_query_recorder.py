@@ -0,0 +1,95 @@
+"""
+SQL 기록기(N+1 탐지/쿼리 예산) 단위 테스트
+1. normalize_statement — 리터럴/바인드/IN 목록 정규화
+2. record_queries — 반복 쿼리 모양 탐지, raise 모드 예산 초과
+3. query_budget 마커 — conftest 가드로 테스트 단위 예산 적용
+4. QueryRecorderMiddleware — 엔드포인트 @query_budget 적용
+"""
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+
+from common.query_recorder import (
+    QueryBudgetExceeded,
+    QueryRecorderMiddleware,
+    normalize_statement,
+    query_budget,
+    record_queries,
+)
+from tests.test_metrics import _asgi_get
+
+
+@pytest_asyncio.fixture
+async def sqlite_engine():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield engine
+    await engine.dispose()
+
+
+async def _select_each(engine, ids):
+    from sqlalchemy import text
+
+    async with engine.connect() as conn:
+        for i in ids:
+            await conn.execute(text("SELECT :id AS id"), {"id": i})
+
+
+def test_normalize_statement_collapses_literals_and_in_lists():
+    a = normalize_statement("SELECT * FROM t WHERE id IN (?, ?, ?) AND name = 'x'")
+    b = normalize_statement("SELECT *  FROM t\nWHERE id IN (%s) AND name = %s")
+    c = normalize_statement("SELECT * FROM t WHERE id IN (:id_1, :id_2) AND name = :name")
+    assert a == b == c == "SELECT * FROM t WHERE id IN (...) AND name = ?"
+    assert normalize_statement("SELECT * FROM t LIMIT 10 OFFSET 20") == "SELECT * FROM t LIMIT ? OFFSET ?"
+
+
+@pytest.mark.asyncio
+async def test_record_queries_flags_repeated_shapes(sqlite_engine):
+    with record_queries(repeat_threshold=5) as rec:
+        await _select_each(sqlite_engine, range(6))
+    assert rec.count == 6
+    assert rec.repeated_shapes() == {"SELECT ? AS id": 6}
+
+    with record_queries(repeat_threshold=5) as rec:
+        await _select_each(sqlite_engine, range(2))
+    assert rec.repeated_shapes() == {}
+
+
+@pytest.mark.asyncio
+async def test_record_queries_raise_mode_fails_over_budget(sqlite_engine):
+    with pytest.raises(QueryBudgetExceeded):
+        with record_queries(budget=2, mode="raise"):
+            await _select_each(sqlite_engine, range(3))
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(2)
+async def test_query_budget_marker_counts_test_queries(sqlite_engine, query_recorder):
+    await _select_each(sqlite_engine, range(2))
+    assert query_recorder.count == 2
+
+
+@pytest.mark.asyncio
+async def test_middleware_applies_endpoint_budget(sqlite_engine):
+    app = FastAPI()
+    app.add_middleware(QueryRecorderMiddleware, mode="raise", default_budget=100)
+
+    @app.get("/n-plus-one")
+    @query_budget(2)
+    async def n_plus_one():
+        await _select_each(sqlite_engine, range(3))
+        return {"ok": True}
+
+    @app.get("/batched")
+    @query_budget(2)
+    async def batched():
+        await _select_each(sqlite_engine, range(1))
+        return {"ok": True}
+
+    status, _ = await _asgi_get(app, "/batched")
+    assert status == 200
+    with pytest.raises(QueryBudgetExceeded):
+        await _asgi_get(app, "/n-plus-one")
@@ -0,0 +1,101 @@
+"""
+레시피 별점 집계 테이블 단위 테스트
+1. set_recipe_rating — 신규 등록/변경 시 합/개수/평균 증분 갱신 (전체 AVG 와 동일)
+2. 집계 행이 없는 레시피 — 첫 등록 시 기존 별점까지 집계해 생성 (백필)
+3. get_recipe_ratings — 페이지 단위 별점을 쿼리 1회로 조회
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+
+@pytest_asyncio.fixture
+async def rating_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from services.recipe.models.core_model import Recipe, RecipeRating, RecipeRatingStat
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [
+            t.create(sync_conn) for t in (Recipe.__table__, RecipeRating.__table__, RecipeRatingStat.__table__)
+        ])
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    session.add_all([Recipe(recipe_id=rid, recipe_title=f"레시피 {rid}") for rid in (1, 2, 3)])
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+async def _stat(session, recipe_id):
+    from services.recipe.models.core_model import RecipeRatingStat
+
+    stmt = select(RecipeRatingStat.rating_sum, RecipeRatingStat.rating_count, RecipeRatingStat.rating_avg).where(
+        RecipeRatingStat.recipe_id == recipe_id
+    )
+    return tuple((await session.execute(stmt)).one())
+
+
+async def _full_avg(session, recipe_id):
+    from services.recipe.models.core_model import RecipeRating
+
+    stmt = select(func.avg(RecipeRating.rating)).where(RecipeRating.recipe_id == recipe_id)
+    return float((await session.execute(stmt)).scalar() or 0.0)
+
+
+@pytest.mark.asyncio
+async def test_set_rating_maintains_aggregate_incrementally(rating_session):
+    from services.recipe.crud.recipe_rating_crud import get_recipe_rating, set_recipe_rating
+
+    for user_id, rating in [(10, 5), (11, 3), (12, 4)]:
+        await set_recipe_rating(rating_session, 1, user_id, rating)
+        await rating_session.commit()
+    assert await _stat(rating_session, 1) == (12, 3, 4.0)
+
+    # 같은 사용자가 다시 등록하면 변경 — 개수는 그대로, 합은 변화량만큼
+    assert await set_recipe_rating(rating_session, 1, 11, 0) == 0
+    await rating_session.commit()
+    assert await _stat(rating_session, 1) == (9, 3, 3.0)
+    assert await get_recipe_rating(rating_session, 1) == await _full_avg(rating_session, 1) == 3.0
+
+    # 같은 값으로 다시 등록하면 집계 변화 없음
+    await set_recipe_rating(rating_session, 1, 12, 4)
+    await rating_session.commit()
+    assert await _stat(rating_session, 1) == (9, 3, 3.0)
+
+
+@pytest.mark.asyncio
+async def test_first_write_backfills_existing_ratings(rating_session):
+    from services.recipe.crud.recipe_rating_crud import get_recipe_rating, set_recipe_rating
+    from services.recipe.models.core_model import RecipeRating
+
+    # 집계 테이블 도입 전에 쌓인 별점
+    rating_session.add_all([RecipeRating(recipe_id=2, user_id=uid, rating=r) for uid, r in [(1, 2), (2, 4)]])
+    await rating_session.commit()
+
+    await set_recipe_rating(rating_session, 2, 3, 5)
+    await rating_session.commit()
+    assert await _stat(rating_session, 2) == (11, 3, pytest.approx(11 / 3))
+    assert await get_recipe_rating(rating_session, 2) == pytest.approx(await _full_avg(rating_session, 2))
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(30)
+async def test_get_recipe_ratings_is_one_lookup(rating_session, query_recorder):
+    from services.recipe.crud.recipe_rating_crud import get_recipe_ratings, set_recipe_rating
+
+    await set_recipe_rating(rating_session, 1, 10, 4)
+    await set_recipe_rating(rating_session, 3, 10, 1)
+    await set_recipe_rating(rating_session, 3, 11, 2)
+    await rating_session.commit()
+
+    before = len(query_recorder.statements)
+    ratings = await get_recipe_ratings(rating_session, [3, 1, 2, 3])
+    assert len(query_recorder.statements) - before == 1
+    assert ratings == {3: 1.5, 1: 4.0, 2: 0.0}
+    assert await get_recipe_ratings(rating_session, []) == {}
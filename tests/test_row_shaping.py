@@ -0,0 +1,163 @@
+"""
+레시피 검색/추천 결과 행 정리 단위 테스트 (pandas 미사용)
+1. recommend_by_recipe_pgvector_v2 — 제목 일치 우선 + 벡터 보완 순서, No./RANK_TYPE/MATERIALS
+   · 제목 SQL 단계와 벡터 단계 동시 실행, 상세 + 재료는 JOIN 쿼리 1회
+2. 기존 DataFrame 정리와 결과 동일 (순서/MATERIALS)
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from services.recipe.utils.row_shaping import attach_materials, group_materials, number_records, order_by_ids
+
+DETAIL_COLUMNS = [
+    "RECIPE_ID", "RECIPE_TITLE", "COOKING_NAME", "SCRAP_COUNT", "COOKING_CASE_NAME",
+    "COOKING_CATEGORY_NAME", "COOKING_INTRODUCTION", "NUMBER_OF_SERVING", "THUMBNAIL_URL",
+]
+
+
+class _FakeVectorSearcher:
+    def __init__(self, ids):
+        self.ids = ids
+        self.calls = []
+
+    async def find_similar_ids(self, pg_db, query, top_k, exclude_ids=None):
+        self.calls.append((top_k, exclude_ids))
+        return [(rid, 0.9) for rid in self.ids if rid not in (exclude_ids or [])][:top_k]
+
+
+@pytest_asyncio.fixture
+async def recipe_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from services.recipe.models.core_model import Material, Recipe
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.create(sync_conn) for t in (Recipe.__table__, Material.__table__)])
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    for rid, name, scrap in [(1, "김치찌개", 50), (2, "참치 김치찌개", 80), (3, "된장국", 10), (4, "순두부찌개", 30)]:
+        session.add(Recipe(recipe_id=rid, recipe_title=f"{name} 만들기", cooking_name=name, scrap_count=scrap))
+    session.add_all([
+        Material(recipe_id=1, material_name="김치", measure_amount="1", measure_unit="컵"),
+        Material(recipe_id=1, material_name="돼지고기", measure_amount="200", measure_unit="g"),
+        Material(recipe_id=2, material_name="김치", measure_amount="1", measure_unit="컵"),
+        Material(recipe_id=3, material_name="된장", measure_amount="2", measure_unit="큰술"),
+    ])
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_recipe_method_orders_title_matches_before_vector_results(recipe_session):
+    from services.recipe.crud.recipe_search_crud import recommend_by_recipe_pgvector_v2
+
+    searcher = _FakeVectorSearcher([4, 3, 1])
+    records = await recommend_by_recipe_pgvector_v2(
+        mariadb=recipe_session, postgres=None, query="김치찌개", page=1, size=3,
+        vector_searcher=searcher, include_materials=True,
+    )
+
+    assert [(r["No."], r["RECIPE_ID"], r["RANK_TYPE"]) for r in records] == [(1, 2, 0), (2, 1, 0), (3, 4, 1)]
+    assert list(records[0])[:2] == ["No.", "RECIPE_ID"]
+    assert [m["MATERIAL_NAME"] for m in records[1]["MATERIALS"]] == ["김치", "돼지고기"]
+    assert records[2]["MATERIALS"] is None
+    # 제목 SQL 과 동시에 실행되므로 제외 조건 없이 fetch_upto(3) + 버퍼(10) 만큼 가져와 메모리에서 중복 제거
+    assert searcher.calls == [(13, None)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(5)
+async def test_recipe_method_runs_title_and_vector_stages_concurrently(recipe_session, query_recorder, monkeypatch):
+    from services.recipe.crud import recipe_search_crud
+
+    vector_started = asyncio.Event()
+    title_sql = recipe_search_crud._title_ids_sql
+
+    class _SlowSearcher(_FakeVectorSearcher):
+        async def find_similar_ids(self, pg_db, query, top_k, exclude_ids=None):
+            vector_started.set()
+            await asyncio.sleep(0.01)
+            return await super().find_similar_ids(pg_db, query, top_k, exclude_ids)
+
+    async def title_waits_for_vector(mariadb, query, limit):
+        # 순차 실행이면 벡터 단계가 시작되지 않아 시간 초과
+        await asyncio.wait_for(vector_started.wait(), timeout=1)
+        return await title_sql(mariadb, query, limit)
+
+    monkeypatch.setattr(recipe_search_crud, "_title_ids_sql", title_waits_for_vector)
+    before = len(query_recorder.statements)
+    records = await recipe_search_crud.recommend_by_recipe_pgvector_v2(
+        mariadb=recipe_session, postgres=None, query="김치찌개", page=1, size=3,
+        vector_searcher=_SlowSearcher([2, 4, 3]), include_materials=True,
+    )
+
+    assert [(r["RECIPE_ID"], r["RANK_TYPE"]) for r in records] == [(2, 0), (1, 0), (4, 1)]
+    assert [m["MATERIAL_NAME"] for m in records[1]["MATERIALS"]] == ["김치", "돼지고기"]
+    # 제목 SQL 1회 + 상세/재료 JOIN 1회
+    statements = query_recorder.statements[before:]
+    assert len(statements) == 2 and "LEFT OUTER JOIN" in statements[1] and "FCT_MTRL" in statements[1]
+
+
+@pytest.mark.asyncio
+async def test_ingredient_method_returns_records(recipe_session):
+    from services.recipe.crud.recipe_search_crud import recommend_by_recipe_pgvector_v2, search_recipes_with_pagination
+
+    records = await recommend_by_recipe_pgvector_v2(
+        mariadb=recipe_session, postgres=None, query="김치", method="ingredient", include_materials=True,
+    )
+    assert sorted(r["RECIPE_ID"] for r in records) == [1, 2]
+    assert all(r["MATERIALS"] for r in records)
+
+    page, _, has_more = await search_recipes_with_pagination(
+        mariadb=recipe_session, method="ingredient", recipe="김치, 돼지고기", page=1, size=10,
+    )
+    assert [r["recipe_id"] for r in page] == [1] and not has_more
+    assert "_sa_instance_state" not in page[0]
+
+
+def _legacy_pandas_shaping(pd, detail_rows, page_ids, material_rows, exact_set):
+    """기존 recommend_by_recipe_pgvector_v2 의 DataFrame 정리 (비교 기준)"""
+    detail_df = pd.DataFrame(detail_rows, columns=DETAIL_COLUMNS)
+    detail_df["RANK_TYPE"] = detail_df["RECIPE_ID"].apply(lambda x: 0 if int(x) in exact_set else 1)
+    order_map = {rid: i for i, rid in enumerate(page_ids)}
+    detail_df["__order__"] = detail_df["RECIPE_ID"].map(order_map).fillna(len(page_ids))
+    final_df = detail_df.sort_values("__order__").drop(columns="__order__").reset_index(drop=True)
+    final_df.insert(0, "No.", range(1, len(final_df) + 1))
+    m_df = pd.DataFrame(material_rows, columns=["RECIPE_ID", "MATERIAL_NAME", "MEASURE_AMOUNT", "MEASURE_UNIT"])
+    mats = (
+        m_df.groupby("RECIPE_ID")[["MATERIAL_NAME", "MEASURE_AMOUNT", "MEASURE_UNIT"]]
+        .apply(lambda g: g.to_dict("records"))
+        .rename("MATERIALS")
+        .reset_index()
+    )
+    return final_df.merge(mats, on="RECIPE_ID", how="left").to_dict("records")
+
+
+def _row_shaping(detail_rows, page_ids, material_rows, exact_set):
+    records = [dict(zip(DETAIL_COLUMNS, row)) for row in detail_rows]
+    for record in records:
+        record["RANK_TYPE"] = 0 if record["RECIPE_ID"] in exact_set else 1
+    records = number_records(order_by_ids(records, page_ids))
+    return attach_materials(records, group_materials(material_rows))
+
+
+def test_row_shaping_matches_pandas():
+    pd = pytest.importorskip("pandas")
+
+    page_ids = list(range(120, 100, -1))  # 페이지 크기 20, 역순 재정렬
+    detail_rows = [(rid, f"레시피 {rid}", f"요리 {rid}", rid * 3, "반찬", "밑반찬", "소개", "2인분", "t.jpg") for rid in range(101, 121)]
+    material_rows = [(rid, f"재료{i}", str(i), "g") for rid in page_ids for i in range(8)]
+    exact_set = set(page_ids[:5])
+
+    legacy = _legacy_pandas_shaping(pd, detail_rows, page_ids, material_rows, exact_set)
+    shaped = _row_shaping(detail_rows, page_ids, material_rows, exact_set)
+    assert [r["RECIPE_ID"] for r in shaped] == [int(r["RECIPE_ID"]) for r in legacy] == page_ids
+    assert [r["MATERIALS"] for r in shaped] == [r["MATERIALS"] for r in legacy]
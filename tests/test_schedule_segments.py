@@ -0,0 +1,196 @@
+"""
+홈쇼핑 편성표 일자별 세그먼트 단위 테스트
+1. 전체 편성표 = 날짜별 세그먼트 연결 (식품만, 날짜/시작시각 순)
+2. 워터마크가 바뀐 날짜만 다시 조회, 프로세스 메모리 → Redis 세그먼트 재사용
+3. 현재 ± N시간 구간 조회 (자정을 넘기는 방송 포함)
+4. 체크섬 — 조인된 가격/식품 분류 변경 감지, 세그먼트 최대 보관 시간, 캐시 무효화 시 메모리 세그먼트 제거
+"""
+
+from datetime import date, datetime, time
+
+import pytest
+import pytest_asyncio
+
+from services.homeshopping.crud import schedule_crud
+
+DAY1 = date(2025, 3, 1)
+DAY2 = date(2025, 3, 2)
+
+
+class _FakeSegmentCache:
+    def __init__(self):
+        self.store = {}
+        self.written = []
+
+    async def get_schedule_segments(self, live_dates):
+        return {d: self.store[d] for d in live_dates if d in self.store}
+
+    async def set_schedule_segments(self, segments):
+        self.written.append(sorted(segments))
+        self.store.update(segments)
+        return True
+
+
+@pytest.fixture(autouse=True)
+def segment_cache(monkeypatch):
+    cache = _FakeSegmentCache()
+    monkeypatch.setattr(schedule_crud, "cache_manager", cache)
+    schedule_crud.clear_schedule_segments()
+    yield cache
+    schedule_crud.clear_schedule_segments()
+
+
+def _live(live_id, day, start, end, product_id, name):
+    from services.homeshopping.models.core_model import HomeshoppingList
+
+    return HomeshoppingList(
+        live_id=live_id, homeshopping_id=1, live_date=day, live_start_time=start, live_end_time=end,
+        promotion_type="main", product_id=product_id, product_name=name, thumb_img_url="t.jpg",
+    )
+
+
+@pytest_asyncio.fixture
+async def schedule_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import services.homeshopping.models.interaction_model  # noqa: F401  (관계 대상 매퍼)
+    import services.kok.models.interaction_model  # noqa: F401
+    import services.kok.models.product_model  # noqa: F401
+    import services.order.models.homeshopping.hs_order_model  # noqa: F401
+    import services.order.models.kok.kok_order_model  # noqa: F401
+    import services.order.models.order_base_model  # noqa: F401
+    import services.recipe.models.core_model  # noqa: F401
+    from services.homeshopping.models.core_model import (
+        HomeshoppingClassify,
+        HomeshoppingInfo,
+        HomeshoppingList,
+        HomeshoppingProductInfo,
+    )
+
+    tables = (HomeshoppingInfo.__table__, HomeshoppingList.__table__, HomeshoppingClassify.__table__, HomeshoppingProductInfo.__table__)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.create(sync_conn) for t in tables])
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    session.add(HomeshoppingInfo(homeshopping_id=1, homeshopping_name="홈쇼핑A", homeshopping_channel=10))
+    for product_id, food in [(100, 1), (200, 1), (300, 0), (400, 1)]:
+        session.add(HomeshoppingClassify(product_id=product_id, product_name=f"상품{product_id}", cls_food=food))
+        session.add(HomeshoppingProductInfo(product_id=product_id, sale_price=10000, dc_price=9000, dc_rate=10))
+    session.add_all([
+        _live(2, DAY1, time(10, 0), time(11, 0), 200, "두부"),
+        _live(1, DAY1, time(9, 0), time(10, 0), 100, "김치"),
+        _live(3, DAY1, time(12, 0), time(13, 0), 300, "청소기"),
+        _live(4, DAY1, time(23, 30), time(0, 30), 400, "심야 갈비"),
+        _live(5, DAY2, time(8, 0), time(9, 0), 100, "김치"),
+    ])
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(2)
+async def test_full_schedule_concatenates_day_segments(schedule_session, query_recorder, segment_cache):
+    schedules = await schedule_crud.get_homeshopping_schedule(schedule_session)
+
+    assert [(s["live_date"], s["live_id"]) for s in schedules] == [(DAY1, 1), (DAY1, 2), (DAY1, 4), (DAY2, 5)]
+    assert schedules[0]["live_start_time"] == time(9, 0)
+    assert schedules[0]["homeshopping_name"] == "홈쇼핑A"
+    assert segment_cache.written == [[DAY1, DAY2]]
+
+    # 워터마크 확인 간격 이내: 쿼리 없이 메모리 세그먼트 사용
+    again = await schedule_crud.get_homeshopping_schedule(schedule_session)
+    assert query_recorder.count == 2
+    assert again == schedules
+
+
+@pytest.mark.asyncio
+async def test_only_changed_day_is_refreshed(schedule_session, segment_cache, monkeypatch):
+    monkeypatch.setattr(schedule_crud, "SCHEDULE_WATERMARK_CHECK_SECONDS", 0)
+    await schedule_crud.get_homeshopping_schedule(schedule_session)
+
+    schedule_session.add(_live(6, DAY2, time(7, 0), time(8, 0), 200, "두부"))
+    await schedule_session.commit()
+
+    day2 = await schedule_crud.get_homeshopping_schedule(schedule_session, live_date=DAY2)
+    assert [s["live_id"] for s in day2] == [6, 5]
+    assert segment_cache.written == [[DAY1, DAY2], [DAY2]]
+
+    # 다른 워커(빈 메모리)는 Redis 세그먼트를 재사용
+    schedule_crud.clear_schedule_segments()
+    full = await schedule_crud.get_homeshopping_schedule(schedule_session)
+    assert [s["live_id"] for s in full] == [1, 2, 4, 6, 5]
+    assert segment_cache.written == [[DAY1, DAY2], [DAY2]]
+
+
+@pytest.mark.asyncio
+async def test_schedule_window_includes_overnight_broadcast(schedule_session):
+    around_midnight = await schedule_crud.get_homeshopping_schedule_window(
+        schedule_session, center=datetime(2025, 3, 2, 0, 15), hours=1
+    )
+    assert [s["live_id"] for s in around_midnight] == [4]
+
+    morning = await schedule_crud.get_homeshopping_schedule_window(
+        schedule_session, center=datetime(2025, 3, 1, 10, 0), hours=1
+    )
+    assert [s["live_id"] for s in morning] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_price_and_food_class_changes_refresh_segments(schedule_session, segment_cache, monkeypatch):
+    from sqlalchemy import update
+
+    from services.homeshopping.models.core_model import HomeshoppingClassify, HomeshoppingProductInfo
+
+    monkeypatch.setattr(schedule_crud, "SCHEDULE_WATERMARK_CHECK_SECONDS", 0)
+    await schedule_crud.get_homeshopping_schedule(schedule_session)
+
+    # 편성 행은 그대로, 조인된 가격/식품 분류만 변경 → 체크섬으로 감지
+    await schedule_session.execute(
+        update(HomeshoppingProductInfo).where(HomeshoppingProductInfo.product_id == 200).values(dc_price=7000)
+    )
+    await schedule_session.execute(
+        update(HomeshoppingClassify).where(HomeshoppingClassify.product_id == 300).values(cls_food=1)
+    )
+    await schedule_session.commit()
+
+    day1 = await schedule_crud.get_homeshopping_schedule(schedule_session, live_date=DAY1)
+    assert [s["live_id"] for s in day1] == [1, 2, 3, 4]
+    assert next(s for s in day1 if s["live_id"] == 2)["dc_price"] == 7000
+    assert segment_cache.written == [[DAY1, DAY2], [DAY1]]
+
+
+@pytest.mark.asyncio
+async def test_segments_expire_after_max_age(schedule_session, segment_cache, monkeypatch):
+    await schedule_crud.get_homeshopping_schedule(schedule_session)
+    assert segment_cache.written == [[DAY1, DAY2]]
+
+    # 최대 보관 시간이 지난 세그먼트는 워터마크가 같아도 메모리/Redis 어느 쪽도 재사용하지 않음
+    monkeypatch.setattr(schedule_crud, "SCHEDULE_SEGMENT_MAX_AGE_SECONDS", 0)
+    await schedule_crud.get_homeshopping_schedule(schedule_session)
+    assert segment_cache.written == [[DAY1, DAY2], [DAY1, DAY2]]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_schedule_cache_clears_process_segments(schedule_session, monkeypatch):
+    from services.homeshopping.utils.cache_manager import cache_manager as real_cache_manager
+
+    await schedule_crud.get_homeshopping_schedule(schedule_session)
+    assert schedule_crud._segments and schedule_crud._watermark_checked_at
+
+    async def _delete(*args, **kwargs):
+        return 1
+
+    monkeypatch.setattr(real_cache_manager.redis_cache, "delete_key", _delete)
+    monkeypatch.setattr(real_cache_manager.redis_cache, "delete_pattern", _delete)
+
+    assert await real_cache_manager.invalidate_schedule_cache(DAY1) is True
+    assert DAY1 not in schedule_crud._segments and DAY2 in schedule_crud._segments
+    assert DAY1 not in schedule_crud._watermarks and not schedule_crud._watermark_checked_at
+
+    assert await real_cache_manager.invalidate_schedule_cache() is True
+    assert not schedule_crud._segments and not schedule_crud._watermarks
@@ -0,0 +1,197 @@
+"""
+KOK 스토어 베스트 인덱스 단위 테스트
+1. merge_store_tops — 스토어별 정렬 목록 k-way merge
+2. get_kok_store_best_items — 구매 스토어 한정 결과가 전체 정렬 순서와 일치 (Redis 없음/있음)
+3. 인덱스 재구성 API — 최소 간격 이내 재호출은 429
+"""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+
+from services.kok.utils import store_best_index
+from services.kok.utils.store_best_index import merge_store_tops, rank_score
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.zsets = {}
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def zrevrange(self, key, start, end, withscores=False):
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1], reverse=True)
+        return members[start:end + 1]
+
+    def delete(self, key):
+        return 1 if self.zsets.pop(key, None) is not None else 0
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def expire(self, key, ttl):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def no_result_cache(monkeypatch):
+    from services.kok.utils.cache_utils import cache_manager
+
+    async def _get(*args, **kwargs):
+        return None
+
+    async def _set(*args, **kwargs):
+        return True
+
+    monkeypatch.setattr(cache_manager, "get", _get)
+    monkeypatch.setattr(cache_manager, "set", _set)
+
+
+@pytest_asyncio.fixture
+async def store_session():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import services.homeshopping.models.core_model  # noqa: F401  (관계 대상 매퍼)
+    import services.homeshopping.models.interaction_model  # noqa: F401
+    import services.kok.models.interaction_model  # noqa: F401
+    import services.order.models.homeshopping.hs_order_model  # noqa: F401
+    import services.recipe.models.core_model  # noqa: F401  (FK 대상 테이블 메타데이터)
+    from services.kok.models.product_model import KokPriceInfo, KokProductInfo
+    from services.order.models.kok.kok_order_model import KokOrder
+    from services.order.models.order_base_model import Order
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: [
+                t.create(sync_conn)
+                for t in (Order.__table__, KokProductInfo.__table__, KokPriceInfo.__table__, KokOrder.__table__)
+            ]
+        )
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    pid = 0
+    for store in ("가게A", "가게B", "가게C"):
+        for i in range(12):
+            pid += 1
+            session.add(KokProductInfo(
+                kok_product_id=pid,
+                kok_product_name=f"{store} 상품 {i}",
+                kok_store_name=store,
+                kok_product_price=1000,
+                kok_review_cnt=(pid * 37) % 101,
+                kok_review_score=round(((pid * 13) % 50) / 10, 1),
+            ))
+            session.add(KokPriceInfo(kok_product_id=pid, kok_discount_rate=10, kok_discounted_price=900))
+    session.add(Order(order_id=1, user_id=1, order_time=datetime(2025, 1, 1)))
+    session.add(KokOrder(order_id=1, kok_price_id=1, kok_product_id=1, quantity=1))    # 가게A
+    session.add(KokOrder(order_id=1, kok_price_id=30, kok_product_id=30, quantity=1))  # 가게C
+    await session.commit()
+
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+async def _expected_ids(session, sort_by):
+    from sqlalchemy import select
+
+    from services.kok.models.product_model import KokProductInfo
+
+    rows = (await session.execute(
+        select(KokProductInfo).where(KokProductInfo.kok_store_name.in_(["가게A", "가게C"]))
+    )).scalars().all()
+    rows = [r for r in rows if r.kok_review_cnt > 0 and (sort_by != "rating" or r.kok_review_score > 0)]
+    rows.sort(key=lambda r: rank_score(sort_by, r.kok_review_cnt, r.kok_review_score), reverse=True)
+    return [r.kok_product_id for r in rows[:10]]
+
+
+def test_merge_store_tops_interleaves_sorted_lists():
+    assert merge_store_tops([[(9.0, 1), (3.0, 2)], [(8.0, 3), (7.0, 4)], []], limit=3) == [1, 3, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_by", ["review_count", "rating"])
+async def test_store_best_without_redis_matches_full_sort(store_session, monkeypatch, sort_by):
+    from services.kok.crud.listing_crud import get_kok_store_best_items
+
+    async def _no_client():
+        return None
+
+    monkeypatch.setattr(store_best_index, "_get_client", _no_client)
+
+    items = await get_kok_store_best_items(store_session, user_id=1, sort_by=sort_by)
+    assert [i["kok_product_id"] for i in items] == await _expected_ids(store_session, sort_by)
+    assert {i["kok_store_name"] for i in items} <= {"가게A", "가게C"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(7)
+async def test_store_best_reads_materialized_lists(store_session, monkeypatch, query_recorder):
+    from services.kok.crud.listing_crud import get_kok_store_best_items
+
+    redis = _FakeRedis()
+
+    async def _client():
+        return redis
+
+    monkeypatch.setattr(store_best_index, "_get_client", _client)
+
+    first = await get_kok_store_best_items(store_session, user_id=1)
+    assert set(redis.zsets) == {"kok:store_top:review_count:가게A", "kok:store_top:review_count:가게C"}
+    assert all(len(z) == store_best_index.STORE_TOP_N for z in redis.zsets.values())
+
+    # 두 번째 요청: 스토어 목록은 Redis 에서 읽고 DB 는 구매 스토어/상품만 조회 (가격은 세션 메모이즈)
+    before = query_recorder.count
+    second = await get_kok_store_best_items(store_session, user_id=1)
+    assert query_recorder.count - before == 2
+    assert [i["kok_product_id"] for i in second] == [i["kok_product_id"] for i in first]
+    assert [i["kok_product_id"] for i in first] == await _expected_ids(store_session, "review_count")
+
+
+@pytest.mark.asyncio
+async def test_refresh_endpoint_is_rate_limited(store_session, monkeypatch):
+    from common.errors import RateLimitExceededException
+    from services.kok.routers.cache_router import refresh_store_best_index
+    from services.kok.utils.cache_utils import cache_manager
+
+    redis = _FakeRedis()
+
+    async def _client():
+        return redis
+
+    async def _invalidate():
+        return 0
+
+    monkeypatch.setattr(store_best_index, "_get_client", _client)
+    monkeypatch.setattr(store_best_index, "_last_refresh_at", 0.0)
+    monkeypatch.setattr(cache_manager, "invalidate_store_best_items", _invalidate)
+
+    response = await refresh_store_best_index(db=store_session)
+    assert "스토어 수: 3" in response["message"]
+    assert len(redis.zsets) == 3 * len(store_best_index.STORE_BEST_SORTS)
+
+    # 최소 간격 이내 재호출은 DB 를 다시 훑지 않고 429
+    with pytest.raises(RateLimitExceededException) as exc_info:
+        await refresh_store_best_index(db=store_session)
+    assert exc_info.value.status_code == 429
+    assert await store_best_index.refresh_store_top_index_throttled(store_session) is None
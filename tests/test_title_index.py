@@ -0,0 +1,136 @@
+"""
+레시피명 n-gram 색인 단위 테스트
+1. search — 기존 LIKE + ORDER BY SCRAP_COUNT DESC + LIMIT 과 같은 결과 (NULL 스크랩은 마지막)
+2. 증분 반영 — 신규 레시피를 스크랩 수 순서에 맞게 삽입
+3. recommend_by_recipe_pgvector_v2 — 색인 준비 후 제목 단계에서 FCT_RECIPE LIKE 조회 없음
+4. PeriodicRefresher — lifespan 백그라운드 태스크로 적재, 실패는 다음 주기 재시도
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import desc, select
+
+from common.periodic_refresh import PeriodicRefresher
+from services.recipe.utils import title_index
+
+# (레시피 ID, 요리명, 스크랩 수)
+RECIPES = [
+    (1, "김치찌개", 120),
+    (2, "돼지고기 김치찌개", 300),
+    (3, "참치김치찌개", None),
+    (4, "김치볶음밥", 80),
+    (5, "된장찌개", 500),
+    (6, "Kimchi 파스타", 10),
+    (7, "묵은지 김치찜", 0),
+]
+
+
+@pytest_asyncio.fixture
+async def recipe_engine():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from services.recipe.models.core_model import Material, Recipe
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: [t.create(sync_conn) for t in (Recipe.__table__, Material.__table__)])
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        for rid, name, scrap in RECIPES:
+            session.add(Recipe(recipe_id=rid, recipe_title=f"{name} 만들기", cooking_name=name, scrap_count=scrap))
+        await session.commit()
+
+    title_index.clear_title_index()
+    yield factory
+    title_index.clear_title_index()
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def recipe_session(recipe_engine):
+    async with recipe_engine() as session:
+        yield session
+
+
+async def _sql_title_ids(session, query, limit):
+    from services.recipe.models.core_model import Recipe
+
+    stmt = (
+        select(Recipe.recipe_id)
+        .where(Recipe.cooking_name.contains(query))
+        .order_by(desc(Recipe.scrap_count))
+        .limit(limit)
+    )
+    return list((await session.execute(stmt)).scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_search_matches_like_query_order(recipe_session):
+    assert title_index.search_recipe_titles("김치", 10) is None  # 적재 전
+
+    await title_index.refresh_title_index(recipe_session)
+
+    for query, limit in [("김치찌개", 10), ("김치", 10), ("김치", 2), ("찌", 10), ("없는요리", 5), ("", 3)]:
+        assert title_index.search_recipe_titles(query, limit) == await _sql_title_ids(recipe_session, query, limit)
+    assert title_index.search_recipe_titles("김치찌개", 10) == [2, 1, 3]
+    assert title_index.search_recipe_titles("KIMCHI", 10) == [6]  # 대소문자 무시
+
+
+@pytest.mark.asyncio
+async def test_refresh_inserts_new_recipes_in_scrap_order(recipe_session):
+    from services.recipe.models.core_model import Recipe
+
+    await title_index.refresh_title_index(recipe_session)
+    recipe_session.add(Recipe(recipe_id=8, recipe_title="새 레시피", cooking_name="김치찌개 황금레시피", scrap_count=200))
+    await recipe_session.commit()
+
+    assert title_index.search_recipe_titles("김치찌개", 10) == [2, 1, 3]
+    await title_index.refresh_title_index(recipe_session)
+    assert title_index.search_recipe_titles("김치찌개", 10) == [2, 8, 1, 3]
+    assert title_index.search_recipe_titles("황금", 10) == [8]
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(5)
+async def test_recommend_uses_title_index(recipe_session, query_recorder):
+    from services.recipe.crud.recipe_search_crud import recommend_by_recipe_pgvector_v2
+
+    await title_index.refresh_title_index(recipe_session)
+    before = len(query_recorder.statements)
+
+    records = await recommend_by_recipe_pgvector_v2(
+        mariadb=recipe_session, postgres=None, query="김치찌개", page=1, size=5,
+    )
+
+    assert [r["RECIPE_ID"] for r in records] == [2, 1, 3]
+    assert all(r["RANK_TYPE"] == 0 for r in records)
+    statements = query_recorder.statements[before:]
+    assert len(statements) == 1 and "LIKE" not in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_periodic_refresher_loads_in_background(recipe_engine):
+    calls = []
+
+    async def flaky_refresh(session):
+        calls.append(session)
+        if len(calls) == 1:
+            raise RuntimeError("db down")
+        await title_index.refresh_title_index(session)
+
+    refresher = PeriodicRefresher("title_index_test", flaky_refresh, interval_seconds=0.01)
+    refresher.start(recipe_engine)
+    refresher.start(recipe_engine)  # 실행 중이면 무시
+    for _ in range(100):
+        if title_index.search_recipe_titles("김치", 1) is not None:
+            break
+        await asyncio.sleep(0.01)
+    await refresher.stop()
+
+    assert not refresher.running
+    assert len(calls) >= 2
+    assert title_index.search_recipe_titles("김치", 1) == [2]